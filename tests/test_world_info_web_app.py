@@ -1,9 +1,14 @@
+import gzip
 import json
 import shutil
+import tempfile
+import threading
 import uuid
 from datetime import datetime
 from pathlib import Path
 
+import pytest
+
 import world_info_web.backend.service as service_module
 from world_info_web.backend.app import create_app
 from world_info_web.backend.scheduler import AutoSyncScheduler
@@ -15,8 +20,17 @@ def _write_json(path: Path, payload):
     path.write_text(json.dumps(payload, ensure_ascii=False, indent=2), encoding="utf-8")
 
 
+_CASE_ROOT = Path(tempfile.gettempdir()) / "world_info_web_tests"
+
+
+@pytest.fixture(autouse=True)
+def _case_root(tmp_path, monkeypatch):
+    # Keep per-test repo copies under pytest's tmp_path, outside the checkout.
+    monkeypatch.setitem(globals(), "_CASE_ROOT", tmp_path)
+
+
 def _make_case_dir(name: str) -> Path:
-    root = Path.cwd() / ".tmp_pytest" / f"{name}_{uuid.uuid4().hex}"
+    root = _CASE_ROOT / f"{name}_{uuid.uuid4().hex}"
     if root.exists():
         shutil.rmtree(root)
     root.mkdir(parents=True, exist_ok=True)
@@ -64,6 +78,295 @@ def test_api_worlds_and_self_check_routes():
     assert "warnings" in check_response.get_json()
 
 
+def test_storage_diagnostics_route_reports_connection_reuse():
+    repo_root = _make_case_dir("app_storage_diagnostics") / "repo"
+    service = WorldInfoService(repo_root=repo_root, app_root=repo_root / "world_info_web")
+    app = create_app(service)
+    client = app.test_client()
+
+    service.storage.list_runs(limit=1)
+    service.storage.list_runs(limit=1)
+    before = service.storage.connection_stats()
+    worker = threading.Thread(target=lambda: service.storage.list_runs(limit=1))
+    worker.start()
+    worker.join()
+
+    response = client.get("/api/v1/diagnostics/storage")
+
+    assert response.status_code == 200
+    connections = response.get_json()["connections"]
+    assert before["reuses"] >= 2
+    assert connections["opens"] >= before["opens"] + 1
+    assert connections["cached_statements"] > 0
+    assert "open_ms_total" in connections and "wait_ms_total" not in connections
+    # Requests keep their thread's connection open across requests.
+    after_request = service.storage.connection_stats()
+    client.get("/api/v1/diagnostics/storage")
+    client.get("/api/v1/diagnostics/storage")
+    repeated = service.storage.connection_stats()
+    assert repeated["opens"] == after_request["opens"]
+    assert repeated["reuses"] >= after_request["reuses"] + 2
+    assert repeated["closes"] == before["closes"]
+    # The next open on another thread sweeps the exited worker's connection.
+    sweeper = threading.Thread(target=lambda: service.storage.list_runs(limit=1))
+    sweeper.start()
+    sweeper.join()
+    assert service.storage.connection_stats()["closes"] == before["closes"] + 1
+
+
+def test_tag_facets_route_and_worlds_tag_filter_use_world_tags():
+    repo_root = _make_case_dir("app_tag_facets") / "repo"
+    service = WorldInfoService(repo_root=repo_root, app_root=repo_root / "world_info_web")
+    app = create_app(service)
+    client = app.test_client()
+    for source_key, worlds in (
+        ("job:alpha", [{"id": "wrld_a", "tags": ["game", "horror"]}, {"id": "wrld_b", "tags": ["game"]}]),
+        ("job:beta", [{"id": "wrld_a", "tags": ["game", "horror"]}, {"id": "wrld_c", "tags": ["chill"]}]),
+    ):
+        run_id = service.storage.create_run(
+            source_key=source_key,
+            job_key=source_key.removeprefix("job:"),
+            trigger_type="manual",
+            query_label=source_key,
+            started_at="2026-03-01T00:00:00+00:00",
+        )
+        service.storage.insert_world_snapshots(
+            run_id=run_id,
+            source_key=source_key,
+            fetched_at="2026-03-01T00:00:00+00:00",
+            worlds=worlds,
+        )
+
+    response = client.get("/api/v1/tags?source=db:all")
+    assert response.status_code == 200
+    assert response.get_json()["items"] == [
+        {"tag": "game", "world_count": 2},
+        {"tag": "chill", "world_count": 1},
+        {"tag": "horror", "world_count": 1},
+    ]
+    beta = client.get("/api/v1/tags?source=db:job:beta").get_json()["items"]
+    assert beta == [{"tag": "chill", "world_count": 1}, {"tag": "game", "world_count": 1}, {"tag": "horror", "world_count": 1}]
+
+    tag_lookups = []
+    list_tagged_world_ids = service.storage.list_tagged_world_ids
+    service.storage.list_tagged_world_ids = lambda *args: tag_lookups.append(args) or list_tagged_world_ids(*args)
+    payload = client.get("/api/v1/worlds?source=db:job:alpha&tag=horror").get_json()
+    assert [item["id"] for item in payload["items"]] == ["wrld_a"]
+    assert payload["tags"] == ["game", "horror"]
+    payload = client.get("/api/v1/worlds?source=db:all&tag=game").get_json()
+    assert sorted(item["id"] for item in payload["items"]) == ["wrld_a", "wrld_b"]
+    assert tag_lookups == [("horror", "job:alpha"), ("game", None)]
+    # Filtered lists take their tags from the matches; unfiltered ones from the source-wide facets.
+    assert client.get("/api/v1/worlds?source=db:all&tag=horror").get_json()["tags"] == ["game", "horror"]
+    assert client.get("/api/v1/worlds?source=db:all&tag=horror&limit=1").get_json()["tags"] == ["game", "horror"]
+    assert client.get("/api/v1/worlds?source=db:all&limit=1").get_json()["tags"] == ["chill", "game", "horror"]
+
+    # Blacklisted in job:beta only, so wrld_a still counts through job:alpha.
+    _write_json(
+        repo_root / "world_info_web" / "config" / "sync_jobs.json",
+        {"beta": {"type": "keywords", "source_key": "job:beta", "keywords": ["x"], "blacklist_file": "world_info/blacklist_beta.txt"}},
+    )
+    (repo_root / "world_info").mkdir(parents=True, exist_ok=True)
+    (repo_root / "world_info" / "blacklist_beta.txt").write_text("wrld_a\nwrld_c\n", encoding="utf-8")
+    assert client.get("/api/v1/tags?source=db:all").get_json()["items"] == [
+        {"tag": "game", "world_count": 2},
+        {"tag": "horror", "world_count": 1},
+    ]
+    assert client.get("/api/v1/tags?source=db:job:beta").get_json()["items"] == []
+    assert client.get("/api/v1/worlds?source=db:job:beta&limit=5").get_json()["tags"] == []
+
+    service.storage.delete_world_snapshots("job:alpha", "wrld_a")
+    alpha = client.get("/api/v1/tags?source=db:job:alpha").get_json()["items"]
+    assert alpha == [{"tag": "game", "world_count": 1}]
+
+
+def test_run_diff_route_compares_any_two_runs_with_paging():
+    repo_root = _make_case_dir("app_run_diff") / "repo"
+    service = WorldInfoService(repo_root=repo_root, app_root=repo_root / "world_info_web")
+    app = create_app(service)
+    client = app.test_client()
+    batches = [
+        [{"id": "wrld_a", "name": "A", "visits": 10}, {"id": "wrld_b", "name": "B", "visits": 5}],
+        [{"id": "wrld_a", "name": "A", "visits": 12}],
+        [
+            {"id": "wrld_a", "name": "A2", "visits": 40, "favorites": 3},
+            {"id": "wrld_b", "name": "B", "visits": 6},
+            {"id": "wrld_c", "name": "C"},
+            {"id": "wrld_d", "name": "D"},
+        ],
+    ]
+    run_ids = []
+    for index, worlds in enumerate(batches):
+        fetched_at = f"2026-03-0{index + 1}T00:00:00+00:00"
+        run_id = service.storage.create_run(
+            source_key="job:alpha",
+            job_key="alpha",
+            trigger_type="manual",
+            query_label="alpha",
+            started_at=fetched_at,
+        )
+        service.storage.insert_world_snapshots(
+            run_id=run_id,
+            source_key="job:alpha",
+            fetched_at=fetched_at,
+            worlds=worlds,
+            change_only=True,
+        )
+        run_ids.append(run_id)
+
+    response = client.get(f"/api/v1/runs/{run_ids[0]}/diff/{run_ids[2]}?limit=1")
+    assert response.status_code == 200
+    payload = response.get_json()
+    assert (payload["added_count"], payload["removed_count"], payload["changed_count"]) == (2, 0, 2)
+    assert [item["id"] for item in payload["added_worlds"]] == ["wrld_c"]
+    top = payload["changed_worlds"][0]
+    assert top["id"] == "wrld_a"
+    assert (top["visits_delta"], top["favorites_delta"]) == (30, 3)
+    assert top["changed_fields"] == ["favorites", "name", "visits"]
+    assert (top["previous"]["name"], top["latest"]["name"]) == ("A", "A2")
+
+    page = client.get(f"/api/v1/runs/{run_ids[0]}/diff/{run_ids[2]}?kind=added&limit=1&offset=1").get_json()
+    assert [item["id"] for item in page["added_worlds"]] == ["wrld_d"]
+    assert page["changed_worlds"] == []
+
+    reverse = client.get(f"/api/v1/runs/{run_ids[1]}/diff/{run_ids[0]}").get_json()
+    assert [item["id"] for item in reverse["added_worlds"]] == ["wrld_b"]
+    assert reverse["changed_worlds"][0]["visits_delta"] == -2
+
+    assert client.get(f"/api/v1/runs/{run_ids[0]}/diff/9999").status_code == 404
+    assert client.get(f"/api/v1/runs/{run_ids[0]}/diff/{run_ids[1]}?kind=bogus").status_code == 400
+
+
+def test_worlds_route_pages_with_top_k_and_projects_fields():
+    repo_root = _make_case_dir("app_worlds_paging") / "repo"
+    service = WorldInfoService(repo_root=repo_root, app_root=repo_root / "world_info_web")
+    app = create_app(service)
+    client = app.test_client()
+    run_id = service.storage.create_run(
+        source_key="job:alpha",
+        job_key="alpha",
+        trigger_type="manual",
+        query_label="alpha",
+        started_at="2026-03-01T00:00:00+00:00",
+    )
+    worlds = [
+        {"id": f"wrld_{index:02d}", "name": f"World {index}", "visits": (index * 7) % 23, "tags": ["game"]}
+        for index in range(12)
+    ]
+    service.storage.insert_world_snapshots(
+        run_id=run_id,
+        source_key="job:alpha",
+        fetched_at="2026-03-01T00:00:00+00:00",
+        worlds=worlds,
+    )
+
+    full = client.get("/api/v1/worlds?source=db:job:alpha&sort=visits").get_json()
+    assert (full["total"], full["count"], full["next_offset"]) == (12, 12, None)
+    expected = [item["id"] for item in full["items"]]
+
+    first = client.get("/api/v1/worlds?source=db:job:alpha&sort=visits&limit=5&fields=name,visits").get_json()
+    assert (first["total"], first["count"], first["offset"], first["limit"], first["next_offset"]) == (12, 5, 0, 5, 5)
+    assert [item["id"] for item in first["items"]] == expected[:5]
+    assert set(first["items"][0]) == {"id", "name", "visits"}
+    assert first["tags"] == ["game"]
+    totals = {"world_count": 12, "total_visits": sum(world["visits"] for world in worlds), "total_favorites": 0, "tracked_creators": 0}
+    assert first["summary"] == full["summary"] == totals
+
+    last = client.get("/api/v1/worlds?source=db:job:alpha&sort=visits&limit=5&offset=10").get_json()
+    assert [item["id"] for item in last["items"]] == expected[10:]
+    assert last["next_offset"] is None
+
+    ascending = client.get("/api/v1/worlds?source=db:job:alpha&sort=visits&direction=asc").get_json()["items"]
+    page = client.get("/api/v1/worlds?source=db:job:alpha&sort=visits&direction=asc&limit=4").get_json()["items"]
+    assert page == ascending[:4]
+
+    trending = client.get("/api/v1/worlds?source=db:job:alpha&sort=new_hot").get_json()["items"]
+    trend_page = client.get("/api/v1/worlds?source=db:job:alpha&sort=new_hot&limit=3&offset=3").get_json()["items"]
+    assert [item["id"] for item in trend_page] == [item["id"] for item in trending[3:6]]
+
+    assert client.get("/api/v1/worlds?source=db:job:alpha&limit=0").status_code == 400
+    assert client.get("/api/v1/worlds?source=db:job:alpha&offset=-1").status_code == 400
+
+
+def test_read_endpoints_answer_conditional_gets_and_gzip_large_bodies(monkeypatch):
+    repo_root = _make_case_dir("app_conditional_get") / "repo"
+    service = WorldInfoService(repo_root=repo_root, app_root=repo_root / "world_info_web")
+    app = create_app(service)
+    client = app.test_client()
+
+    def seed(run_index: int) -> None:
+        fetched_at = f"2026-03-0{run_index + 1}T00:00:00+00:00"
+        run_id = service.storage.create_run(
+            source_key="job:alpha",
+            job_key="alpha",
+            trigger_type="manual",
+            query_label="alpha",
+            started_at=fetched_at,
+        )
+        service.storage.insert_world_snapshots(
+            run_id=run_id,
+            source_key="job:alpha",
+            fetched_at=fetched_at,
+            worlds=[
+                {"id": f"wrld_{index:03d}", "name": f"World {index}", "visits": index + run_index, "description": "x" * 40}
+                for index in range(40)
+            ],
+        )
+
+    seed(0)
+    first = client.get("/api/v1/worlds?source=db:job:alpha&sort=visits")
+    assert first.status_code == 200
+    etag = first.headers["ETag"]
+    assert first.headers["Cache-Control"] == "no-cache"
+
+    calls = []
+    original = service.load_worlds
+    monkeypatch.setattr(service, "load_worlds", lambda *args, **kwargs: calls.append(args) or original(*args, **kwargs))
+    cached = client.get("/api/v1/worlds?source=db:job:alpha&sort=visits", headers={"If-None-Match": etag})
+    assert cached.status_code == 304
+    assert cached.headers["ETag"] == etag
+    assert calls == []
+    other_args = client.get("/api/v1/worlds?source=db:job:alpha&sort=name", headers={"If-None-Match": etag})
+    assert other_args.status_code == 200
+
+    compressed = client.get("/api/v1/worlds?source=db:job:alpha&sort=visits", headers={"Accept-Encoding": "gzip"})
+    assert compressed.headers["Content-Encoding"] == "gzip"
+    assert compressed.headers["ETag"] == etag[:-1] + '-gzip"'
+    assert json.loads(gzip.decompress(compressed.data)) == first.get_json()
+    revalidated = client.get(
+        "/api/v1/worlds?source=db:job:alpha&sort=visits",
+        headers={"If-None-Match": compressed.headers["ETag"], "Accept-Encoding": "gzip"},
+    )
+    assert revalidated.status_code == 304
+    assert revalidated.headers["ETag"] == compressed.headers["ETag"]
+
+    seed(1)
+    changed = client.get("/api/v1/worlds?source=db:job:alpha&sort=visits", headers={"If-None-Match": etag})
+    assert changed.status_code == 200
+    assert changed.headers["ETag"] != etag
+
+    # Membership writes (incremental refresh, scheduled or manual rebuild) change topic views.
+    service.storage.upsert_topics([{"topic_key": "picked", "label": "Picked"}])
+    topic_etag = client.get("/api/v1/topics/picked/worlds").headers["ETag"]
+    service.storage.apply_topic_memberships(
+        "picked",
+        [{"world_id": "wrld_001", "first_seen_at": "2026-03-02T00:00:00+00:00", "last_seen_at": "2026-03-02T00:00:00+00:00"}],
+        world_ids={"wrld_001"},
+    )
+    regrown = client.get("/api/v1/topics/picked/worlds", headers={"If-None-Match": topic_etag})
+    assert regrown.status_code == 200
+    assert [item["id"] for item in regrown.get_json()["items"]] == ["wrld_001"]
+
+    status = client.get("/api/v1/auto-sync/status")
+    assert client.get("/api/v1/auto-sync/status", headers={"If-None-Match": status.headers["ETag"]}).status_code == 304
+
+    stats = client.get("/api/v1/diagnostics/http").get_json()
+    assert stats["not_modified"] == 3
+    assert stats["not_modified_bytes_saved"] >= 2 * len(first.data)
+    assert stats["compressed_responses"] >= 1
+    assert stats["compression_bytes_saved"] > 0
+
+
 def test_jobs_routes_run_and_list(monkeypatch):
     repo_root = _make_case_dir("app_jobs") / "repo"
     app_root = repo_root / "world_info_web"
@@ -324,6 +627,41 @@ def test_events_route_forwards_limit_and_days(monkeypatch):
     assert captured == {"limit": 9, "recency_days": 3}
 
 
+def test_events_route_forwards_cursor_and_filters(monkeypatch):
+    repo_root = _make_case_dir("app_events_filters") / "repo"
+    app_root = repo_root / "world_info_web"
+    frontend_dir = app_root / "frontend"
+    frontend_dir.mkdir(parents=True, exist_ok=True)
+    (frontend_dir / "index.html").write_text("<html><body>ok</body></html>", encoding="utf-8")
+
+    service = WorldInfoService(repo_root=repo_root, app_root=app_root)
+    app = create_app(service)
+    client = app.test_client()
+    captured: dict[str, object] = {}
+
+    def fake_list_event_feed(**kwargs):
+        if kwargs.get("cursor") == "bad":
+            raise ValueError("Invalid event cursor.")
+        captured.update(kwargs)
+        return {"summary": {"total": 0}, "items": [], "next_cursor": None}
+
+    monkeypatch.setattr(service, "list_event_feed", fake_list_event_feed)
+
+    response = client.get("/api/v1/events?cursor=abc&type=traffic_spike,new_upload&job=taiwan&min_severity=70")
+
+    assert response.status_code == 200
+    assert captured == {
+        "limit": 50,
+        "recency_days": 7,
+        "cursor": "abc",
+        "event_types": ["traffic_spike", "new_upload"],
+        "job_key": "taiwan",
+        "min_severity": 70.0,
+    }
+    assert client.get("/api/v1/events?cursor=bad").status_code == 400
+    assert client.get("/api/v1/events?min_severity=high").status_code == 400
+
+
 def test_auto_sync_status_prefers_latest_completed_run_over_stale_schedule():
     repo_root = _make_case_dir("app_auto_sync_status_latest") / "repo"
     app_root = repo_root / "world_info_web"
@@ -840,6 +1178,58 @@ def test_insights_route(monkeypatch):
     assert "signals" in response.get_json()
 
 
+def test_insights_route_serves_cached_scopes_from_encoded_slices(monkeypatch):
+    repo_root = _make_case_dir("app_insights_tier") / "repo"
+    app_root = repo_root / "world_info_web"
+    frontend_dir = app_root / "frontend"
+    frontend_dir.mkdir(parents=True, exist_ok=True)
+    (frontend_dir / "index.html").write_text("<html><body>ok</body></html>", encoding="utf-8")
+
+    service = WorldInfoService(repo_root=repo_root, app_root=app_root)
+    app = create_app(service)
+    client = app.test_client()
+    payload = {
+        "label": "db:all",
+        "generated_at": "2026-01-01T00:00:00+00:00",
+        "growth_leaderboard": [{"id": f"wrld_{index}", "name": f"世界 {index}"} for index in range(40)],
+        "briefing": {"momentum": [{"id": "wrld_0"}] * 20},
+        "performance": {"enabled": True, "items": list(range(40)), "summary": {"count": 40}},
+        "signals": {"summary": {"top_signals": list(range(30))}, "correlations": [], "charts": []},
+    }
+    service.storage.upsert_analysis_cache(
+        scope_key="db:all", scope_type="source", updated_at=payload["generated_at"], payload=payload
+    )
+
+    first = client.get("/api/v1/insights?limit=12")
+    assert first.status_code == 200
+    assert first.get_json() == service._limit_collection_insights_payload(payload, 12)
+    assert first.get_json()["performance"]["summary"] == {"count": 40}
+    assert payload["performance"]["items"] == list(range(40))
+
+    monkeypatch.setattr(
+        service.storage,
+        "get_analysis_cache",
+        lambda scope_key: (_ for _ in ()).throw(AssertionError("decoded tier should answer")),
+    )
+    monkeypatch.setattr(
+        service_module.jsoncodec,
+        "dumps_bytes",
+        lambda *args, **kwargs: (_ for _ in ()).throw(AssertionError("body should be pre-encoded")),
+    )
+    again = client.get("/api/v1/insights?limit=12")
+    assert again.get_data() == first.get_data()
+    monkeypatch.undo()
+
+    assert len(client.get("/api/v1/insights?limit=5").get_json()["growth_leaderboard"]) == 5
+    payload["growth_leaderboard"] = payload["growth_leaderboard"][:2]
+    payload["generated_at"] = "2026-01-02T00:00:00+00:00"
+    service.storage.upsert_analysis_cache(
+        scope_key="db:all", scope_type="source", updated_at=payload["generated_at"], payload=payload
+    )
+    assert len(client.get("/api/v1/insights?limit=12").get_json()["growth_leaderboard"]) == 2
+    assert service.get_storage_diagnostics()["insights_cache"]["hits"] >= 2
+
+
 def test_communities_crud_routes():
     repo_root = Path.cwd()
     app_root = repo_root / "world_info_web"
@@ -1,13 +1,17 @@
 import datetime as dt
 import json
+import random
 import shutil
+import tempfile
 import uuid
 from pathlib import Path
 
+import pytest
 from openpyxl import Workbook
 
 import world_info_web.backend.service as service_module
 from world_info_web.backend.service import WorldInfoService
+from world_info_web.backend.storage import WorldInfoStorage
 
 
 def _write_json(path: Path, payload):
@@ -24,8 +28,17 @@ def _write_workbook(path: Path, rows: list[list[object]]):
     workbook.save(path)
 
 
+_CASE_ROOT = Path(tempfile.gettempdir()) / "world_info_web_tests"
+
+
+@pytest.fixture(autouse=True)
+def _case_root(tmp_path, monkeypatch):
+    # Keep per-test repo copies under pytest's tmp_path, outside the checkout.
+    monkeypatch.setitem(globals(), "_CASE_ROOT", tmp_path)
+
+
 def _make_case_dir(name: str) -> Path:
-    root = Path.cwd() / ".tmp_pytest" / f"{name}_{uuid.uuid4().hex}"
+    root = _CASE_ROOT / f"{name}_{uuid.uuid4().hex}"
     if root.exists():
         shutil.rmtree(root)
     root.mkdir(parents=True, exist_ok=True)
@@ -695,6 +708,407 @@ def test_update_and_delete_world_record(monkeypatch):
     assert service.load_worlds("db:job:taiwan") == []
 
 
+def test_world_latest_tracks_newest_snapshot_and_backfills():
+    repo_root = _make_case_dir("service_world_latest") / "repo"
+    service = WorldInfoService(repo_root=repo_root, app_root=repo_root / "world_info_web")
+    storage = service.storage
+
+    run_id = storage.create_run(
+        source_key="job:latest",
+        job_key="latest",
+        trigger_type="manual",
+        query_label="latest",
+        started_at="2026-03-02T00:00:00+00:00",
+    )
+    storage.insert_world_snapshots(
+        run_id=run_id,
+        source_key="job:latest",
+        fetched_at="2026-03-02T00:00:00+00:00",
+        worlds=[
+            {"id": "wrld_a", "name": "Alpha New", "author_id": "usr_a", "visits": 200, "tags": []},
+            {"id": "wrld_b", "name": "Beta", "author_id": "usr_b", "visits": 50, "tags": []},
+        ],
+    )
+    storage.insert_world_snapshots(
+        run_id=run_id,
+        source_key="job:latest",
+        fetched_at="2026-03-01T00:00:00+00:00",
+        worlds=[{"id": "wrld_a", "name": "Alpha Old", "author_id": "usr_a", "visits": 100, "tags": []}],
+    )
+
+    latest = {item["id"]: item for item in storage.load_latest_worlds("job:latest")}
+    assert latest["wrld_a"]["name"] == "Alpha New"
+    assert storage.count_latest_worlds("job:latest") == 2
+    assert storage.list_db_sources()[0]["world_count"] == 2
+    assert [item["id"] for item in storage.load_worlds_by_authors({"usr_a"})] == ["wrld_a"]
+
+    storage.delete_world_snapshots("job:latest", "wrld_b")
+    assert storage.count_latest_worlds("job:latest") == 1
+
+    with storage._connect() as conn:
+        conn.execute("DELETE FROM world_latest")
+    reopened = WorldInfoStorage(storage.db_path)
+    assert reopened.count_latest_worlds() == 1
+    assert reopened.load_latest_worlds()[0]["visits"] == 200
+
+    result = service.rebuild_latest_worlds("db:job:latest")
+    assert result["world_count"] == 1
+
+
+def test_history_reads_typed_metric_points_and_backfills():
+    repo_root = _make_case_dir("service_metric_points") / "repo"
+    service = WorldInfoService(repo_root=repo_root, app_root=repo_root / "world_info_web")
+    storage = service.storage
+
+    run_id = storage.create_run(
+        source_key="job:points",
+        job_key="points",
+        trigger_type="manual",
+        query_label="points",
+        started_at="2026-03-01T00:00:00+00:00",
+    )
+    for fetched_at, visits in (("2026-03-01T00:00:00+00:00", 10), ("2026-03-02T00:00:00Z", 25)):
+        storage.insert_world_snapshots(
+            run_id=run_id,
+            source_key="job:points",
+            fetched_at=fetched_at,
+            worlds=[{"id": "wrld_p", "name": "Points", "visits": visits, "favorites": 1, "tags": []}],
+        )
+
+    with storage._connect() as conn:
+        conn.execute("UPDATE world_snapshots SET raw_json = 'not json'")
+    history = service.load_history("wrld_p", source="db:job:points")["wrld_p"]
+    assert [item["visits"] for item in history] == [10, 25]
+    assert history[-1]["timestamp"] == int(dt.datetime(2026, 3, 2, tzinfo=dt.timezone.utc).timestamp())
+
+    with storage._connect() as conn:
+        conn.execute("DELETE FROM world_metric_points")
+    reopened = WorldInfoStorage(storage.db_path)
+    points = reopened.load_history_points("wrld_p")["wrld_p"]
+    assert [item["visits"] for item in points] == [10, 25]
+
+
+def test_run_diff_breaks_score_ties_on_casefolded_names():
+    storage = WorldInfoStorage(_make_case_dir("storage_run_diff_ties") / "world_info.sqlite3")
+    run_ids = []
+    for index, visits in enumerate((10, 20)):
+        fetched_at = f"2026-03-0{index + 1}T00:00:00+00:00"
+        run_id = storage.create_run(
+            source_key="job:ties",
+            job_key="ties",
+            trigger_type="manual",
+            query_label="ties",
+            started_at=fetched_at,
+        )
+        storage.insert_world_snapshots(
+            run_id=run_id,
+            source_key="job:ties",
+            fetched_at=fetched_at,
+            worlds=[
+                {"id": "wrld_1", "name": "éab", "visits": visits},
+                {"id": "wrld_2", "name": "Ébc", "visits": visits},
+            ],
+        )
+        run_ids.append(run_id)
+
+    changed = storage.diff_runs(run_ids[0], run_ids[1], kinds=("changed",))["changed"]
+    # Same order as sorting on (score, name.casefold()) descending in Python.
+    assert [item["name"] for item in changed] == ["Ébc", "éab"]
+
+
+def test_history_points_round_trip_publication_dates():
+    repo_root = _make_case_dir("service_metric_point_dates") / "repo"
+    service = WorldInfoService(repo_root=repo_root, app_root=repo_root / "world_info_web")
+    storage = service.storage
+    dates = {
+        "created_at": "2025-12-01T00:00:00Z",
+        "publication_date": "2026-01-15T00:00:00Z",
+        "labs_publication_date": "2026-01-02T00:00:00Z",
+    }
+    run_id = storage.create_run(
+        source_key="job:dates",
+        job_key="dates",
+        trigger_type="manual",
+        query_label="dates",
+        started_at="2026-03-01T00:00:00+00:00",
+    )
+    storage.insert_world_snapshots(
+        run_id=run_id,
+        source_key="job:dates",
+        fetched_at="2026-03-01T00:00:00+00:00",
+        worlds=[{"id": "wrld_d", "name": "Dated", "visits": 5, "tags": [], **dates}],
+    )
+
+    def point_dates(history: dict) -> dict:
+        return {key: history["wrld_d"][0][key] for key in dates}
+
+    assert point_dates(storage.load_history_points("wrld_d")) == dates
+    assert point_dates(service.load_history("wrld_d", source="db:job:dates")) == dates
+
+    # Databases from before the date columns get them back from the snapshots.
+    with storage._connect() as conn:
+        for column in dates:
+            conn.execute(f"ALTER TABLE world_metric_points DROP COLUMN {column}")
+    reopened = WorldInfoStorage(storage.db_path)
+    assert point_dates(reopened.load_history_points("wrld_d")) == dates
+
+
+def test_compressed_payloads_round_trip_and_migrate():
+    db_path = _make_case_dir("storage_payload_codec") / "world_info.sqlite3"
+    plain = WorldInfoStorage(db_path)
+    run_id = plain.create_run(
+        source_key="job:codec",
+        job_key="codec",
+        trigger_type="manual",
+        query_label="codec",
+        started_at="2026-03-01T00:00:00+00:00",
+    )
+    plain.insert_world_snapshots(
+        run_id=run_id,
+        source_key="job:codec",
+        fetched_at="2026-03-01T00:00:00+00:00",
+        worlds=[{"id": "wrld_z", "name": "壓縮世界", "author_id": "usr_z", "visits": 7, "tags": ["a"]}],
+    )
+    plain.upsert_analysis_cache(scope_key="db:job:codec", scope_type="source", updated_at="now", payload={"n": 1})
+
+    compressed = WorldInfoStorage(db_path, payload_codec="zlib")
+    converted = compressed.migrate_payload_encoding()
+    assert converted == {"world_snapshots": 1, "world_latest": 1, "analysis_cache": 1}
+    assert compressed.migrate_payload_encoding() == {"world_snapshots": 0, "world_latest": 0, "analysis_cache": 0}
+
+    compressed.insert_world_snapshots(
+        run_id=run_id,
+        source_key="job:codec",
+        fetched_at="2026-03-02T00:00:00+00:00",
+        worlds=[{"id": "wrld_y", "name": "Second", "author_id": "usr_z", "visits": 3, "tags": []}],
+    )
+    with compressed._connect() as conn:
+        encodings = {row[0] for row in conn.execute("SELECT raw_encoding FROM world_snapshots").fetchall()}
+    assert encodings == {"zlib"}
+    assert {item["name"] for item in compressed.load_latest_worlds("job:codec")} == {"壓縮世界", "Second"}
+    assert len(compressed.load_run_worlds(run_id)) == 2
+    assert len(compressed.load_worlds_by_authors({"usr_z"})) == 2
+    assert compressed.get_analysis_cache("db:job:codec")["payload"] == {"n": 1}
+    assert plain.load_latest_worlds("job:codec")[0]["visits"] in {3, 7}
+
+
+def test_stored_worlds_decode_payloads_only_for_untyped_fields(monkeypatch):
+    import world_info_web.backend.storage as storage_module
+
+    storage = WorldInfoStorage(_make_case_dir("storage_lazy_payload") / "world_info.sqlite3", payload_codec="zlib")
+    world = {
+        "id": "wrld_lazy",
+        "name": "Lazy",
+        "author_id": "usr_lazy",
+        "visits": 40,
+        "description": "only in the payload",
+        "tags": ["a"],
+        "metrics": {"favorite_rate": 1.5, "custom": 9},
+    }
+    run_ids = []
+    for day, favorite_rate in ((1, 1.5), (2, 2.5)):
+        run_id = storage.create_run(
+            source_key="job:lazy",
+            job_key="lazy",
+            trigger_type="manual",
+            query_label="lazy",
+            started_at=f"2026-03-0{day}T00:00:00+00:00",
+        )
+        storage.insert_world_snapshots(
+            run_id=run_id,
+            source_key="job:lazy",
+            fetched_at=f"2026-03-0{day}T00:00:00+00:00",
+            worlds=[{**world, "metrics": {**world["metrics"], "favorite_rate": favorite_rate}}],
+            change_only=True,
+        )
+        run_ids.append(run_id)
+
+    decoded = []
+    original = storage_module._decode_payload
+    monkeypatch.setattr(
+        storage_module,
+        "_decode_payload",
+        lambda raw, encoding: decoded.append(encoding) or original(raw, encoding),
+    )
+    latest = storage.load_latest_worlds("job:lazy")[0]
+    seen = storage.load_run_worlds(run_ids[1])[0]
+    assert (latest["id"], latest["name"], latest["visits"], latest["author_id"]) == ("wrld_lazy", "Lazy", 40, "usr_lazy")
+    assert (seen["name"], seen["fetched_at"], seen["_db_source_key"]) == ("Lazy", "2026-03-02T00:00:00+00:00", "job:lazy")
+    assert decoded == []
+
+    assert latest["description"] == "only in the payload"
+    assert seen["metrics"] == {
+        "favorite_rate": 2.5,
+        "custom": 9,
+        "labs_to_publication_days": None,
+        "days_since_update": None,
+        "visits_per_day": None,
+    }
+    assert decoded == ["zlib", "zlib"]
+    assert dict(latest) == {
+        **world,
+        "metrics": {**world["metrics"], "favorite_rate": 2.5},
+        "fetched_at": "2026-03-02T00:00:00+00:00",
+        "_db_source_key": "job:lazy",
+    }
+    assert len(decoded) == 2
+
+
+def test_json_codecs_agree_and_keep_non_ascii_text():
+    from world_info_web.backend import jsoncodec
+
+    payload = {"id": "wrld_台灣", "name": "星河 World", "visits": 2**70, "tags": ["a", "b"], "nested": {"n": None}}
+    for codec in jsoncodec.CODECS.values():
+        text = codec.dumps(payload)
+        assert "台灣" in text
+        assert codec.loads(text) == payload
+        assert codec.loads(codec.dumps_bytes(payload)) == payload
+        assert json.loads(codec.dumps(payload, sort_keys=True)) == payload
+        with pytest.raises(json.JSONDecodeError):
+            codec.loads("{not json")
+
+
+def test_world_records_round_trip_and_shrink_a_50k_world_catalog():
+    import tracemalloc
+
+    from world_info_web.backend import jsoncodec
+    from world_info_web.backend.records import WorldRecord
+
+    def payload(index: int) -> bytes:
+        return jsoncodec.dumps_bytes(
+            {
+                "source": "db:job:bench",
+                "id": f"wrld_{index:06d}",
+                "name": f"World {index}",
+                "description": None,
+                "author_id": f"usr_{index % 700:04d}",
+                "author_name": f"Creator {index % 700}",
+                "capacity": 32,
+                "visits": 1000 + index,
+                "favorites": 50 + index,
+                "heat": index % 6,
+                "popularity": index % 9,
+                "created_at": "2025-01-01T00:00:00Z",
+                "updated_at": "2025-06-01T00:00:00Z",
+                "publication_date": "2025-02-01T00:00:00Z",
+                "labs_publication_date": None,
+                "release_status": "public",
+                "image_url": f"https://example.invalid/images/{index}.png",
+                "thumbnail_url": f"https://example.invalid/thumbs/{index}.png",
+                "tags": ["system_approved", f"author_tag_{index % 40}"],
+                "portal_links": [],
+                "world_url": f"https://vrchat.com/home/world/wrld_{index:06d}",
+                "metrics": {
+                    "favorite_rate": 5.0,
+                    "labs_to_publication_days": None,
+                    "days_since_update": 30,
+                    "days_since_publication": 120,
+                    "visits_per_day": 12.5,
+                },
+                "_db_source_key": "job:bench",
+            }
+        )
+
+    payloads = [payload(index) for index in range(50_000)]
+    sample = jsoncodec.loads(payloads[123])
+    record = WorldRecord.from_dict(sample)
+    assert record.to_dict() == sample
+    assert record.get("tags") == ("system_approved", "author_tag_3")
+    assert record.get("metrics")["visits_per_day"] == 12.5
+    assert record.get("_db_source_key") == "job:bench"
+    assert record.get("missing", "fallback") == "fallback"
+
+    tracemalloc.start()
+    try:
+        baseline = tracemalloc.get_traced_memory()[0]
+        dicts = [jsoncodec.loads(item) for item in payloads]
+        dict_bytes = tracemalloc.get_traced_memory()[0] - baseline
+        records = [WorldRecord.from_dict(world) for world in dicts]
+        del dicts
+        record_bytes = tracemalloc.get_traced_memory()[0] - baseline
+    finally:
+        tracemalloc.stop()
+    assert len(records) == 50_000
+    assert record_bytes < dict_bytes * 0.7
+
+
+def test_store_sync_result_rolls_back_partial_writes(monkeypatch):
+    repo_root = _make_case_dir("service_sync_unit_of_work") / "repo"
+    service = WorldInfoService(repo_root=repo_root, app_root=repo_root / "world_info_web")
+
+    def broken_insert_run_queries(conn, **kwargs):
+        raise RuntimeError("query log unavailable")
+
+    monkeypatch.setattr(service.storage, "_insert_run_queries", broken_insert_run_queries)
+    worlds = [{"id": "wrld_uow", "name": "Atomic", "visits": 10, "favorites": 1}]
+    with pytest.raises(RuntimeError):
+        service._store_sync_result(
+            source_key="job:uow",
+            job_key="uow",
+            trigger_type="manual",
+            query_label="uow",
+            worlds=worlds,
+            query_batches=[{"kind": "keyword", "value": "atomic", "worlds": worlds}],
+        )
+
+    assert service.storage.load_latest_worlds("job:uow") == []
+    runs = service.storage.list_runs(job_key="uow")
+    assert [run["status"] for run in runs] == ["failed"]
+    assert runs[0]["error_text"] == "query log unavailable"
+
+    monkeypatch.undo()
+    service._store_sync_result(
+        source_key="job:uow",
+        job_key="uow",
+        trigger_type="manual",
+        query_label="uow",
+        worlds=worlds,
+    )
+    assert [world["id"] for world in service.storage.load_latest_worlds("job:uow")] == ["wrld_uow"]
+    assert service.get_storage_diagnostics()["transactions"]["count"] >= 2
+
+
+def test_store_sync_result_commits_summary_and_events_with_the_run(monkeypatch):
+    repo_root = _make_case_dir("service_sync_summary_events") / "repo"
+    service = WorldInfoService(repo_root=repo_root, app_root=repo_root / "world_info_web")
+
+    def broken_upsert_world_events(conn, events):
+        raise RuntimeError("event log unavailable")
+
+    monkeypatch.setattr(service.storage, "_upsert_world_events", broken_upsert_world_events)
+    published = dt.datetime.now(dt.timezone.utc).isoformat()
+    worlds = [
+        {"id": "wrld_events", "name": "Eventful", "visits": 10, "favorites": 1, "publicationDate": published}
+    ]
+    with pytest.raises(RuntimeError):
+        service._store_sync_result(
+            source_key="job:events",
+            job_key="events",
+            trigger_type="manual",
+            query_label="events",
+            worlds=worlds,
+        )
+
+    assert service.storage.load_latest_worlds("job:events") == []
+    runs = service.storage.list_runs(job_key="events")
+    assert [run["status"] for run in runs] == ["failed"]
+    with service.storage._connect() as conn:
+        assert conn.execute("SELECT COUNT(*) FROM run_summaries").fetchone()[0] == 0
+
+    monkeypatch.undo()
+    result = service._store_sync_result(
+        source_key="job:events",
+        job_key="events",
+        trigger_type="manual",
+        query_label="events",
+        worlds=worlds,
+    )
+    with service.storage._connect() as conn:
+        summary_runs = [row[0] for row in conn.execute("SELECT run_id FROM run_summaries")]
+    assert summary_runs == [result["run_id"]]
+    assert service.storage.has_world_events()
+
+
 def test_update_world_record_persists_portal_links_property(monkeypatch):
     repo_root = _make_case_dir("service_world_portal_links") / "repo"
     app_root = repo_root / "world_info_web"
@@ -1084,6 +1498,226 @@ def test_topic_source_rule_tracks_same_worlds_as_job_source(monkeypatch):
     assert topic_worlds[0]["topic_matched_by"] == "source:db:job:taiwan"
 
 
+def test_sync_reevaluates_only_written_worlds_for_topics_covering_the_source(monkeypatch):
+    repo_root = _make_case_dir("service_incremental_topics") / "repo"
+    app_root = repo_root / "world_info_web"
+    topics_path = app_root / "config" / "topics.json"
+    _write_json(
+        topics_path,
+        {
+            "alpha": {"label": "Alpha", "rules": [{"type": "source", "value": "db:job:alpha"}]},
+            "beta": {"label": "Beta", "rules": [{"type": "source", "value": "job:beta"}]},
+            "popular": {"label": "Popular", "rules": [{"type": "visits_min", "value": "100"}]},
+        },
+    )
+    service = WorldInfoService(repo_root=repo_root, app_root=app_root, topics_path=topics_path)
+
+    def sync(source_key: str, worlds: list[dict]) -> None:
+        service._store_sync_result(
+            source_key=source_key,
+            job_key=source_key.removeprefix("job:"),
+            trigger_type="manual",
+            query_label=source_key,
+            worlds=worlds,
+        )
+
+    sync("job:alpha", [{"id": "wrld_a1", "name": "A1", "visits": 150}, {"id": "wrld_a2", "name": "A2", "visits": 20}])
+    sync("job:beta", [{"id": "wrld_b1", "name": "B1", "visits": 300}])
+
+    def members(topic_key: str) -> dict[str, str]:
+        return {row["world_id"]: row["matched_by"] for row in service.storage.list_topic_memberships(topic_key)}
+
+    assert members("alpha") == {"wrld_a1": "source:db:job:alpha", "wrld_a2": "source:db:job:alpha"}
+    assert members("beta") == {"wrld_b1": "source:job:beta"}
+    assert members("popular") == {"wrld_a1": "visits_min:100", "wrld_b1": "visits_min:100"}
+
+    calls = []
+    original = service.storage.apply_topic_memberships
+    monkeypatch.setattr(
+        service.storage,
+        "apply_topic_memberships",
+        lambda topic_key, memberships, *, world_ids=None: calls.append((topic_key, world_ids))
+        or original(topic_key, memberships, world_ids=world_ids),
+    )
+    sync("job:alpha", [{"id": "wrld_a1", "name": "A1", "visits": 90}, {"id": "wrld_a3", "name": "A3", "visits": 500}])
+
+    assert sorted(calls) == [("alpha", {"wrld_a1", "wrld_a3"}), ("popular", {"wrld_a1", "wrld_a3"})]
+    incremental = {topic_key: members(topic_key) for topic_key in ("alpha", "beta", "popular")}
+    assert incremental["popular"] == {"wrld_a3": "visits_min:100", "wrld_b1": "visits_min:100"}
+
+    rebuilt = service.rebuild_topic_memberships()
+    assert rebuilt["topics"] == {key: {"upserted": 0, "deleted": 0} for key in ("alpha", "beta", "popular")}
+    assert {topic_key: members(topic_key) for topic_key in ("alpha", "beta", "popular")} == incremental
+
+
+def test_sync_refreshes_run_in_background_and_insights_serve_stale_payload():
+    import threading
+
+    repo_root = _make_case_dir("service_background_refresh") / "repo"
+    service = WorldInfoService(repo_root=repo_root, app_root=repo_root / "world_info_web")
+
+    def sync(worlds: list[dict]) -> None:
+        service._store_sync_result(
+            source_key="job:bg",
+            job_key="bg",
+            trigger_type="manual",
+            query_label="bg",
+            worlds=worlds,
+        )
+
+    sync([{"id": "wrld_bg1", "name": "First", "visits": 10, "favorites": 1}])
+    assert service.load_collection_insights(source="db:all")["summary"]["world_count"] == 1
+    assert service.storage.list_stale_analysis_scopes() == []
+
+    gate = threading.Event()
+    service.refresh_queue.start()
+    try:
+        service.refresh_queue.submit("gate", gate.wait)
+        sync([{"id": "wrld_bg2", "name": "Second", "visits": 20, "favorites": 2}])
+        sync([{"id": "wrld_bg3", "name": "Third", "visits": 30, "favorites": 3}])
+
+        stats = service.refresh_queue.stats()
+        assert stats["coalesced"] == 2
+        assert len(stats["pending"]) == 2
+        assert {item["scope_key"] for item in service.storage.list_stale_analysis_scopes()} == {"db:all", "db:job:bg"}
+        assert service.load_collection_insights(source="db:all")["summary"]["world_count"] == 1
+        data_version = service.storage.data_version()
+        response_version = service.response_version()
+
+        gate.set()
+        assert service.refresh_queue.wait_idle(timeout=30)
+    finally:
+        service.refresh_queue.stop(timeout=5)
+
+    assert service.storage.list_stale_analysis_scopes() == []
+    assert service.load_collection_insights(source="db:all")["summary"]["world_count"] == 3
+    assert {world["id"] for world in service.load_worlds("db:job:bg")} == {"wrld_bg1", "wrld_bg2", "wrld_bg3"}
+    # The rebuild landed without a new write, but validators must still change.
+    assert service.storage.data_version() == data_version
+    assert service.response_version() != response_version
+
+    # A write after a rebuild started keeps the payload it produces stale.
+    storage = service.storage
+    payload = storage.get_analysis_cache("db:all")["payload"]
+    storage.mark_analysis_stale(["db:all"], "2030-01-01T00:00:00+00:00")
+    storage.mark_analysis_stale(["db:all"], "2030-01-01T00:00:03+00:00")
+    storage.upsert_analysis_cache(
+        scope_key="db:all", scope_type="source", updated_at="2030-01-01T00:00:02+00:00", payload=payload
+    )
+    assert storage.get_analysis_cache_meta("db:all")["stale_since"] == "2030-01-01T00:00:03+00:00"
+    storage.upsert_analysis_cache(
+        scope_key="db:all", scope_type="source", updated_at="2030-01-01T00:00:04+00:00", payload=payload
+    )
+    assert storage.get_analysis_cache_meta("db:all")["stale_since"] is None
+
+
+def test_analysis_cache_covers_topics_and_tracks_scopes_a_sync_invalidates(monkeypatch):
+    repo_root = _make_case_dir("service_analysis_scopes") / "repo"
+    app_root = repo_root / "world_info_web"
+    topics_path = app_root / "config" / "topics.json"
+    _write_json(
+        topics_path,
+        {
+            "beta": {"label": "Beta", "rules": [{"type": "source", "value": "job:beta"}]},
+            "popular": {"label": "Popular", "rules": [{"type": "visits_min", "value": "100"}]},
+        },
+    )
+    service = WorldInfoService(repo_root=repo_root, app_root=app_root, topics_path=topics_path)
+
+    def sync(source_key: str, worlds: list[dict]) -> None:
+        service._store_sync_result(
+            source_key=source_key,
+            job_key=source_key.removeprefix("job:"),
+            trigger_type="manual",
+            query_label=source_key,
+            worlds=worlds,
+        )
+
+    sync("job:alpha", [{"id": "wrld_a1", "name": "A1", "visits": 150, "favorites": 10}])
+    sync("job:beta", [{"id": "wrld_b1", "name": "B1", "visits": 30, "favorites": 3}])
+    assert service.load_collection_insights(topic_key="popular")["summary"]["world_count"] == 1
+    assert service.load_collection_insights(topic_key="beta")["summary"]["world_count"] == 1
+    assert service.storage.get_analysis_cache("topic:popular")["scope_type"] == "topic"
+    assert service.storage.get_analysis_cache("db:job:alpha")["scope_type"] == "job"
+
+    monkeypatch.setattr(
+        service,
+        "load_topic_worlds",
+        lambda *args, **kwargs: (_ for _ in ()).throw(AssertionError("topic insights should be cached")),
+    )
+    assert service.load_collection_insights(topic_key="popular", limit=5)["summary"]["world_count"] == 1
+    monkeypatch.undo()
+
+    refreshed = []
+    original = service.refresh_analysis_cache
+    monkeypatch.setattr(
+        service,
+        "refresh_analysis_cache",
+        lambda scope_key, **kwargs: refreshed.append(scope_key) or original(scope_key, **kwargs),
+    )
+    sync("job:alpha", [{"id": "wrld_a2", "name": "A2", "visits": 500, "favorites": 50}])
+    assert refreshed == ["db:job:alpha", "db:all", "topic:popular"]
+    assert service.storage.get_analysis_cache("topic:popular")["payload"]["summary"]["world_count"] == 2
+    monkeypatch.undo()
+
+    service.storage.mark_analysis_stale(service.storage.list_analysis_scope_keys(), "2000-01-01T00:00:00+00:00")
+    result = service.refresh_stale_analysis(workers=2)
+    assert result["workers"] == 2
+    assert result["failed"] == {}
+    assert result["refreshed"] == ["db:all", "db:job:alpha", "db:job:beta", "topic:beta", "topic:popular"]
+    assert service.storage.list_stale_analysis_scopes() == []
+
+    service.delete_topic("beta")
+    assert service.storage.get_analysis_cache("topic:beta") is None
+
+
+def test_world_edit_delete_and_blacklist_invalidate_cached_insights(monkeypatch):
+    repo_root = _make_case_dir("service_analysis_world_writes") / "repo"
+    app_root = repo_root / "world_info_web"
+    jobs_path = app_root / "config" / "sync_jobs.json"
+    topics_path = app_root / "config" / "topics.json"
+    _write_json(
+        jobs_path,
+        {
+            "taiwan": {
+                "label": "Taiwan Sync",
+                "type": "keywords",
+                "source_key": "job:taiwan",
+                "keywords": ["Taiwan"],
+                "blacklist_file": "world_info/blacklist_taiwan.txt",
+                "limit_per_keyword": 20,
+            }
+        },
+    )
+    _write_json(topics_path, {"popular": {"label": "Popular", "rules": [{"type": "visits_min", "value": "100"}]}})
+    monkeypatch.setattr(
+        service_module,
+        "fetch_worlds",
+        lambda **kwargs: [
+            {"id": f"wrld_{index}", "name": f"World {index}", "visits": 200, "favorites": 5}
+            for index in range(3)
+        ],
+    )
+    monkeypatch.setattr(service_module, "enrich_visits", lambda worlds, headers=None, delay=0.0: worlds)
+    service = WorldInfoService(repo_root=repo_root, app_root=app_root, jobs_path=jobs_path, topics_path=topics_path)
+    service.run_job("taiwan")
+
+    def counts() -> tuple[int, int]:
+        return (
+            service.load_collection_insights(topic_key="popular")["summary"]["world_count"],
+            service.load_collection_insights(source="db:job:taiwan")["summary"]["world_count"],
+        )
+
+    assert counts() == (3, 3)
+    service.update_world_record(source="db:job:taiwan", world_id="wrld_0", changes={"visits": 5})
+    assert counts() == (2, 3)
+    service.delete_world_record(source="db:job:taiwan", world_id="wrld_1")
+    assert counts() == (1, 2)
+    service.add_job_blacklist_entry(job_key="taiwan", world_id="wrld_2")
+    assert counts() == (0, 1)
+    assert service.storage.list_stale_analysis_scopes() == []
+
+
 def test_view_topic_recent_updated_matches_db_all(monkeypatch):
     repo_root = _make_case_dir("service_recent_updated_topic") / "repo"
     app_root = repo_root / "world_info_web"
@@ -1181,6 +1815,94 @@ def test_world_matches_rule_can_compute_favorite_rate_from_world_values():
     assert service._world_matches_rule(world, "favorite_rate_min", "11") is False
 
 
+def test_compiled_topic_rules_match_per_rule_evaluation(monkeypatch):
+    from world_info_web.backend import automaton as automaton_module
+    from world_info_web.backend.records import WorldRecord
+
+    service = object.__new__(WorldInfoService)
+    now = dt.datetime.now(dt.timezone.utc)
+    worlds = [
+        {
+            "id": "wrld_cjk",
+            "name": "台灣夜市 Night Market",
+            "author_id": "usr_a",
+            "author_name": "Alice",
+            "source": "db:taiwan",
+            "tags": ["system_approved", "author_tag_taiwan"],
+            "visits": 500,
+            "favorites": 40,
+            "publication_date": (now - dt.timedelta(days=3)).isoformat(),
+        },
+        {
+            "id": "wrld_upper",
+            "name": "HORROR House",
+            "author_id": "usr_b",
+            "author_name": "Bob",
+            "source": "taiwan",
+            "tags": ["author_tag_horror"],
+            "visits": "1,200",
+            "favorites": 12,
+            "heat": 7,
+            "metrics": {"favorite_rate": 22.5},
+            "updated_at": (now - dt.timedelta(days=40)).isoformat(),
+        },
+        {
+            "id": "wrld_plain",
+            "name": "Quiet Lake",
+            "author_id": "usr_c",
+            "author_name": "Carol horrorfan",
+            "source": "db:taiwan",
+            "tags": [],
+            "visits": 0,
+            "labs_publication_date": (now - dt.timedelta(days=20)).isoformat(),
+            "updated_at": (now - dt.timedelta(days=1)).isoformat(),
+        },
+        {"id": "wrld_empty"},
+    ]
+    rules_by_topic = {
+        "keywords": [
+            {"rule_type": "keyword", "rule_value": "horror"},
+            {"rule_type": "keyword", "rule_value": "台灣"},
+            {"rule_type": "keyword", "rule_value": "usr_"},
+        ],
+        "mixed": [
+            {"rule_type": "visits_min", "rule_value": "1000"},
+            {"rule_type": "tag", "rule_value": "system_approved"},
+            {"rule_type": "source", "rule_value": "taiwan"},
+            {"rule_type": "author_id", "rule_value": "usr_c"},
+        ],
+        "quality": [
+            {"rule_type": "favorite_rate_min", "rule_value": "8"},
+            {"rule_type": "favorite_rate_max", "rule_value": "0"},
+            {"rule_type": "popularity_max", "rule_value": "0"},
+        ],
+        "recent": [
+            {"rule_type": "published_within_days", "rule_value": "7"},
+            {"rule_type": "updated_within_days", "rule_value": "0"},
+            {"rule_type": "updated_within_days", "rule_value": "30"},
+            {"rule_type": "world_id", "rule_value": "wrld_empty"},
+        ],
+        "empty": [],
+    }
+
+    def expected(world, rules):
+        for rule in rules:
+            if service._world_matches_rule(world, rule["rule_type"], rule["rule_value"]):
+                return f"{rule['rule_type']}:{rule['rule_value']}"
+        return None
+
+    wanted = {topic_key: [expected(world, rules) for world in worlds] for topic_key, rules in rules_by_topic.items()}
+    assert wanted["keywords"] == ["keyword:台灣", "keyword:horror", "keyword:horror", None]
+    assert wanted["mixed"] == ["tag:system_approved", "visits_min:1000", "source:taiwan", None]
+
+    records = [WorldRecord.from_dict(world) for world in worlds]
+    assert service._evaluate_topic_rules(service._compile_topic_rules(rules_by_topic), worlds) == wanted
+    assert service._evaluate_topic_rules(service._compile_topic_rules(rules_by_topic), records) == wanted
+    monkeypatch.setattr(service_module, "np", None)
+    monkeypatch.setattr(automaton_module, "ahocorasick", None)
+    assert service._evaluate_topic_rules(service._compile_topic_rules(rules_by_topic), worlds) == wanted
+
+
 def test_load_collection_insights_exposes_monitor_analysis_without_storage():
     service = object.__new__(WorldInfoService)
     now = dt.datetime.now(dt.timezone.utc)
@@ -1605,6 +2327,440 @@ def test_job_diagnostics_include_source_diff(monkeypatch):
     assert any(world["id"] == "wrld_keep" for world in item["source_diff"]["changed_worlds"])
 
 
+def test_job_diagnostics_read_run_summaries_without_decoding_runs(monkeypatch):
+    repo_root = _make_case_dir("service_job_diagnostics_batched") / "repo"
+    app_root = repo_root / "world_info_web"
+    jobs_path = app_root / "config" / "sync_jobs.json"
+    _write_json(
+        jobs_path,
+        {
+            "racing": {
+                "label": "Racing sync",
+                "type": "keywords",
+                "source_key": "job:racing",
+                "keywords": ["Racing"],
+                "limit_per_keyword": 20,
+            },
+            "taiwan": {
+                "label": "Zh keyword sync",
+                "type": "keywords",
+                "source_key": "job:taiwan",
+                "keywords": ["Taiwan"],
+                "limit_per_keyword": 20,
+            },
+        },
+    )
+    batches = {
+        "Taiwan": [
+            [
+                {"id": "wrld_keep", "name": "Keep", "authorId": "usr_a", "visits": 100},
+                {"id": "wrld_drop", "name": "Drop", "authorId": "usr_a", "visits": 80},
+            ],
+            [
+                {"id": "wrld_keep", "name": "Keep", "authorId": "usr_a", "visits": 140},
+                {"id": "wrld_new", "name": "New", "authorId": "usr_b", "visits": 60},
+                {"id": "wrld_more", "name": "More", "authorId": "usr_b", "visits": 30},
+            ],
+        ],
+        "Racing": [[{"id": "wrld_race", "name": "Race", "authorId": "usr_c", "visits": 10}]],
+    }
+    monkeypatch.setattr(service_module, "fetch_worlds", lambda *, keyword=None, **kwargs: batches[keyword].pop(0))
+    monkeypatch.setattr(service_module, "enrich_visits", lambda worlds, headers=None, delay=0.0: worlds)
+
+    service = WorldInfoService(repo_root=repo_root, app_root=app_root, jobs_path=jobs_path)
+    service.run_job("taiwan")
+    service.run_job("racing")
+    service.run_job("taiwan")
+    expected_diff = service.get_job_source_diff("taiwan")
+
+    def fail(*args, **kwargs):
+        raise AssertionError("diagnostics must not decode runs or diff per job")
+
+    monkeypatch.setattr(service.storage, "load_run_worlds", fail)
+    monkeypatch.setattr(service, "get_job_source_diff", fail)
+    monkeypatch.setattr(service.storage, "diff_runs", fail)
+
+    items = {item["job_key"]: item for item in service.list_job_diagnostics()}
+
+    assert (items["taiwan"]["current_world_count"], items["taiwan"]["current_creator_count"]) == (3, 2)
+    assert (items["racing"]["current_world_count"], items["racing"]["current_creator_count"]) == (1, 1)
+    assert items["taiwan"]["source_diff"] == expected_diff
+    assert items["racing"]["source_diff"]["status"] == "insufficient_history"
+    assert items["taiwan"]["latest_run"]["label"] == "Zh keyword sync"
+
+    # Databases from before run summaries are backfilled on first read.
+    monkeypatch.undo()
+    with service.storage._connect() as conn:
+        conn.execute("DELETE FROM run_summaries")
+    backfilled = {item["job_key"]: item for item in service.list_job_diagnostics()}
+    assert backfilled["taiwan"]["source_diff"] == expected_diff
+    assert backfilled["taiwan"]["current_creator_count"] == 2
+
+
+def test_unchanged_worlds_are_written_as_seen_markers(monkeypatch):
+    repo_root = _make_case_dir("service_change_only_snapshots") / "repo"
+    app_root = repo_root / "world_info_web"
+    jobs_path = app_root / "config" / "sync_jobs.json"
+    _write_json(
+        jobs_path,
+        {
+            "taiwan": {
+                "label": "Zh keyword sync",
+                "type": "keywords",
+                "source_key": "job:taiwan",
+                "keywords": ["Taiwan"],
+                "limit_per_keyword": 20,
+            }
+        },
+    )
+    batches = [
+        [{"id": "wrld_same", "name": "Same", "visits": 100}, {"id": "wrld_move", "name": "Move", "visits": 50}],
+        [{"id": "wrld_same", "name": "Same", "visits": 100}, {"id": "wrld_move", "name": "Move", "visits": 75}],
+        [{"id": "wrld_same", "name": "Same", "visits": 100}],
+    ]
+    monkeypatch.setattr(service_module, "fetch_worlds", lambda **kwargs: batches.pop(0))
+    monkeypatch.setattr(service_module, "enrich_visits", lambda worlds, headers=None, delay=0.0: worlds)
+
+    service = WorldInfoService(repo_root=repo_root, app_root=app_root, jobs_path=jobs_path)
+    run_ids = [service.run_job("taiwan")["run_id"] for _ in range(3)]
+
+    with service.storage._connect() as conn:
+        rows = conn.execute(
+            "SELECT run_id, world_id, raw_json, payload_snapshot_id FROM world_snapshots ORDER BY id"
+        ).fetchall()
+    markers = [(row["run_id"], row["world_id"]) for row in rows if row["payload_snapshot_id"] is not None]
+    assert markers == [(run_ids[1], "wrld_same"), (run_ids[2], "wrld_same")]
+    assert all(row["raw_json"] == "" for row in rows if row["payload_snapshot_id"] is not None)
+
+    assert [world["id"] for world in service.storage.load_run_worlds(run_ids[2])] == ["wrld_same"]
+    points = service.storage.load_history_points("wrld_same", source_key="job:taiwan")["wrld_same"]
+    assert [item["visits"] for item in points] == [100, 100, 100]
+    diff = service.get_job_source_diff("taiwan")
+    assert diff["removed_count"] == 1
+    assert diff["changed_count"] == 0
+
+    service.storage.delete_runs_before("job:taiwan", {run_ids[2]})
+    kept = service.storage.load_run_worlds(run_ids[2])
+    assert [(world["id"], world["name"]) for world in kept] == [("wrld_same", "Same")]
+
+
+def test_world_search_index_matches_cjk_description_and_tracks_latest_state():
+    repo_root = _make_case_dir("service_world_search") / "repo"
+    app_root = repo_root / "world_info_web"
+    service = WorldInfoService(repo_root=repo_root, app_root=app_root)
+    storage = service.storage
+    assert storage.search_index_enabled
+
+    def sync(fetched_at: str, worlds: list[dict]) -> None:
+        run_id = storage.create_run(
+            source_key="job:taiwan",
+            job_key="taiwan",
+            trigger_type="manual",
+            query_label="Taiwan",
+            started_at=fetched_at,
+        )
+        storage.insert_world_snapshots(run_id=run_id, source_key="job:taiwan", fetched_at=fetched_at, worlds=worlds)
+
+    sync(
+        "2026-03-01T00:00:00+00:00",
+        [
+            {"id": "wrld_tw", "name": "夜市 in 台灣南部", "author_name": "Alice", "tags": ["author_tag_food"]},
+            {"id": "wrld_ks", "name": "Harbor", "author_name": "Bob", "description": "港口 高雄市 夜景"},
+            {"id": "wrld_other", "name": "Plain_Room", "author_name": "Carol"},
+            {"id": "wrld_eu", "name": "Éclair Straße", "author_name": "Dora"},
+        ],
+    )
+
+    def ids(query: str) -> list[str]:
+        return sorted(world["id"] for world in service.load_worlds("db:job:taiwan", query=query))
+
+    assert ids("台灣") == ["wrld_tw"]
+    assert ids("高雄市") == ["wrld_ks"]
+    assert ids("harb") == ["wrld_ks"]
+    assert ids("food") == ["wrld_tw"]
+    assert ids("n_") == ["wrld_other"]
+    assert ids("WRLD_O") == ["wrld_other"]
+    assert ids("éc") == ["wrld_eu"]
+    assert ids("SS") == ["wrld_eu"]
+    assert ids("STRASSE") == ["wrld_eu"]
+    assert ids("ÉCLAIR") == ["wrld_eu"]
+
+    sync("2026-03-02T00:00:00+00:00", [{"id": "wrld_ks", "name": "Lighthouse", "author_name": "Bob"}])
+    assert ids("harb") == []
+    assert ids("light") == ["wrld_ks"]
+    assert ids("高雄市") == []
+
+    storage.delete_world_snapshots("job:taiwan", "wrld_tw")
+    assert ids("台灣") == []
+    storage.rebuild_world_latest("job:taiwan")
+    assert ids("light") == ["wrld_ks"]
+    assert storage.search_world_ids("bob", columns=("author_name",)) == {"wrld_ks"}
+    assert storage.search_world_ids("bob", columns=("name",)) == set()
+
+
+def test_world_search_index_migrates_to_stable_keys_and_survives_vacuum():
+    db_path = _make_case_dir("storage_search_keys") / "world_info.sqlite3"
+    storage = WorldInfoStorage(db_path)
+    run_id = storage.create_run(
+        source_key="job:keys",
+        job_key="keys",
+        trigger_type="manual",
+        query_label="keys",
+        started_at="2026-03-01T00:00:00+00:00",
+    )
+    storage.insert_world_snapshots(
+        run_id=run_id,
+        source_key="job:keys",
+        fetched_at="2026-03-01T00:00:00+00:00",
+        worlds=[{"id": f"wrld_{index}", "name": f"Room {index}", "tags": []} for index in range(6)]
+        + [{"id": "wrld_strasse", "name": "Große Straße", "tags": []}],
+    )
+    # Rewind to the old layout: world_latest keyed on its implicit rowid, indexed by
+    # an external-content search table.
+    with storage._connect() as conn:
+        columns = [row["name"] for row in conn.execute("PRAGMA table_info(world_latest)") if row["name"] != "id"]
+        conn.executescript(
+            f"""
+            DROP TABLE world_search;
+            CREATE TABLE world_latest_old AS SELECT {", ".join(columns)} FROM world_latest;
+            DROP TABLE world_latest;
+            ALTER TABLE world_latest_old RENAME TO world_latest;
+            CREATE VIRTUAL TABLE world_search USING fts5(
+                world_id, name, author_id, author_name, tags_json, description,
+                content='world_latest', content_rowid='rowid', tokenize='trigram'
+            );
+            INSERT INTO world_search(world_search) VALUES ('rebuild');
+            """
+        )
+    storage.close_connection()
+
+    migrated = WorldInfoStorage(db_path)
+    with migrated._connect() as conn:
+        assert "id" in {row["name"] for row in conn.execute("PRAGMA table_info(world_latest)")}
+    assert migrated.search_world_ids("STRASSE") == {"wrld_strasse"}
+
+    for index in range(5):
+        migrated.delete_world_snapshots("job:keys", f"wrld_{index}")
+    with migrated._connect() as conn:
+        conn.execute("VACUUM")
+    assert migrated.search_world_ids("straße") == {"wrld_strasse"}
+    assert migrated.search_world_ids("room") == {"wrld_5"}
+    assert [world["id"] for world in migrated.load_latest_worlds("job:keys", search="ROOM 5")] == ["wrld_5"]
+
+
+def test_load_worlds_catalog_cache_hits_until_data_changes():
+    repo_root = _make_case_dir("service_catalog_cache") / "repo"
+    app_root = repo_root / "world_info_web"
+    service = WorldInfoService(repo_root=repo_root, app_root=app_root)
+    storage = service.storage
+
+    def sync(fetched_at: str, worlds: list[dict]) -> None:
+        run_id = storage.create_run(
+            source_key="import:catalog",
+            job_key=None,
+            trigger_type="manual",
+            query_label="catalog",
+            started_at=fetched_at,
+        )
+        storage.insert_world_snapshots(run_id=run_id, source_key="import:catalog", fetched_at=fetched_at, worlds=worlds)
+
+    sync("2026-03-01T00:00:00+00:00", [{"id": "wrld_a", "name": "A", "visits": 10}])
+    first = service.load_worlds("db:import:catalog")
+    first[0]["name"] = "mutated by caller"
+    second = service.load_worlds("db:import:catalog", sort="name", direction="asc")
+    stats = service.get_storage_diagnostics()["catalog_cache"]
+    assert second[0]["name"] == "A"
+    assert stats["hits"] >= 2
+    assert stats["misses"] == 2
+
+    sync("2026-03-02T00:00:00+00:00", [{"id": "wrld_b", "name": "B", "visits": 20}])
+    assert [world["id"] for world in service.load_worlds("db:import:catalog")] == ["wrld_b", "wrld_a"]
+
+    service.update_world_record(source="db:import:catalog", world_id="wrld_a", changes={"portal_links": ["wrld_b"]})
+    edited = {world["id"]: world for world in service.load_worlds("db:import:catalog")}
+    assert edited["wrld_a"]["portal_links"] == ["wrld_b"]
+
+    storage.delete_world_snapshots("import:catalog", "wrld_b")
+    assert [world["id"] for world in service.load_worlds("db:import:catalog")] == ["wrld_a"]
+    storage.purge_source("import:catalog")
+    assert service.load_worlds("db:import:catalog") == []
+    assert service.get_storage_diagnostics()["catalog_cache"]["stale"] >= 4
+
+
+def test_legacy_history_and_config_reads_are_cached_by_file_signature():
+    repo_root = _make_case_dir("service_file_cache") / "repo"
+    app_root = repo_root / "world_info_web"
+    history_path = repo_root / "world_info" / "scraper" / "history.json"
+    _write_json(history_path, {"wrld_old": [{"timestamp": 1700000000, "visits": 10}]})
+    service = WorldInfoService(repo_root=repo_root, app_root=app_root)
+
+    first = service.load_history(source="db:all")
+    first["wrld_old"].append({"timestamp": 1, "visits": 0})
+    second = service.load_history(source="db:all")
+    assert [entry["visits"] for entry in second["wrld_old"]] == [10]
+    stats = service.get_storage_diagnostics()["file_cache"]
+    assert stats["hits"] >= 1
+
+    _write_json(
+        history_path,
+        {"wrld_old": [{"timestamp": 1700000000, "visits": 10}, {"timestamp": 1700086400, "visits": 25}]},
+    )
+    assert [entry["visits"] for entry in service.load_history(source="db:all")["wrld_old"]] == [10, 25]
+    # Only the normalised history is kept; importing reads the raw file uncached.
+    assert service._import_history_batch({}) is not None
+    assert [key for key in service._file_cache._entries if key[0] == str(history_path)] == [(str(history_path), "history")]
+
+    service._update_world_properties("wrld_old", {"portal_links": ["wrld_next"]})
+    assert service._load_world_properties()["wrld_old"]["portal_links"] == ["wrld_next"]
+
+
+def test_compact_snapshots_downsamples_old_history_and_keeps_trend_deltas():
+    repo_root = _make_case_dir("service_compact_snapshots") / "repo"
+    app_root = repo_root / "world_info_web"
+    jobs_path = app_root / "config" / "sync_jobs.json"
+    _write_json(
+        jobs_path,
+        {
+            "taiwan": {
+                "label": "Zh keyword sync",
+                "type": "keywords",
+                "source_key": "job:taiwan",
+                "keywords": ["Taiwan"],
+                "retention": {"full_resolution_days": 10, "daily_days": 60},
+            }
+        },
+    )
+    service = WorldInfoService(repo_root=repo_root, app_root=app_root, jobs_path=jobs_path)
+    storage = service.storage
+    start = dt.datetime(2025, 1, 1, tzinfo=dt.timezone.utc)
+    step_hours = 8
+    for index in range(150 * 24 // step_hours):
+        fetched_at = (start + dt.timedelta(hours=step_hours * index)).isoformat()
+        run_id = storage.create_run(
+            source_key="job:taiwan",
+            job_key="taiwan",
+            trigger_type="manual",
+            query_label="Taiwan",
+            started_at=fetched_at,
+        )
+        storage.insert_run_queries(
+            run_id=run_id,
+            queries=[{"query_kind": "keyword", "query_value": "Taiwan", "hits": [{"world_id": "wrld_long"}]}],
+        )
+        storage.insert_world_snapshots(
+            run_id=run_id,
+            source_key="job:taiwan",
+            fetched_at=fetched_at,
+            worlds=[{"id": "wrld_long", "name": "Long", "visits": 1000 + index * 3, "favorites": index}],
+        )
+
+    def trend() -> dict:
+        points = storage.load_history_points("wrld_long")["wrld_long"]
+        entries = [service._normalise_db_history_entry("wrld_long", item) for item in points]
+        latest = storage.load_latest_worlds("job:taiwan")[0]
+        return service._build_world_trend_metrics(latest, entries)
+
+    before_points = storage.load_history_points("wrld_long")["wrld_long"]
+    before = trend()
+    result = service.compact_snapshots("db:job:taiwan")
+
+    after_points = storage.load_history_points("wrld_long")["wrld_long"]
+    latest_ts = before_points[-1]["ts"]
+    recent = [item["ts"] for item in before_points if item["ts"] >= latest_ts - 30 * 86400]
+    assert [item["ts"] for item in after_points if item["ts"] >= latest_ts - 30 * 86400] == recent
+    daily = [item["ts"] for item in after_points if latest_ts - 60 * 86400 <= item["ts"] < latest_ts - 30 * 86400]
+    assert len({ts // 86400 for ts in daily}) == len(daily)
+    weekly = [item["ts"] for item in after_points if item["ts"] < latest_ts - 60 * 86400]
+    assert len({(ts + 3 * 86400) // 604800 for ts in weekly}) == len(weekly)
+    assert result["snapshots_deleted"] == len(before_points) - len(after_points) > 0
+    assert result["sources"][0]["full_resolution_days"] == 30
+    assert result["sources"][0]["daily_days"] == 60
+
+    after = trend()
+    for key in ("visits_delta_1d", "visits_delta_7d", "visits_delta_30d", "favorites_delta_7d"):
+        assert after[key] == before[key]
+    assert storage.load_latest_worlds("job:taiwan")[0]["visits"] == before_points[-1]["visits"]
+    with storage._connect() as conn:
+        orphaned_hits = conn.execute(
+            "SELECT COUNT(*) FROM run_query_hits WHERE run_query_id NOT IN (SELECT id FROM run_queries)"
+        ).fetchone()[0]
+        orphaned_queries = conn.execute(
+            "SELECT COUNT(*) FROM run_queries WHERE run_id NOT IN (SELECT id FROM sync_runs)"
+        ).fetchone()[0]
+        empty_runs = conn.execute(
+            "SELECT COUNT(*) FROM sync_runs WHERE id NOT IN (SELECT run_id FROM world_snapshots)"
+        ).fetchone()[0]
+        snapshot_count = conn.execute("SELECT COUNT(*) FROM world_snapshots").fetchone()[0]
+        run_count = conn.execute("SELECT COUNT(*) FROM sync_runs").fetchone()[0]
+        hit_count = conn.execute("SELECT COUNT(*) FROM run_query_hits").fetchone()[0]
+    assert (orphaned_hits, orphaned_queries, empty_runs) == (0, 0, 0)
+    assert snapshot_count == run_count == hit_count == len(after_points)
+    # One world per run: each thinned point takes its run, query and hit with it.
+    thinned = len(before_points) - len(after_points)
+    source_result = result["sources"][0]
+    assert source_result["runs_deleted"] == thinned
+    assert source_result["run_queries_deleted"] == thinned
+    assert source_result["run_query_hits_deleted"] == thinned
+
+
+def test_compact_snapshots_keeps_points_around_world_updates():
+    repo_root = _make_case_dir("service_compact_snapshots_updates") / "repo"
+    service = WorldInfoService(repo_root=repo_root, app_root=repo_root / "world_info_web")
+    storage = service.storage
+    start = dt.datetime(2025, 1, 1, tzinfo=dt.timezone.utc)
+    updates = [start + dt.timedelta(days=20, hours=3), start + dt.timedelta(days=50, hours=13)]
+    step_hours = 8
+    for index in range(150 * 24 // step_hours):
+        fetched = start + dt.timedelta(hours=step_hours * index)
+        updated_at = max((value for value in updates if value <= fetched), default=start)
+        run_id = storage.create_run(
+            source_key="job:updates",
+            job_key="updates",
+            trigger_type="manual",
+            query_label="updates",
+            started_at=fetched.isoformat(),
+        )
+        storage.insert_world_snapshots(
+            run_id=run_id,
+            source_key="job:updates",
+            fetched_at=fetched.isoformat(),
+            worlds=[
+                {
+                    "id": "wrld_updates",
+                    "name": "Updates",
+                    "visits": 1000 + index * 3,
+                    "favorites": index,
+                    "updated_at": updated_at.isoformat(),
+                }
+            ],
+        )
+
+    def trend() -> dict:
+        points = storage.load_history_points("wrld_updates")["wrld_updates"]
+        entries = [service._normalise_db_history_entry("wrld_updates", item) for item in points]
+        latest = storage.load_latest_worlds("job:updates")[0]
+        return service._build_world_trend_metrics(latest, entries)
+
+    def first_seen(points: list[dict]) -> list[tuple[int, str]]:
+        return [
+            (item["ts"], item["updated_at"])
+            for previous, item in zip(points, points[1:])
+            if item["updated_at"] != previous["updated_at"]
+        ]
+
+    before = trend()
+    before_first_seen = first_seen(storage.load_history_points("wrld_updates")["wrld_updates"])
+    result = storage.compact_snapshots("job:updates", full_resolution_days=30, daily_days=60)
+
+    after = trend()
+    assert result["snapshots_deleted"] > 0
+    assert before["since_update_visits_delta"] is not None
+    assert after["since_update_visits_delta"] == before["since_update_visits_delta"]
+    assert after["since_update_favorites_delta"] == before["since_update_favorites_delta"]
+    assert len(before_first_seen) == len(updates)
+    assert first_seen(storage.load_history_points("wrld_updates")["wrld_updates"]) == before_first_seen
+
+
 def test_event_feed_includes_spikes_uploads_and_updates(monkeypatch):
     repo_root = _make_case_dir("service_event_feed") / "repo"
     app_root = repo_root / "world_info_web"
@@ -1690,6 +2846,120 @@ def test_event_feed_includes_spikes_uploads_and_updates(monkeypatch):
     assert ("new_upload", "wrld_new") in types_by_world
 
 
+def test_event_feed_is_persisted_per_day_and_paged_by_cursor(monkeypatch):
+    repo_root = _make_case_dir("service_event_feed_persisted") / "repo"
+    app_root = repo_root / "world_info_web"
+    jobs_path = app_root / "config" / "sync_jobs.json"
+    _write_json(
+        jobs_path,
+        {
+            "taiwan": {
+                "label": "Zh keyword sync",
+                "type": "keywords",
+                "source_key": "job:taiwan",
+                "keywords": ["Taiwan"],
+                "limit_per_keyword": 20,
+            }
+        },
+    )
+    now = dt.datetime.now(dt.timezone.utc)
+    visits = {"count": 0}
+
+    def fake_fetch_worlds(*, keyword=None, user_id=None, limit=20, delay=1.0, headers=None):
+        visits["count"] += 1
+        return [
+            {
+                "id": f"wrld_{index}",
+                "name": f"World {index}",
+                "authorId": "usr_author",
+                "authorName": "Author",
+                "visits": 100 * visits["count"],
+                "favorites": 10,
+                "updated_at": (now - dt.timedelta(days=index)).isoformat(),
+                "publicationDate": (now - dt.timedelta(days=index + 1)).isoformat(),
+            }
+            for index in range(3)
+        ]
+
+    monkeypatch.setattr(service_module, "fetch_worlds", fake_fetch_worlds)
+    monkeypatch.setattr(service_module, "enrich_visits", lambda worlds, headers=None, delay=0.0: worlds)
+
+    service = WorldInfoService(repo_root=repo_root, app_root=app_root, jobs_path=jobs_path)
+    service.run_job("taiwan")
+    service.run_job("taiwan")
+    service.run_job("taiwan")
+
+    with service.storage._connect() as conn:
+        rows = conn.execute(
+            "SELECT event_type, world_id, COUNT(*) AS total FROM world_events GROUP BY event_type, world_id"
+        ).fetchall()
+    assert {row["total"] for row in rows} == {1}
+    assert {(row["event_type"], row["world_id"]) for row in rows} >= {
+        ("traffic_spike", "wrld_0"),
+        ("new_upload", "wrld_2"),
+        ("new_update", "wrld_1"),
+    }
+
+    def fail_load_worlds(*args, **kwargs):
+        raise AssertionError("event feed must not reload job worlds")
+
+    monkeypatch.setattr(service, "load_worlds", fail_load_worlds)
+    monkeypatch.setattr(service, "get_job_source_diff", fail_load_worlds)
+
+    full = service.list_event_feed(limit=50, recency_days=7)
+    assert full["next_cursor"] is None
+    assert full["summary"]["total"] == len(full["items"]) == len(rows)
+    assert full["items"][0]["label"] == "Zh keyword sync"
+
+    paged = []
+    cursor = None
+    while True:
+        page = service.list_event_feed(limit=2, recency_days=7, cursor=cursor)
+        paged.extend(item["event_key"] for item in page["items"])
+        cursor = page["next_cursor"]
+        if cursor is None:
+            break
+    assert paged == [item["event_key"] for item in full["items"]]
+
+    spikes = service.list_event_feed(limit=50, recency_days=7, event_types=["traffic_spike"], job_key="taiwan")
+    assert spikes["items"] and {item["type"] for item in spikes["items"]} == {"traffic_spike"}
+    assert spikes["summary"]["total"] == spikes["summary"]["spikes"]
+    severe = service.list_event_feed(limit=50, recency_days=7, min_severity=80)
+    assert all(item["severity"] >= 80 for item in severe["items"])
+    assert service.list_event_feed(limit=50, recency_days=7, job_key="missing")["items"] == []
+    with pytest.raises(ValueError):
+        service.list_event_feed(limit=5, recency_days=7, cursor="not-a-cursor")
+    with pytest.raises(ValueError):
+        service.list_event_feed(limit=5, recency_days=7, event_types=["nope"])
+
+    service.delete_job("taiwan")
+    assert service.list_event_feed(limit=50, recency_days=7)["items"] == []
+
+
+def test_event_feed_keeps_one_event_for_a_world_added_then_rescanned(monkeypatch):
+    repo_root = _make_case_dir("service_event_feed_rescan") / "repo"
+    app_root = repo_root / "world_info_web"
+    jobs_path = app_root / "config" / "sync_jobs.json"
+    _write_json(
+        jobs_path,
+        {"tw": {"label": "Tw", "type": "keywords", "source_key": "job:tw", "keywords": ["Taiwan"]}},
+    )
+    published = (dt.datetime.now(dt.timezone.utc) - dt.timedelta(days=3)).isoformat()
+    base = {"id": "wrld_1", "name": "Base", "authorId": "usr_a", "visits": 10}
+    added = {"id": "wrld_2", "name": "Added", "authorId": "usr_b", "visits": 40, "publicationDate": published}
+    batches = [[base], [base, added], [base, added]]
+    monkeypatch.setattr(service_module, "fetch_worlds", lambda **kwargs: batches.pop(0))
+    monkeypatch.setattr(service_module, "enrich_visits", lambda worlds, headers=None, delay=0.0: worlds)
+
+    service = WorldInfoService(repo_root=repo_root, app_root=app_root, jobs_path=jobs_path)
+    for _ in range(3):
+        service.run_job("tw")
+
+    uploads = service.list_event_feed(limit=50, recency_days=7, event_types=["new_upload"])["items"]
+    assert [item["world_id"] for item in uploads] == ["wrld_2"]
+    assert uploads[0]["summary"].startswith("New in Tw")
+
+
 def test_collection_insights_include_growth_authors_and_performance(monkeypatch):
     repo_root = _make_case_dir("service_collection_insights") / "repo"
     app_root = repo_root / "world_info_web"
@@ -2170,3 +3440,222 @@ def test_import_legacy_data_moves_snapshots_history_and_daily_stats():
     assert any(item["source"] == "db:import:legacy-taiwan" for item in daily_stats)
     assert any(item["key"] == "db:import:legacy-raw" for item in sources)
     assert all(item["key"] != "db:history:legacy" for item in sources)
+
+
+def test_batch_trend_metrics_match_per_world_engine():
+    if service_module.np is None:
+        pytest.skip("numpy is not installed")
+    repo_root = _make_case_dir("service_trend_batch") / "repo"
+    service = WorldInfoService(repo_root=repo_root, app_root=repo_root / "world_info_web")
+    now = dt.datetime(2026, 3, 20, tzinfo=dt.timezone.utc)
+    base = int(dt.datetime(2026, 3, 19, tzinfo=dt.timezone.utc).timestamp())
+    day = 86400
+    worlds = [
+        {
+            "id": "wrld_steady",
+            "visits": 900,
+            "favorites": 90,
+            "updated_at": "2026-03-05T00:00:00Z",
+            "publication_date": "2026-02-01T00:00:00Z",
+        },
+        {"id": "wrld_gaps", "visits": "1,200", "favorites": None, "updated_at": "2026-03-18T00:00:00Z"},
+        {"id": "wrld_no_history", "visits": 5},
+        {"name": "missing id"},
+    ]
+    history = {
+        "wrld_steady": [
+            {"timestamp": base - offset * day, "visits": 900 - offset * 20, "favorites": 90 - offset, "updated_at": updated}
+            for offset, updated in [
+                (0, "2026-03-05T00:00:00Z"),
+                (31, "2025-06-01T00:00:00Z"),
+                (14, "2026-03-05T00:00:00Z"),
+                (7, "2026-03-05T00:00:00Z"),
+                (1, "2026-03-05T00:00:00Z"),
+                (20, "2025-06-01T00:00:00Z"),
+            ]
+        ],
+        "wrld_gaps": [
+            {"timestamp": base - 8 * day, "visits": None, "favorites": "7"},
+            {"timestamp": base - 8 * day, "visits": "1,000", "favorites": 8},
+            {"timestamp": None, "visits": 5},
+            {"timestamp": base, "visits": 1200, "favorites": 9, "updated_at": "2026-03-18T00:00:00Z"},
+        ],
+    }
+
+    batch = service._build_trend_metrics_batch(worlds, history, now=now)
+    expected = [
+        service._build_world_trend_metrics(world, history.get(world["id"], []), now=now) if world.get("id") else {}
+        for world in worlds
+    ]
+
+    assert batch == expected
+    steady = batch[0]
+    assert steady["visits_delta_1d"] == 20
+    assert steady["visits_delta_7d"] == 140
+    assert steady["visits_delta_prev_7d"] == 140
+    assert steady["visits_delta_30d"] == 620
+    assert steady["update_gap_days"] == 277
+    assert batch[1]["visits_delta_7d"] == 200
+    assert batch[1]["favorites_delta_7d"] == 1
+    assert batch[2]["visits_delta_7d"] is None
+    assert batch[3] == {}
+
+    # Deltas, ratios and scores are computed column-wise; spot-check parity on a
+    # wider random scope (future and missing publication dates, missing heat).
+    rng = random.Random(13)
+    scope = []
+    scope_history = {}
+    for index in range(200):
+        world_id = f"wrld_random_{index}"
+        visits = rng.randint(0, 3000)
+        entries = []
+        for _ in range(rng.randint(0, 40)):
+            visits += rng.randint(0, 60)
+            entries.append(
+                {
+                    "timestamp": base - rng.randint(0, 40) * day - rng.randint(0, 86399),
+                    "visits": visits,
+                    "favorites": visits // rng.randint(3, 30),
+                    "updated_at": rng.choice(["2026-03-10T00:00:00Z", "2025-01-01T00:00:00Z", None]),
+                }
+            )
+        scope_history[world_id] = entries
+        published = now - dt.timedelta(days=rng.randint(-2, 90), seconds=rng.randint(0, 86399))
+        scope.append(
+            {
+                "id": world_id,
+                "visits": visits,
+                "favorites": visits // 10,
+                "heat": rng.choice([None, 0, 3, 7]),
+                "popularity": rng.randint(0, 9),
+                "updated_at": rng.choice(["2026-03-10T00:00:00Z", "2026-03-19T12:00:00Z", None]),
+                "publication_date": rng.choice([published.isoformat(), None]),
+            }
+        )
+    assert service._build_trend_metrics_batch(scope, scope_history, now=now) == [
+        service._build_world_trend_metrics(world, scope_history[world["id"]], now=now) for world in scope
+    ]
+
+    # Flattened arrays are cached against the data version they were built for.
+    arrays = service._trend_history_arrays(history, ("db:test", (1,)))
+    assert service._trend_history_arrays(history, ("db:test", (1,))) is arrays
+    assert service._trend_history_arrays(history, ("db:test", (2,))) is not arrays
+
+
+def test_stored_trend_order_matches_python_sort_ties_and_missing_rows():
+    repo_root = _make_case_dir("service_trend_order_parity") / "repo"
+    service = WorldInfoService(repo_root=repo_root, app_root=repo_root / "world_info_web")
+    storage = service.storage
+    now = dt.datetime.now(dt.timezone.utc)
+    published = (now - dt.timedelta(days=200)).isoformat()
+    # Tied worlds are stored out of id order so a world_id tie-break would show.
+    counts = {"wrld_t3": 100, "wrld_t1": 100, "wrld_t2": 100, "wrld_up": 100, "wrld_zero": 0}
+    for days_ago, bump in ((8, 0), (0, 1)):
+        fetched_at = (now - dt.timedelta(days=days_ago)).isoformat()
+        run_id = storage.create_run(
+            source_key="import:parity",
+            job_key=None,
+            trigger_type="manual",
+            query_label="parity",
+            started_at=fetched_at,
+        )
+        storage.insert_world_snapshots(
+            run_id=run_id,
+            source_key="import:parity",
+            fetched_at=fetched_at,
+            worlds=[
+                {
+                    "id": world_id,
+                    "name": world_id,
+                    "visits": count + (bump * 500 if world_id == "wrld_up" else 0),
+                    "publication_date": published,
+                }
+                for world_id, count in counts.items()
+            ],
+        )
+
+    list_trend_order = storage.list_trend_order
+    # wrld_t2 loses its stored row; it must rank like an empty trend payload.
+    storage.list_trend_order = lambda *args, **kwargs: [
+        item for item in list_trend_order(*args, **kwargs) if item[0] != "wrld_t2"
+    ]
+    history = service.load_history(source="db:import:parity")
+    for sort in ("momentum", "new_hot", "publication_velocity"):
+        for direction in ("desc", "asc"):
+            expected = service._sort_worlds(
+                service.load_worlds("db:import:parity"),
+                sort=sort,
+                direction=direction,
+                history=history,
+            )
+            stored = service.page_worlds("db:import:parity", sort=sort, direction=direction)["items"]
+            assert [world["id"] for world in stored] == [world["id"] for world in expected], (sort, direction)
+            paged = service.page_worlds("db:import:parity", sort=sort, direction=direction, limit=2, offset=1)
+            assert [world["id"] for world in paged["items"]] == [world["id"] for world in expected[1:3]]
+    assert storage.stale_trend_world_ids("import:parity") == []
+
+
+def test_trend_metrics_are_persisted_incrementally_and_drive_trend_sorts():
+    repo_root = _make_case_dir("service_trend_metrics_table") / "repo"
+    service = WorldInfoService(repo_root=repo_root, app_root=repo_root / "world_info_web")
+    storage = service.storage
+    now = dt.datetime.now(dt.timezone.utc)
+
+    def sync(days_ago: int, visits: dict[str, int]) -> None:
+        fetched_at = (now - dt.timedelta(days=days_ago)).isoformat()
+        run_id = storage.create_run(
+            source_key="import:trends",
+            job_key=None,
+            trigger_type="manual",
+            query_label="trends",
+            started_at=fetched_at,
+        )
+        storage.insert_world_snapshots(
+            run_id=run_id,
+            source_key="import:trends",
+            fetched_at=fetched_at,
+            worlds=[
+                {
+                    "id": world_id,
+                    "name": world_id,
+                    "visits": count,
+                    "favorites": count // 10,
+                    "publication_date": (now - dt.timedelta(days=40)).isoformat(),
+                }
+                for world_id, count in visits.items()
+            ],
+        )
+
+    sync(8, {"wrld_a": 100, "wrld_b": 1000, "wrld_c": 50})
+    sync(0, {"wrld_a": 900, "wrld_b": 1010, "wrld_c": 60})
+
+    assert service.refresh_trend_metrics("import:trends", ["wrld_a"]) == 1
+    assert set(storage.load_trend_metrics("import:trends")) == {"wrld_a"}
+    assert storage.stale_trend_world_ids("import:trends") == ["wrld_b", "wrld_c"]
+
+    for sort in ("new_hot", "momentum"):
+        expected = service._sort_worlds(
+            service.load_worlds("db:import:trends"),
+            sort=sort,
+            direction="desc",
+            history=service.load_history(source="db:import:trends"),
+        )
+        sorted_worlds = service.load_worlds("db:import:trends", sort=sort)
+        assert [world["id"] for world in sorted_worlds] == [world["id"] for world in expected]
+    assert storage.stale_trend_world_ids("import:trends") == []
+    assert [world["id"] for world in service.load_worlds("db:import:trends", sort="new_hot", direction="asc")][0] == "wrld_c"
+
+    # A backfilled point leaves world_latest alone but still invalidates the trend row.
+    sync(3, {"wrld_c": 55})
+    assert storage.stale_trend_world_ids("import:trends") == ["wrld_c"]
+
+    result = service.refresh_trend_decay(now=now + dt.timedelta(days=3))
+    stored = storage.load_trend_metrics("import:trends")
+    assert result["worlds_refreshed"] == 2
+    assert set(stored) == {"wrld_a", "wrld_b"}
+    assert stored["wrld_a"]["payload"]["days_since_publication"] == 43
+    assert stored["wrld_a"]["payload"]["visits_delta_7d"] == 800
+
+    storage.delete_world_snapshots("import:trends", "wrld_a")
+    assert service.refresh_trend_metrics("import:trends") == 2
+    assert set(storage.load_trend_metrics("import:trends")) == {"wrld_b", "wrld_c"}
@@ -2,14 +2,54 @@ from __future__ import annotations
 
 import os
 from pathlib import Path
+from typing import Any
 
 from flask import Flask, jsonify, request, send_from_directory
+from flask.json.provider import DefaultJSONProvider
 
 from world_info.scraper.scraper import VRChatRateLimitError
 
+from . import jsoncodec
+from .http_cache import ResponseCache
 from .scheduler import AutoSyncScheduler
 from .service import WorldInfoService
 
+WORLD_PAGE_MAX = 1000
+# Read endpoints answered with 304 while the data version is unchanged. The
+# value is the time bucket (seconds) for responses that also depend on "now".
+CONDITIONAL_ENDPOINTS = {
+    "worlds": 300,
+    "topic_worlds": 300,
+    "tag_facets": 0,
+    "insights": 300,
+    "events": 300,
+    "job_diagnostics": 300,
+}
+
+
+# jsonify through the shared codec: orjson/msgspec when installed, UTF-8 output
+# without ASCII escaping, and keys left in insertion order.
+class CodecJSONProvider(DefaultJSONProvider):
+    ensure_ascii = False
+    sort_keys = False
+
+    def dumps(self, obj: Any, **kwargs: Any) -> str:
+        if kwargs:
+            return super().dumps(obj, **kwargs)
+        return jsoncodec.dumps(obj, sort_keys=self.sort_keys, default=self.default)
+
+    def loads(self, s: str | bytes, **kwargs: Any) -> Any:
+        if kwargs:
+            return super().loads(s, **kwargs)
+        return jsoncodec.loads(s)
+
+    def response(self, *args: Any, **kwargs: Any):
+        if (self.compact is None and self._app.debug) or self.compact is False:
+            return super().response(*args, **kwargs)
+        obj = self._prepare_response_obj(args, kwargs)
+        body = jsoncodec.dumps_bytes(obj, sort_keys=self.sort_keys, default=self.default)
+        return self._app.response_class(body + b"\n", mimetype=self.mimetype)
+
 
 def create_app(service: WorldInfoService | None = None) -> Flask:
     service = service or WorldInfoService()
@@ -17,8 +57,16 @@ def create_app(service: WorldInfoService | None = None) -> Flask:
     schedule_config_path = service.app_root / "config" / "auto_sync_schedule.json"
     scheduler = AutoSyncScheduler(service, schedule_config_path)
     scheduler.start()
+    service.refresh_queue.start()
     app = Flask(__name__, static_folder=frontend_dir, static_url_path="")
+    app.json = CodecJSONProvider(app)
     app.config["JSON_AS_ASCII"] = False
+    response_cache = ResponseCache(
+        service.response_version,
+        endpoints=CONDITIONAL_ENDPOINTS,
+        content_endpoints={"auto_sync_status"},
+    )
+    response_cache.init_app(app)
 
     def error(message: str, status: int = 400):
         return jsonify({"error": message}), status
@@ -84,6 +132,37 @@ def create_app(service: WorldInfoService | None = None) -> Flask:
             raise ValueError("limit must be a positive integer")
         return min(limit, maximum)
 
+    def parse_offset(raw_value: str | None) -> int:
+        if raw_value in (None, ""):
+            return 0
+        try:
+            offset = int(raw_value)
+        except ValueError as exc:
+            raise ValueError("offset must be a non-negative integer") from exc
+        if offset < 0:
+            raise ValueError("offset must be a non-negative integer")
+        return offset
+
+    def parse_world_page_args() -> tuple[int | None, int, set[str] | None]:
+        # World lists stay unbounded unless the client asks for a page.
+        raw_limit = request.args.get("limit")
+        limit = None if raw_limit in (None, "") else parse_limit(raw_limit, maximum=WORLD_PAGE_MAX)
+        offset = parse_offset(request.args.get("offset"))
+        raw_fields = request.args.get("fields")
+        fields = None
+        if raw_fields:
+            fields = {field.strip() for field in raw_fields.split(",") if field.strip()}
+            fields.add("id")
+        return limit, offset, fields
+
+    def unpaged_worlds(items: list[dict[str, Any]], **extra: Any) -> dict[str, Any]:
+        return {"total": len(items), "offset": 0, "limit": None, "next_offset": None, "items": items, **extra}
+
+    def project_worlds(items: list[dict[str, Any]], fields: set[str] | None) -> list[dict[str, Any]]:
+        if fields is None:
+            return items
+        return [{key: value for key, value in world.items() if key in fields} for world in items]
+
     def parse_bool(value, default: bool = False) -> bool:
         if value in (None, ""):
             return default
@@ -94,8 +173,9 @@ def create_app(service: WorldInfoService | None = None) -> Flask:
     @app.after_request
     def add_cors_headers(response):
         response.headers["Access-Control-Allow-Origin"] = "*"
-        response.headers["Access-Control-Allow-Headers"] = "Content-Type"
+        response.headers["Access-Control-Allow-Headers"] = "Content-Type, If-None-Match"
         response.headers["Access-Control-Allow-Methods"] = "GET,POST,PUT,DELETE,OPTIONS"
+        response.headers["Access-Control-Expose-Headers"] = "ETag"
         return response
 
     @app.get("/")
@@ -279,22 +359,43 @@ def create_app(service: WorldInfoService | None = None) -> Flask:
         tag = request.args.get("tag")
         sort = request.args.get("sort", "new_hot")
         direction = request.args.get("direction", "desc")
+        try:
+            limit, offset, fields = parse_world_page_args()
+        except ValueError as exc:
+            return error(str(exc))
         try:
             topic_info = service.get_topic(topic_key)
-            items = service.load_topic_worlds(
-                topic_key,
-                query=query,
-                tag=tag,
-                sort=sort,
-                direction=direction,
-            )
+            if limit is None and not offset:
+                items = service.load_topic_worlds(
+                    topic_key,
+                    query=query,
+                    tag=tag,
+                    sort=sort,
+                    direction=direction,
+                )
+                page = unpaged_worlds(items, tags=service.collect_tags(items))
+            else:
+                page = service.page_topic_worlds(
+                    topic_key,
+                    query=query,
+                    tag=tag,
+                    sort=sort,
+                    direction=direction,
+                    limit=limit,
+                    offset=offset,
+                )
         except KeyError:
             return error(f"Unknown topic: {topic_key}", 404)
+        items = project_worlds(page["items"], fields)
         return jsonify(
             {
                 "topic": topic_info,
                 "count": len(items),
-                "tags": service.collect_tags(items),
+                "total": page["total"],
+                "offset": page["offset"],
+                "limit": page["limit"],
+                "next_offset": page["next_offset"],
+                "tags": page["tags"],
                 "items": items,
             }
         )
@@ -307,28 +408,65 @@ def create_app(service: WorldInfoService | None = None) -> Flask:
         sort = request.args.get("sort", "new_hot")
         direction = request.args.get("direction", "desc")
         dedupe = request.args.get("dedupe", "1") != "0"
+        try:
+            limit, offset, fields = parse_world_page_args()
+        except ValueError as exc:
+            return error(str(exc))
 
         try:
-            items = service.load_worlds(
-                source,
-                query=query,
-                tag=tag,
-                sort=sort,
-                direction=direction,
-                dedupe=dedupe,
-            )
+            if limit is None and not offset:
+                items = service.load_worlds(
+                    source,
+                    query=query,
+                    tag=tag,
+                    sort=sort,
+                    direction=direction,
+                    dedupe=dedupe,
+                )
+                page = unpaged_worlds(items, summary=service.collect_totals(items))
+                if query or tag:
+                    page["tags"] = service.collect_tags(items)
+            else:
+                page = service.page_worlds(
+                    source,
+                    query=query,
+                    tag=tag,
+                    sort=sort,
+                    direction=direction,
+                    dedupe=dedupe,
+                    limit=limit,
+                    offset=offset,
+                    # Tag-index facets are source-wide; filtered lists take the matches' tags.
+                    with_tags=not source.startswith("db:") or bool(query or tag),
+                )
         except KeyError:
             return error(f"Unknown source: {source}", 404)
 
+        tags = page["tags"] if "tags" in page else service.collect_source_tags(source, page["items"])
+        items = project_worlds(page["items"], fields)
         return jsonify(
             {
                 "source": source,
                 "count": len(items),
-                "tags": service.collect_tags(items),
+                "total": page["total"],
+                "offset": page["offset"],
+                "limit": page["limit"],
+                "next_offset": page["next_offset"],
+                "summary": page["summary"],
+                "tags": tags,
                 "items": items,
             }
         )
 
+    @app.get("/api/v1/tags")
+    def tag_facets():
+        source = request.args.get("source", "db:all")
+        try:
+            items = service.list_tag_facets(source)
+        except KeyError:
+            return error(f"Unknown source: {source}", 404)
+        return jsonify({"source": source, "count": len(items), "items": items})
+
     @app.put("/api/v1/worlds/<world_id>")
     def update_world(world_id: str):
         payload = request.get_json(silent=True) or {}
@@ -381,10 +519,10 @@ def create_app(service: WorldInfoService | None = None) -> Flask:
         if not source and not topic_key:
             source = "db:all"
         try:
-            payload = service.load_collection_insights(source=source, topic_key=topic_key, limit=limit)
+            body = service.load_collection_insights_bytes(source=source, topic_key=topic_key, limit=limit)
         except KeyError as exc:
             return error(str(exc), 404)
-        return jsonify(payload)
+        return app.response_class(body, mimetype="application/json")
 
     @app.get("/api/v1/communities/summary")
     def communities_summary():
@@ -648,7 +786,21 @@ def create_app(service: WorldInfoService | None = None) -> Flask:
     def events():
         limit = parse_limit(request.args.get("limit"), default=50, maximum=200)
         recency_days = parse_limit(request.args.get("days"), default=7, maximum=30)
-        return jsonify(service.list_event_feed(limit=limit, recency_days=recency_days))
+        filters: dict[str, object] = {}
+        if request.args.get("cursor"):
+            filters["cursor"] = request.args["cursor"]
+        event_types = [item.strip() for item in request.args.get("type", "").split(",") if item.strip()]
+        if event_types:
+            filters["event_types"] = event_types
+        if request.args.get("job"):
+            filters["job_key"] = request.args["job"].strip()
+        try:
+            if request.args.get("min_severity"):
+                filters["min_severity"] = float(request.args["min_severity"])
+            result = service.list_event_feed(limit=limit, recency_days=recency_days, **filters)
+        except ValueError as exc:
+            return error(str(exc))
+        return jsonify(result)
 
     @app.get("/api/v1/jobs")
     def jobs():
@@ -790,6 +942,56 @@ def create_app(service: WorldInfoService | None = None) -> Flask:
             return error(str(exc), 500)
         return jsonify(result), 201
 
+    @app.post("/api/v1/maintenance/rebuild-latest")
+    def rebuild_latest():
+        payload = request.get_json(silent=True) or {}
+        try:
+            result = service.rebuild_latest_worlds(payload.get("source"))
+        except ValueError as exc:
+            return error(str(exc))
+        except Exception as exc:
+            return error(str(exc), 500)
+        return jsonify(result), 200
+
+    @app.post("/api/v1/maintenance/compact")
+    def compact_snapshots():
+        payload = request.get_json(silent=True) or {}
+        try:
+            result = service.compact_snapshots(payload.get("source"))
+        except ValueError as exc:
+            return error(str(exc))
+        except Exception as exc:
+            return error(str(exc), 500)
+        return jsonify(result), 200
+
+    @app.post("/api/v1/maintenance/rebuild-topics")
+    def rebuild_topics():
+        payload = request.get_json(silent=True) or {}
+        topic_keys = payload.get("topics")
+        try:
+            result = service.rebuild_topic_memberships(set(topic_keys) if topic_keys else None)
+        except Exception as exc:
+            return error(str(exc), 500)
+        return jsonify(result), 200
+
+    @app.post("/api/v1/maintenance/refresh-analysis")
+    def refresh_analysis():
+        payload = request.get_json(silent=True) or {}
+        workers = payload.get("workers")
+        try:
+            result = service.refresh_stale_analysis(workers=int(workers) if workers else None)
+        except Exception as exc:
+            return error(str(exc), 500)
+        return jsonify(result), 200
+
+    @app.post("/api/v1/maintenance/compress-payloads")
+    def compress_payloads():
+        try:
+            result = service.migrate_payload_encoding()
+        except Exception as exc:
+            return error(str(exc), 500)
+        return jsonify(result), 200
+
     @app.post("/api/v1/jobs/<job_key>/run")
     def run_job(job_key: str):
         payload = request.get_json(silent=True) or {}
@@ -895,6 +1097,24 @@ def create_app(service: WorldInfoService | None = None) -> Flask:
         limit = parse_limit(request.args.get("limit"), default=12, maximum=50)
         return jsonify({"items": service.list_runs(limit=limit)})
 
+    @app.get("/api/v1/runs/<int:base_run_id>/diff/<int:target_run_id>")
+    def run_diff(base_run_id: int, target_run_id: int):
+        try:
+            limit = parse_limit(request.args.get("limit"), default=50, maximum=500)
+            offset = parse_offset(request.args.get("offset"))
+            result = service.diff_runs(
+                base_run_id,
+                target_run_id,
+                kind=request.args.get("kind") or None,
+                limit=limit,
+                offset=offset,
+            )
+        except KeyError as exc:
+            return error(str(exc), 404)
+        except ValueError as exc:
+            return error(str(exc))
+        return jsonify(result)
+
     @app.get("/api/v1/query-analytics")
     def query_analytics():
         limit = parse_limit(request.args.get("limit"), default=12, maximum=24)
@@ -905,6 +1125,14 @@ def create_app(service: WorldInfoService | None = None) -> Flask:
         limit = parse_limit(request.args.get("limit"), default=20, maximum=100)
         return jsonify(service.list_rate_limit_events(limit=limit))
 
+    @app.get("/api/v1/diagnostics/storage")
+    def storage_diagnostics():
+        return jsonify(service.get_storage_diagnostics())
+
+    @app.get("/api/v1/diagnostics/http")
+    def http_diagnostics():
+        return jsonify(response_cache.stats())
+
     @app.get("/api/v1/review/self-check")
     def self_check():
         result = service.run_self_check()
@@ -0,0 +1,76 @@
+from __future__ import annotations
+
+from collections import deque
+from collections.abc import Iterable
+
+try:
+    import ahocorasick
+except ImportError:  # pragma: no cover - optional dependency
+    ahocorasick = None
+
+
+# Aho-Corasick matcher over a fixed set of needles: one scan of a text reports
+# every needle it contains, however many needles there are. Uses pyahocorasick
+# when installed, otherwise an equivalent pure-Python automaton.
+class KeywordAutomaton:
+    def __init__(self, needles: Iterable[str]) -> None:
+        self.needles: list[str] = []
+        index: dict[str, int] = {}
+        for needle in needles:
+            if needle and needle not in index:
+                index[needle] = len(self.needles)
+                self.needles.append(needle)
+        self._native = None
+        if ahocorasick is not None and self.needles:
+            automaton = ahocorasick.Automaton()
+            for needle_id, needle in enumerate(self.needles):
+                automaton.add_word(needle, needle_id)
+            automaton.make_automaton()
+            self._native = automaton
+            return
+        self._goto: list[dict[str, int]] = [{}]
+        self._fail: list[int] = [0]
+        self._out: list[tuple[int, ...]] = [()]
+        for needle_id, needle in enumerate(self.needles):
+            state = 0
+            for char in needle:
+                nxt = self._goto[state].get(char)
+                if nxt is None:
+                    nxt = len(self._goto)
+                    self._goto.append({})
+                    self._fail.append(0)
+                    self._out.append(())
+                    self._goto[state][char] = nxt
+                state = nxt
+            self._out[state] += (needle_id,)
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, nxt in self._goto[state].items():
+                queue.append(nxt)
+                fallback = self._fail[state]
+                while fallback and char not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                target = self._goto[fallback].get(char, 0)
+                self._fail[nxt] = target if target != nxt else 0
+                self._out[nxt] += self._out[self._fail[nxt]]
+
+    def __len__(self) -> int:
+        return len(self.needles)
+
+    def find(self, text: str) -> set[int]:
+        """Ids (positions in self.needles) of every needle occurring in text."""
+        if not self.needles or not text:
+            return set()
+        if self._native is not None:
+            return {needle_id for _, needle_id in self._native.iter(text)}
+        goto, fail, out = self._goto, self._fail, self._out
+        found: set[int] = set()
+        state = 0
+        for char in text:
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            if out[state]:
+                found.update(out[state])
+        return found
@@ -0,0 +1,104 @@
+from __future__ import annotations
+
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Callable, Hashable
+
+
+# Size-bounded LRU where every entry remembers the version token it was built
+# under. A lookup with a different token is a miss and drops the stale entry, so
+# callers never have to enumerate what a write invalidated.
+class VersionedLRUCache:
+    def __init__(self, max_entries: int) -> None:
+        self.max_entries = max(int(max_entries), 0)
+        self._entries: OrderedDict[Hashable, tuple[Hashable, Any]] = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._stale = 0
+        self._evictions = 0
+        self._invalidations = 0
+
+    def get(self, key: Hashable, token: Hashable) -> Any | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self._misses += 1
+                return None
+            if entry[0] != token:
+                del self._entries[key]
+                self._misses += 1
+                self._stale += 1
+                return None
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return entry[1]
+
+    def put(self, key: Hashable, token: Hashable, value: Any) -> None:
+        if self.max_entries <= 0:
+            return
+        with self._lock:
+            self._entries[key] = (token, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self._evictions += 1
+
+    def invalidate(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._invalidations += 1
+
+    def stats(self) -> dict[str, Any]:
+        with self._lock:
+            hits = self._hits
+            misses = self._misses
+            return {
+                "entries": len(self._entries),
+                "max_entries": self.max_entries,
+                "hits": hits,
+                "misses": misses,
+                "hit_ratio": round(hits / (hits + misses), 4) if hits + misses else 0.0,
+                "stale": self._stale,
+                "evictions": self._evictions,
+                "invalidations": self._invalidations,
+            }
+
+
+# Parsed file contents keyed by path and loader variant, reused while the file's
+# (mtime_ns, size) signature is unchanged. Values are shared between callers and
+# must be treated as read-only.
+class FileCache:
+    def __init__(self) -> None:
+        self._entries: dict[tuple[str, str], tuple[tuple[int, int] | None, Any]] = {}
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+
+    def load(self, path: Path, variant: str, loader: Callable[[Path], Any]) -> Any:
+        key = (str(path), variant)
+        try:
+            stat = path.stat()
+            signature: tuple[int, int] | None = (stat.st_mtime_ns, stat.st_size)
+        except OSError:
+            signature = None
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] == signature:
+                self._hits += 1
+                return entry[1]
+            self._misses += 1
+        value = loader(path)
+        with self._lock:
+            self._entries[key] = (signature, value)
+        return value
+
+    def discard(self, path: Path) -> None:
+        with self._lock:
+            for key in [key for key in self._entries if key[0] == str(path)]:
+                del self._entries[key]
+
+    def stats(self) -> dict[str, Any]:
+        with self._lock:
+            return {"entries": len(self._entries), "hits": self._hits, "misses": self._misses}
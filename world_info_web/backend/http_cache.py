@@ -0,0 +1,172 @@
+from __future__ import annotations
+
+import gzip
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Hashable
+
+from flask import Flask, Response, g, request
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover - optional dependency
+    brotli = None
+
+COMPRESS_MIN_BYTES = 1024
+ETAG_SIZE_ENTRIES = 512
+
+
+def _accepted_encodings(header: str | None) -> set[str]:
+    encodings = set()
+    for part in (header or "").split(","):
+        name, _, params = part.strip().partition(";")
+        quality = params.strip().replace(" ", "").removeprefix("q=")
+        try:
+            if quality and float(quality) <= 0:
+                continue
+        except ValueError:
+            continue
+        if name:
+            encodings.add(name.strip().casefold())
+    return encodings
+
+
+def _if_none_match(header: str | None) -> set[str]:
+    return {tag.strip().removeprefix("W/") for tag in (header or "").split(",") if tag.strip()}
+
+
+# Conditional GET and compression for read-heavy JSON endpoints.
+#
+# Version endpoints derive their ETag from a caller-supplied data version, the
+# endpoint, its view args and query args (plus a time bucket for responses that
+# depend on "now"), so a matching If-None-Match is answered with 304 before the
+# view runs. Content endpoints depend on live state outside the data version and
+# hash the rendered body instead, which still saves the transfer.
+class ResponseCache:
+    def __init__(
+        self,
+        version: Callable[[], Hashable],
+        *,
+        endpoints: dict[str, int] | None = None,
+        content_endpoints: set[str] | None = None,
+        min_compress_bytes: int = COMPRESS_MIN_BYTES,
+    ) -> None:
+        self.version = version
+        self.endpoints = dict(endpoints or {})
+        self.content_endpoints = set(content_endpoints or ())
+        self.min_compress_bytes = min_compress_bytes
+        self._body_sizes: OrderedDict[str, int] = OrderedDict()
+        self._lock = threading.Lock()
+        self._not_modified = 0
+        self._full_responses = 0
+        self._not_modified_bytes_saved = 0
+        self._compressed = 0
+        self._compressed_bytes_in = 0
+        self._compressed_bytes_out = 0
+
+    def init_app(self, app: Flask) -> None:
+        app.before_request(self._before_request)
+        app.after_request(self._after_request)
+
+    def _version_etag(self, endpoint: str, bucket_seconds: int) -> str:
+        key = (
+            endpoint,
+            self.version(),
+            sorted((request.view_args or {}).items()),
+            sorted(request.args.items(multi=True)),
+            int(time.time() // bucket_seconds) if bucket_seconds > 0 else None,
+        )
+        return '"' + hashlib.blake2b(repr(key).encode("utf-8"), digest_size=16).hexdigest() + '"'
+
+    def _match(self, etag: str) -> str | None:
+        # Returns the representation tag the client holds (base or -gzip/-br).
+        candidates = _if_none_match(request.headers.get("If-None-Match"))
+        if "*" in candidates:
+            return etag
+        base = etag.rstrip('"')
+        for tag in sorted(candidates):
+            if tag == etag or tag.startswith(base + "-"):
+                return tag
+        return None
+
+    def _not_modified_response(self, etag: str, matched: str) -> Response:
+        with self._lock:
+            self._not_modified += 1
+            self._not_modified_bytes_saved += self._body_sizes.get(etag, 0)
+        response = Response(status=304)
+        response.headers["ETag"] = matched
+        response.headers["Cache-Control"] = "no-cache"
+        response.headers["Vary"] = "Accept-Encoding"
+        return response
+
+    def _before_request(self) -> Response | None:
+        if request.method != "GET" or request.endpoint not in self.endpoints:
+            return None
+        etag = self._version_etag(request.endpoint, self.endpoints[request.endpoint])
+        matched = self._match(etag)
+        if matched is not None:
+            return self._not_modified_response(etag, matched)
+        g.response_etag = etag
+        return None
+
+    def _after_request(self, response: Response) -> Response:
+        if request.method != "GET" or response.status_code != 200 or response.direct_passthrough:
+            return response
+        etag = g.pop("response_etag", None)
+        if etag is None and request.endpoint in self.content_endpoints:
+            etag = '"' + hashlib.blake2b(response.get_data(), digest_size=16).hexdigest() + '"'
+            matched = self._match(etag)
+            if matched is not None:
+                return self._not_modified_response(etag, matched)
+        if etag is not None:
+            with self._lock:
+                self._full_responses += 1
+                self._body_sizes[etag] = response.content_length or len(response.get_data())
+                self._body_sizes.move_to_end(etag)
+                while len(self._body_sizes) > ETAG_SIZE_ENTRIES:
+                    self._body_sizes.popitem(last=False)
+            response.headers["ETag"] = etag
+            response.headers["Cache-Control"] = "no-cache"
+        return self._compress(response, etag)
+
+    def _compress(self, response: Response, etag: str | None) -> Response:
+        if response.mimetype != "application/json" or "Content-Encoding" in response.headers:
+            return response
+        response.vary.add("Accept-Encoding")
+        body = response.get_data()
+        if len(body) < self.min_compress_bytes:
+            return response
+        accepted = _accepted_encodings(request.headers.get("Accept-Encoding"))
+        if brotli is not None and "br" in accepted:
+            encoding, compressed = "br", brotli.compress(body, quality=5)
+        elif "gzip" in accepted:
+            encoding, compressed = "gzip", gzip.compress(body, compresslevel=6)
+        else:
+            return response
+        response.set_data(compressed)
+        response.headers["Content-Encoding"] = encoding
+        if etag is not None:
+            # Each encoding is a different representation, so it gets its own strong tag.
+            response.headers["ETag"] = etag[:-1] + f'-{encoding}"'
+        with self._lock:
+            self._compressed += 1
+            self._compressed_bytes_in += len(body)
+            self._compressed_bytes_out += len(compressed)
+        return response
+
+    def stats(self) -> dict[str, Any]:
+        with self._lock:
+            conditional = self._not_modified + self._full_responses
+            return {
+                "not_modified": self._not_modified,
+                "full_responses": self._full_responses,
+                "hit_ratio": round(self._not_modified / conditional, 4) if conditional else 0.0,
+                "not_modified_bytes_saved": self._not_modified_bytes_saved,
+                "compressed_responses": self._compressed,
+                "compressed_bytes_in": self._compressed_bytes_in,
+                "compressed_bytes_out": self._compressed_bytes_out,
+                "compression_bytes_saved": self._compressed_bytes_in - self._compressed_bytes_out,
+                "brotli": brotli is not None,
+            }
@@ -0,0 +1,109 @@
+from __future__ import annotations
+
+import json
+import os
+from typing import Any, Callable
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
+try:
+    import msgspec
+except ImportError:  # pragma: no cover - optional dependency
+    msgspec = None
+
+
+# All codecs write UTF-8 without escaping non-ASCII text (the stdlib's
+# ensure_ascii=False), so CJK world names stay readable in storage and responses.
+# The fast codecs emit compact separators; every reader parses either form.
+class StdlibCodec:
+    name = "json"
+
+    def dumps(self, obj: Any, *, sort_keys: bool = False, default: Callable[[Any], Any] | None = None) -> str:
+        return json.dumps(obj, ensure_ascii=False, sort_keys=sort_keys, default=default)
+
+    def dumps_bytes(self, obj: Any, *, sort_keys: bool = False, default: Callable[[Any], Any] | None = None) -> bytes:
+        return StdlibCodec.dumps(self, obj, sort_keys=sort_keys, default=default).encode("utf-8")
+
+    def loads(self, data: str | bytes | bytearray | memoryview) -> Any:
+        if isinstance(data, memoryview):
+            data = data.tobytes()
+        return json.loads(data)
+
+
+class OrjsonCodec(StdlibCodec):
+    name = "orjson"
+
+    def dumps(self, obj: Any, *, sort_keys: bool = False, default: Callable[[Any], Any] | None = None) -> str:
+        return self.dumps_bytes(obj, sort_keys=sort_keys, default=default).decode("utf-8")
+
+    def dumps_bytes(self, obj: Any, *, sort_keys: bool = False, default: Callable[[Any], Any] | None = None) -> bytes:
+        # Non-string keys are stringified like the stdlib does, and datetimes go
+        # through `default` so callers keep control of their format.
+        option = orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME
+        if sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        try:
+            return orjson.dumps(obj, default=default, option=option)
+        except TypeError:
+            # Integers beyond 64 bits and similar edge cases.
+            return super().dumps_bytes(obj, sort_keys=sort_keys, default=default)
+
+    def loads(self, data: str | bytes | bytearray | memoryview) -> Any:
+        return orjson.loads(data)
+
+
+class MsgspecCodec(StdlibCodec):
+    name = "msgspec"
+
+    def dumps(self, obj: Any, *, sort_keys: bool = False, default: Callable[[Any], Any] | None = None) -> str:
+        return self.dumps_bytes(obj, sort_keys=sort_keys, default=default).decode("utf-8")
+
+    def dumps_bytes(self, obj: Any, *, sort_keys: bool = False, default: Callable[[Any], Any] | None = None) -> bytes:
+        if sort_keys:
+            # msgspec only sorts its own struct fields deterministically.
+            return super().dumps_bytes(obj, sort_keys=True, default=default)
+        try:
+            return msgspec.json.encode(obj, enc_hook=default)
+        except (TypeError, OverflowError):
+            return super().dumps_bytes(obj, default=default)
+
+    def loads(self, data: str | bytes | bytearray | memoryview) -> Any:
+        try:
+            return msgspec.json.decode(data)
+        except msgspec.DecodeError as exc:
+            # Callers catch the stdlib error type.
+            raise json.JSONDecodeError(str(exc), "", 0) from exc
+
+
+CODECS: dict[str, StdlibCodec] = {"json": StdlibCodec()}
+if msgspec is not None:
+    CODECS["msgspec"] = MsgspecCodec()
+if orjson is not None:
+    CODECS["orjson"] = OrjsonCodec()
+
+
+def _select_codec() -> StdlibCodec:
+    requested = os.getenv("WORLD_INFO_JSON_CODEC", "").strip().lower()
+    if requested:
+        if requested not in CODECS:
+            raise RuntimeError(f"JSON codec {requested!r} is not available; installed: {', '.join(sorted(CODECS))}.")
+        return CODECS[requested]
+    return CODECS.get("orjson") or CODECS.get("msgspec") or CODECS["json"]
+
+
+codec = _select_codec()
+
+
+def dumps(obj: Any, *, sort_keys: bool = False, default: Callable[[Any], Any] | None = None) -> str:
+    return codec.dumps(obj, sort_keys=sort_keys, default=default)
+
+
+def dumps_bytes(obj: Any, *, sort_keys: bool = False, default: Callable[[Any], Any] | None = None) -> bytes:
+    return codec.dumps_bytes(obj, sort_keys=sort_keys, default=default)
+
+
+def loads(data: str | bytes | bytearray | memoryview) -> Any:
+    return codec.loads(data)
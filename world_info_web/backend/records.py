@@ -0,0 +1,144 @@
+from __future__ import annotations
+
+import sys
+from dataclasses import dataclass, fields
+from typing import Any
+
+
+class _Missing:
+    __slots__ = ()
+
+    def __repr__(self) -> str:
+        return "<missing>"
+
+
+# Marks a key the source dict did not have, so to_dict() round-trips exactly.
+_MISSING: Any = _Missing()
+
+METRIC_FIELDS = (
+    "favorite_rate",
+    "labs_to_publication_days",
+    "days_since_update",
+    "days_since_publication",
+    "visits_per_day",
+)
+# Low-cardinality text repeated across many worlds; interning shares one copy.
+INTERNED_FIELDS = frozenset({"source", "author_id", "author_name", "release_status"})
+LIST_FIELDS = frozenset({"tags", "portal_links"})
+TAG_TUPLE_CACHE_MAX = 65536
+
+_tag_tuples: dict[tuple[str, ...], tuple[str, ...]] = {}
+
+
+def _intern_tags(tags: Any) -> tuple[Any, ...]:
+    items = tuple(sys.intern(tag) if type(tag) is str else tag for tag in tags)
+    if len(_tag_tuples) >= TAG_TUPLE_CACHE_MAX:
+        _tag_tuples.clear()
+    return _tag_tuples.setdefault(items, items)
+
+
+# Compact, read-only view of a normalised world used by the in-memory catalog.
+# Known keys live in slots (metrics flattened into metric_* slots, tags as shared
+# interned tuples); anything else is kept in `extra`. Read paths call .get() like
+# on the dict it replaces; to_dict() rebuilds the original dict at the JSON
+# boundary.
+@dataclass(slots=True, eq=False)
+class WorldRecord:
+    id: str | None = _MISSING
+    source: str | None = _MISSING
+    name: str | None = _MISSING
+    description: str | None = _MISSING
+    author_id: str | None = _MISSING
+    author_name: str | None = _MISSING
+    capacity: int | None = _MISSING
+    visits: int | None = _MISSING
+    favorites: int | None = _MISSING
+    heat: int | None = _MISSING
+    popularity: int | None = _MISSING
+    created_at: str | None = _MISSING
+    updated_at: str | None = _MISSING
+    fetched_at: str | None = _MISSING
+    publication_date: str | None = _MISSING
+    labs_publication_date: str | None = _MISSING
+    release_status: str | None = _MISSING
+    image_url: str | None = _MISSING
+    thumbnail_url: str | None = _MISSING
+    world_url: str | None = _MISSING
+    tags: tuple[str, ...] = _MISSING
+    portal_links: tuple[str, ...] = _MISSING
+    metric_favorite_rate: float | None = _MISSING
+    metric_labs_to_publication_days: int | None = _MISSING
+    metric_days_since_update: int | None = _MISSING
+    metric_days_since_publication: int | None = _MISSING
+    metric_visits_per_day: float | None = _MISSING
+    has_metrics: bool = False
+    extra_metrics: dict[str, Any] | None = None
+    extra: dict[str, Any] | None = None
+
+    @classmethod
+    def from_dict(cls, world: dict[str, Any]) -> WorldRecord:
+        record = cls()
+        extra = None
+        for key, value in world.items():
+            if key in _RECORD_KEY_SET:
+                if key in LIST_FIELDS and isinstance(value, list):
+                    value = _intern_tags(value) if key == "tags" else tuple(value)
+                elif key in INTERNED_FIELDS and type(value) is str:
+                    value = sys.intern(value)
+                setattr(record, key, value)
+            elif key == "metrics" and isinstance(value, dict):
+                record.has_metrics = True
+                for metric, metric_value in value.items():
+                    if metric in METRIC_FIELDS:
+                        setattr(record, "metric_" + metric, metric_value)
+                    else:
+                        if record.extra_metrics is None:
+                            record.extra_metrics = {}
+                        record.extra_metrics[metric] = metric_value
+            else:
+                if extra is None:
+                    extra = {}
+                extra[key] = value
+        record.extra = extra
+        return record
+
+    def metrics(self) -> dict[str, Any]:
+        metrics = {}
+        for metric in METRIC_FIELDS:
+            value = getattr(self, "metric_" + metric)
+            if value is not _MISSING:
+                metrics[metric] = value
+        if self.extra_metrics:
+            metrics.update(self.extra_metrics)
+        return metrics
+
+    def get(self, key: str, default: Any = None) -> Any:
+        if key in _RECORD_KEY_SET:
+            value = getattr(self, key)
+            return default if value is _MISSING else value
+        if key == "metrics":
+            return self.metrics() if self.has_metrics else default
+        if self.extra is not None:
+            return self.extra.get(key, default)
+        return default
+
+    def to_dict(self) -> dict[str, Any]:
+        world: dict[str, Any] = {}
+        for key in _RECORD_KEYS:
+            value = getattr(self, key)
+            if value is _MISSING:
+                continue
+            world[key] = list(value) if key in LIST_FIELDS and isinstance(value, tuple) else value
+        if self.has_metrics:
+            world["metrics"] = self.metrics()
+        if self.extra:
+            world.update(self.extra)
+        return world
+
+
+_RECORD_KEYS = tuple(
+    field.name
+    for field in fields(WorldRecord)
+    if not field.name.startswith("metric_") and field.name not in {"has_metrics", "extra_metrics", "extra"}
+)
+_RECORD_KEY_SET = frozenset(_RECORD_KEYS)
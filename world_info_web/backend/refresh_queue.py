@@ -0,0 +1,126 @@
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Hashable
+
+logger = logging.getLogger(__name__)
+
+
+# Background queue for refresh work that follows a write (topic memberships,
+# analysis cache). Tasks are keyed by scope: submitting a key that is already
+# waiting replaces the waiting task instead of queueing a second run, so a burst
+# of syncs touching db:all rebuilds it once. A key submitted while it is running
+# is queued again, because the running task may have read older data.
+#
+# Until start() is called tasks run inline on the caller's thread, which keeps
+# scripts and tests deterministic.
+class RefreshQueue:
+    def __init__(self, name: str = "RefreshQueue") -> None:
+        self.name = name
+        self._pending: OrderedDict[Hashable, Callable[[], Any]] = OrderedDict()
+        self._condition = threading.Condition()
+        self._thread: threading.Thread | None = None
+        self._stopping = False
+        self._running: Hashable | None = None
+        self._submitted = 0
+        self._coalesced = 0
+        self._completed = 0
+        self._failed = 0
+        self._last_error: str | None = None
+        self._last_duration_ms: float | None = None
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self) -> None:
+        with self._condition:
+            if self.running:
+                return
+            self._stopping = False
+            self._thread = threading.Thread(target=self._loop, daemon=True, name=self.name)
+            self._thread.start()
+
+    def stop(self, timeout: float | None = None) -> None:
+        with self._condition:
+            self._stopping = True
+            self._condition.notify_all()
+        if self._thread is not None:
+            self._thread.join(timeout)
+
+    def submit(self, key: Hashable, task: Callable[[], Any]) -> bool:
+        """Queue task under key; returns True when it replaced a waiting task."""
+        with self._condition:
+            self._submitted += 1
+            if self.running:
+                coalesced = key in self._pending
+                if coalesced:
+                    self._coalesced += 1
+                self._pending[key] = task
+                self._condition.notify_all()
+                return coalesced
+        self._run(key, task)
+        return False
+
+    def wait_idle(self, timeout: float | None = None) -> bool:
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._condition:
+            while self._pending or self._running is not None:
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    return False
+                self._condition.wait(remaining)
+        return True
+
+    def is_queued(self, key: Hashable) -> bool:
+        with self._condition:
+            return key in self._pending or self._running == key
+
+    def _loop(self) -> None:
+        while True:
+            with self._condition:
+                while not self._pending and not self._stopping:
+                    self._condition.wait()
+                if self._stopping:
+                    return
+                key, task = self._pending.popitem(last=False)
+                self._running = key
+            try:
+                self._run(key, task)
+            finally:
+                with self._condition:
+                    self._running = None
+                    self._condition.notify_all()
+
+    def _run(self, key: Hashable, task: Callable[[], Any]) -> None:
+        started = time.perf_counter()
+        try:
+            task()
+        except Exception as exc:
+            logger.warning("Refresh %r failed: %s", key, exc)
+            with self._condition:
+                self._failed += 1
+                self._last_error = f"{key!r}: {exc}"
+        else:
+            with self._condition:
+                self._completed += 1
+        finally:
+            with self._condition:
+                self._last_duration_ms = round((time.perf_counter() - started) * 1000, 2)
+
+    def stats(self) -> dict[str, Any]:
+        with self._condition:
+            return {
+                "background": self.running,
+                "pending": [repr(key) for key in self._pending],
+                "running": None if self._running is None else repr(self._running),
+                "submitted": self._submitted,
+                "coalesced": self._coalesced,
+                "completed": self._completed,
+                "failed": self._failed,
+                "last_error": self._last_error,
+                "last_duration_ms": self._last_duration_ms,
+            }
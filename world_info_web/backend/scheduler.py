@@ -28,6 +28,11 @@ VALID_INTERVALS = {
 
 DEFAULT_CONFIG: dict[str, Any] = {}
 GLOBAL_CONFIG_KEY = "__global__"
+COMPACTION_INTERVAL_SEC = 86400
+TREND_DECAY_INTERVAL_SEC = 86400
+# Syncs only re-evaluate the worlds they wrote; the daily rebuild also expires
+# memberships from time-relative rules (published_within_days, ...).
+TOPIC_REBUILD_INTERVAL_SEC = 86400
 
 
 class AutoSyncScheduler:
@@ -269,10 +274,59 @@ class AutoSyncScheduler:
         job_cfg["running"] = False
         self.save_config(config)
 
+    def _claim_maintenance_slot(self, config: dict[str, Any], key: str, interval_sec: int) -> bool:
+        global_cfg = config.setdefault(GLOBAL_CONFIG_KEY, {})
+        last_iso = global_cfg.get(key)
+        now = datetime.now(tz=timezone.utc)
+        if last_iso:
+            try:
+                if (now.timestamp() - datetime.fromisoformat(last_iso).timestamp()) < interval_sec:
+                    return False
+            except ValueError:
+                pass
+        global_cfg[key] = now.isoformat()
+        self.save_config(config)
+        return True
+
+    def _maybe_compact(self, config: dict[str, Any]) -> None:
+        if not self._claim_maintenance_slot(config, "last_compaction_at", COMPACTION_INTERVAL_SEC):
+            return
+        try:
+            result = self._service.compact_snapshots()
+        except Exception as exc:
+            logger.error("AutoSync: snapshot compaction failed: %s", exc)
+            return
+        logger.info("AutoSync: snapshot compaction removed %s snapshots", result["snapshots_deleted"])
+
+    def _maybe_refresh_trend_decay(self, config: dict[str, Any]) -> None:
+        if not self._claim_maintenance_slot(config, "last_trend_decay_at", TREND_DECAY_INTERVAL_SEC):
+            return
+        try:
+            result = self._service.refresh_trend_decay()
+        except Exception as exc:
+            logger.error("AutoSync: trend decay refresh failed: %s", exc)
+            return
+        logger.info("AutoSync: trend decay refreshed %s worlds", result["worlds_refreshed"])
+
+    def _maybe_rebuild_topics(self, config: dict[str, Any]) -> None:
+        if not self._claim_maintenance_slot(config, "last_topic_rebuild_at", TOPIC_REBUILD_INTERVAL_SEC):
+            return
+        try:
+            result = self._service.rebuild_topic_memberships()
+        except Exception as exc:
+            logger.error("AutoSync: topic membership rebuild failed: %s", exc)
+            return
+        logger.info("AutoSync: topic memberships rebuilt for %s topics", len(result["topics"]))
+
     def _tick(self) -> None:
         config = self.load_config()
         if self._normalise_schedule(config):
             self.save_config(config)
+        # Compaction, the trend decay pass and the topic rebuild only touch the
+        # local database, so they also run during a VRChat rate-limit cooldown.
+        self._maybe_compact(config)
+        self._maybe_refresh_trend_decay(config)
+        self._maybe_rebuild_topics(config)
         rate_limit_state = self.get_rate_limit_state(config)
         if rate_limit_state["active"]:
             logger.warning(
@@ -319,13 +373,16 @@ class AutoSyncScheduler:
                 logger.error("AutoSync: job %s failed: %s", job_key, exc)
 
     def _loop(self) -> None:
-        while not self._stop.is_set():
-            try:
-                self._tick()
-            except Exception as exc:
-                logger.error("AutoSync loop error: %s", exc)
-            if self._stop.wait(60):  # check every minute
-                break
+        try:
+            while not self._stop.is_set():
+                try:
+                    self._tick()
+                except Exception as exc:
+                    logger.error("AutoSync loop error: %s", exc)
+                if self._stop.wait(60):  # check every minute
+                    break
+        finally:
+            self._service.storage.close_connection()
 
     def start(self) -> None:
         if self._thread and self._thread.is_alive():
@@ -2,12 +2,21 @@ from __future__ import annotations
 
 import datetime as dt
 import base64
+import bisect
 import copy
+import heapq
+import itertools
 import json
 import logging
+import multiprocessing
+import operator
 import os
 import re
+import time
 from collections import Counter
+from collections.abc import Container, Iterable
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from concurrent.futures.process import BrokenProcessPool
 from pathlib import Path
 from typing import Any
 
@@ -25,11 +34,52 @@ from world_info.scraper.scraper import (
     vrchat_verify_2fa,
 )
 
-from .storage import WorldInfoStorage
+from . import jsoncodec
+from .automaton import KeywordAutomaton
+from .cache import FileCache, VersionedLRUCache
+from .records import WorldRecord
+from .refresh_queue import RefreshQueue
+from .storage import RUN_DIFF_KINDS, TREND_SORT_COLUMNS, StorageUnitOfWork, WorldInfoStorage
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - optional dependency
+    np = None
 
 logger = logging.getLogger(__name__)
 
 ANALYSIS_CACHE_LIMIT = 40
+TOPIC_SCOPE_PREFIX = "topic:"
+# Numeric topic rules: rule type -> (world feature, comparison). Age features are
+# whole days since the date, as _within_days counts them.
+TOPIC_THRESHOLD_RULES = {
+    "visits_min": ("visits", ">="),
+    "visits_max": ("visits", "<="),
+    "favorites_min": ("favorites", ">="),
+    "favorites_max": ("favorites", "<="),
+    "heat_min": ("heat", ">="),
+    "heat_max": ("heat", "<="),
+    "popularity_min": ("popularity", ">="),
+    "popularity_max": ("popularity", "<="),
+    "favorite_rate_min": ("favorite_rate", ">="),
+    "favorite_rate_max": ("favorite_rate", "<="),
+    "published_within_days": ("published_age_days", "<="),
+    "updated_within_days": ("updated_age_days", "<="),
+}
+TOPIC_EXACT_RULES = frozenset({"source", "author_id", "world_id", "tag"})
+CATALOG_CACHE_ENTRIES = 32
+INSIGHTS_CACHE_ENTRIES = 16
+JOB_DIFF_PREVIEW_LIMIT = 5
+EVENT_TYPES = ("new_upload", "traffic_spike", "new_update")
+EVENT_DIFF_LIMIT = 20
+# Widest window the events route serves; older uploads/updates are not recorded.
+EVENT_SCAN_DAYS = 30
+EVENT_RETENTION_DAYS = 90
+# Insights limits the frontend requests; their response bodies are encoded
+# up front when a cached payload is decoded.
+INSIGHTS_PRESET_LIMITS = (12,)
+# (metric, days back from the latest point) baselines behind the trend deltas.
+TREND_BASELINE_WINDOWS = (("visits", 1), ("visits", 7), ("visits", 14), ("visits", 30), ("favorites", 1), ("favorites", 7))
 
 
 LEGACY_SOURCE_LABELS = {
@@ -64,10 +114,23 @@ class WorldInfoService:
         self.data_dir.mkdir(parents=True, exist_ok=True)
 
         self._job_display_cache: dict[str, tuple[float, dict]] = {}
+        self._file_cache = FileCache()
+        self._catalog_cache = VersionedLRUCache(
+            self._to_int(os.getenv("WORLD_INFO_CATALOG_CACHE_SIZE", str(CATALOG_CACHE_ENTRIES)))
+        )
+        self._insights_cache = VersionedLRUCache(
+            self._to_int(os.getenv("WORLD_INFO_INSIGHTS_CACHE_SIZE", str(INSIGHTS_CACHE_ENTRIES)))
+        )
+        # Post-sync analysis refreshes; runs inline until the app starts it.
+        self.refresh_queue = RefreshQueue("AnalysisRefresh")
         self.legacy_root = self.repo_root / "world_info"
         self.legacy_scraper_dir = self.legacy_root / "scraper"
         self.legacy_analytics_dir = self.repo_root / "analytics"
-        self.storage = WorldInfoStorage(self.data_dir / "world_info.sqlite3")
+        self.storage = WorldInfoStorage(
+            self.data_dir / "world_info.sqlite3",
+            payload_codec=os.getenv("WORLD_INFO_PAYLOAD_CODEC", "json"),
+        )
+        self.snapshot_write_mode = os.getenv("WORLD_INFO_SNAPSHOT_MODE", "changes").strip().lower() or "changes"
         self.jobs_path = jobs_path or (self.app_root / "config" / "sync_jobs.json")
         self.topics_path = topics_path or (self.app_root / "config" / "topics.json")
         self.world_properties_path = world_properties_path or (self.app_root / "config" / "world_properties.json")
@@ -162,6 +225,19 @@ class WorldInfoService:
         sort: str = "visits",
         direction: str = "desc",
     ) -> list[dict[str, Any]]:
+        return self.page_topic_worlds(topic_key, query=query, tag=tag, sort=sort, direction=direction)["items"]
+
+    def page_topic_worlds(
+        self,
+        topic_key: str,
+        *,
+        query: str | None = None,
+        tag: str | None = None,
+        sort: str = "visits",
+        direction: str = "desc",
+        limit: int | None = None,
+        offset: int = 0,
+    ) -> dict[str, Any]:
         membership_rows = self.storage.list_topic_memberships(topic_key)
         membership_map = {row["world_id"]: row for row in membership_rows}
         rules = [rule for rule in self.storage.list_topic_rules(topic_key) if rule.get("is_active", 1)]
@@ -187,20 +263,32 @@ class WorldInfoService:
                 ]
             if tag and tag != "all":
                 worlds = [world for world in worlds if tag in world.get("tags", [])]
-            worlds = self._sort_worlds(worlds, sort=sort, direction=direction, history=topic_history)
+            page = self._page_worlds(
+                worlds,
+                lambda window: self._sort_worlds(worlds, sort=sort, direction=direction, history=topic_history, limit=window),
+                limit=limit,
+                offset=offset,
+                with_tags=True,
+            )
         else:
-            worlds = [
-                world
-                for world in self.load_worlds("db:all", query=query, tag=tag, sort=sort, direction=direction)
-                if world.get("id") in membership_map
-            ]
-        for world in worlds:
+            page = self.page_worlds(
+                "db:all",
+                query=query,
+                tag=tag,
+                sort=sort,
+                direction=direction,
+                world_ids=membership_map,
+                limit=limit,
+                offset=offset,
+                with_tags=True,
+            )
+        for world in page["items"]:
             membership = membership_map.get(world.get("id"))
             if membership:
                 world["topic_first_seen_at"] = membership["first_seen_at"]
                 world["topic_last_seen_at"] = membership["last_seen_at"]
                 world["topic_matched_by"] = membership.get("matched_by")
-        return worlds
+        return page
 
     def get_topic_dashboard(self, topic_key: str) -> dict[str, Any]:
         topic = self.storage.get_topic(topic_key)
@@ -210,10 +298,7 @@ class WorldInfoService:
         worlds = self.load_topic_worlds(topic_key)
         today = dt.datetime.now(dt.timezone.utc)
         summary = {
-            "world_count": len(worlds),
-            "total_visits": sum(self._to_int(world.get("visits")) for world in worlds),
-            "total_favorites": sum(self._to_int(world.get("favorites")) for world in worlds),
-            "tracked_creators": len({world.get("author_id") for world in worlds if world.get("author_id")}),
+            **self.collect_totals(worlds),
             "new_worlds_7d": sum(
                 1
                 for world in worlds
@@ -727,28 +812,42 @@ class WorldInfoService:
         return {"status": "deleted", "post_id": cleaned_post_id}
 
     def list_job_diagnostics(self) -> list[dict[str, Any]]:
-        configs = self._load_job_configs()
+        # Batched: configs are resolved once, every job's recent runs come from
+        # one query, and counts and diffs are read from run_summaries (written
+        # when a run completes, backfilled here for older runs).
+        resolved_by_job = {
+            job_key: self._resolve_job_config(job_key, config)
+            for job_key, config in sorted(self._load_job_configs().items())
+        }
+        labels = {resolved["source_key"]: resolved["label"] for resolved in resolved_by_job.values()}
+        runs_by_job: dict[str, list[dict[str, Any]]] = {}
+        for run in self.storage.list_recent_job_runs(runs_per_job=20, completed_per_job=2):
+            runs_by_job.setdefault(run["job_key"], []).append(run)
+
         items: list[dict[str, Any]] = []
-        for job in self.list_jobs():
-            job_key = job["job_key"]
-            resolved = self._resolve_job_config(job_key, configs.get(job_key, {}))
-            raw_runs = self.storage.list_runs(limit=20, job_key=job_key)
-            completed_runs = [run for run in raw_runs if run.get("status") == "completed"]
+        for job_key, resolved in resolved_by_job.items():
+            runs = runs_by_job.get(job_key, [])
+            completed_runs = [run for run in runs if run.get("status") == "completed"]
             latest_completed_run = completed_runs[0] if completed_runs else None
-            worlds = (
-                [self._normalise_db_world(world) for world in self.storage.load_run_worlds(int(latest_completed_run["id"]))]
-                if latest_completed_run
-                else []
-            )
-            current_creator_count = len({world.get("author_id") for world in worlds if world.get("author_id")})
+            previous_run = completed_runs[1] if len(completed_runs) > 1 else None
+            summary = None
+            if latest_completed_run is not None:
+                summary = latest_completed_run.get("summary")
+                previous_run_id = int(previous_run["id"]) if previous_run else None
+                if summary is None or summary["previous_run_id"] != previous_run_id:
+                    summary = self._record_run_summary(
+                        job_key=job_key,
+                        run_id=int(latest_completed_run["id"]),
+                        previous_run_id=previous_run_id,
+                    )
             item = {
                 "job_key": job_key,
-                "label": job["label"],
-                "type": job["type"],
-                "source": job["source"],
-                "ready": job["ready"],
-                "reason": job["reason"],
-                "creator_review_enabled": job["creator_review_enabled"],
+                "label": resolved["label"],
+                "type": resolved["type"],
+                "source": self._public_db_source_key(resolved["source_key"]),
+                "ready": resolved["ready"],
+                "reason": resolved["reason"],
+                "creator_review_enabled": bool(resolved.get("creator_review_enabled")),
                 "keyword_count": len(resolved.get("keywords", [])),
                 "keywords": resolved.get("keywords", []),
                 "search": resolved.get("search"),
@@ -763,15 +862,91 @@ class WorldInfoService:
                 "world_blacklist_count": len(self._load_blacklist(resolved.get("blacklist_file"))),
                 "creator_whitelist_count": len(resolved.get("include_user_ids", [])),
                 "creator_blacklist_count": len(resolved.get("exclude_author_ids", [])),
-                "current_world_count": len(worlds),
-                "current_creator_count": current_creator_count,
-                "latest_run": self._decorate_run(raw_runs[0]) if raw_runs else None,
-                "latest_completed_run": self._decorate_run(latest_completed_run) if latest_completed_run else None,
-                "source_diff": self.get_job_source_diff(job_key),
+                "current_world_count": summary["world_count"] if summary else 0,
+                "current_creator_count": summary["creator_count"] if summary else 0,
+                "latest_run": self._decorate_run(self._strip_run_summary(runs[0]), labels=labels) if runs else None,
+                "latest_completed_run": (
+                    self._decorate_run(self._strip_run_summary(latest_completed_run), labels=labels)
+                    if latest_completed_run
+                    else None
+                ),
+                "source_diff": self._source_diff_from_summary(
+                    job_key,
+                    summary,
+                    latest_run=self._decorate_run(self._strip_run_summary(latest_completed_run), labels=labels),
+                    previous_run=self._decorate_run(self._strip_run_summary(previous_run), labels=labels),
+                ),
             }
             items.append(item)
         return items
 
+    def _record_run_summary(
+        self,
+        *,
+        job_key: str | None,
+        run_id: int,
+        previous_run_id: int | None,
+        store: WorldInfoStorage | StorageUnitOfWork | None = None,
+    ) -> dict[str, Any]:
+        store = store or self.storage
+        counts = store.count_run_worlds([run_id])[run_id]
+        diff = None
+        if previous_run_id is not None:
+            result = store.diff_runs(previous_run_id, run_id, limit=JOB_DIFF_PREVIEW_LIMIT)
+            diff = {
+                "added_count": result["added_count"],
+                "removed_count": result["removed_count"],
+                "changed_count": result["changed_count"],
+                "added_worlds": result["added"],
+                "removed_worlds": result["removed"],
+                "changed_worlds": result["changed"],
+            }
+        summary = {"previous_run_id": previous_run_id, **counts, "diff": diff}
+        store.upsert_run_summary(
+            run_id=run_id,
+            job_key=job_key,
+            created_at=dt.datetime.now(dt.timezone.utc).isoformat(),
+            **summary,
+        )
+        return summary
+
+    def _strip_run_summary(self, run: dict[str, Any] | None) -> dict[str, Any] | None:
+        if run is None:
+            return None
+        return {key: value for key, value in run.items() if key not in {"summary", "run_rank", "completed_rank"}}
+
+    def _source_diff_from_summary(
+        self,
+        job_key: str,
+        summary: dict[str, Any] | None,
+        *,
+        latest_run: dict[str, Any] | None,
+        previous_run: dict[str, Any] | None,
+    ) -> dict[str, Any]:
+        diff = (summary or {}).get("diff")
+        if latest_run is None or previous_run is None or diff is None:
+            return {
+                "job_key": job_key,
+                "status": "insufficient_history",
+                "latest_run": latest_run,
+                "previous_run": previous_run,
+                "added_count": 0,
+                "removed_count": 0,
+                "changed_count": 0,
+                "added_worlds": [],
+                "removed_worlds": [],
+                "changed_worlds": [],
+                "message": "Need at least two completed runs for a source diff.",
+            }
+        return {
+            "job_key": job_key,
+            "status": "ok",
+            "latest_run": latest_run,
+            "previous_run": previous_run,
+            **diff,
+            "message": "Compared the latest two completed runs for this job source.",
+        }
+
     def get_job_source_diff(
         self,
         job_key: str,
@@ -805,81 +980,61 @@ class WorldInfoService:
                 "message": "Need at least two completed runs for a source diff.",
             }
 
-        latest_worlds = {
-            world.get("id"): self._normalise_db_world(world)
-            for world in self.storage.load_run_worlds(int(latest_run["id"]))
-            if world.get("id")
-        }
-        previous_worlds = {
-            world.get("id"): self._normalise_db_world(world)
-            for world in self.storage.load_run_worlds(int(previous_run["id"]))
-            if world.get("id")
-        }
-
-        added_ids = sorted(set(latest_worlds) - set(previous_worlds))
-        removed_ids = sorted(set(previous_worlds) - set(latest_worlds))
-        changed_worlds = []
-        for world_id in sorted(set(latest_worlds) & set(previous_worlds)):
-            latest = latest_worlds[world_id]
-            previous = previous_worlds[world_id]
-            visits_delta = self._to_int(latest.get("visits")) - self._to_int(previous.get("visits"))
-            favorites_delta = self._to_int(latest.get("favorites")) - self._to_int(previous.get("favorites"))
-            heat_delta = self._to_int(latest.get("heat")) - self._to_int(previous.get("heat"))
-            popularity_delta = self._to_int(latest.get("popularity")) - self._to_int(previous.get("popularity"))
-            changed_fields = []
-            for field in ("name", "author_id", "author_name", "updated_at", "release_status"):
-                if (latest.get(field) or None) != (previous.get(field) or None):
-                    changed_fields.append(field)
-            if visits_delta:
-                changed_fields.append("visits")
-            if favorites_delta:
-                changed_fields.append("favorites")
-            if heat_delta:
-                changed_fields.append("heat")
-            if popularity_delta:
-                changed_fields.append("popularity")
-            if not changed_fields:
-                continue
-            changed_worlds.append(
-                {
-                    "id": world_id,
-                    "name": latest.get("name") or previous.get("name") or world_id,
-                    "author_name": latest.get("author_name") or previous.get("author_name"),
-                    "visits_delta": visits_delta,
-                    "favorites_delta": favorites_delta,
-                    "heat_delta": heat_delta,
-                    "popularity_delta": popularity_delta,
-                    "changed_fields": sorted(set(changed_fields)),
-                    "latest": self._world_preview(latest),
-                    "previous": self._world_preview(previous),
-                    "score": abs(visits_delta) + abs(favorites_delta) * 4 + abs(heat_delta) * 2 + abs(popularity_delta) * 2,
-                }
-            )
-
-        changed_worlds.sort(key=lambda item: (item["score"], item["name"].casefold()), reverse=True)
-        for item in changed_worlds:
-            item.pop("score", None)
-
+        limits = (added_limit, removed_limit, changed_limit)
+        diff = self.storage.diff_runs(
+            int(previous_run["id"]),
+            int(latest_run["id"]),
+            limit=None if None in limits else max(limits),
+        )
         return {
             "job_key": job_key,
             "status": "ok",
             "latest_run": self._decorate_run(latest_run),
             "previous_run": self._decorate_run(previous_run),
-            "added_count": len(added_ids),
-            "removed_count": len(removed_ids),
-            "changed_count": len(changed_worlds),
-            "added_worlds": [
-                self._world_preview(latest_worlds[world_id])
-                for world_id in (added_ids if added_limit is None else added_ids[:added_limit])
-            ],
-            "removed_worlds": [
-                self._world_preview(previous_worlds[world_id])
-                for world_id in (removed_ids if removed_limit is None else removed_ids[:removed_limit])
-            ],
-            "changed_worlds": changed_worlds if changed_limit is None else changed_worlds[:changed_limit],
+            "added_count": diff["added_count"],
+            "removed_count": diff["removed_count"],
+            "changed_count": diff["changed_count"],
+            "added_worlds": diff["added"] if added_limit is None else diff["added"][:added_limit],
+            "removed_worlds": diff["removed"] if removed_limit is None else diff["removed"][:removed_limit],
+            "changed_worlds": diff["changed"] if changed_limit is None else diff["changed"][:changed_limit],
             "message": "Compared the latest two completed runs for this job source.",
         }
 
+    def diff_runs(
+        self,
+        base_run_id: int,
+        target_run_id: int,
+        *,
+        kind: str | None = None,
+        limit: int = 50,
+        offset: int = 0,
+    ) -> dict[str, Any]:
+        base_run = self.storage.get_run(base_run_id)
+        target_run = self.storage.get_run(target_run_id)
+        if base_run is None or target_run is None:
+            raise KeyError(f"Unknown run: {base_run_id if base_run is None else target_run_id}")
+        if kind and kind not in RUN_DIFF_KINDS:
+            raise ValueError(f"kind must be one of: {', '.join(RUN_DIFF_KINDS)}")
+        diff = self.storage.diff_runs(
+            base_run_id,
+            target_run_id,
+            kinds=(kind,) if kind else RUN_DIFF_KINDS,
+            limit=limit,
+            offset=offset,
+        )
+        return {
+            "base_run": self._decorate_run(base_run),
+            "target_run": self._decorate_run(target_run),
+            "limit": limit,
+            "offset": offset,
+            "added_count": diff["added_count"],
+            "removed_count": diff["removed_count"],
+            "changed_count": diff["changed_count"],
+            "added_worlds": diff["added"],
+            "removed_worlds": diff["removed"],
+            "changed_worlds": diff["changed"],
+        }
+
     def create_job_with_topic(
         self,
         *,
@@ -1121,6 +1276,7 @@ class WorldInfoService:
         self._sync_topic_catalog(refresh=False)
         if self.storage.has_data():
             self._refresh_topic_memberships(topic_keys={topic_key})
+        self.invalidate_analysis_scopes([self._topic_analysis_scope(topic_key)])
         return self.get_topic(topic_key)
 
     def set_topic_active(self, topic_key: str, is_active: bool) -> dict[str, Any]:
@@ -1140,6 +1296,7 @@ class WorldInfoService:
             topics.pop(topic_key)
             self._write_json(self.topics_path, topics)
         self.storage.delete_topic(topic_key)
+        self.storage.delete_analysis_cache(self._topic_analysis_scope(topic_key))
         return {"status": "deleted", "topic_key": topic_key}
 
     def delete_job(self, job_key: str, *, delete_topic: bool = True) -> dict[str, Any]:
@@ -1158,6 +1315,7 @@ class WorldInfoService:
                     self._write_json(self.topics_path, topics)
                 self.storage.delete_topic(job_key)
                 topic_deleted = True
+        self.storage.delete_world_events(job_key=job_key)
         return {"status": "deleted", "job_key": job_key, "topic_deleted": topic_deleted}
 
     def list_runs(self, limit: int = 20) -> list[dict[str, Any]]:
@@ -1228,6 +1386,20 @@ class WorldInfoService:
         }
         return {"summary": summary, "items": items}
 
+    def get_storage_diagnostics(self) -> dict[str, Any]:
+        return {
+            "db_path": self._display_path(self.storage.db_path),
+            "db_size_bytes": self.storage.database_size_bytes(),
+            "payload_codec": self.storage.payload_codec,
+            "connections": self.storage.connection_stats(),
+            "transactions": self.storage.transaction_stats(),
+            "catalog_cache": self._catalog_cache.stats(),
+            "file_cache": self._file_cache.stats(),
+            "insights_cache": self._insights_cache.stats(),
+            "refresh_queue": self.refresh_queue.stats(),
+            "stale_analysis_scopes": self.storage.list_stale_analysis_scopes(),
+        }
+
     def list_query_analytics(self, limit_runs: int = 12) -> dict[str, Any]:
         recent_runs = self.storage.list_runs(limit=limit_runs)
         decorated_runs = [self._decorate_run(run) for run in recent_runs]
@@ -1500,9 +1672,148 @@ class WorldInfoService:
         direction: str = "desc",
         dedupe: bool = True,
     ) -> list[dict[str, Any]]:
+        return self.page_worlds(source, query=query, tag=tag, sort=sort, direction=direction, dedupe=dedupe)["items"]
+
+    def page_worlds(
+        self,
+        source: str,
+        *,
+        query: str | None = None,
+        tag: str | None = None,
+        sort: str = "visits",
+        direction: str = "desc",
+        dedupe: bool = True,
+        world_ids: Container[str] | None = None,
+        limit: int | None = None,
+        offset: int = 0,
+        with_tags: bool = False,
+    ) -> dict[str, Any]:
+        is_db_source = source == "db:all" or source.startswith("db:")
+        if is_db_source and not query:
+            # Repeated loads within a request (event feed, graph, topic refresh,
+            # dashboards) share the deduped catalog until the data version moves.
+            cache_key = ("worlds", source, dedupe)
+            token = self._catalog_cache_token(source)
+            worlds = self._catalog_cache.get(cache_key, token)
+            if worlds is None:
+                worlds, _, _ = self._load_world_catalog(source, dedupe=dedupe)
+                # Cached as compact records; pages are turned back into dicts below.
+                worlds = [WorldRecord.from_dict(world) for world in worlds]
+                self._catalog_cache.put(cache_key, token, worlds)
+            search_applied = tag_applied = False
+            if tag and tag != "all":
+                # Tag filters come from the world_tags index, not a scan of the records.
+                tag_source_key = None if source == "db:all" else source.removeprefix("db:")
+                tagged = self.storage.list_tagged_world_ids(tag, tag_source_key)
+                worlds = [world for world in worlds if world.get("id") in tagged]
+                tag_applied = True
+        else:
+            worlds, search_applied, tag_applied = self._load_world_catalog(
+                source,
+                query=query,
+                tag=tag,
+                dedupe=dedupe,
+            )
+
+        if query and not search_applied:
+            needle = query.casefold()
+            worlds = [
+                world
+                for world in worlds
+                if needle in (world.get("name") or "").casefold()
+                or needle in (world.get("id") or "").casefold()
+                or needle in (world.get("author_name") or "").casefold()
+            ]
+
+        if tag and tag != "all" and not tag_applied:
+            worlds = [world for world in worlds if tag in world.get("tags", [])]
+
+        if world_ids is not None:
+            worlds = [world for world in worlds if world.get("id") in world_ids]
+
+        def order(window: int | None) -> list[dict[str, Any]]:
+            trend_source_key = self._trend_source_key(source)
+            if trend_source_key and sort in TREND_SORT_COLUMNS:
+                # Persisted trend scores: the order comes from an indexed ORDER BY.
+                self._ensure_trend_metrics(trend_source_key)
+                descending = direction != "asc"
+                ranked = self.storage.list_trend_order(trend_source_key, sort, descending=descending)
+                ranks = self._stored_trend_ranks(worlds, ranked, source, sort, descending=descending)
+                ranked_worlds = self._top_k(list(zip(ranks, worlds)), key=lambda item: item[0], limit=window)
+                return [world for _, world in ranked_worlds]
+            if is_db_source:
+                history, history_key = self._load_cached_history(source)
+            else:
+                history, history_key = self.load_history(source=source), None
+            return self._sort_worlds(
+                worlds,
+                sort=sort,
+                direction=direction,
+                history=history,
+                history_key=history_key,
+                limit=window,
+            )
+
+        page = self._page_worlds(worlds, order, limit=limit, offset=offset, with_tags=with_tags)
+        if is_db_source and not query:
+            page["items"] = [self._clone_world(world) for world in page["items"]]
+        return page
+
+    def _page_worlds(
+        self,
+        worlds: list[dict[str, Any]],
+        order: Any,
+        *,
+        limit: int | None,
+        offset: int,
+        with_tags: bool = False,
+    ) -> dict[str, Any]:
+        # order(window) returns the first `window` worlds in sort order (all of
+        # them for None), so bounded pages only pay for a top-K selection.
+        total = len(worlds)
+        window = None if limit is None else offset + limit
+        items = order(window)[offset:window]
+        next_offset = offset + len(items) if window is not None and window < total else None
+        page = {"total": total, "offset": offset, "limit": limit, "next_offset": next_offset, "items": items}
+        # Totals cover every matching world, not just the page.
+        page["summary"] = self.collect_totals(worlds)
+        if with_tags:
+            page["tags"] = self.collect_tags(worlds)
+        return page
+
+    def _top_k(
+        self,
+        items: list[dict[str, Any]],
+        *,
+        key: Any,
+        limit: int | None,
+        reverse: bool = False,
+    ) -> list[dict[str, Any]]:
+        # heapq.nsmallest/nlargest are stable and match sorted(...)[:limit].
+        if limit is not None and limit < len(items):
+            return (heapq.nlargest if reverse else heapq.nsmallest)(limit, items, key=key)
+        return sorted(items, key=key, reverse=reverse)
+
+    def _load_world_catalog(
+        self,
+        source: str,
+        *,
+        query: str | None = None,
+        tag: str | None = None,
+        dedupe: bool = True,
+        world_ids: Iterable[str] | None = None,
+    ) -> tuple[list[dict[str, Any]], bool, bool]:
+        search_applied = False
+        tag_applied = False
         if source == "db:all" or source.startswith("db:"):
             source_key = None if source == "db:all" else source.removeprefix("db:")
-            worlds = self.storage.load_latest_worlds(source_key)
+            db_tag = tag if tag and tag != "all" else None
+            if query and self.storage.search_index_enabled:
+                worlds = self.storage.load_latest_worlds(source_key, search=query, tag=db_tag, world_ids=world_ids)
+                search_applied = True
+            else:
+                worlds = self.storage.load_latest_worlds(source_key, tag=db_tag, world_ids=world_ids)
+            tag_applied = db_tag is not None
             worlds = [self._normalise_db_world(world) for world in worlds]
             if source_key and source_key.startswith("job:"):
                 job_key = source_key.removeprefix("job:")
@@ -1530,35 +1841,69 @@ class WorldInfoService:
             else:
                 raw_items = self._read_json(path, default=[])
                 worlds = [self._normalise_api_world(item, source) for item in raw_items if isinstance(item, dict)]
+            if world_ids is not None:
+                wanted = set(world_ids)
+                worlds = [world for world in worlds if world.get("id") in wanted]
 
         if dedupe:
             worlds = self._dedupe_worlds(worlds)
+        elif source.startswith("db:"):
+            worlds = [dict(world) for world in worlds]
 
         world_properties = self._load_world_properties()
         worlds = [self._apply_world_properties(world, properties=world_properties) for world in worlds]
+        return worlds, search_applied, tag_applied
+
+    def _catalog_cache_token(self, source: str) -> tuple[Any, ...]:
+        parts: list[Any] = [self.storage.data_version(), self._file_signature(self.world_properties_path)]
+        if source.startswith("db:job:"):
+            job_key = source.removeprefix("db:job:")
+            self._resolve_job_for_display(job_key)
+            parts.append(self._job_display_cache.get(job_key, (None,))[0])
+        return tuple(parts)
+
+    def _load_cached_history(self, source: str) -> tuple[dict[str, list[dict[str, Any]]], tuple[str, Any]]:
+        # Also returns the (source, token) key the history is cached under, so
+        # arrays derived from it can be cached against the same data version.
+        cache_key = ("history", source)
+        token = (self.storage.data_version(), self._file_signature(self.legacy_scraper_dir / "history.json"))
+        history = self._catalog_cache.get(cache_key, token)
+        if history is None:
+            history = self.load_history(source=source)
+            self._catalog_cache.put(cache_key, token, history)
+        return history, (source, token)
+
+    def _file_signature(self, path: Path) -> tuple[int, int] | None:
+        try:
+            stat = path.stat()
+        except OSError:
+            return None
+        return (stat.st_mtime_ns, stat.st_size)
+
+    def response_version(self) -> tuple[Any, ...]:
+        # Everything read-only API responses are built from: the database and the
+        # config/legacy files that are read straight from disk. Analysis rows are
+        # rebuilt in the background after the write, so they count separately.
+        paths = [self.jobs_path, self.topics_path, self.world_properties_path, self.legacy_scraper_dir / "history.json"]
+        paths.extend(source["path"] for source in self.legacy_sources.values())
+        return (
+            self.storage.data_version(),
+            self.storage.analysis_version(),
+            *(self._file_signature(path) for path in paths),
+        )
 
-        if query:
-            needle = query.casefold()
-            worlds = [
-                world
-                for world in worlds
-                if needle in (world.get("name") or "").casefold()
-                or needle in (world.get("id") or "").casefold()
-                or needle in (world.get("author_name") or "").casefold()
-            ]
-
-        if tag and tag != "all":
-            worlds = [world for world in worlds if tag in world.get("tags", [])]
-
-        history = self.load_history(source=source)
-        return self._sort_worlds(worlds, sort=sort, direction=direction, history=history)
+    def invalidate_catalog_cache(self) -> None:
+        self._catalog_cache.invalidate()
 
     def load_history(
         self,
         world_id: str | None = None,
         source: str | None = None,
+        *,
+        world_ids: Iterable[str] | None = None,
     ) -> dict[str, list[dict[str, Any]]]:
         merged: dict[str, list[dict[str, Any]]] = {}
+        id_set = None if world_ids is None else set(world_ids)
 
         source_key = None
         include_legacy_history = True
@@ -1566,19 +1911,15 @@ class WorldInfoService:
             source_key = source.removeprefix("db:")
             include_legacy_history = False
 
-        legacy_history = self._read_json(self.legacy_scraper_dir / "history.json", default={})
-        if include_legacy_history and isinstance(legacy_history, dict):
-            for wid, entries in legacy_history.items():
+        if include_legacy_history:
+            for wid, entries in self._load_legacy_history().items():
                 if world_id and wid != world_id:
                     continue
-                if not isinstance(entries, list):
+                if id_set is not None and wid not in id_set:
                     continue
-                bucket = merged.setdefault(wid, [])
-                for entry in entries:
-                    if isinstance(entry, dict):
-                        bucket.append(self._normalise_history_entry(wid, entry, "legacy"))
+                merged[wid] = list(entries)
 
-        for wid, entries in self.storage.load_history_points(world_id, source_key=source_key).items():
+        for wid, entries in self.storage.load_history_points(world_id, source_key=source_key, world_ids=id_set).items():
             bucket = merged.setdefault(wid, [])
             for entry in entries:
                 bucket.append(self._normalise_db_history_entry(wid, entry))
@@ -1597,6 +1938,23 @@ class WorldInfoService:
             merged[wid] = sorted(deduped.values(), key=lambda item: item.get("timestamp") or 0)
         return merged
 
+    def _load_legacy_history(self) -> dict[str, list[dict[str, Any]]]:
+        def normalise(path: Path) -> dict[str, list[dict[str, Any]]]:
+            payload = self._read_json(path, default={})
+            if not isinstance(payload, dict):
+                return {}
+            return {
+                wid: [
+                    self._normalise_history_entry(wid, entry, "legacy")
+                    for entry in entries
+                    if isinstance(entry, dict)
+                ]
+                for wid, entries in payload.items()
+                if isinstance(entries, list)
+            }
+
+        return self._file_cache.load(self.legacy_scraper_dir / "history.json", "history", normalise)
+
     def load_history_summary(self, source: str | None = None) -> list[dict[str, Any]]:
         history = self.load_history(source=source)
         items: list[dict[str, Any]] = []
@@ -1703,8 +2061,21 @@ class WorldInfoService:
         limit: int = 12,
         allow_cache: bool = True,
     ) -> dict[str, Any]:
-        resolved_source: str | None = None
-        effective_limit = limit
+        if topic_key:
+            scope_key = self._topic_analysis_scope(topic_key)
+        else:
+            resolved_source = source or "db:all"
+            scope_key = resolved_source
+        effective_limit = max(limit, ANALYSIS_CACHE_LIMIT)
+        storage = getattr(self, "storage", None)
+        if allow_cache and storage is not None:
+            cached = storage.get_analysis_cache(scope_key)
+            if (
+                cached
+                and isinstance(cached.get("payload"), dict)
+                and self._can_serve_cached_analysis(scope_key, cached)
+            ):
+                return self._limit_collection_insights_payload(cached["payload"], limit)
         if topic_key:
             topic = self.get_topic(topic_key)
             worlds = self.load_topic_worlds(topic_key)
@@ -1712,13 +2083,6 @@ class WorldInfoService:
             scope = {"topic_key": topic_key, "label": label}
             history = self._load_topic_history(topic_key)
         else:
-            resolved_source = source or "db:all"
-            effective_limit = max(limit, ANALYSIS_CACHE_LIMIT)
-            storage = getattr(self, "storage", None)
-            if allow_cache and storage is not None:
-                cached = storage.get_analysis_cache(resolved_source)
-                if cached and isinstance(cached.get("payload"), dict):
-                    return self._limit_collection_insights_payload(cached["payload"], limit)
             worlds = self.load_worlds(resolved_source)
             label = resolved_source
             scope = {"source": resolved_source, "label": label}
@@ -1738,7 +2102,8 @@ class WorldInfoService:
         summary_creators: set[str] = set()
         summary_last_seen_at: str | None = None
 
-        for world in worlds:
+        trends = self._build_trend_metrics_batch(worlds, history)
+        for world, trend in zip(worlds, trends):
             world_id = world.get("id")
             if not world_id:
                 continue
@@ -1750,7 +2115,6 @@ class WorldInfoService:
             fetched_at = self._clean_optional_text(world.get("fetched_at"))
             if fetched_at and (summary_last_seen_at is None or fetched_at > summary_last_seen_at):
                 summary_last_seen_at = fetched_at
-            trend = self._build_world_trend_metrics(world, history.get(world_id, []))
             insights_by_id[world_id] = trend
             row_base = {
                 "id": world_id,
@@ -2093,88 +2457,195 @@ class WorldInfoService:
                 "summary": update_summary,
             },
         }
-        storage = getattr(self, "storage", None)
-        if resolved_source and storage is not None:
+        if storage is not None:
             storage.upsert_analysis_cache(
-                scope_key=resolved_source,
-                scope_type="source",
+                scope_key=scope_key,
+                scope_type=self._analysis_scope_type(scope_key),
                 updated_at=payload["generated_at"],
                 payload=payload,
             )
         return self._limit_collection_insights_payload(payload, limit)
 
-    def list_event_feed(self, *, limit: int = 50, recency_days: int = 7) -> dict[str, Any]:
+    def list_event_feed(
+        self,
+        *,
+        limit: int = 50,
+        recency_days: int = 7,
+        cursor: str | None = None,
+        event_types: Iterable[str] | None = None,
+        job_key: str | None = None,
+        min_severity: float | None = None,
+    ) -> dict[str, Any]:
+        # Events are written when a run completes (_record_run_events); the feed
+        # is a keyset-paged range over world_events, newest first.
         now = dt.datetime.now(dt.timezone.utc)
-        events: list[dict[str, Any]] = []
-        seen_keys: set[tuple[str, str, str]] = set()
-        worlds_cache: dict[str, dict[str, dict[str, Any]]] = {}
+        types = [str(item).strip() for item in (event_types or []) if str(item).strip()]
+        unknown = sorted(set(types) - set(EVENT_TYPES))
+        if unknown:
+            raise ValueError(f"Unknown event type: {', '.join(unknown)}")
+        before = self._decode_event_cursor(cursor) if cursor else None
+        self._ensure_world_events_backfilled()
+        filters = {
+            "since": (now - dt.timedelta(days=recency_days + 1)).isoformat(),
+            "event_types": types or None,
+            "job_key": job_key or None,
+            "min_severity": min_severity,
+        }
+        rows = self.storage.list_world_events(**filters, before=before, limit=limit + 1)
+        counts = self.storage.count_world_events(**filters)
+        labels = {
+            key: str(config.get("label", key)).strip() or key
+            for key, config in self._load_job_configs().items()
+        }
+        topic_keys = {topic["topic_key"] for topic in self.storage.list_topics()}
+        items = []
+        for row in rows[:limit]:
+            item = dict(row["payload"].get("world") or {})
+            item.update(
+                {
+                    "event_id": row["id"],
+                    "event_key": f"{row['job_key']}:{row['event_type']}:{row['world_id']}:{row['event_day']}",
+                    "type": row["event_type"],
+                    "job_key": row["job_key"],
+                    "label": labels.get(row["job_key"], row["job_key"]),
+                    "source": row["source_key"],
+                    "topic_key": row["job_key"] if row["job_key"] in topic_keys else None,
+                    "run_id": row["run_id"],
+                    "occurred_at": row["occurred_at"],
+                    "detected_at": row["detected_at"],
+                    "summary": row["summary"],
+                    "severity": round(float(row["severity"]), 2),
+                    "delta": row["payload"].get("delta") or {},
+                }
+            )
+            items.append(item)
+        next_cursor = None
+        if len(rows) > limit:
+            last = rows[limit - 1]
+            next_cursor = self._encode_event_cursor(last["sort_at"], int(last["id"]))
+        return {
+            "generated_at": now.isoformat(),
+            "recency_days": recency_days,
+            "summary": {
+                "total": sum(counts.values()),
+                "spikes": counts.get("traffic_spike", 0),
+                "uploads": counts.get("new_upload", 0),
+                "updates": counts.get("new_update", 0),
+            },
+            "items": items,
+            "next_cursor": next_cursor,
+        }
 
-        def load_world_map(source_key: str) -> dict[str, dict[str, Any]]:
-            cached = worlds_cache.get(source_key)
-            if cached is not None:
-                return cached
-            try:
-                worlds = self.load_worlds(source_key)
-            except KeyError:
-                worlds = []
-            mapping = {
-                str(world.get("id")): world
-                for world in worlds
-                if world.get("id")
-            }
-            worlds_cache[source_key] = mapping
-            return mapping
+    def _encode_event_cursor(self, sort_at: str, event_id: int) -> str:
+        return base64.urlsafe_b64encode(f"{sort_at}|{event_id}".encode("utf-8")).decode("ascii").rstrip("=")
 
-        def append_event(
+    def _decode_event_cursor(self, cursor: str) -> tuple[str, int]:
+        try:
+            raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)).decode("utf-8")
+            sort_at, event_id = raw.rsplit("|", 1)
+            return sort_at, int(event_id)
+        except ValueError as exc:
+            raise ValueError("Invalid event cursor.") from exc
+
+    def _ensure_world_events_backfilled(self) -> None:
+        # Databases from before world_events get one pass over each job's latest
+        # completed run, so the feed is not empty until the next sync.
+        if getattr(self, "_world_events_checked", False):
+            return
+        self._world_events_checked = True
+        if self.storage.has_world_events():
+            return
+        for job_key, config in sorted(self._load_job_configs().items()):
+            source_key = self._resolve_job_config(job_key, config)["source_key"]
+            completed = [
+                run for run in self.storage.list_runs(limit=20, job_key=job_key)
+                if run.get("status") == "completed"
+            ]
+            if not completed:
+                continue
+            latest = completed[0]
+            self._record_run_events(
+                job_key=job_key,
+                source_key=source_key,
+                run_id=int(latest["id"]),
+                worlds=self.storage.load_run_worlds(int(latest["id"])),
+                detected_at=latest.get("finished_at") or latest.get("started_at"),
+            )
+
+    def _record_run_events(
+        self,
+        *,
+        job_key: str,
+        source_key: str,
+        run_id: int,
+        worlds: list[dict[str, Any]],
+        detected_at: str | None = None,
+        store: WorldInfoStorage | StorageUnitOfWork | None = None,
+    ) -> int:
+        # Diff-based events (new in this run, spikes, update detected) are placed
+        # at detection time; scan-based ones (recently published or updated) at
+        # the world's own date. One event per (type, world) per run, diff first.
+        # The dedup day is the day of the occurrence (publication, update, or
+        # detection for spikes), so a world first seen in a diff and scanned
+        # again by a later run lands on the same row.
+        store = store or self.storage
+        now = dt.datetime.now(dt.timezone.utc)
+        detected_at = detected_at or now.isoformat()
+        public_source = self._public_db_source_key(source_key)
+        world_map = {str(world.get("id")): world for world in worlds if world.get("id")}
+        events: dict[tuple[str, str], dict[str, Any]] = {}
+
+        def add_event(
             *,
             event_type: str,
-            job: dict[str, Any],
-            world: dict[str, Any] | None,
+            world: dict[str, Any],
             occurred_at: str | None,
+            sort_at: str | None,
             summary: str,
             severity: float,
-            delta: dict[str, Any] | None = None,
+            delta: dict[str, Any],
         ) -> None:
-            world_id = str((world or {}).get("id") or "")
-            event_key = (job["job_key"], event_type, world_id)
-            if event_key in seen_keys:
+            world_id = str(world.get("id") or "")
+            if not world_id or (event_type, world_id) in events:
                 return
-            seen_keys.add(event_key)
-            payload = self._event_world_preview(world or {})
-            payload.update(
-                {
-                    "event_key": f"{job['job_key']}:{event_type}:{world_id or 'job'}",
-                    "type": event_type,
-                    "job_key": job["job_key"],
-                    "label": job["label"],
-                    "source": job["source"],
-                    "topic_key": job["job_key"] if self.storage.get_topic(job["job_key"]) else None,
-                    "occurred_at": occurred_at,
-                    "detected_at": (job.get("latest_run") or {}).get("finished_at") or (job.get("latest_run") or {}).get("started_at"),
-                    "summary": summary,
-                    "severity": round(float(severity), 2),
-                    "delta": delta or {},
-                }
-            )
-            events.append(payload)
-
-        jobs = self.list_jobs()
-        for job in jobs:
-            source = job["source"]
-            world_map = load_world_map(source)
-            diff = self.get_job_source_diff(job["job_key"], added_limit=20, removed_limit=0, changed_limit=20)
-            latest_run = diff.get("latest_run") or job.get("latest_run")
+            parsed = _parse_date(sort_at) if sort_at else None
+            sort_value = parsed.astimezone(dt.timezone.utc).isoformat() if parsed else detected_at
+            occurred = _parse_date(occurred_at) if occurred_at else None
+            event_day = occurred.astimezone(dt.timezone.utc).date().isoformat() if occurred else sort_value[:10]
+            events[(event_type, world_id)] = {
+                "job_key": job_key,
+                "source_key": public_source,
+                "run_id": run_id,
+                "event_type": event_type,
+                "world_id": world_id,
+                "event_day": event_day,
+                "occurred_at": occurred_at,
+                "detected_at": detected_at,
+                "sort_at": sort_value,
+                "severity": round(float(severity), 2),
+                "summary": summary,
+                "payload": {"world": self._event_world_preview(world), "delta": delta},
+            }
 
-            for added in diff.get("added_worlds", []):
+        previous_run = next(
+            (
+                run for run in store.list_runs(limit=20, job_key=job_key)
+                if run.get("status") == "completed" and int(run["id"]) < run_id
+            ),
+            None,
+        )
+        if previous_run is not None:
+            diff = store.diff_runs(int(previous_run["id"]), run_id, limit=EVENT_DIFF_LIMIT)
+            job_label = self._label_for_db_source(source_key)
+            for added in diff["added"]:
                 current_world = world_map.get(str(added.get("id"))) or added
-                occurred_at = self._new_world_event_date(current_world) or ((latest_run or {}).get("finished_at"))
-                append_event(
+                add_event(
                     event_type="new_upload",
-                    job=job,
                     world=current_world,
-                    occurred_at=occurred_at,
+                    occurred_at=self._new_world_event_date(current_world) or detected_at,
+                    sort_at=detected_at,
                     summary=(
-                        f"New in {job['label']} "
+                        f"New in {job_label} "
                         f"/ visits {self._to_int(current_world.get('visits')):,} "
                         f"/ favorites {self._to_int(current_world.get('favorites')):,}"
                     ),
@@ -2185,15 +2656,15 @@ class WorldInfoService:
                     },
                 )
 
-            for changed in diff.get("changed_worlds", []):
+            for changed in diff["changed"]:
                 current_world = world_map.get(str(changed.get("id"))) or changed.get("latest") or {}
                 spike = self._compute_diff_spike(changed)
                 if self._is_notable_diff_spike(changed, spike):
-                    append_event(
+                    add_event(
                         event_type="traffic_spike",
-                        job=job,
                         world=current_world,
-                        occurred_at=(latest_run or {}).get("finished_at"),
+                        occurred_at=detected_at,
+                        sort_at=detected_at,
                         summary=(
                             f"Visits {self._signed_number(changed.get('visits_delta'))}"
                             f" / fav {self._signed_number(changed.get('favorites_delta'))}"
@@ -2216,11 +2687,11 @@ class WorldInfoService:
                         update_summary += f" / visits {self._signed_number(changed.get('visits_delta'))}"
                     if self._to_int(changed.get("heat_delta")):
                         update_summary += f" / heat {self._signed_number(changed.get('heat_delta'))}"
-                    append_event(
+                    add_event(
                         event_type="new_update",
-                        job=job,
                         world=current_world,
                         occurred_at=current_world.get("updated_at") or (changed.get("latest") or {}).get("updated_at"),
+                        sort_at=detected_at,
                         summary=update_summary,
                         severity=55 + max(0, self._to_int(changed.get("visits_delta")) / 10),
                         delta={
@@ -2232,73 +2703,56 @@ class WorldInfoService:
                         },
                     )
 
-            for world in world_map.values():
-                world_id = str(world.get("id") or "")
-                new_world_event_date = self._new_world_event_date(world)
-                if world_id and self._within_days(new_world_event_date, recency_days, now):
-                    append_event(
-                        event_type="new_upload",
-                        job=job,
-                        world=world,
-                        occurred_at=new_world_event_date,
-                        summary=(
-                            f"Published recently"
-                            f" / visits {self._to_int(world.get('visits')):,}"
-                            f" / favorites {self._to_int(world.get('favorites')):,}"
-                        ),
-                        severity=60 + min(self._to_int(world.get("visits")) / 40, 15),
-                        delta={
-                            "visits": self._to_int(world.get("visits")),
-                            "favorites": self._to_int(world.get("favorites")),
-                        },
-                    )
-                if world_id and self._within_days(world.get("updated_at"), recency_days, now):
-                    append_event(
-                        event_type="new_update",
-                        job=job,
-                        world=world,
-                        occurred_at=world.get("updated_at"),
-                        summary=(
-                            f"Updated recently"
-                            f" / visits {self._to_int(world.get('visits')):,}"
-                            f" / heat {self._to_int(world.get('heat')):,}"
-                            f" / popularity {self._to_int(world.get('popularity')):,}"
-                        ),
-                        severity=45 + min(self._to_int(world.get("heat")) * 3, 18),
-                        delta={
-                            "visits": self._to_int(world.get("visits")),
-                            "favorites": self._to_int(world.get("favorites")),
-                            "heat": self._to_int(world.get("heat")),
-                            "popularity": self._to_int(world.get("popularity")),
-                        },
-                    )
-
-        events.sort(
-            key=lambda item: (
-                self._date_score(item.get("occurred_at") or item.get("detected_at")),
-                item.get("severity", 0),
-                item.get("label", "").casefold(),
-                item.get("name", "").casefold(),
-            ),
-            reverse=True,
-        )
-        counts = Counter(item["type"] for item in events)
-        return {
-            "generated_at": now.isoformat(),
-            "recency_days": recency_days,
-            "summary": {
-                "total": len(events),
-                "spikes": counts.get("traffic_spike", 0),
-                "uploads": counts.get("new_upload", 0),
-                "updates": counts.get("new_update", 0),
-            },
-            "items": events[:limit],
-        }
+        for world in world_map.values():
+            new_world_event_date = self._new_world_event_date(world)
+            if self._within_days(new_world_event_date, EVENT_SCAN_DAYS, now):
+                add_event(
+                    event_type="new_upload",
+                    world=world,
+                    occurred_at=new_world_event_date,
+                    sort_at=new_world_event_date,
+                    summary=(
+                        f"Published recently"
+                        f" / visits {self._to_int(world.get('visits')):,}"
+                        f" / favorites {self._to_int(world.get('favorites')):,}"
+                    ),
+                    severity=60 + min(self._to_int(world.get("visits")) / 40, 15),
+                    delta={
+                        "visits": self._to_int(world.get("visits")),
+                        "favorites": self._to_int(world.get("favorites")),
+                    },
+                )
+            if self._within_days(world.get("updated_at"), EVENT_SCAN_DAYS, now):
+                add_event(
+                    event_type="new_update",
+                    world=world,
+                    occurred_at=world.get("updated_at"),
+                    sort_at=world.get("updated_at"),
+                    summary=(
+                        f"Updated recently"
+                        f" / visits {self._to_int(world.get('visits')):,}"
+                        f" / heat {self._to_int(world.get('heat')):,}"
+                        f" / popularity {self._to_int(world.get('popularity')):,}"
+                    ),
+                    severity=45 + min(self._to_int(world.get("heat")) * 3, 18),
+                    delta={
+                        "visits": self._to_int(world.get("visits")),
+                        "favorites": self._to_int(world.get("favorites")),
+                        "heat": self._to_int(world.get("heat")),
+                        "popularity": self._to_int(world.get("popularity")),
+                    },
+                )
+        return store.upsert_world_events(list(events.values()))
 
     def _limit_collection_insights_payload(self, payload: dict[str, Any], limit: int) -> dict[str, Any]:
+        return copy.deepcopy(self._slice_collection_insights_payload(payload, limit))
+
+    def _slice_collection_insights_payload(self, payload: dict[str, Any], limit: int) -> dict[str, Any]:
+        # Shallow: only the containers on the path to a sliced list are copied,
+        # so the result shares everything else with `payload`.
+        limited = dict(payload)
         if limit <= 0:
-            return copy.deepcopy(payload)
-        limited = copy.deepcopy(payload)
+            return limited
         for key in (
             "growth_leaderboard",
             "rising_now_leaderboard",
@@ -2310,34 +2764,211 @@ class WorldInfoService:
         ):
             if isinstance(limited.get(key), list):
                 limited[key] = limited[key][:limit]
-        briefing = limited.get("briefing")
-        if isinstance(briefing, dict):
+        if isinstance(limited.get("briefing"), dict):
+            briefing = limited["briefing"] = dict(limited["briefing"])
             for key in ("momentum", "rising_now", "new_worlds", "worth_watching"):
                 if isinstance(briefing.get(key), list):
                     briefing[key] = briefing[key][:limit]
         for key in ("anomalies", "update_effectiveness", "performance"):
             section = limited.get(key)
             if isinstance(section, dict) and isinstance(section.get("items"), list):
-                section["items"] = section["items"][:limit]
-        signals = limited.get("signals")
-        if isinstance(signals, dict):
+                limited[key] = {**section, "items": section["items"][:limit]}
+        if isinstance(limited.get("signals"), dict):
+            signals = limited["signals"] = dict(limited["signals"])
             for key in ("correlations", "charts", "leaderboards"):
                 if isinstance(signals.get(key), list):
                     signals[key] = signals[key][:limit]
             summary = signals.get("summary")
             if isinstance(summary, dict) and isinstance(summary.get("top_signals"), list):
-                summary["top_signals"] = summary["top_signals"][:limit]
+                signals["summary"] = {**summary, "top_signals": summary["top_signals"][:limit]}
         return limited
 
-    def refresh_analysis_cache(self, source: str, *, source_run_id: int | None = None) -> None:
-        payload = self.load_collection_insights(
-            source=source,
-            limit=ANALYSIS_CACHE_LIMIT,
-            allow_cache=False,
+    def load_collection_insights_bytes(
+        self,
+        *,
+        source: str | None = None,
+        topic_key: str | None = None,
+        limit: int = 12,
+    ) -> bytes:
+        # Serialized insights for the API. Cached scopes are decoded once per
+        # analysis_cache version and keep the encoded body for each limit, so a
+        # repeat request costs one metadata lookup and a dict hit.
+        scope_key = self._topic_analysis_scope(topic_key) if topic_key else source or "db:all"
+        meta = self.storage.get_analysis_cache_meta(scope_key)
+        if meta is None or not self._can_serve_cached_analysis(scope_key, meta):
+            return jsoncodec.dumps_bytes(
+                self.load_collection_insights(source=source, topic_key=topic_key, limit=limit)
+            )
+        entry = self._insights_cache.get(scope_key, meta["updated_at"])
+        if entry is None:
+            cached = self.storage.get_analysis_cache(scope_key)
+            if not cached or cached["updated_at"] != meta["updated_at"] or not isinstance(cached.get("payload"), dict):
+                return jsoncodec.dumps_bytes(
+                    self.load_collection_insights(source=source, topic_key=topic_key, limit=limit)
+                )
+            entry = {
+                "payload": cached["payload"],
+                "bodies": {
+                    preset: jsoncodec.dumps_bytes(self._slice_collection_insights_payload(cached["payload"], preset))
+                    for preset in INSIGHTS_PRESET_LIMITS
+                },
+            }
+            self._insights_cache.put(scope_key, meta["updated_at"], entry)
+        body = entry["bodies"].get(limit)
+        if body is None:
+            # Other limits are memoised too; the route caps them, so this stays small.
+            body = entry["bodies"][limit] = jsoncodec.dumps_bytes(
+                self._slice_collection_insights_payload(entry["payload"], limit)
+            )
+        return body
+
+    def _can_serve_cached_analysis(self, scope_key: str, cached: dict[str, Any]) -> bool:
+        if not cached.get("stale_since"):
+            return True
+        # Stale-while-revalidate: serve the previous payload while the background
+        # queue rebuilds it. Without a worker the caller rebuilds inline.
+        queue = getattr(self, "refresh_queue", None)
+        if queue is None or not queue.running:
+            return False
+        if not queue.is_queued(("analysis", scope_key)):
+            self.schedule_analysis_refresh(scope_key)
+        return True
+
+    def _topic_analysis_scope(self, topic_key: str) -> str:
+        return f"{TOPIC_SCOPE_PREFIX}{topic_key}"
+
+    def _analysis_scope_type(self, scope_key: str) -> str:
+        if scope_key.startswith(TOPIC_SCOPE_PREFIX):
+            return "topic"
+        if scope_key.startswith("db:job:"):
+            return "job"
+        return "source"
+
+    def _analysis_scopes_for_write(self, source_key: str, world_ids: Iterable[str]) -> list[str]:
+        # A write to one source reaches its own scope, db:all, every topic whose
+        # rules cover the source and every topic already holding one of the
+        # written worlds (topic history spans all sources).
+        topic_keys = self.storage.list_topics_for_worlds(world_ids)
+        for topic in self.storage.list_topics():
+            rules = [rule for rule in self.storage.list_topic_rules(topic["topic_key"]) if rule.get("is_active", 1)]
+            if self._topic_covers_source(rules, source_key):
+                topic_keys.add(topic["topic_key"])
+        return [
+            self._public_db_source_key(source_key),
+            "db:all",
+            *(self._topic_analysis_scope(topic_key) for topic_key in sorted(topic_keys)),
+        ]
+
+    def _invalidate_world_write(
+        self,
+        source_key: str,
+        world_ids: set[str],
+        *,
+        before: list[str],
+        source_run_id: int | None = None,
+    ) -> list[str]:
+        # Scopes taken before the write still list topics the world has just
+        # left; the ones taken after add topics it has joined.
+        return self.invalidate_analysis_scopes(
+            [*before, *self._analysis_scopes_for_write(source_key, world_ids)],
+            source_run_id=source_run_id,
+        )
+
+    def invalidate_analysis_scopes(
+        self,
+        scope_keys: Iterable[str],
+        *,
+        refresh: Iterable[str] = (),
+        source_run_id: int | None = None,
+    ) -> list[str]:
+        # Cached scopes are marked stale and queued for a rebuild. Scopes in
+        # `refresh` are rebuilt even when nothing is cached yet; other uncached
+        # scopes are computed on first read.
+        refresh = list(refresh)
+        cached = self.storage.list_analysis_scope_keys()
+        stale = [scope_key for scope_key in dict.fromkeys([*refresh, *scope_keys]) if scope_key in cached]
+        self.storage.mark_analysis_stale(stale, dt.datetime.now(dt.timezone.utc).isoformat())
+        scheduled = list(dict.fromkeys([*refresh, *stale]))
+        for scope_key in scheduled:
+            self.schedule_analysis_refresh(scope_key, source_run_id=source_run_id)
+        return scheduled
+
+    def schedule_analysis_refresh(self, scope_key: str, *, source_run_id: int | None = None) -> None:
+        self.refresh_queue.submit(
+            ("analysis", scope_key),
+            lambda: self.refresh_analysis_cache(scope_key, source_run_id=source_run_id),
+        )
+
+    def schedule_bulk_analysis_refresh(self) -> None:
+        # Everything cached goes stale at once (import, compaction); the pool
+        # rebuilds it off the request thread.
+        self.storage.mark_analysis_stale(
+            self.storage.list_analysis_scope_keys(),
+            dt.datetime.now(dt.timezone.utc).isoformat(),
         )
+        self.refresh_queue.submit(("analysis", "*"), self.refresh_stale_analysis)
+
+    def refresh_stale_analysis(self, *, workers: int | None = None) -> dict[str, Any]:
+        scope_keys = [item["scope_key"] for item in self.storage.list_stale_analysis_scopes()]
+        if workers is None:
+            workers = self._to_int(os.getenv("WORLD_INFO_ANALYSIS_WORKERS", str(min(os.cpu_count() or 1, 4))))
+        workers = max(1, min(workers, len(scope_keys) or 1))
+        started = time.perf_counter()
+        refreshed: list[str] = []
+        failed: dict[str, str] = {}
+        if workers > 1:
+            service_kwargs = {
+                "repo_root": self.repo_root,
+                "app_root": self.app_root,
+                "jobs_path": self.jobs_path,
+                "topics_path": self.topics_path,
+                "world_properties_path": self.world_properties_path,
+            }
+            try:
+                with ProcessPoolExecutor(
+                    max_workers=workers,
+                    mp_context=multiprocessing.get_context("spawn"),
+                    initializer=_init_analysis_worker,
+                    initargs=(service_kwargs,),
+                ) as pool:
+                    futures = {pool.submit(_refresh_analysis_scope, scope_key): scope_key for scope_key in scope_keys}
+                    for future in as_completed(futures):
+                        try:
+                            future.result()
+                            refreshed.append(futures[future])
+                        except Exception as exc:
+                            failed[futures[future]] = str(exc)
+            except (OSError, BrokenProcessPool) as exc:
+                logger.warning("Analysis worker pool unavailable, refreshing in-process: %s", exc)
+                workers = 1
+                refreshed, failed = [], {}
+        if workers == 1:
+            for scope_key in scope_keys:
+                try:
+                    self.refresh_analysis_cache(scope_key)
+                    refreshed.append(scope_key)
+                except Exception as exc:
+                    failed[scope_key] = str(exc)
+        return {
+            "status": "completed" if not failed else "partial",
+            "workers": workers,
+            "refreshed": sorted(refreshed),
+            "failed": failed,
+            "elapsed_ms": round((time.perf_counter() - started) * 1000, 2),
+        }
+
+    def refresh_analysis_cache(self, scope_key: str, *, source_run_id: int | None = None) -> None:
+        if scope_key.startswith(TOPIC_SCOPE_PREFIX):
+            topic_key = scope_key.removeprefix(TOPIC_SCOPE_PREFIX)
+            if self.storage.get_topic(topic_key) is None:
+                self.storage.delete_analysis_cache(scope_key)
+                return
+            payload = self.load_collection_insights(topic_key=topic_key, limit=ANALYSIS_CACHE_LIMIT, allow_cache=False)
+        else:
+            payload = self.load_collection_insights(source=scope_key, limit=ANALYSIS_CACHE_LIMIT, allow_cache=False)
         self.storage.upsert_analysis_cache(
-            scope_key=source,
-            scope_type="source",
+            scope_key=scope_key,
+            scope_type=self._analysis_scope_type(scope_key),
             updated_at=payload.get("generated_at") or dt.datetime.now(dt.timezone.utc).isoformat(),
             payload=payload,
             source_run_id=source_run_id,
@@ -2884,6 +3515,7 @@ class WorldInfoService:
 
         daily_stats_rows = self._import_legacy_daily_stats()
         self._refresh_topic_memberships()
+        self.schedule_bulk_analysis_refresh()
 
         return {
             "status": "completed",
@@ -2894,6 +3526,150 @@ class WorldInfoService:
             "topics": self.list_topics(),
         }
 
+    def rebuild_latest_worlds(self, source: str | None = None) -> dict[str, Any]:
+        source_key = None
+        if source and source != "db:all":
+            if not source.startswith("db:"):
+                raise ValueError("Only database sources can be rebuilt.")
+            source_key = source.removeprefix("db:")
+        row_count = self.storage.rebuild_world_latest(source_key)
+        return {
+            "status": "completed",
+            "source": source or "db:all",
+            "rebuilt_at": dt.datetime.now(dt.timezone.utc).isoformat(),
+            "world_count": row_count,
+        }
+
+    def migrate_payload_encoding(self) -> dict[str, Any]:
+        size_before = self.storage.database_size_bytes()
+        converted = self.storage.migrate_payload_encoding()
+        return {
+            "status": "completed",
+            "codec": self.storage.payload_codec,
+            "converted": converted,
+            "db_size_bytes_before": size_before,
+            "db_size_bytes_after": self.storage.database_size_bytes(),
+        }
+
+    def compact_snapshots(self, source: str | None = None) -> dict[str, Any]:
+        if source and source != "db:all":
+            if not source.startswith("db:"):
+                raise ValueError("Only database sources can be compacted.")
+            source_keys = [source.removeprefix("db:")]
+        else:
+            source_keys = [item["source_key"] for item in self.storage.list_db_sources()]
+        retention_by_source = self._load_retention_settings()
+        results = []
+        for source_key in source_keys:
+            retention = retention_by_source.get(source_key, {})
+            counts = self.storage.compact_snapshots(source_key, **retention)
+            if counts["snapshots_deleted"]:
+                # Thinned history can move the 30d and since-update baselines.
+                self.refresh_trend_metrics(source_key)
+            results.append({"source": self._public_db_source_key(source_key), **counts})
+        if any(item["snapshots_deleted"] for item in results):
+            self.schedule_bulk_analysis_refresh()
+        now = dt.datetime.now(dt.timezone.utc)
+        events_deleted = 0
+        if not source or source == "db:all":
+            events_deleted = self.storage.delete_world_events(
+                before=(now - dt.timedelta(days=EVENT_RETENTION_DAYS)).isoformat()
+            )
+        return {
+            "status": "completed",
+            "compacted_at": now.isoformat(),
+            "sources": results,
+            "snapshots_deleted": sum(item["snapshots_deleted"] for item in results),
+            "events_deleted": events_deleted,
+        }
+
+    def refresh_trend_metrics(
+        self,
+        source_key: str,
+        world_ids: Iterable[str] | None = None,
+        *,
+        now: dt.datetime | None = None,
+    ) -> int:
+        # Recomputes the stored trend payloads of one database source, either for
+        # the given worlds (the ones a run just touched) or the whole source.
+        ids = None if world_ids is None else sorted({str(world_id) for world_id in world_ids if world_id})
+        if ids == []:
+            return 0
+        worlds = [self._normalise_db_world(world) for world in self.storage.load_latest_worlds(source_key, world_ids=ids)]
+        if not worlds:
+            return 0
+        history = self.load_history(source=f"db:{source_key}", world_ids=ids)
+        now = now or dt.datetime.now(dt.timezone.utc)
+        rows = [
+            self._trend_metrics_row(world, baselines, now=now)
+            for world, baselines in zip(worlds, self._trend_baselines_batch(worlds, history))
+            if baselines is not None
+        ]
+        return self.storage.upsert_trend_metrics(source_key, rows)
+
+    def refresh_trend_decay(self, *, now: dt.datetime | None = None) -> dict[str, Any]:
+        # Daily pass for the fields that move with the clock alone (days since
+        # update/publication, freshness, per-day rates): stored baselines are
+        # re-assembled against `now` without reading any history.
+        now = now or dt.datetime.now(dt.timezone.utc)
+        refreshed = 0
+        sources = self.storage.list_trend_sources()
+        for source_key in sources:
+            stored = self.storage.load_trend_metrics(source_key)
+            if not stored:
+                continue
+            worlds = self.storage.load_latest_worlds(source_key, world_ids=stored)
+            rows = [
+                self._trend_metrics_row(self._normalise_db_world(world), stored[world["id"]]["baselines"], now=now)
+                for world in worlds
+                if world.get("id") in stored
+            ]
+            refreshed += self.storage.upsert_trend_metrics(source_key, rows)
+        return {
+            "status": "completed",
+            "refreshed_at": now.isoformat(),
+            "sources": len(sources),
+            "worlds_refreshed": refreshed,
+        }
+
+    def _trend_metrics_row(self, world: dict[str, Any], baselines: dict[str, Any], *, now: dt.datetime) -> dict[str, Any]:
+        payload = self._assemble_world_trend_metrics(world, baselines, now=now)
+        return {
+            "world_id": world["id"],
+            "computed_at": now.isoformat(),
+            "baselines": baselines,
+            "payload": payload,
+            "scores": {field: self._trend_sort_metric(world, payload, field) for field in TREND_SORT_COLUMNS},
+            "sort_date": self._date_score(world.get("publication_date") or world.get("updated_at") or world.get("fetched_at")),
+            "visits": self._to_int(world.get("visits")),
+        }
+
+    def _trend_source_key(self, source: str | None) -> str | None:
+        # Only single database sources have persisted trend metrics; db:all merges
+        # sources and legacy history, so it keeps computing them per request.
+        if getattr(self, "storage", None) is None or not source or not source.startswith("db:") or source == "db:all":
+            return None
+        return source.removeprefix("db:")
+
+    def _ensure_trend_metrics(self, source_key: str) -> None:
+        stale = self.storage.stale_trend_world_ids(source_key)
+        if stale:
+            self.refresh_trend_metrics(source_key, stale)
+
+    def _load_retention_settings(self) -> dict[str, dict[str, int]]:
+        settings: dict[str, dict[str, int]] = {}
+        for job_key, config in self._load_job_configs().items():
+            retention = config.get("retention")
+            if not isinstance(retention, dict):
+                continue
+            source_key = str(config.get("source_key", f"job:{job_key}")).strip() or f"job:{job_key}"
+            settings[source_key] = {
+                key: self._to_int(retention[key])
+                for key in ("full_resolution_days", "daily_days")
+                if retention.get(key) is not None
+            }
+        return settings
+
     def update_world_record(
         self,
         *,
@@ -2903,7 +3679,7 @@ class WorldInfoService:
     ) -> dict[str, Any]:
         source_key = self._editable_source_key(source)
         current = next(
-            (item for item in self.storage.load_latest_worlds(source_key) if item.get("id") == world_id),
+            (item for item in self.storage.load_latest_worlds(source_key, world_ids=[world_id]) if item.get("id") == world_id),
             None,
         )
         if current is None:
@@ -2950,37 +3726,42 @@ class WorldInfoService:
 
         editable["metrics"] = self._calculate_metrics_for_world(editable)
 
+        affected_scopes = self._analysis_scopes_for_write(source_key, {world_id})
         started_at = dt.datetime.now(dt.timezone.utc).isoformat()
-        run_id = self.storage.create_run(
-            source_key=source_key,
-            job_key=None,
-            trigger_type="edit",
-            query_label=f"Edit {world_id}",
-            started_at=started_at,
-        )
         try:
-            self.storage.insert_world_snapshots(
-                run_id=run_id,
-                source_key=source_key,
-                fetched_at=started_at,
-                worlds=[editable],
-            )
-            self.storage.finish_run(
-                run_id,
-                status="completed",
-                finished_at=dt.datetime.now(dt.timezone.utc).isoformat(),
-                world_count=1,
-            )
+            with self.storage.unit_of_work() as uow:
+                run_id = uow.create_run(
+                    source_key=source_key,
+                    job_key=None,
+                    trigger_type="edit",
+                    query_label=f"Edit {world_id}",
+                    started_at=started_at,
+                )
+                uow.insert_world_snapshots(
+                    run_id=run_id,
+                    source_key=source_key,
+                    fetched_at=started_at,
+                    worlds=[editable],
+                )
+                uow.finish_run(
+                    run_id,
+                    status="completed",
+                    finished_at=dt.datetime.now(dt.timezone.utc).isoformat(),
+                    world_count=1,
+                )
         except Exception as exc:
-            self.storage.finish_run(
-                run_id,
-                status="failed",
-                finished_at=dt.datetime.now(dt.timezone.utc).isoformat(),
-                error_text=str(exc),
+            self._record_failed_run(
+                source_key=source_key,
+                job_key=None,
+                trigger_type="edit",
+                query_label=f"Edit {world_id}",
+                started_at=started_at,
+                exc=exc,
             )
             raise
 
-        self._refresh_topic_memberships()
+        self._refresh_topic_memberships(source_key=source_key, world_ids={world_id})
+        self._invalidate_world_write(source_key, {world_id}, before=affected_scopes, source_run_id=run_id)
         portal_links_saved_to = self._display_path(self.world_properties_path) if "portal_links" in changes else None
         refreshed = next(
             (item for item in self.load_worlds(source, dedupe=False) if item.get("id") == world_id),
@@ -2997,6 +3778,7 @@ class WorldInfoService:
 
     def delete_world_record(self, *, source: str, world_id: str) -> dict[str, Any]:
         source_key = self._editable_source_key(source)
+        affected_scopes = self._analysis_scopes_for_write(source_key, {world_id})
         started_at = dt.datetime.now(dt.timezone.utc).isoformat()
         run_id = self.storage.create_run(
             source_key=source_key,
@@ -3021,7 +3803,8 @@ class WorldInfoService:
                 error_text=str(exc),
             )
             raise
-        self._refresh_topic_memberships()
+        self._refresh_topic_memberships(source_key=source_key, world_ids={world_id})
+        self._invalidate_world_write(source_key, {world_id}, before=affected_scopes, source_run_id=run_id)
         return {
             "status": "deleted",
             "source": source,
@@ -3047,20 +3830,22 @@ class WorldInfoService:
         self._write_blacklist(resolved["blacklist_path"], existing)
         removed = 0
         if str(resolved.get("source_key", "")).strip():
+            affected_scopes = self._analysis_scopes_for_write(resolved["source_key"], {cleaned})
             before = sum(
                 1
-                for item in self.storage.load_latest_worlds(resolved["source_key"])
+                for item in self.storage.load_latest_worlds(resolved["source_key"], world_ids=[cleaned])
                 if item.get("id") == cleaned
             )
             removed = self.storage.delete_world_snapshots(resolved["source_key"], cleaned)
             if removed is None:
                 after = sum(
                     1
-                    for item in self.storage.load_latest_worlds(resolved["source_key"])
+                    for item in self.storage.load_latest_worlds(resolved["source_key"], world_ids=[cleaned])
                     if item.get("id") == cleaned
                 )
                 removed = max(before - after, 0)
-            self._refresh_topic_memberships()
+            self._refresh_topic_memberships(source_key=resolved["source_key"], world_ids={cleaned})
+            self._invalidate_world_write(resolved["source_key"], {cleaned}, before=affected_scopes)
         return {
             "status": "added",
             "job_key": job_key,
@@ -3086,9 +3871,20 @@ class WorldInfoService:
             "path": self._display_path(resolved["blacklist_path"]),
         }
 
+    def _blacklisted_world_keys(self, source_key: str | None) -> list[tuple[str, str]]:
+        keys: list[tuple[str, str]] = []
+        for job_key, config in self._load_job_configs().items():
+            resolved = self._resolve_job_config(job_key, config)
+            if source_key is not None and resolved["source_key"] != source_key:
+                continue
+            keys.extend(
+                (resolved["source_key"], world_id) for world_id in self._load_blacklist(resolved.get("blacklist_file"))
+            )
+        return keys
+
     def _resolve_job_for_display(self, job_key: str) -> dict[str, Any]:
         import os
-        job_configs = self._read_json(self.jobs_path, default={})
+        job_configs = self._read_json_cached(self.jobs_path, default={})
         job_cfg = job_configs.get(job_key, {})
         def _mtime(rel: str | None) -> float:
             if not rel:
@@ -3113,11 +3909,12 @@ class WorldInfoService:
         return result
 
     def _load_world_properties(self) -> dict[str, Any]:
-        payload = self._read_json(self.world_properties_path, default={})
-        return payload if isinstance(payload, dict) else {}
+        payload = self._read_json_cached(self.world_properties_path, default={})
+        return dict(payload) if isinstance(payload, dict) else {}
 
     def _save_world_properties(self, payload: dict[str, Any]) -> None:
         self._write_json(self.world_properties_path, payload)
+        self.invalidate_catalog_cache()
 
     def _update_world_properties(self, world_id: str, updates: dict[str, Any]) -> None:
         cleaned_world_id = self._clean_optional_text(world_id)
@@ -3203,7 +4000,7 @@ class WorldInfoService:
                 name_blacklist=name_bl,
             ):
                 continue
-            pending.append(w)
+            pending.append(dict(w))
         pending.sort(key=lambda w: (w.get("author_name") or "").casefold())
         return pending
 
@@ -3576,6 +4373,31 @@ class WorldInfoService:
         tags = {tag for world in worlds for tag in world.get("tags", []) if tag}
         return sorted(tags)
 
+    def collect_totals(self, worlds: list[dict[str, Any]]) -> dict[str, int]:
+        return {
+            "world_count": len(worlds),
+            "total_visits": sum(self._to_int(world.get("visits")) for world in worlds),
+            "total_favorites": sum(self._to_int(world.get("favorites")) for world in worlds),
+            "tracked_creators": len({world.get("author_id") for world in worlds if world.get("author_id")}),
+        }
+
+    def collect_source_tags(self, source: str, worlds: list[dict[str, Any]]) -> list[str]:
+        if source == "db:all" or source.startswith("db:"):
+            return sorted(item["tag"] for item in self.list_tag_facets(source))
+        return self.collect_tags(worlds)
+
+    def list_tag_facets(self, source: str = "db:all") -> list[dict[str, Any]]:
+        if source == "db:all" or source.startswith("db:"):
+            source_key = None if source == "db:all" else source.removeprefix("db:")
+            return self.storage.list_tag_facets(source_key, exclude=self._blacklisted_world_keys(source_key))
+        counts = Counter(
+            tag for world in self.load_worlds(source) for tag in set(world.get("tags") or []) if tag
+        )
+        return [
+            {"tag": tag, "world_count": count}
+            for tag, count in sorted(counts.items(), key=lambda item: (-item[1], item[0]))
+        ]
+
     def _store_sync_result(
         self,
         *,
@@ -3589,14 +4411,6 @@ class WorldInfoService:
         query_batches: list[dict[str, Any]] | None = None,
     ) -> dict[str, Any]:
         started_at = dt.datetime.now(dt.timezone.utc).isoformat()
-        run_id = self.storage.create_run(
-            source_key=source_key,
-            job_key=job_key,
-            trigger_type=trigger_type,
-            query_label=query_label,
-            started_at=started_at,
-        )
-
         try:
             normalised = [self._normalise_api_world(world, self._public_db_source_key(source_key)) for world in worlds]
             normalised = self._dedupe_worlds(normalised)
@@ -3605,50 +4419,90 @@ class WorldInfoService:
                 for world in normalised
                 if str(world.get("id") or "").strip()
             }
-            existing_world_ids = self.storage.get_existing_world_ids(normalised_world_ids)
-            self.storage.insert_world_snapshots(
-                run_id=run_id,
-                source_key=source_key,
-                fetched_at=started_at,
-                worlds=normalised,
-            )
-            if query_batches:
-                self.storage.insert_run_queries(
+            with self.storage.unit_of_work() as uow:
+                run_id = uow.create_run(
+                    source_key=source_key,
+                    job_key=job_key,
+                    trigger_type=trigger_type,
+                    query_label=query_label,
+                    started_at=started_at,
+                )
+                existing_world_ids = uow.get_existing_world_ids(normalised_world_ids)
+                uow.insert_world_snapshots(
                     run_id=run_id,
-                    queries=self._build_run_query_rows(
-                        query_batches=query_batches,
-                        kept_world_ids=normalised_world_ids,
-                        existing_world_ids=existing_world_ids,
-                    ),
+                    source_key=source_key,
+                    fetched_at=started_at,
+                    worlds=normalised,
+                    change_only=self.snapshot_write_mode == "changes",
                 )
-            self.storage.upsert_daily_stats(
-                source_key=source_key,
-                date=dt.datetime.now(dt.timezone.utc).strftime("%Y/%m/%d"),
-                total_worlds=len(normalised),
-                new_worlds_today=self._calculate_new_worlds_today(normalised),
-            )
-            self.storage.finish_run(
-                run_id,
-                status="completed",
-                finished_at=dt.datetime.now(dt.timezone.utc).isoformat(),
-                world_count=len(normalised),
-            )
+                if query_batches:
+                    uow.insert_run_queries(
+                        run_id=run_id,
+                        queries=self._build_run_query_rows(
+                            query_batches=query_batches,
+                            kept_world_ids=normalised_world_ids,
+                            existing_world_ids=existing_world_ids,
+                        ),
+                    )
+                uow.upsert_daily_stats(
+                    source_key=source_key,
+                    date=dt.datetime.now(dt.timezone.utc).strftime("%Y/%m/%d"),
+                    total_worlds=len(normalised),
+                    new_worlds_today=self._calculate_new_worlds_today(normalised),
+                )
+                uow.finish_run(
+                    run_id,
+                    status="completed",
+                    finished_at=dt.datetime.now(dt.timezone.utc).isoformat(),
+                    world_count=len(normalised),
+                )
+                if job_key:
+                    # Summary and events commit with the run, so a completed run
+                    # never lacks them and a failed insert fails the whole sync.
+                    previous_run = next(
+                        (
+                            run for run in uow.list_runs(limit=20, job_key=job_key)
+                            if run.get("status") == "completed" and int(run["id"]) < run_id
+                        ),
+                        None,
+                    )
+                    self._record_run_summary(
+                        job_key=job_key,
+                        run_id=run_id,
+                        previous_run_id=int(previous_run["id"]) if previous_run else None,
+                        store=uow,
+                    )
+                    self._record_run_events(
+                        job_key=job_key,
+                        source_key=source_key,
+                        run_id=run_id,
+                        worlds=normalised,
+                        store=uow,
+                    )
         except Exception as exc:
-            self.storage.finish_run(
-                run_id,
-                status="failed",
-                finished_at=dt.datetime.now(dt.timezone.utc).isoformat(),
-                error_text=str(exc),
+            self._record_failed_run(
+                source_key=source_key,
+                job_key=job_key,
+                trigger_type=trigger_type,
+                query_label=query_label,
+                started_at=started_at,
+                exc=exc,
             )
             raise
 
         public_source = self._public_db_source_key(source_key)
-        self._refresh_topic_memberships()
-        for cache_source in (public_source, "db:all"):
-            try:
-                self.refresh_analysis_cache(cache_source, source_run_id=run_id)
-            except Exception as exc:
-                logger.warning("Analysis cache refresh skipped for %s: %s", cache_source, exc)
+        try:
+            self.refresh_trend_metrics(source_key, normalised_world_ids)
+        except Exception as exc:
+            logger.warning("Trend metrics refresh skipped for %s: %s", source_key, exc)
+        # Memberships stay read-your-writes: the refresh only re-evaluates the
+        # written worlds, so it is cheap enough for the request thread.
+        self._refresh_topic_memberships(source_key=source_key, world_ids=normalised_world_ids)
+        self.invalidate_analysis_scopes(
+            self._analysis_scopes_for_write(source_key, normalised_world_ids),
+            refresh=(public_source, "db:all"),
+            source_run_id=run_id,
+        )
         return {
             "run_id": run_id,
             "source": public_source,
@@ -3659,6 +4513,34 @@ class WorldInfoService:
             "meta": meta or {},
         }
 
+    def _record_failed_run(
+        self,
+        *,
+        source_key: str,
+        job_key: str | None,
+        trigger_type: str,
+        query_label: str | None,
+        started_at: str,
+        exc: Exception,
+    ) -> None:
+        try:
+            with self.storage.unit_of_work() as uow:
+                run_id = uow.create_run(
+                    source_key=source_key,
+                    job_key=job_key,
+                    trigger_type=trigger_type,
+                    query_label=query_label,
+                    started_at=started_at,
+                )
+                uow.finish_run(
+                    run_id,
+                    status="failed",
+                    finished_at=dt.datetime.now(dt.timezone.utc).isoformat(),
+                    error_text=str(exc),
+                )
+        except Exception as record_exc:
+            logger.warning("Failed run for %s could not be recorded: %s", source_key, record_exc)
+
     def _build_run_query_rows(
         self,
         *,
@@ -3757,36 +4639,38 @@ class WorldInfoService:
         query_label: str,
         worlds: list[dict[str, Any]],
     ) -> dict[str, Any]:
-        self.storage.purge_source(source_key)
         started_at = dt.datetime.now(dt.timezone.utc).isoformat()
-        run_id = self.storage.create_run(
-            source_key=source_key,
-            job_key=None,
-            trigger_type="import",
-            query_label=query_label,
-            started_at=started_at,
-        )
-
         normalised = self._dedupe_worlds([dict(world) for world in worlds if world.get("id")])
         try:
-            self.storage.insert_world_snapshots(
-                run_id=run_id,
-                source_key=source_key,
-                fetched_at=started_at,
-                worlds=normalised,
-            )
-            self.storage.finish_run(
-                run_id,
-                status="completed",
-                finished_at=dt.datetime.now(dt.timezone.utc).isoformat(),
-                world_count=len(normalised),
-            )
+            with self.storage.unit_of_work() as uow:
+                uow.purge_source(source_key)
+                run_id = uow.create_run(
+                    source_key=source_key,
+                    job_key=None,
+                    trigger_type="import",
+                    query_label=query_label,
+                    started_at=started_at,
+                )
+                uow.insert_world_snapshots(
+                    run_id=run_id,
+                    source_key=source_key,
+                    fetched_at=started_at,
+                    worlds=normalised,
+                )
+                uow.finish_run(
+                    run_id,
+                    status="completed",
+                    finished_at=dt.datetime.now(dt.timezone.utc).isoformat(),
+                    world_count=len(normalised),
+                )
         except Exception as exc:
-            self.storage.finish_run(
-                run_id,
-                status="failed",
-                finished_at=dt.datetime.now(dt.timezone.utc).isoformat(),
-                error_text=str(exc),
+            self._record_failed_run(
+                source_key=source_key,
+                job_key=None,
+                trigger_type="import",
+                query_label=query_label,
+                started_at=started_at,
+                exc=exc,
             )
             raise
 
@@ -4027,9 +4911,9 @@ class WorldInfoService:
             self._refresh_topic_memberships()
 
     def _load_topic_configs(self) -> dict[str, dict[str, Any]]:
-        data = self._read_json(self.topics_path, default={})
+        data = self._read_json_cached(self.topics_path, default={})
         if isinstance(data, dict):
-            return {str(key): value for key, value in data.items() if isinstance(value, dict)}
+            return {str(key): dict(value) for key, value in data.items() if isinstance(value, dict)}
         return {}
 
     def _resolve_topic_config(self, topic_key: str, config: dict[str, Any]) -> dict[str, Any]:
@@ -4063,7 +4947,32 @@ class WorldInfoService:
             "rules": [rule for rule in rules if rule["rule_type"] and rule["rule_value"]],
         }
 
-    def _refresh_topic_memberships(self, topic_keys: set[str] | None = None) -> None:
+    def rebuild_topic_memberships(self, topic_keys: set[str] | None = None) -> dict[str, Any]:
+        changes = self._refresh_topic_memberships(topic_keys)
+        self.invalidate_analysis_scopes(
+            self._topic_analysis_scope(topic_key)
+            for topic_key, counts in changes.items()
+            if counts["upserted"] or counts["deleted"]
+        )
+        return {
+            "status": "completed",
+            "rebuilt_at": dt.datetime.now(dt.timezone.utc).isoformat(),
+            "topics": changes,
+        }
+
+    def _refresh_topic_memberships(
+        self,
+        topic_keys: set[str] | None = None,
+        *,
+        source_key: str | None = None,
+        world_ids: Iterable[str] | None = None,
+    ) -> dict[str, dict[str, int]]:
+        # With world_ids only those worlds are re-evaluated, and with source_key only
+        # for topics whose scope covers that source. Without them every membership
+        # is rebuilt.
+        scope = None if world_ids is None else {str(world_id) for world_id in world_ids if world_id}
+        if scope is not None and not scope:
+            return {}
         topics = [
             topic
             for topic in self.storage.list_topics()
@@ -4075,12 +4984,36 @@ class WorldInfoService:
             ]
             for topic in topics
         }
+        if source_key is not None:
+            rules_by_topic = {
+                topic_key: rules
+                for topic_key, rules in rules_by_topic.items()
+                if self._topic_covers_source(rules, source_key)
+            }
+            topics = [topic for topic in topics if topic["topic_key"] in rules_by_topic]
         needs_all_worlds = any(
             (not any(rule.get("rule_type") == "source" for rule in rules))
             and any(rule.get("rule_type") != "source" for rule in rules)
             for rules in rules_by_topic.values()
         )
-        worlds = self.load_worlds("db:all") if needs_all_worlds else []
+        if not needs_all_worlds:
+            worlds = []
+        elif scope is None:
+            worlds = self.load_worlds("db:all")
+        else:
+            worlds, _, _ = self._load_world_catalog("db:all", world_ids=scope)
+        # Every topic that scans db:all is evaluated in one compiled pass.
+        all_world_matches = self._evaluate_topic_rules(
+            self._compile_topic_rules(
+                {
+                    topic_key: rules
+                    for topic_key, rules in rules_by_topic.items()
+                    if not any(rule.get("rule_type") == "source" for rule in rules)
+                }
+            ),
+            worlds,
+        )
+        changes: dict[str, dict[str, int]] = {}
         for topic in topics:
             rules = rules_by_topic.get(topic["topic_key"], [])
             existing = self.storage.get_existing_topic_memberships(topic["topic_key"])
@@ -4091,17 +5024,22 @@ class WorldInfoService:
 
             source_worlds_by_id: dict[str, tuple[dict[str, Any], str]] = {}
             for rule in source_rules:
-                for world in self._load_topic_source_worlds(rule.get("rule_value") or ""):
+                for world in self._load_topic_source_worlds(rule.get("rule_value") or "", world_ids=scope):
                     world_id = world.get("id")
                     if not world_id:
                         continue
                     source_worlds_by_id[world_id] = (world, f"source:{rule.get('rule_value')}")
 
             if source_rules and other_rules:
-                for world_id, (world, source_match) in source_worlds_by_id.items():
-                    matched_by = self._match_topic(world, other_rules)
+                candidates = list(source_worlds_by_id.values())
+                matches = self._evaluate_topic_rules(
+                    self._compile_topic_rules({topic["topic_key"]: other_rules}),
+                    [world for world, _ in candidates],
+                )[topic["topic_key"]]
+                for (world, source_match), matched_by in zip(candidates, matches):
                     if not matched_by:
                         continue
+                    world_id = world.get("id")
                     current = existing.get(world_id)
                     memberships_by_world[world_id] = {
                         "world_id": world_id,
@@ -4124,8 +5062,7 @@ class WorldInfoService:
                     }
 
             if not source_rules:
-                for world in worlds:
-                    matched_by = self._match_topic(world, other_rules)
+                for world, matched_by in zip(worlds, all_world_matches.get(topic["topic_key"], ())):
                     if not matched_by:
                         continue
                     world_id = world.get("id")
@@ -4143,14 +5080,152 @@ class WorldInfoService:
                             "matched_by": matched_by,
                         },
                     )
-            self.storage.replace_topic_memberships(topic["topic_key"], list(memberships_by_world.values()))
-
-    def _match_topic(self, world: dict[str, Any], rules: list[dict[str, Any]]) -> str | None:
-        for rule in rules:
-            matched = self._world_matches_rule(world, rule["rule_type"], rule["rule_value"])
-            if matched:
-                return f"{rule['rule_type']}:{rule['rule_value']}"
-        return None
+            changes[topic["topic_key"]] = self.storage.apply_topic_memberships(
+                topic["topic_key"],
+                list(memberships_by_world.values()),
+                world_ids=scope,
+            )
+        return changes
+
+    def _topic_covers_source(self, rules: list[dict[str, Any]], source_key: str) -> bool:
+        source_values = {rule.get("rule_value") for rule in rules if rule.get("rule_type") == "source"}
+        if not source_values:
+            return any(rule.get("rule_type") != "source" for rule in rules)
+        return bool(source_values & {source_key, self._public_db_source_key(source_key)})
+
+    def _compile_topic_rules(self, rules_by_topic: dict[str, list[dict[str, Any]]]) -> dict[str, Any]:
+        # Rules are parsed once into (label, kind, operand) steps. Keyword needles
+        # from every topic share one automaton, and only the numeric features some
+        # rule reads are extracted from the worlds. Same semantics as
+        # _world_matches_rule, except that unparseable thresholds never match.
+        needles: dict[str, int] = {}
+        features: set[str] = set()
+        topics: dict[str, list[tuple[str, str, Any]]] = {}
+        for topic_key, rules in rules_by_topic.items():
+            steps = []
+            for rule in rules:
+                rule_type = rule.get("rule_type") or ""
+                rule_value = rule.get("rule_value") or ""
+                if not rule_value:
+                    continue
+                label = f"{rule_type}:{rule_value}"
+                if rule_type == "keyword":
+                    steps.append((label, "keyword", needles.setdefault(rule_value.casefold(), len(needles))))
+                elif rule_type == "source":
+                    steps.append((label, "source", (rule_value, self._public_db_source_key(rule_value))))
+                elif rule_type in TOPIC_EXACT_RULES:
+                    steps.append((label, rule_type, (rule_value,)))
+                elif rule_type in TOPIC_THRESHOLD_RULES:
+                    feature, op = TOPIC_THRESHOLD_RULES[rule_type]
+                    if feature == "favorite_rate":
+                        try:
+                            threshold = float(rule_value)
+                        except ValueError:
+                            continue
+                    else:
+                        threshold = self._to_int(rule_value)
+                        if feature.endswith("_age_days") and threshold <= 0:
+                            continue
+                    features.add(feature)
+                    steps.append((label, op, (feature, threshold)))
+            topics[topic_key] = steps
+        return {"topics": topics, "automaton": KeywordAutomaton(needles), "features": features}
+
+    def _evaluate_topic_rules(self, plan: dict[str, Any], worlds: list[Any]) -> dict[str, list[str | None]]:
+        # One pass over the worlds collects postings for the exact-match values and
+        # keyword needles the plan references plus its numeric feature columns;
+        # each rule then becomes a mask. Per world, the first matching rule of a
+        # topic labels the membership, as rules are ORed in order.
+        topics = plan["topics"]
+        if not worlds or not any(topics.values()):
+            return {topic_key: [None] * len(worlds) for topic_key in topics}
+        now = dt.datetime.now(dt.timezone.utc)
+        automaton: KeywordAutomaton = plan["automaton"]
+        features = plan["features"]
+        wanted: dict[str, set[str]] = {kind: set() for kind in TOPIC_EXACT_RULES}
+        for steps in topics.values():
+            for _, kind, operand in steps:
+                if kind in wanted:
+                    wanted[kind].update(operand)
+        postings: dict[tuple[str, Any], list[int]] = {}
+        columns: dict[str, list[float]] = {feature: [] for feature in features}
+        nan = float("nan")
+        for index, world in enumerate(worlds):
+            tags = world.get("tags") or []
+            if automaton:
+                haystack = "\x00".join(
+                    (
+                        world.get("name") or "",
+                        world.get("author_name") or "",
+                        world.get("author_id") or "",
+                        " ".join(tags),
+                    )
+                ).casefold()
+                for needle_id in automaton.find(haystack):
+                    postings.setdefault(("keyword", needle_id), []).append(index)
+            for kind, value in (
+                ("source", world.get("source") or ""),
+                ("author_id", world.get("author_id") or ""),
+                ("world_id", world.get("id") or ""),
+            ):
+                if value in wanted[kind]:
+                    postings.setdefault((kind, value), []).append(index)
+            if wanted["tag"]:
+                for tag in set(tags) & wanted["tag"]:
+                    postings.setdefault(("tag", tag), []).append(index)
+            for feature, column in columns.items():
+                if feature == "favorite_rate":
+                    metrics = world.get("metrics", {}) if isinstance(world.get("metrics"), dict) else {}
+                    favorite_rate = self._to_float(metrics.get("favorite_rate"))
+                    if favorite_rate is None:
+                        visits = self._to_int(world.get("visits"))
+                        favorites = self._to_int(world.get("favorites"))
+                        favorite_rate = (favorites / visits) * 100 if visits > 0 else None
+                    column.append(favorite_rate or 0.0)
+                elif feature.endswith("_age_days"):
+                    value = self._new_world_event_date(world) if feature == "published_age_days" else world.get("updated_at")
+                    parsed = _parse_date(value) if value else None
+                    column.append((now - parsed.astimezone(dt.timezone.utc)).days if parsed else nan)
+                else:
+                    column.append(self._to_int(world.get(feature)))
+        if np is not None:
+            arrays = {feature: np.asarray(column, dtype=np.float64) for feature, column in columns.items()}
+
+        results: dict[str, list[str | None]] = {}
+        for topic_key, steps in topics.items():
+            # Later rules are applied first so earlier ones overwrite them.
+            if np is not None:
+                chosen = np.full(len(worlds), -1, dtype=np.int64)
+            else:
+                chosen = [-1] * len(worlds)
+            for position in range(len(steps) - 1, -1, -1):
+                _, kind, operand = steps[position]
+                if kind in (">=", "<="):
+                    feature, threshold = operand
+                    if np is not None:
+                        values = arrays[feature]
+                        chosen[values >= threshold if kind == ">=" else values <= threshold] = position
+                    else:
+                        for index, value in enumerate(columns[feature]):
+                            if value >= threshold if kind == ">=" else value <= threshold:
+                                chosen[index] = position
+                    continue
+                keys = [("keyword", operand)] if kind == "keyword" else [(kind, value) for value in operand]
+                for key in keys:
+                    hits = postings.get(key)
+                    if not hits:
+                        continue
+                    if np is not None:
+                        chosen[np.asarray(hits, dtype=np.int64)] = position
+                    else:
+                        for index in hits:
+                            chosen[index] = position
+            labels = [step[0] for step in steps]
+            results[topic_key] = [
+                labels[position] if position >= 0 else None
+                for position in (chosen.tolist() if np is not None else chosen)
+            ]
+        return results
 
     def _world_matches_rule(self, world: dict[str, Any], rule_type: str, rule_value: str) -> bool:
         if not rule_value:
@@ -4218,9 +5293,9 @@ class WorldInfoService:
         return False
 
     def _load_job_configs(self) -> dict[str, dict[str, Any]]:
-        data = self._read_json(self.jobs_path, default={})
+        data = self._read_json_cached(self.jobs_path, default={})
         if isinstance(data, dict):
-            return {str(key): value for key, value in data.items() if isinstance(value, dict)}
+            return {str(key): dict(value) for key, value in data.items() if isinstance(value, dict)}
         return {}
 
     def _resolve_job_config(self, job_key: str, config: dict[str, Any]) -> dict[str, Any]:
@@ -4353,17 +5428,26 @@ class WorldInfoService:
         path = Path(str(value))
         if not path.is_absolute():
             path = self.repo_root / path
-        if not path.exists():
+        if path.suffix.lower() != ".txt":
             return set()
-        if path.suffix.lower() == ".txt":
-            return {
+
+        def read_lines(file_path: Path) -> frozenset[str]:
+            if not file_path.exists():
+                return frozenset()
+            return frozenset(
                 line.strip()
-                for line in path.read_text(encoding="utf-8").splitlines()
+                for line in file_path.read_text(encoding="utf-8").splitlines()
                 if line.strip() and not line.strip().startswith("#")
-            }
-        return set()
+            )
 
-    def _load_topic_source_worlds(self, source_value: str) -> list[dict[str, Any]]:
+        return set(self._file_cache.load(path, "lines", read_lines))
+
+    def _load_topic_source_worlds(
+        self,
+        source_value: str,
+        *,
+        world_ids: Iterable[str] | None = None,
+    ) -> list[dict[str, Any]]:
         cleaned = self._clean_optional_text(source_value)
         if not cleaned:
             return []
@@ -4372,6 +5456,8 @@ class WorldInfoService:
             candidates.append(self._public_db_source_key(cleaned))
         for candidate in candidates:
             try:
+                if world_ids is not None:
+                    return self._load_world_catalog(candidate, world_ids=world_ids)[0]
                 return self.load_worlds(candidate)
             except KeyError:
                 continue
@@ -4381,6 +5467,7 @@ class WorldInfoService:
         path.parent.mkdir(parents=True, exist_ok=True)
         payload = "\n".join(sorted(entry for entry in entries if entry)) + ("\n" if entries else "")
         path.write_text(payload, encoding="utf-8")
+        self._file_cache.discard(path)
 
     def _resolve_job_config_for_blacklist(self, job_key: str) -> dict[str, Any]:
         return self._resolve_job_config_for_list_file(job_key, "blacklist_file", "has no blacklist_file configured")
@@ -4778,36 +5865,509 @@ class WorldInfoService:
         author_ids = {str(world.get("author_id") or "").strip() for world in worlds if world.get("author_id")}
         return author_ids == {"usr_0673194d-712d-4b5d-8167-1f03ed3233cb"}
 
-    def _build_world_trend_metrics(self, world: dict[str, Any], history_entries: list[dict[str, Any]]) -> dict[str, Any]:
+    def _build_world_trend_metrics(
+        self,
+        world: dict[str, Any],
+        history_entries: list[dict[str, Any]],
+        *,
+        now: dt.datetime | None = None,
+    ) -> dict[str, Any]:
+        return self._assemble_world_trend_metrics(world, self._world_trend_baselines(world, history_entries), now=now)
+
+    def _world_trend_baselines(self, world: dict[str, Any], history_entries: list[dict[str, Any]]) -> dict[str, Any]:
         entries = sorted(
             [entry for entry in history_entries if entry.get("timestamp") is not None],
             key=lambda item: item.get("timestamp") or 0,
         )
+        timestamps = [entry.get("timestamp") or 0 for entry in entries]
+        updated_at = _parse_date(world.get("updated_at"))
+
+        def metric_at_or_before(target_ts: int, field: str) -> int | None:
+            index = bisect.bisect_right(timestamps, target_ts) - 1
+            if index < 0:
+                return None
+            return self._to_optional_int(entries[index].get(field))
+
+        baselines: dict[str, Any] = {}
+        if entries:
+            latest_ts = entries[-1]["timestamp"]
+            baselines["latest_ts"] = latest_ts
+            baselines["current_visits"] = self._to_int(entries[-1].get("visits"))
+            baselines["current_favorites"] = self._to_int(entries[-1].get("favorites"))
+            for field, days in TREND_BASELINE_WINDOWS:
+                baselines[f"{field}_{days}d"] = metric_at_or_before(latest_ts - days * 86400, field)
+            if updated_at:
+                baselines["visits_update"] = metric_at_or_before(int(updated_at.timestamp()), "visits")
+                baselines["favorites_update"] = metric_at_or_before(int(updated_at.timestamp()), "favorites")
+        baselines["update_gap_days"] = self._update_gap_days(
+            updated_at,
+            (entry.get("updated_at") for entry in reversed(entries)),
+        )
+        return baselines
+
+    def _trend_history_arrays(
+        self,
+        history: dict[str, list[dict[str, Any]]],
+        history_key: tuple[str, Any] | None = None,
+    ) -> dict[str, Any]:
+        # history_key is the (source, version token) a cached history map was
+        # served under; the flattened arrays are cached under the same token.
+        cache_key = None if history_key is None else ("trend_arrays", history_key[0])
+        if cache_key is not None:
+            cached = self._catalog_cache.get(cache_key, history_key[1])
+            if cached is not None:
+                return cached
+
+        world_ids = list(history)
+        lengths = [len(entries) for entries in history.values()]
+        entries = list(itertools.chain.from_iterable(history.values()))
+        owner = np.repeat(np.arange(len(world_ids), dtype=np.int64), lengths)
+        stamps = self._trend_metric_column(self._trend_history_column(entries, "timestamp"))
+        present = ~np.isnan(stamps)
+        ts = np.nan_to_num(stamps).astype(np.int64)
+        columns = {
+            "visits": self._trend_metric_column(self._trend_history_column(entries, "visits")),
+            "favorites": self._trend_metric_column(self._trend_history_column(entries, "favorites")),
+        }
+        present_index = np.flatnonzero(present)
+        owner = owner[present_index]
+        ts = ts[present_index]
+        ts_min = int(ts.min()) if ts.size else 0
+        ts_max = int(ts.max()) if ts.size else 0
+        span = ts_max - ts_min + 2
+        # Composite (world, timestamp) keys let one searchsorted resolve a
+        # per-world "latest point at or before" lookup for every world. The
+        # sort is stable, so equal timestamps keep their original order
+        # exactly like the per-world sort.
+        keys = owner * span + (ts - ts_min + 1)
+        order = np.argsort(keys, kind="stable")
+        owner = owner[order]
+        ts = ts[order]
+        keys = keys[order]
+        order = present_index[order]
+        positions = np.arange(len(world_ids), dtype=np.int64)
+        arrays = {
+            "index": {world_id: position for position, world_id in enumerate(world_ids)},
+            "starts": np.searchsorted(owner, positions, side="left"),
+            "ends": np.searchsorted(owner, positions, side="right"),
+            "ts": ts,
+            "ts_min": ts_min,
+            "ts_max": ts_max,
+            "span": span,
+            "keys": keys,
+            "visits": columns["visits"][order],
+            "favorites": columns["favorites"][order],
+            "updated_at": np.asarray(self._trend_history_column(entries, "updated_at"), dtype=object)[order],
+        }
+        if cache_key is not None:
+            self._catalog_cache.put(cache_key, history_key[1], arrays)
+        return arrays
+
+    def _trend_history_column(self, entries: list[dict[str, Any]], field: str) -> list[Any]:
+        try:
+            return list(map(operator.itemgetter(field), entries))
+        except KeyError:
+            return [entry.get(field) for entry in entries]
+
+    def _trend_metric_column(self, values: list[Any]) -> Any:
+        try:
+            return np.asarray(values, dtype=np.float64)
+        except (TypeError, ValueError):
+            converted = [self._to_optional_int(value) for value in values]
+            return np.asarray([np.nan if value is None else value for value in converted], dtype=np.float64)
+
+    def _build_trend_metrics_batch(
+        self,
+        worlds: list[dict[str, Any]],
+        history: dict[str, list[dict[str, Any]]],
+        *,
+        now: dt.datetime | None = None,
+        history_key: tuple[str, Any] | None = None,
+    ) -> list[dict[str, Any]]:
+        now = now or dt.datetime.now(dt.timezone.utc)
+        if np is None:
+            return [
+                self._assemble_world_trend_metrics(world, baselines, now=now) if baselines is not None else {}
+                for world, baselines in zip(worlds, self._trend_baselines_batch(worlds, history))
+            ]
+        return self._assemble_trend_metrics_columns(
+            worlds,
+            self._trend_baseline_columns(worlds, history, history_key),
+            now=now,
+        )
+
+    def _trend_baselines_batch(
+        self,
+        worlds: list[dict[str, Any]],
+        history: dict[str, list[dict[str, Any]]],
+    ) -> list[dict[str, Any] | None]:
+        if np is None:
+            return [
+                self._world_trend_baselines(world, history.get(world.get("id"), [])) if world.get("id") else None
+                for world in worlds
+            ]
+
+        columns = self._trend_baseline_columns(worlds, history)
+        named = {name: self._masked_int_list(*column) for name, column in columns["baselines"].items()}
+        named["current_visits"] = columns["current_visits"].tolist()
+        named["current_favorites"] = columns["current_favorites"].tolist()
+        latest_list = columns["latest_ts"].tolist()
+        history_flags = columns["has_history"].tolist()
+        results: list[dict[str, Any] | None] = []
+        for position, world in enumerate(worlds):
+            if not world.get("id"):
+                results.append(None)
+                continue
+            baselines: dict[str, Any] = {}
+            if history_flags[position]:
+                baselines = {name: column[position] for name, column in named.items()}
+                baselines["latest_ts"] = latest_list[position]
+            baselines["update_gap_days"] = columns["update_gap_days"][position]
+            results.append(baselines)
+        return results
+
+    def _trend_baseline_columns(
+        self,
+        worlds: list[dict[str, Any]],
+        history: dict[str, list[dict[str, Any]]],
+        history_key: tuple[str, Any] | None = None,
+    ) -> dict[str, Any]:
+        # The baselines of _world_trend_baselines for every world at once, as
+        # (values, found) array pairs.
+        arrays = self._trend_history_arrays(history, history_key)
+        index = arrays["index"]
+        world_count = len(worlds)
+        slots = np.asarray(
+            [index.get(world.get("id"), -1) if world.get("id") else -1 for world in worlds],
+            dtype=np.int64,
+        )
+        known = slots >= 0
+        safe_slots = np.where(known, slots, 0)
+        if arrays["starts"].size:
+            starts = np.where(known, arrays["starts"][safe_slots], 0)
+            ends = np.where(known, arrays["ends"][safe_slots], 0)
+        else:
+            starts = ends = np.zeros(world_count, dtype=np.int64)
+        has_history = ends > starts
+        last = np.where(has_history, ends - 1, 0)
+        ts = arrays["ts"]
+        ts_min = arrays["ts_min"]
+        span = arrays["span"]
+
+        def baseline_at(targets: Any, field: str) -> tuple[Any, Any]:
+            if not ts.size:
+                return np.zeros(world_count), np.zeros(world_count, dtype=bool)
+            clipped = np.clip(targets, ts_min - 1, arrays["ts_max"])
+            found_index = np.searchsorted(arrays["keys"], safe_slots * span + (clipped - ts_min + 1), side="right") - 1
+            found = has_history & (found_index >= starts)
+            picked = arrays[field][np.where(found, found_index, 0)]
+            return picked, found & ~np.isnan(picked)
+
+        latest_ts = ts[last] if ts.size else np.zeros(world_count, dtype=np.int64)
+        updated_dates = [_parse_date(world.get("updated_at")) if world.get("id") else None for world in worlds]
+        update_targets = np.asarray([int(value.timestamp()) if value else 0 for value in updated_dates], dtype=np.int64)
+        has_update = np.asarray([value is not None for value in updated_dates], dtype=bool)
+
+        baselines = {
+            f"{field}_{days}d": baseline_at(latest_ts - days * 86400, field)
+            for field, days in TREND_BASELINE_WINDOWS
+        }
+        for field in ("visits", "favorites"):
+            values, found = baseline_at(update_targets, field)
+            baselines[f"{field}_update"] = (values, found & has_update)
+        current = {
+            field: np.nan_to_num(arrays[field][last]).astype(np.int64) if ts.size else np.zeros(world_count, dtype=np.int64)
+            for field in ("visits", "favorites")
+        }
+        updates = arrays["updated_at"]
+        gap_days = [
+            self._update_gap_days(updated, reversed(updates[start:end]) if flag else ())
+            for updated, flag, start, end in zip(updated_dates, has_history.tolist(), starts.tolist(), ends.tolist())
+        ]
+        return {
+            "has_history": has_history,
+            "latest_ts": latest_ts,
+            "updated_dates": updated_dates,
+            "update_targets": update_targets,
+            "baselines": baselines,
+            "current_visits": current["visits"],
+            "current_favorites": current["favorites"],
+            "update_gap_days": gap_days,
+        }
+
+    def _masked_int_list(self, values: Any, mask: Any) -> list[int | None]:
+        return [int(value) if ok else None for value, ok in zip(values.tolist(), mask.tolist())]
+
+    def _assemble_trend_metrics_columns(
+        self,
+        worlds: list[dict[str, Any]],
+        columns: dict[str, Any],
+        *,
+        now: dt.datetime,
+    ) -> list[dict[str, Any]]:
+        # Column-wise _assemble_world_trend_metrics: deltas, growth ratios,
+        # since-update rates and scores are array expressions over the scope.
+        # Every operation mirrors the scalar one (same operand order, Python
+        # round() on the values the scalar path rounds), so payloads are identical.
+        current_visits = columns["current_visits"]
+        current_favorites = columns["current_favorites"]
+        baselines = {
+            name: (np.where(found, values, 0).astype(np.int64), found)
+            for name, (values, found) in columns["baselines"].items()
+        }
+        every = np.ones(len(worlds), dtype=bool)
+
+        def delta(current: Any, name: str) -> tuple[Any, Any]:
+            base, found = baselines[name]
+            return current - base, found
+
+        def growth(current: Any, name: str) -> tuple[Any, Any]:
+            base, found = baselines[name]
+            ok = found & (base > 0)
+            return np.divide(current - base, base, out=np.zeros(len(base)), where=ok), ok
+
+        def rounded(values: Any, mask: Any, digits: int) -> list[float | None]:
+            return [round(value, digits) if ok else None for value, ok in zip(values.tolist(), mask.tolist())]
+
+        def as_float(values: list[Any]) -> Any:
+            return np.asarray([value or 0.0 for value in values], dtype=np.float64)
+
+        def as_int(values: list[Any]) -> Any:
+            return np.asarray([value or 0 for value in values], dtype=np.int64)
+
+        def floor_zero(values: Any) -> Any:
+            return np.where(values > 0, values, 0)
+
+        latest_visits = np.asarray([self._to_int(world.get("visits")) for world in worlds], dtype=np.int64)
+        latest_favorites = np.asarray([self._to_int(world.get("favorites")) for world in worlds], dtype=np.int64)
+        has_visits = latest_visits > 0
+        favorite_rate = rounded(
+            np.divide(latest_favorites, latest_visits, out=np.zeros(len(worlds)), where=has_visits) * 100,
+            has_visits,
+            2,
+        )
+
+        updated_dates = columns["updated_dates"]
+        publication_dates = [_parse_date(world.get("publication_date")) for world in worlds]
+        days_since_update = [(now - value).days if value else None for value in updated_dates]
+        days_since_publication = [(now - value).days if value else None for value in publication_dates]
+        has_publication = np.asarray([value is not None for value in publication_dates], dtype=bool)
+        age_days = np.asarray(
+            [(now - value).total_seconds() / 86400 if value else 0.0 for value in publication_dates],
+            dtype=np.float64,
+        )
+        age_days = np.where(age_days > 0, age_days, 0)
+        publication_ok = has_publication & has_visits
+        publication_visits_per_day = rounded(
+            np.divide(latest_visits, np.where(1.0 > age_days, 1.0, age_days)),
+            publication_ok,
+            2,
+        )
+
+        visits_delta_1d = delta(current_visits, "visits_1d")
+        visits_delta_7d = delta(current_visits, "visits_7d")
+        visits_delta_30d = delta(current_visits, "visits_30d")
+        visits_delta_prev_7d = (
+            baselines["visits_7d"][0] - baselines["visits_14d"][0],
+            baselines["visits_7d"][1] & baselines["visits_14d"][1],
+        )
+        favorites_delta_1d = delta(current_favorites, "favorites_1d")
+        favorites_delta_7d = delta(current_favorites, "favorites_7d")
+        visits_growth_1d = rounded(*growth(current_visits, "visits_1d"), 4)
+        visits_growth_7d = rounded(*growth(current_visits, "visits_7d"), 4)
+        favorites_growth_7d = rounded(*growth(current_favorites, "favorites_7d"), 4)
+
+        since_update_visits_delta = delta(current_visits, "visits_update")
+        since_update_favorites_delta = delta(current_favorites, "favorites_update")
+        elapsed_days = (columns["latest_ts"] - columns["update_targets"]) / 86400
+        elapsed_days = np.where(elapsed_days > 0, elapsed_days, 0)
+        elapsed_ok = columns["has_history"] & (elapsed_days > 0)
+        safe_elapsed = np.where(elapsed_ok, elapsed_days, 1.0)
+        since_update_visits_per_day = rounded(
+            since_update_visits_delta[0] / safe_elapsed,
+            elapsed_ok & since_update_visits_delta[1],
+            2,
+        )
+        since_update_favorites_per_day = rounded(
+            since_update_favorites_delta[0] / safe_elapsed,
+            elapsed_ok & since_update_favorites_delta[1],
+            2,
+        )
+
+        # Score inputs, read the way the scalar scores read the payload.
+        v1 = floor_zero(np.where(visits_delta_1d[1], visits_delta_1d[0], 0))
+        v7 = floor_zero(np.where(visits_delta_7d[1], visits_delta_7d[0], 0))
+        v30 = floor_zero(np.where(visits_delta_30d[1], visits_delta_30d[0], 0))
+        prev7 = floor_zero(np.where(visits_delta_prev_7d[1], visits_delta_prev_7d[0], 0))
+        f7 = floor_zero(np.where(favorites_delta_7d[1], favorites_delta_7d[0], 0))
+        su_visits = floor_zero(np.where(since_update_visits_delta[1], since_update_visits_delta[0], 0))
+        su_favorites = floor_zero(np.where(since_update_favorites_delta[1], since_update_favorites_delta[0], 0))
+        g1 = floor_zero(as_float(visits_growth_1d))
+        g7 = floor_zero(as_float(visits_growth_7d))
+        rate = floor_zero(as_float(favorite_rate))
+        publication_rate = floor_zero(as_float(publication_visits_per_day))
+        su_rate = floor_zero(as_float(since_update_visits_per_day))
+        heat_values = [self._to_optional_int(world.get("heat")) for world in worlds]
+        popularity_values = [self._to_optional_int(world.get("popularity")) for world in worlds]
+        heat = floor_zero(as_int(heat_values))
+        popularity = floor_zero(as_int(popularity_values))
+        acceleration = floor_zero(v7 - prev7)
+        publication_days = as_int(days_since_publication)
+        freshness = np.select(
+            [
+                ~has_publication,
+                publication_days <= 3,
+                publication_days <= 7,
+                publication_days <= 14,
+                publication_days <= 30,
+                publication_days <= 60,
+            ],
+            [0.9, 2.4, 2.1, 1.75, 1.35, 1.0],
+            default=0.7,
+        )
+
+        momentum = (
+            v7
+            + v30 * 0.35
+            + f7 * 7
+            + np.where(g7 > 4.0, 4.0, g7) * 42
+            + acceleration * 0.25
+        )
+        breakout_bonus = np.where(
+            has_publication,
+            floor_zero(14 - np.where(publication_days > 14, 14, publication_days)) * 4.0,
+            0.0,
+        )
+        best_growth = np.where(g7 > g1, g7, g1)
+        breakout = (
+            v1 * 2.5
+            + v7 * 1.1
+            + f7 * 11
+            + publication_rate * 3.5
+            + np.where(best_growth > 5.0, 5.0, best_growth) * 45
+            + acceleration * 0.35
+            + rate * 3.0
+        ) * freshness + breakout_bonus
+        watching_bonus = np.where(
+            has_publication & (publication_days <= 30),
+            (31 - floor_zero(publication_days)) * 1.8,
+            0.0,
+        )
+        watching = (
+            rate * 16
+            + f7 * 9
+            + np.where(v7 > 300, 300, v7) * 0.55
+            + su_rate * 2.5
+            + heat * 4
+            + popularity * 3
+            + watching_bonus
+        )
+        breakout_scores = rounded(breakout, every, 2)
+        watching_scores = rounded(watching, every, 2)
+        new_hot = (as_float(breakout_scores) * 0.82 + as_float(watching_scores) * 0.18) * np.where(
+            1.0 > freshness, 1.0, freshness
+        )
+        update_days = as_int(days_since_update)
+        divisor = np.where(update_days > 0, np.where(update_days > 30, 30, update_days), 1)
+        effectiveness = su_visits / divisor + su_favorites * 5 + v1 * 0.8
+
+        lists = {
+            "visits_delta_1d": self._masked_int_list(*visits_delta_1d),
+            "visits_delta_7d": self._masked_int_list(*visits_delta_7d),
+            "visits_delta_prev_7d": self._masked_int_list(*visits_delta_prev_7d),
+            "visits_delta_30d": self._masked_int_list(*visits_delta_30d),
+            "favorites_delta_1d": self._masked_int_list(*favorites_delta_1d),
+            "favorites_delta_7d": self._masked_int_list(*favorites_delta_7d),
+            "since_update_visits_delta": self._masked_int_list(*since_update_visits_delta),
+            "since_update_favorites_delta": self._masked_int_list(*since_update_favorites_delta),
+        }
+        momentum_scores = rounded(momentum, every, 2)
+        new_hot_scores = rounded(new_hot, every, 2)
+        effectiveness_scores = rounded(effectiveness, every, 2)
+        favorites_list = latest_favorites.tolist()
+        gap_days = columns["update_gap_days"]
+
+        results: list[dict[str, Any]] = []
+        for position, world in enumerate(worlds):
+            if not world.get("id"):
+                results.append({})
+                continue
+            trend_payload = {
+                "favorite_rate": favorite_rate[position],
+                "visits_delta_1d": lists["visits_delta_1d"][position],
+                "days_since_update": days_since_update[position],
+                "days_since_publication": days_since_publication[position],
+                "visits_delta_7d": lists["visits_delta_7d"][position],
+                "visits_delta_prev_7d": lists["visits_delta_prev_7d"][position],
+                "visits_delta_30d": lists["visits_delta_30d"][position],
+                "visits_growth_1d": visits_growth_1d[position],
+                "visits_growth_7d": visits_growth_7d[position],
+                "favorites_delta_1d": lists["favorites_delta_1d"][position],
+                "favorites_delta_7d": lists["favorites_delta_7d"][position],
+                "favorites_growth_7d": favorites_growth_7d[position],
+                "since_update_visits_delta": lists["since_update_visits_delta"][position],
+                "since_update_favorites_delta": lists["since_update_favorites_delta"][position],
+                "since_update_visits_per_day": since_update_visits_per_day[position],
+                "since_update_favorites_per_day": since_update_favorites_per_day[position],
+                "publication_visits_per_day": publication_visits_per_day[position],
+                "update_gap_days": gap_days[position],
+            }
+            tags, trend_payload["update_effect_tag"] = self._trend_tags(trend_payload, favorites_list[position])
+            trend_payload["tags"] = tags[:3]
+            trend_payload["heat"] = heat_values[position]
+            trend_payload["popularity"] = popularity_values[position]
+            trend_payload["momentum_score"] = momentum_scores[position]
+            trend_payload["breakout_score"] = breakout_scores[position]
+            trend_payload["worth_watching_score"] = watching_scores[position]
+            trend_payload["new_hot_score"] = new_hot_scores[position]
+            trend_payload["update_effectiveness_score"] = effectiveness_scores[position]
+            results.append(trend_payload)
+        return results
+
+    def _update_gap_days(self, updated_at: dt.datetime | None, recent_updates: Any) -> int | None:
+        # recent_updates yields raw updated_at values newest first; only the two
+        # most recent distinct dates matter, so stop as soon as both are known.
+        if not updated_at:
+            return None
+        latest_known = None
+        previous_raw: Any = object()
+        for raw in recent_updates:
+            if raw == previous_raw:
+                continue
+            previous_raw = raw
+            parsed = _parse_date(raw)
+            if not parsed:
+                continue
+            if latest_known is None:
+                if abs((parsed - updated_at).total_seconds()) >= 86400:
+                    return None
+                latest_known = parsed
+            elif parsed != latest_known:
+                return (latest_known - parsed).days
+        return None
+
+    def _assemble_world_trend_metrics(
+        self,
+        world: dict[str, Any],
+        baselines: dict[str, Any],
+        *,
+        now: dt.datetime | None = None,
+    ) -> dict[str, Any]:
+        # baselines holds everything history-derived (see _world_trend_baselines),
+        # so a stored copy can be re-assembled against a new `now` without history.
+        updated_at = _parse_date(world.get("updated_at"))
         latest_visits = self._to_int(world.get("visits"))
         latest_favorites = self._to_int(world.get("favorites"))
         favorite_rate = None
         if latest_visits > 0:
             favorite_rate = round((latest_favorites / latest_visits) * 100, 2)
 
-        updated_at = _parse_date(world.get("updated_at"))
         publication_date = _parse_date(world.get("publication_date"))
-        now = dt.datetime.now(dt.timezone.utc)
+        now = now or dt.datetime.now(dt.timezone.utc)
         days_since_update = (now - updated_at).days if updated_at else None
         days_since_publication = (now - publication_date).days if publication_date else None
 
-        def metric_at_or_before(target_ts: int, field: str) -> int | None:
-            candidate = None
-            for entry in entries:
-                timestamp = entry.get("timestamp") or 0
-                if timestamp <= target_ts:
-                    candidate = entry
-                else:
-                    break
-            if candidate is None:
-                return None
-            return self._to_optional_int(candidate.get(field))
-
-        latest_ts = entries[-1]["timestamp"] if entries else None
+        latest_ts = baselines.get("latest_ts")
         visits_delta_7d = None
         visits_delta_prev_7d = None
         visits_delta_30d = None
@@ -4818,14 +6378,14 @@ class WorldInfoService:
         favorites_delta_1d = None
         favorites_growth_7d = None
         if latest_ts is not None:
-            current_visits = self._to_int(entries[-1].get("visits"))
-            current_favorites = self._to_int(entries[-1].get("favorites"))
-            visits_1d = metric_at_or_before(latest_ts - 1 * 86400, "visits")
-            visits_7d = metric_at_or_before(latest_ts - 7 * 86400, "visits")
-            visits_14d = metric_at_or_before(latest_ts - 14 * 86400, "visits")
-            visits_30d = metric_at_or_before(latest_ts - 30 * 86400, "visits")
-            favorites_1d = metric_at_or_before(latest_ts - 1 * 86400, "favorites")
-            favorites_7d = metric_at_or_before(latest_ts - 7 * 86400, "favorites")
+            current_visits = baselines["current_visits"]
+            current_favorites = baselines["current_favorites"]
+            visits_1d = baselines.get("visits_1d")
+            visits_7d = baselines.get("visits_7d")
+            visits_14d = baselines.get("visits_14d")
+            visits_30d = baselines.get("visits_30d")
+            favorites_1d = baselines.get("favorites_1d")
+            favorites_7d = baselines.get("favorites_7d")
             if visits_1d is not None:
                 visits_delta_1d = current_visits - visits_1d
                 visits_growth_1d = ((current_visits - visits_1d) / visits_1d) if visits_1d > 0 else None
@@ -4842,18 +6402,7 @@ class WorldInfoService:
                 favorites_delta_7d = current_favorites - favorites_7d
                 favorites_growth_7d = ((current_favorites - favorites_7d) / favorites_7d) if favorites_7d > 0 else None
 
-        update_gap_days = None
-        distinct_updates = []
-        for entry in entries:
-            parsed = _parse_date(entry.get("updated_at"))
-            if not parsed:
-                continue
-            if not distinct_updates or distinct_updates[-1] != parsed:
-                distinct_updates.append(parsed)
-        if updated_at and distinct_updates:
-            latest_known = distinct_updates[-1]
-            if abs((latest_known - updated_at).total_seconds()) < 86400 and len(distinct_updates) > 1:
-                update_gap_days = (distinct_updates[-1] - distinct_updates[-2]).days
+        update_gap_days = baselines.get("update_gap_days")
 
         since_update_visits_delta = None
         since_update_favorites_delta = None
@@ -4861,13 +6410,13 @@ class WorldInfoService:
         since_update_favorites_per_day = None
         publication_visits_per_day = None
         if updated_at and latest_ts is not None:
-            baseline_visits = metric_at_or_before(int(updated_at.timestamp()), "visits")
-            baseline_favorites = metric_at_or_before(int(updated_at.timestamp()), "favorites")
+            baseline_visits = baselines.get("visits_update")
+            baseline_favorites = baselines.get("favorites_update")
             if baseline_visits is not None:
-                since_update_visits_delta = self._to_int(entries[-1].get("visits")) - baseline_visits
+                since_update_visits_delta = baselines["current_visits"] - baseline_visits
             if baseline_favorites is not None:
-                since_update_favorites_delta = self._to_int(entries[-1].get("favorites")) - baseline_favorites
-            elapsed_days = max((entries[-1]["timestamp"] - int(updated_at.timestamp())) / 86400, 0)
+                since_update_favorites_delta = baselines["current_favorites"] - baseline_favorites
+            elapsed_days = max((latest_ts - int(updated_at.timestamp())) / 86400, 0)
             if elapsed_days > 0 and since_update_visits_delta is not None:
                 since_update_visits_per_day = round(since_update_visits_delta / elapsed_days, 2)
             if elapsed_days > 0 and since_update_favorites_delta is not None:
@@ -4877,6 +6426,46 @@ class WorldInfoService:
             if latest_visits > 0:
                 publication_visits_per_day = round(latest_visits / max(age_days, 1.0), 2)
 
+        trend_payload = {
+            "favorite_rate": favorite_rate,
+            "visits_delta_1d": visits_delta_1d,
+            "days_since_update": days_since_update,
+            "days_since_publication": days_since_publication,
+            "visits_delta_7d": visits_delta_7d,
+            "visits_delta_prev_7d": visits_delta_prev_7d,
+            "visits_delta_30d": visits_delta_30d,
+            "visits_growth_1d": round(visits_growth_1d, 4) if visits_growth_1d is not None else None,
+            "visits_growth_7d": round(visits_growth_7d, 4) if visits_growth_7d is not None else None,
+            "favorites_delta_1d": favorites_delta_1d,
+            "favorites_delta_7d": favorites_delta_7d,
+            "favorites_growth_7d": round(favorites_growth_7d, 4) if favorites_growth_7d is not None else None,
+            "since_update_visits_delta": since_update_visits_delta,
+            "since_update_favorites_delta": since_update_favorites_delta,
+            "since_update_visits_per_day": since_update_visits_per_day,
+            "since_update_favorites_per_day": since_update_favorites_per_day,
+            "publication_visits_per_day": publication_visits_per_day,
+            "update_gap_days": update_gap_days,
+        }
+        tags, trend_payload["update_effect_tag"] = self._trend_tags(trend_payload, latest_favorites)
+        trend_payload["tags"] = tags[:3]
+        trend_payload["heat"] = self._to_optional_int(world.get("heat"))
+        trend_payload["popularity"] = self._to_optional_int(world.get("popularity"))
+        trend_payload["momentum_score"] = self._momentum_score(trend_payload)
+        trend_payload["breakout_score"] = self._breakout_score(trend_payload)
+        trend_payload["worth_watching_score"] = self._worth_watching_score(trend_payload)
+        trend_payload["new_hot_score"] = self._new_hot_score(trend_payload)
+        trend_payload["update_effectiveness_score"] = self._update_effectiveness_score(trend_payload)
+
+        return trend_payload
+
+    def _trend_tags(self, trend: dict[str, Any], latest_favorites: int) -> tuple[list[str], str | None]:
+        favorite_rate = trend["favorite_rate"]
+        visits_delta_7d = trend["visits_delta_7d"]
+        visits_delta_prev_7d = trend["visits_delta_prev_7d"]
+        visits_delta_30d = trend["visits_delta_30d"]
+        days_since_update = trend["days_since_update"]
+        since_update_visits_delta = trend["since_update_visits_delta"]
+        update_gap_days = trend["update_gap_days"]
         tags: list[str] = []
         if favorite_rate is not None and favorite_rate >= 8 and latest_favorites >= 25:
             tags.append("LOVED WORLD")
@@ -4906,38 +6495,7 @@ class WorldInfoService:
                 update_effect_tag = "ACTIVE"
             elif since_update_visits_delta is not None and since_update_visits_delta >= 80:
                 update_effect_tag = "STEADY FLOW"
-
-        trend_payload = {
-            "favorite_rate": favorite_rate,
-            "visits_delta_1d": visits_delta_1d,
-            "days_since_update": days_since_update,
-            "days_since_publication": days_since_publication,
-            "visits_delta_7d": visits_delta_7d,
-            "visits_delta_prev_7d": visits_delta_prev_7d,
-            "visits_delta_30d": visits_delta_30d,
-            "visits_growth_1d": round(visits_growth_1d, 4) if visits_growth_1d is not None else None,
-            "visits_growth_7d": round(visits_growth_7d, 4) if visits_growth_7d is not None else None,
-            "favorites_delta_1d": favorites_delta_1d,
-            "favorites_delta_7d": favorites_delta_7d,
-            "favorites_growth_7d": round(favorites_growth_7d, 4) if favorites_growth_7d is not None else None,
-            "since_update_visits_delta": since_update_visits_delta,
-            "since_update_favorites_delta": since_update_favorites_delta,
-            "since_update_visits_per_day": since_update_visits_per_day,
-            "since_update_favorites_per_day": since_update_favorites_per_day,
-            "publication_visits_per_day": publication_visits_per_day,
-            "update_gap_days": update_gap_days,
-            "update_effect_tag": update_effect_tag,
-            "tags": tags[:3],
-            "heat": self._to_optional_int(world.get("heat")),
-            "popularity": self._to_optional_int(world.get("popularity")),
-        }
-        trend_payload["momentum_score"] = self._momentum_score(trend_payload)
-        trend_payload["breakout_score"] = self._breakout_score(trend_payload)
-        trend_payload["worth_watching_score"] = self._worth_watching_score(trend_payload)
-        trend_payload["new_hot_score"] = self._new_hot_score(trend_payload)
-        trend_payload["update_effectiveness_score"] = self._update_effectiveness_score(trend_payload)
-
-        return trend_payload
+        return tags, update_effect_tag
 
     def _build_signal_analysis(self, rows: list[dict[str, Any]], *, limit: int = 12) -> dict[str, Any]:
         usable_rows = [row for row in rows if row.get("id")]
@@ -5315,8 +6873,10 @@ class WorldInfoService:
 
     def _normalise_db_history_entry(self, world_id: str, entry: dict[str, Any]) -> dict[str, Any]:
         fetched_at = entry.get("fetched_at")
-        fetched_dt = _parse_date(fetched_at)
-        timestamp_int = int(fetched_dt.timestamp()) if fetched_dt else None
+        timestamp_int = entry.get("ts")
+        if timestamp_int is None:
+            fetched_dt = _parse_date(fetched_at)
+            timestamp_int = int(fetched_dt.timestamp()) if fetched_dt else None
         return {
             "world_id": world_id,
             "origin": "db",
@@ -5400,7 +6960,9 @@ class WorldInfoService:
         merged["tags"] = self._merge_tags(left.get("tags"), right.get("tags"))
         return merged
 
-    def _clone_world(self, world: dict[str, Any]) -> dict[str, Any]:
+    def _clone_world(self, world: dict[str, Any] | WorldRecord) -> dict[str, Any]:
+        if isinstance(world, WorldRecord):
+            return world.to_dict()
         cloned = dict(world)
         cloned["metrics"] = dict(world.get("metrics", {}))
         cloned["tags"] = list(world.get("tags", []))
@@ -5625,19 +7187,18 @@ class WorldInfoService:
         sort: str,
         direction: str,
         history: dict[str, list[dict[str, Any]]] | None = None,
+        history_key: tuple[str, Any] | None = None,
+        limit: int | None = None,
     ) -> list[dict[str, Any]]:
         reverse = direction != "asc"
         trend_sort_fields = {"breakout", "new_hot", "momentum", "worth_watching", "recent_update", "publication_velocity"}
         if sort not in trend_sort_fields:
-            items = list(worlds)
-            items.sort(key=lambda item: self._sort_value(item, sort), reverse=reverse)
-            return items
+            return self._top_k(worlds, key=lambda item: self._sort_value(item, sort), limit=limit, reverse=reverse)
 
         history = history if history is not None else self.load_history()
+        trends = self._build_trend_metrics_batch(worlds, history, history_key=history_key)
         scored_worlds = []
-        for world in worlds:
-            world_id = world.get("id")
-            trend = self._build_world_trend_metrics(world, history.get(world_id, [])) if world_id else {}
+        for world, trend in zip(worlds, trends):
             score = self._trend_sort_metric(world, trend, sort)
             scored_worlds.append(
                 (
@@ -5647,9 +7208,57 @@ class WorldInfoService:
                     world,
                 )
             )
-        scored_worlds.sort(key=lambda item: (item[0], item[1], item[2]), reverse=reverse)
+        scored_worlds = self._top_k(scored_worlds, key=lambda item: (item[0], item[1], item[2]), limit=limit, reverse=reverse)
         return [item[3] for item in scored_worlds]
 
+    def _stored_trend_ranks(
+        self,
+        worlds: list[dict[str, Any]],
+        ranked: list[tuple[str, tuple[float, int, int]]],
+        source: str,
+        sort: str,
+        *,
+        descending: bool,
+    ) -> list[float]:
+        # Ranks follow the distinct (score, date, visits) keys of the stored order,
+        # so worlds sharing a key keep their catalog order under a stable sort, as
+        # in _sort_worlds. Worlds without a stored row are scored on the spot and
+        # slot in among the stored keys.
+        stored: dict[str, int] = {}
+        keys: list[tuple[float, int, int]] = []
+        for world_id, key in ranked:
+            if not keys or keys[-1] != key:
+                keys.append(key)
+            stored[world_id] = len(keys) - 1
+        missing = [world for world in worlds if world.get("id") not in stored]
+        missing_keys: list[tuple[float, int, int]] = []
+        if missing:
+            history = self.load_history(source=source, world_ids=[world.get("id") for world in missing if world.get("id")])
+            missing_keys = [
+                (
+                    self._trend_sort_metric(world, trend, sort),
+                    self._date_score(world.get("publication_date") or world.get("updated_at") or world.get("fetched_at")),
+                    self._to_int(world.get("visits")),
+                )
+                for world, trend in zip(missing, self._build_trend_metrics_batch(missing, history))
+            ]
+        order_key = (lambda key: tuple(-value for value in key)) if descending else None
+
+        def slot(key: tuple[float, int, int]) -> float:
+            if order_key is None:
+                position = bisect.bisect_left(keys, key)
+            else:
+                position = bisect.bisect_left(keys, order_key(key), key=order_key)
+            if position < len(keys) and keys[position] == key:
+                return position
+            return position - 0.5
+
+        missing_ranks = iter([slot(key) for key in missing_keys])
+        return [
+            stored[world.get("id")] if world.get("id") in stored else next(missing_ranks)
+            for world in worlds
+        ]
+
     def _read_daily_stats_xlsx(self, path: Path) -> list[dict[str, Any]]:
         workbook = load_workbook(path, read_only=True, data_only=True)
         sheet = workbook.active
@@ -5677,15 +7286,20 @@ class WorldInfoService:
         if not file_path.exists():
             return default
         try:
-            return json.loads(file_path.read_text(encoding="utf-8"))
+            return jsoncodec.loads(file_path.read_bytes())
         except (OSError, json.JSONDecodeError) as exc:
             logger.warning("Failed to read %s: %s", file_path, exc)
             return default
 
+    def _read_json_cached(self, path: Path | str, default: Any) -> Any:
+        payload = self._file_cache.load(Path(path), "json", lambda file_path: self._read_json(file_path, None))
+        return default if payload is None else payload
+
     def _write_json(self, path: Path | str, payload: Any) -> None:
         file_path = Path(path)
         file_path.parent.mkdir(parents=True, exist_ok=True)
         file_path.write_text(json.dumps(payload, ensure_ascii=False, indent=2), encoding="utf-8")
+        self._file_cache.discard(file_path)
 
     def _display_path(self, path: Path) -> str:
         try:
@@ -5842,6 +7456,8 @@ class WorldInfoService:
         return text
 
     def _to_optional_int(self, value: Any) -> int | None:
+        if type(value) is int:
+            return value
         if value in (None, ""):
             return None
         if isinstance(value, bool):
@@ -5856,6 +7472,8 @@ class WorldInfoService:
             return None
 
     def _to_int(self, value: Any) -> int:
+        if type(value) is int:
+            return value
         if value in (None, ""):
             return 0
         if isinstance(value, bool):
@@ -5870,6 +7488,8 @@ class WorldInfoService:
             return 0
 
     def _to_float(self, value: Any) -> float | None:
+        if type(value) in (int, float):
+            return float(value)
         if value in (None, ""):
             return None
         try:
@@ -6001,10 +7621,31 @@ class WorldInfoService:
             return "Recent 429s detected. Space out manual searches and lower per-keyword limits before the next run."
         return "No recent 429 events recorded."
 
-    def _decorate_run(self, run: dict[str, Any] | None) -> dict[str, Any] | None:
+    def _decorate_run(
+        self,
+        run: dict[str, Any] | None,
+        *,
+        labels: dict[str, str] | None = None,
+    ) -> dict[str, Any] | None:
         if run is None:
             return None
         item = dict(run)
         item["source"] = self._public_db_source_key(item["source_key"])
-        item["label"] = self._label_for_db_source(item["source_key"])
+        label = labels.get(item["source_key"]) if labels is not None else None
+        item["label"] = label or self._label_for_db_source(item["source_key"])
         return item
+
+
+# Process-pool workers for refresh_stale_analysis. Each process builds its own
+# service (and SQLite connections) once and rebuilds the scopes it is handed.
+_analysis_worker_service: WorldInfoService | None = None
+
+
+def _init_analysis_worker(service_kwargs: dict[str, Any]) -> None:
+    global _analysis_worker_service
+    _analysis_worker_service = WorldInfoService(**service_kwargs)
+
+
+def _refresh_analysis_scope(scope_key: str) -> str:
+    _analysis_worker_service.refresh_analysis_cache(scope_key)
+    return scope_key
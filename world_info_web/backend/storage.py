@@ -1,25 +1,457 @@
 from __future__ import annotations
 
-import json
+import datetime as dt
 import logging
 import sqlite3
+import threading
+import time
+import zlib
+from collections.abc import Iterable, Iterator, MutableMapping
+from contextlib import contextmanager
 from pathlib import Path
 from typing import Any
 
+try:
+    import zstandard
+except ImportError:  # pragma: no cover - optional dependency
+    zstandard = None
+
+from . import jsoncodec
+
 logger = logging.getLogger(__name__)
 
+METRIC_POINT_BACKFILL_BATCH = 5000
+METRIC_POINT_DATE_COLUMNS = ("created_at", "publication_date", "labs_publication_date")
+SQLITE_CACHED_STATEMENTS = 256
+SQLITE_CONNECTION_PRAGMAS = (
+    "PRAGMA busy_timeout=60000",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA mmap_size=268435456",
+    "PRAGMA cache_size=-32768",
+)
+
+
+PAYLOAD_CODECS = ("json", "zlib", "zstd")
+PAYLOAD_MIGRATION_BATCH = 500
+
+# The trend metrics look back at most 30 days from a world's newest point, so the
+# full-resolution window can never be narrower than that.
+TREND_LOOKBACK_DAYS = 30
+COMPACTION_FULL_RESOLUTION_DAYS = 30
+COMPACTION_DAILY_DAYS = 180
+COMPACTION_BATCH = 500
+
+# world_latest.id is an explicit key so world_search rows keep pointing at the
+# right world across VACUUM.
+WORLD_LATEST_TABLE_SQL = """
+    CREATE TABLE IF NOT EXISTS world_latest (
+        id INTEGER PRIMARY KEY,
+        source_key TEXT NOT NULL,
+        world_id TEXT NOT NULL,
+        snapshot_id INTEGER NOT NULL,
+        run_id INTEGER NOT NULL,
+        fetched_at TEXT NOT NULL,
+        name TEXT,
+        author_id TEXT,
+        author_name TEXT,
+        visits INTEGER,
+        favorites INTEGER,
+        heat INTEGER,
+        popularity INTEGER,
+        updated_at TEXT,
+        publication_date TEXT,
+        tags_json TEXT NOT NULL,
+        raw_json TEXT NOT NULL,
+        raw_encoding TEXT NOT NULL DEFAULT 'json',
+        description TEXT,
+        UNIQUE(source_key, world_id)
+    )
+"""
+
+# Columns of world_latest mirrored, casefolded, into the world_search FTS5 table.
+# Needles are casefolded the same way. The trigram tokenizer needs at least three
+# characters, so shorter needles fall back to a substring scan of the same index.
+SEARCH_COLUMNS = ("world_id", "name", "author_id", "author_name", "tags_json", "description")
+SEARCH_QUERY_COLUMNS = ("world_id", "name", "author_name", "tags_json", "description")
+SEARCH_TRIGRAM_MIN_CHARS = 3
+DESCRIPTION_BACKFILL_BATCH = 1000
+
+RUN_DIFF_KINDS = ("added", "removed", "changed")
+RUN_DIFF_FIELDS = ("name", "author_id", "author_name", "updated_at", "release_status")
+RUN_DIFF_METRICS = ("visits", "favorites", "heat", "popularity")
+RUN_DIFF_PREVIEW_FIELDS = ("name", "author_id", "author_name", "visits", "favorites", "updated_at", "world_url")
+
+# A world_trend_metrics row is current while it matches the world's latest
+# snapshot and no history point newer than the ones it was computed from exists.
+TREND_POINTS_MARK_SQL = """
+    COALESCE((
+        SELECT MAX(p.snapshot_id) FROM world_metric_points p
+        WHERE p.source_key = {row}.source_key AND p.world_id = {row}.world_id
+    ), 0)
+"""
+
+# Trend sort keys and the world_trend_metrics column each one orders by.
+TREND_SORT_COLUMNS = {
+    "breakout": "breakout_score",
+    "new_hot": "new_hot_score",
+    "momentum": "momentum_score",
+    "worth_watching": "worth_watching_score",
+    "recent_update": "update_effectiveness_score",
+    "publication_velocity": "publication_visits_per_day",
+}
+
+
+def _encode_payload(payload: Any, codec: str) -> str | bytes:
+    if codec == "zlib":
+        return zlib.compress(jsoncodec.dumps_bytes(payload), 6)
+    if codec == "zstd":
+        return zstandard.ZstdCompressor(level=6).compress(jsoncodec.dumps_bytes(payload))
+    return jsoncodec.dumps(payload)
+
+
+def _recode_payload(raw: str | bytes, encoding: str, codec: str) -> str | bytes:
+    if encoding == codec:
+        return raw
+    return _encode_payload(_decode_payload(raw, encoding), codec)
+
+
+def _decode_payload(raw: str | bytes | None, encoding: str | None) -> Any:
+    if raw is None or raw == "":
+        return None
+    if encoding == "zlib":
+        return jsoncodec.loads(zlib.decompress(raw))
+    if encoding == "zstd":
+        if zstandard is None:
+            raise RuntimeError("zstandard is required to read zstd-encoded payloads.")
+        return jsoncodec.loads(zstandard.ZstdDecompressor().decompress(raw))
+    return jsoncodec.loads(raw)
+
+
+# Typed columns that hold the payload field of the same name verbatim.
+LATEST_WORLD_FIELDS = (
+    "name", "author_id", "author_name", "visits", "favorites", "heat", "popularity",
+    "updated_at", "publication_date",
+)
+SNAPSHOT_WORLD_FIELDS = (
+    *LATEST_WORLD_FIELDS, "capacity", "created_at", "labs_publication_date",
+    "release_status", "image_url", "thumbnail_url", "world_url",
+)
+SNAPSHOT_METRIC_FIELDS = ("favorite_rate", "labs_to_publication_days", "days_since_update", "visits_per_day")
+
+
+class LazyWorld(MutableMapping):
+    """A stored world that answers from its typed columns and decodes the raw
+    payload only when a field they do not carry is read (or the row is iterated)."""
+
+    __slots__ = ("_data", "_raw", "_encoding", "_metrics", "_decoded")
+
+    def __init__(
+        self,
+        fields: dict[str, Any],
+        raw: str | bytes | None,
+        encoding: str | None,
+        *,
+        metrics: dict[str, Any] | None = None,
+    ) -> None:
+        self._data = fields
+        self._raw = raw
+        self._encoding = encoding
+        self._metrics = metrics
+        self._decoded = False
+
+    def _load(self) -> dict[str, Any]:
+        if not self._decoded:
+            payload = _decode_payload(self._raw, self._encoding) or {}
+            if self._metrics is not None:
+                metrics = payload.get("metrics") if isinstance(payload.get("metrics"), dict) else {}
+                metrics.update(self._metrics)
+                payload["metrics"] = metrics
+            payload.update(self._data)
+            self._data = payload
+            self._raw = self._metrics = None
+            self._decoded = True
+        return self._data
+
+    def __getitem__(self, key: str) -> Any:
+        try:
+            return self._data[key]
+        except KeyError:
+            return self._load()[key]
 
-class WorldInfoStorage:
+    def __setitem__(self, key: str, value: Any) -> None:
+        self._data[key] = value
+
+    def __delitem__(self, key: str) -> None:
+        del self._load()[key]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._load())
+
+    def __len__(self) -> int:
+        return len(self._load())
+
+    def __repr__(self) -> str:
+        return f"LazyWorld({self._data!r}, decoded={self._decoded})"
+
+    def copy(self) -> dict[str, Any]:
+        return dict(self._load())
+
+
+def _lazy_world(row: sqlite3.Row, fields: tuple[str, ...], *, metrics: dict[str, Any] | None = None) -> LazyWorld:
+    # NULL columns may stand for a missing key, so only set values are taken up front.
+    data = {}
+    if row["world_id"] is not None:
+        data["id"] = row["world_id"]
+    for field in fields:
+        value = row[field]
+        if value is not None:
+            data[field] = value
+    data["fetched_at"] = row["fetched_at"]
+    data["_db_source_key"] = row["source_key"]
+    return LazyWorld(data, row["raw_json"], row["raw_encoding"], metrics=metrics)
+
+
+# Fields that change on every fetch without the world itself changing.
+SNAPSHOT_VOLATILE_FIELDS = frozenset({"fetched_at", "metrics"})
+
+
+def _snapshot_fingerprint(world: dict[str, Any]) -> dict[str, Any]:
+    return {key: value for key, value in world.items() if key not in SNAPSHOT_VOLATILE_FIELDS}
+
+
+def _to_epoch_seconds(value: Any) -> int | None:
+    text = str(value or "").strip()
+    if not text:
+        return None
+    if text.endswith("Z"):
+        text = text[:-1] + "+00:00"
+    try:
+        parsed = dt.datetime.fromisoformat(text)
+    except ValueError:
+        return None
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=dt.timezone.utc)
+    return int(parsed.timestamp())
+
+
+def _casefold(value: Any) -> Any:
+    return value.casefold() if isinstance(value, str) else value
+
+
+# Flask request threads and the auto-sync scheduler each keep their own
+# connection for the thread's lifetime. The scheduler closes its own on stop
+# (close_current); a connection whose thread has exited is closed by the next open.
+class ThreadLocalConnections:
     def __init__(self, db_path: Path) -> None:
+        self.db_path = db_path
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._owners: dict[sqlite3.Connection, threading.Thread] = {}
+        self._opens = 0
+        self._reuses = 0
+        self._closes = 0
+        self._open_seconds = 0.0
+
+    def acquire(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is not None:
+            with self._lock:
+                self._reuses += 1
+            return conn
+        self._close_orphaned()
+        started = time.perf_counter()
+        # Only the owning thread uses the connection; check_same_thread is off so
+        # a connection left behind by an exited thread can be closed elsewhere.
+        conn = sqlite3.connect(
+            str(self.db_path),
+            timeout=60,
+            cached_statements=SQLITE_CACHED_STATEMENTS,
+            check_same_thread=False,
+        )
+        conn.row_factory = sqlite3.Row
+        # SQLite's LOWER/LIKE only fold ASCII; the search index and run diffs use this.
+        conn.create_function("casefold", 1, _casefold, deterministic=True)
+        for pragma in SQLITE_CONNECTION_PRAGMAS:
+            try:
+                conn.execute(pragma)
+            except sqlite3.OperationalError as exc:
+                logger.warning("SQLite connection pragma skipped (%s): %s", pragma, exc)
+        elapsed = time.perf_counter() - started
+        with self._lock:
+            self._opens += 1
+            self._open_seconds += elapsed
+            self._owners[conn] = threading.current_thread()
+        self._local.conn = conn
+        return conn
+
+    def close_current(self) -> None:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            return
+        self._local.conn = None
+        with self._lock:
+            self._owners.pop(conn, None)
+            self._closes += 1
+        conn.close()
+
+    def _close_orphaned(self) -> None:
+        with self._lock:
+            orphaned = [conn for conn, owner in self._owners.items() if not owner.is_alive()]
+            for conn in orphaned:
+                del self._owners[conn]
+            self._closes += len(orphaned)
+        for conn in orphaned:
+            conn.close()
+
+    def stats(self) -> dict[str, Any]:
+        with self._lock:
+            opens = self._opens
+            reuses = self._reuses
+            closes = self._closes
+            open_connections = len(self._owners)
+            open_seconds = self._open_seconds
+        acquisitions = opens + reuses
+        return {
+            "opens": opens,
+            "reuses": reuses,
+            "closes": closes,
+            "open_connections": open_connections,
+            "reuse_ratio": round(reuses / acquisitions, 4) if acquisitions else 0.0,
+            "open_ms_total": round(open_seconds * 1000, 3),
+            "open_ms_avg": round(open_seconds * 1000 / opens, 3) if opens else 0.0,
+            "cached_statements": SQLITE_CACHED_STATEMENTS,
+            "pragmas": list(SQLITE_CONNECTION_PRAGMAS),
+        }
+
+
+# Write operations bound to one open BEGIN IMMEDIATE transaction; see
+# WorldInfoStorage.unit_of_work().
+class StorageUnitOfWork:
+    def __init__(self, storage: WorldInfoStorage, conn: sqlite3.Connection) -> None:
+        self._storage = storage
+        self._conn = conn
+        self.commit_ms: float | None = None
+        self.transaction_ms: float | None = None
+
+    def create_run(self, **kwargs: Any) -> int:
+        return self._storage._create_run(self._conn, **kwargs)
+
+    def finish_run(self, run_id: int, **kwargs: Any) -> None:
+        self._storage._finish_run(self._conn, run_id, **kwargs)
+
+    def purge_source(self, source_key: str) -> None:
+        self._storage._purge_source(self._conn, source_key)
+
+    def get_existing_world_ids(self, world_ids: set[str]) -> set[str]:
+        return self._storage._get_existing_world_ids(self._conn, world_ids)
+
+    def insert_world_snapshots(self, **kwargs: Any) -> None:
+        self._storage._insert_world_snapshots(self._conn, **kwargs)
+
+    def insert_run_queries(self, **kwargs: Any) -> None:
+        self._storage._insert_run_queries(self._conn, **kwargs)
+
+    def upsert_daily_stats(self, **kwargs: Any) -> None:
+        self._storage._upsert_daily_stats(self._conn, **kwargs)
+
+    def list_runs(self, **kwargs: Any) -> list[dict[str, Any]]:
+        return self._storage._list_runs(self._conn, **kwargs)
+
+    def count_run_worlds(self, run_ids: Iterable[int]) -> dict[int, dict[str, int]]:
+        return self._storage._count_run_worlds(self._conn, run_ids)
+
+    def diff_runs(self, base_run_id: int, target_run_id: int, **kwargs: Any) -> dict[str, Any]:
+        return self._storage._diff_runs(self._conn, base_run_id, target_run_id, **kwargs)
+
+    def upsert_run_summary(self, **kwargs: Any) -> None:
+        self._storage._upsert_run_summary(self._conn, **kwargs)
+
+    def upsert_world_events(self, events: list[dict[str, Any]]) -> int:
+        return self._storage._upsert_world_events(self._conn, events)
+
+
+class WorldInfoStorage:
+    def __init__(self, db_path: Path, *, payload_codec: str = "json") -> None:
         self.db_path = Path(db_path)
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        payload_codec = (payload_codec or "json").strip().lower()
+        if payload_codec not in PAYLOAD_CODECS:
+            raise ValueError(f"Unknown payload codec: {payload_codec}")
+        if payload_codec == "zstd" and zstandard is None:
+            logger.warning("zstandard is not installed; storing payloads with zlib instead.")
+            payload_codec = "zlib"
+        self.payload_codec = payload_codec
+        self._connections = ThreadLocalConnections(self.db_path)
+        self._transaction_lock = threading.Lock()
+        self._transaction_count = 0
+        self._commit_seconds_total = 0.0
+        self._commit_seconds_max = 0.0
+        self._last_commit_seconds: float | None = None
+        self._last_transaction_seconds: float | None = None
+        self.search_index_enabled = False
+        self._data_version = 0
         self._initialize()
 
     def _connect(self) -> sqlite3.Connection:
-        conn = sqlite3.connect(str(self.db_path), timeout=60)
-        conn.row_factory = sqlite3.Row
-        conn.execute("PRAGMA busy_timeout=60000")
-        return conn
+        return self._connections.acquire()
+
+    def connection_stats(self) -> dict[str, Any]:
+        return self._connections.stats()
+
+    def close_connection(self) -> None:
+        self._connections.close_current()
+
+    @contextmanager
+    def unit_of_work(self) -> Iterator[StorageUnitOfWork]:
+        conn = self._connect()
+        started = time.perf_counter()
+        conn.execute("BEGIN IMMEDIATE")
+        uow = StorageUnitOfWork(self, conn)
+        try:
+            yield uow
+        except BaseException:
+            conn.rollback()
+            raise
+        commit_started = time.perf_counter()
+        conn.commit()
+        finished = time.perf_counter()
+        uow.commit_ms = round((finished - commit_started) * 1000, 3)
+        uow.transaction_ms = round((finished - started) * 1000, 3)
+        with self._transaction_lock:
+            self._transaction_count += 1
+            self._commit_seconds_total += finished - commit_started
+            self._commit_seconds_max = max(self._commit_seconds_max, finished - commit_started)
+            self._last_commit_seconds = finished - commit_started
+            self._last_transaction_seconds = finished - started
+            self._data_version += 1
+
+    def _bump_data_version(self) -> None:
+        with self._transaction_lock:
+            self._data_version += 1
+
+    def data_version(self) -> tuple[int, int]:
+        # Local writes bump the counter once they are committed. The newest run id
+        # also catches syncs written by another process against the same file.
+        with self._connect() as conn:
+            row = conn.execute("SELECT COALESCE(MAX(id), 0) AS run_id FROM sync_runs").fetchone()
+        with self._transaction_lock:
+            return (self._data_version, int(row["run_id"]))
+
+    def transaction_stats(self) -> dict[str, Any]:
+        with self._transaction_lock:
+            count = self._transaction_count
+            total = self._commit_seconds_total
+            maximum = self._commit_seconds_max
+            last_commit = self._last_commit_seconds
+            last_transaction = self._last_transaction_seconds
+        return {
+            "count": count,
+            "commit_ms_avg": round(total * 1000 / count, 3) if count else 0.0,
+            "commit_ms_max": round(maximum * 1000, 3),
+            "last_commit_ms": round(last_commit * 1000, 3) if last_commit is not None else None,
+            "last_transaction_ms": round(last_transaction * 1000, 3) if last_transaction is not None else None,
+        }
 
     def _initialize(self) -> None:
         existing_db = self.db_path.exists() and self.db_path.stat().st_size > 0
@@ -29,6 +461,7 @@ class WorldInfoStorage:
             lowered = str(exc).casefold()
             if "disk i/o" in lowered:
                 logger.warning("SQLite WAL init failed for %s; retrying without WAL: %s", self.db_path, exc)
+                self._connections.close_current()
                 self._cleanup_sqlite_sidecars()
                 try:
                     self._initialize_schema(prefer_wal=False)
@@ -69,11 +502,8 @@ class WorldInfoStorage:
                     conn.execute("PRAGMA journal_mode=DELETE")
                 except sqlite3.OperationalError as exc:
                     logger.warning("SQLite fallback journal mode update skipped: %s", exc)
-            try:
-                conn.execute("PRAGMA synchronous=NORMAL")
-                conn.execute("PRAGMA temp_store=MEMORY")
-            except sqlite3.OperationalError as exc:
-                logger.warning("SQLite performance pragma update skipped: %s", exc)
+            self._migrate_world_latest_key(conn)
+            conn.execute(WORLD_LATEST_TABLE_SQL)
             conn.executescript(
                 """
                 CREATE TABLE IF NOT EXISTS sync_runs (
@@ -120,6 +550,49 @@ class WorldInfoStorage:
                     FOREIGN KEY(run_id) REFERENCES sync_runs(id)
                 );
 
+                CREATE TABLE IF NOT EXISTS world_trend_metrics (
+                    source_key TEXT NOT NULL,
+                    world_id TEXT NOT NULL,
+                    snapshot_id INTEGER NOT NULL,
+                    points_mark INTEGER NOT NULL DEFAULT 0,
+                    computed_at TEXT NOT NULL,
+                    baselines_json TEXT NOT NULL,
+                    payload_json TEXT NOT NULL,
+                    breakout_score REAL NOT NULL DEFAULT 0,
+                    new_hot_score REAL NOT NULL DEFAULT 0,
+                    momentum_score REAL NOT NULL DEFAULT 0,
+                    worth_watching_score REAL NOT NULL DEFAULT 0,
+                    update_effectiveness_score REAL NOT NULL DEFAULT 0,
+                    publication_visits_per_day REAL NOT NULL DEFAULT 0,
+                    sort_date INTEGER NOT NULL DEFAULT 0,
+                    visits INTEGER NOT NULL DEFAULT 0,
+                    PRIMARY KEY(source_key, world_id)
+                );
+
+                CREATE TABLE IF NOT EXISTS world_tags (
+                    source_key TEXT NOT NULL,
+                    world_id TEXT NOT NULL,
+                    tag TEXT NOT NULL,
+                    PRIMARY KEY(source_key, world_id, tag)
+                );
+
+                CREATE TABLE IF NOT EXISTS world_metric_points (
+                    snapshot_id INTEGER PRIMARY KEY,
+                    world_id TEXT NOT NULL,
+                    source_key TEXT NOT NULL,
+                    ts INTEGER,
+                    fetched_at TEXT NOT NULL,
+                    name TEXT,
+                    visits INTEGER,
+                    favorites INTEGER,
+                    heat INTEGER,
+                    popularity INTEGER,
+                    updated_at TEXT,
+                    created_at TEXT,
+                    publication_date TEXT,
+                    labs_publication_date TEXT
+                );
+
                 CREATE TABLE IF NOT EXISTS daily_stats (
                     id INTEGER PRIMARY KEY AUTOINCREMENT,
                     source_key TEXT NOT NULL,
@@ -129,6 +602,17 @@ class WorldInfoStorage:
                     UNIQUE(source_key, date)
                 );
 
+                CREATE TABLE IF NOT EXISTS run_summaries (
+                    run_id INTEGER PRIMARY KEY,
+                    job_key TEXT,
+                    previous_run_id INTEGER,
+                    world_count INTEGER NOT NULL DEFAULT 0,
+                    creator_count INTEGER NOT NULL DEFAULT 0,
+                    diff_json TEXT,
+                    created_at TEXT NOT NULL,
+                    FOREIGN KEY(run_id) REFERENCES sync_runs(id)
+                );
+
                 CREATE TABLE IF NOT EXISTS run_queries (
                     id INTEGER PRIMARY KEY AUTOINCREMENT,
                     run_id INTEGER NOT NULL,
@@ -205,6 +689,23 @@ class WorldInfoStorage:
                     payload_json TEXT NOT NULL
                 );
 
+                CREATE TABLE IF NOT EXISTS world_events (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    job_key TEXT NOT NULL,
+                    source_key TEXT NOT NULL,
+                    run_id INTEGER,
+                    event_type TEXT NOT NULL,
+                    world_id TEXT NOT NULL,
+                    event_day TEXT NOT NULL,
+                    occurred_at TEXT,
+                    detected_at TEXT NOT NULL,
+                    sort_at TEXT NOT NULL,
+                    severity REAL NOT NULL DEFAULT 0,
+                    summary TEXT NOT NULL DEFAULT '',
+                    payload_json TEXT NOT NULL DEFAULT '{}',
+                    UNIQUE(job_key, event_type, world_id, event_day)
+                );
+
                 CREATE TABLE IF NOT EXISTS creators (
                     creator_id TEXT PRIMARY KEY,
                     display_name TEXT,
@@ -263,6 +764,49 @@ class WorldInfoStorage:
                 CREATE INDEX IF NOT EXISTS idx_snapshots_world
                 ON world_snapshots(world_id, fetched_at DESC, id DESC);
 
+                CREATE INDEX IF NOT EXISTS idx_snapshots_run
+                ON world_snapshots(run_id, world_id, id);
+
+                CREATE INDEX IF NOT EXISTS idx_world_latest_world
+                ON world_latest(world_id, fetched_at DESC, snapshot_id DESC);
+
+                CREATE INDEX IF NOT EXISTS idx_world_latest_author
+                ON world_latest(author_id, fetched_at DESC, snapshot_id DESC);
+
+                CREATE INDEX IF NOT EXISTS idx_metric_points_world_ts
+                ON world_metric_points(world_id, ts, snapshot_id);
+
+                CREATE INDEX IF NOT EXISTS idx_metric_points_source_world_ts
+                ON world_metric_points(source_key, world_id, ts, snapshot_id);
+
+                CREATE INDEX IF NOT EXISTS idx_metric_points_source_world_snapshot
+                ON world_metric_points(source_key, world_id, snapshot_id);
+
+                CREATE INDEX IF NOT EXISTS idx_world_tags_tag
+                ON world_tags(tag, source_key, world_id);
+
+                CREATE INDEX IF NOT EXISTS idx_trend_breakout_score
+                ON world_trend_metrics(source_key, breakout_score, sort_date, visits, world_id);
+
+                CREATE INDEX IF NOT EXISTS idx_trend_new_hot_score
+                ON world_trend_metrics(source_key, new_hot_score, sort_date, visits, world_id);
+
+                CREATE INDEX IF NOT EXISTS idx_trend_momentum_score
+                ON world_trend_metrics(source_key, momentum_score, sort_date, visits, world_id);
+
+                CREATE INDEX IF NOT EXISTS idx_trend_worth_watching_score
+                ON world_trend_metrics(source_key, worth_watching_score, sort_date, visits, world_id);
+
+                CREATE INDEX IF NOT EXISTS idx_trend_update_effectiveness_score
+                ON world_trend_metrics(source_key, update_effectiveness_score, sort_date, visits, world_id);
+
+                CREATE INDEX IF NOT EXISTS idx_trend_publication_visits_per_day
+                ON world_trend_metrics(source_key, publication_visits_per_day, sort_date, visits, world_id);
+
+                CREATE TRIGGER IF NOT EXISTS world_latest_trend_delete AFTER DELETE ON world_latest BEGIN
+                    DELETE FROM world_trend_metrics WHERE source_key = old.source_key AND world_id = old.world_id;
+                END;
+
                 CREATE INDEX IF NOT EXISTS idx_runs_job_started
                 ON sync_runs(job_key, started_at DESC, id DESC);
 
@@ -284,12 +828,24 @@ class WorldInfoStorage:
                 CREATE INDEX IF NOT EXISTS idx_topic_memberships_topic
                 ON topic_memberships(topic_key, last_seen_at DESC, world_id ASC);
 
+                CREATE INDEX IF NOT EXISTS idx_topic_memberships_world
+                ON topic_memberships(world_id, topic_key);
+
                 CREATE INDEX IF NOT EXISTS idx_snapshots_author
                 ON world_snapshots(author_id, fetched_at DESC, id DESC);
 
                 CREATE INDEX IF NOT EXISTS idx_analysis_cache_scope_type
                 ON analysis_cache(scope_type, updated_at DESC, scope_key ASC);
 
+                CREATE INDEX IF NOT EXISTS idx_world_events_sort
+                ON world_events(sort_at DESC, id DESC);
+
+                CREATE INDEX IF NOT EXISTS idx_world_events_type
+                ON world_events(event_type, sort_at DESC, id DESC);
+
+                CREATE INDEX IF NOT EXISTS idx_world_events_job
+                ON world_events(job_key, sort_at DESC, id DESC);
+
                 CREATE INDEX IF NOT EXISTS idx_creators_last_seen
                 ON creators(last_seen_at DESC, creator_id ASC);
 
@@ -303,6 +859,534 @@ class WorldInfoStorage:
                 ON scheduled_posts(group_id, status, scheduled_for ASC, id ASC);
                 """
             )
+            self._ensure_column(conn, "world_snapshots", "payload_snapshot_id", "INTEGER")
+            self._ensure_column(conn, "world_snapshots", "raw_encoding", "TEXT NOT NULL DEFAULT 'json'")
+            self._ensure_column(conn, "world_latest", "raw_encoding", "TEXT NOT NULL DEFAULT 'json'")
+            self._ensure_column(conn, "analysis_cache", "payload_encoding", "TEXT NOT NULL DEFAULT 'json'")
+            self._ensure_column(conn, "analysis_cache", "stale_since", "TEXT")
+            self._ensure_column(conn, "world_latest", "description", "TEXT")
+            added_dates = [
+                self._ensure_column(conn, "world_metric_points", column, "TEXT")
+                for column in METRIC_POINT_DATE_COLUMNS
+            ]
+            if any(added_dates):
+                self._backfill_metric_point_dates(conn)
+            conn.execute(
+                """
+                CREATE INDEX IF NOT EXISTS idx_snapshots_payload
+                ON world_snapshots(payload_snapshot_id)
+                WHERE payload_snapshot_id IS NOT NULL
+                """
+            )
+            latest_row = conn.execute("SELECT 1 FROM world_latest LIMIT 1").fetchone()
+            if latest_row is None:
+                snapshot_row = conn.execute(
+                    "SELECT 1 FROM world_snapshots WHERE world_id IS NOT NULL LIMIT 1"
+                ).fetchone()
+                if snapshot_row is not None:
+                    logger.info("Backfilling world_latest for %s", self.db_path)
+                    self._rebuild_world_latest(conn)
+            self._backfill_latest_descriptions(conn)
+            self._initialize_search_index(conn)
+            self._initialize_tag_index(conn)
+            self._backfill_metric_points(conn)
+
+    def _ensure_column(self, conn: sqlite3.Connection, table: str, column: str, declaration: str) -> bool:
+        columns = {row["name"] for row in conn.execute(f"PRAGMA table_info({table})").fetchall()}
+        if column in columns:
+            return False
+        conn.execute(f"ALTER TABLE {table} ADD COLUMN {column} {declaration}")
+        return True
+
+    def _migrate_world_latest_key(self, conn: sqlite3.Connection) -> None:
+        columns = [row["name"] for row in conn.execute("PRAGMA table_info(world_latest)").fetchall()]
+        if not columns or "id" in columns:
+            return
+        logger.info("Adding a stable row key to world_latest for %s", self.db_path)
+        # The old search index points at world_latest's implicit rowids; it is rebuilt
+        # from the new keys by _initialize_search_index.
+        self._drop_search_index(conn)
+        conn.execute("ALTER TABLE world_latest RENAME TO world_latest_unkeyed")
+        conn.execute(WORLD_LATEST_TABLE_SQL)
+        names = ", ".join(columns)
+        conn.execute(f"INSERT INTO world_latest ({names}) SELECT {names} FROM world_latest_unkeyed ORDER BY rowid")
+        conn.execute("DROP TABLE world_latest_unkeyed")
+
+    def _drop_search_index(self, conn: sqlite3.Connection) -> None:
+        for trigger in ("world_latest_search_insert", "world_latest_search_delete", "world_latest_search_update"):
+            conn.execute(f"DROP TRIGGER IF EXISTS {trigger}")
+        conn.execute("DROP TABLE IF EXISTS world_search")
+
+    def _initialize_search_index(self, conn: sqlite3.Connection) -> None:
+        existing = conn.execute(
+            "SELECT sql FROM sqlite_master WHERE type = 'table' AND name = 'world_search'"
+        ).fetchone()
+        if existing is not None and "content=" in existing["sql"]:
+            # Older databases indexed world_latest's raw text through an external-content table.
+            self._drop_search_index(conn)
+            existing = None
+        columns = ", ".join(SEARCH_COLUMNS)
+        try:
+            conn.execute(f"CREATE VIRTUAL TABLE IF NOT EXISTS world_search USING fts5({columns}, tokenize='trigram')")
+        except sqlite3.OperationalError as exc:
+            logger.warning("SQLite FTS5 trigram search unavailable, using in-memory search: %s", exc)
+            self.search_index_enabled = False
+            return
+        folded = ", ".join(f"casefold({{row}}.{column})" for column in SEARCH_COLUMNS)
+        conn.executescript(
+            f"""
+            CREATE TRIGGER IF NOT EXISTS world_latest_search_insert AFTER INSERT ON world_latest BEGIN
+                INSERT INTO world_search(rowid, {columns}) VALUES (new.id, {folded.format(row="new")});
+            END;
+
+            CREATE TRIGGER IF NOT EXISTS world_latest_search_delete AFTER DELETE ON world_latest BEGIN
+                DELETE FROM world_search WHERE rowid = old.id;
+            END;
+
+            CREATE TRIGGER IF NOT EXISTS world_latest_search_update
+            AFTER UPDATE OF {columns} ON world_latest BEGIN
+                DELETE FROM world_search WHERE rowid = old.id;
+                INSERT INTO world_search(rowid, {columns}) VALUES (new.id, {folded.format(row="new")});
+            END;
+            """
+        )
+        if existing is None:
+            logger.info("Building world_search index for %s", self.db_path)
+            conn.execute(
+                f"INSERT INTO world_search(rowid, {columns}) SELECT id, {folded.format(row='world_latest')} FROM world_latest"
+            )
+        self.search_index_enabled = True
+
+    def _initialize_tag_index(self, conn: sqlite3.Connection) -> None:
+        # world_tags mirrors world_latest.tags_json one row per tag so tag filters and
+        # facet counts can use an index instead of decoding every payload.
+        tag_rows = """
+            SELECT {row}.source_key, {row}.world_id, tag.value
+            FROM json_each({row}.tags_json) AS tag
+            WHERE tag.type = 'text' AND tag.value != ''
+        """
+        conn.executescript(
+            f"""
+            CREATE TRIGGER IF NOT EXISTS world_latest_tags_insert AFTER INSERT ON world_latest BEGIN
+                INSERT OR IGNORE INTO world_tags(source_key, world_id, tag) {tag_rows.format(row="new")};
+            END;
+
+            CREATE TRIGGER IF NOT EXISTS world_latest_tags_delete AFTER DELETE ON world_latest BEGIN
+                DELETE FROM world_tags WHERE source_key = old.source_key AND world_id = old.world_id;
+            END;
+
+            CREATE TRIGGER IF NOT EXISTS world_latest_tags_update
+            AFTER UPDATE OF source_key, world_id, tags_json ON world_latest BEGIN
+                DELETE FROM world_tags WHERE source_key = old.source_key AND world_id = old.world_id;
+                INSERT OR IGNORE INTO world_tags(source_key, world_id, tag) {tag_rows.format(row="new")};
+            END;
+            """
+        )
+        if conn.execute("SELECT 1 FROM world_tags LIMIT 1").fetchone() is None:
+            conn.execute(
+                """
+                INSERT OR IGNORE INTO world_tags(source_key, world_id, tag)
+                SELECT wl.source_key, wl.world_id, tag.value
+                FROM world_latest AS wl, json_each(wl.tags_json) AS tag
+                WHERE tag.type = 'text' AND tag.value != ''
+                """
+            )
+
+    def _backfill_latest_descriptions(self, conn: sqlite3.Connection) -> int:
+        # world_latest.description feeds the search index; it is NULL until extracted
+        # from the (possibly compressed) payload, and '' when a world has none.
+        total = 0
+        while True:
+            rows = conn.execute(
+                """
+                SELECT rowid AS row_key, raw_json, raw_encoding
+                FROM world_latest
+                WHERE description IS NULL
+                LIMIT ?
+                """,
+                (DESCRIPTION_BACKFILL_BATCH,),
+            ).fetchall()
+            if not rows:
+                break
+            updates = []
+            for row in rows:
+                payload = _decode_payload(row["raw_json"], row["raw_encoding"])
+                description = payload.get("description") if isinstance(payload, dict) else None
+                updates.append((str(description or ""), row["row_key"]))
+            conn.executemany("UPDATE world_latest SET description = ? WHERE rowid = ?", updates)
+            total += len(rows)
+        return total
+
+    def _search_condition(self, text: str, columns: tuple[str, ...]) -> tuple[str, tuple[object, ...]]:
+        needle = text.casefold()
+        if len(needle) >= SEARCH_TRIGRAM_MIN_CHARS:
+            phrase = '"' + needle.replace('"', '""') + '"'
+            return "world_search MATCH ?", ("{" + " ".join(columns) + "} : " + phrase,)
+        clause = " OR ".join(f"instr(world_search.{column}, ?) > 0" for column in columns)
+        return f"({clause})", tuple(needle for _ in columns)
+
+    def search_world_ids(
+        self,
+        text: str,
+        *,
+        source_key: str | None = None,
+        columns: tuple[str, ...] = SEARCH_QUERY_COLUMNS,
+    ) -> set[str]:
+        condition, params = self._search_condition(text, columns)
+        with self._connect() as conn:
+            rows = conn.execute(
+                f"""
+                SELECT DISTINCT wl.world_id
+                FROM world_search
+                JOIN world_latest wl ON wl.id = world_search.rowid
+                WHERE {condition}
+                  AND (? IS NULL OR wl.source_key = ?)
+                  AND wl.source_key NOT LIKE 'history:%'
+                """,
+                (*params, source_key, source_key),
+            ).fetchall()
+        return {row["world_id"] for row in rows}
+
+    def _backfill_metric_points(self, conn: sqlite3.Connection) -> int:
+        last_id = conn.execute(
+            "SELECT COALESCE(MAX(snapshot_id), 0) AS last_id FROM world_metric_points"
+        ).fetchone()["last_id"]
+        total = 0
+        while True:
+            rows = conn.execute(
+                """
+                SELECT id, world_id, source_key, fetched_at, name, visits, favorites,
+                    heat, popularity, updated_at, created_at, publication_date, labs_publication_date
+                FROM world_snapshots
+                WHERE id > ? AND world_id IS NOT NULL
+                ORDER BY id ASC
+                LIMIT ?
+                """,
+                (last_id, METRIC_POINT_BACKFILL_BATCH),
+            ).fetchall()
+            if not rows:
+                break
+            self._insert_metric_points(conn, rows)
+            last_id = rows[-1]["id"]
+            total += len(rows)
+        if total:
+            logger.info("Backfilled %s world_metric_points rows for %s", total, self.db_path)
+        return total
+
+    def _backfill_metric_point_dates(self, conn: sqlite3.Connection) -> None:
+        # Points written before the date columns existed take them from their snapshot.
+        conn.execute(
+            """
+            UPDATE world_metric_points
+            SET created_at = s.created_at,
+                publication_date = s.publication_date,
+                labs_publication_date = s.labs_publication_date
+            FROM world_snapshots AS s
+            WHERE s.id = world_metric_points.snapshot_id
+            """
+        )
+
+    def _insert_metric_points(self, conn: sqlite3.Connection, rows: list[sqlite3.Row]) -> None:
+        conn.executemany(
+            """
+            INSERT OR REPLACE INTO world_metric_points (
+                snapshot_id, world_id, source_key, ts, fetched_at, name,
+                visits, favorites, heat, popularity, updated_at,
+                created_at, publication_date, labs_publication_date
+            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            """,
+            [
+                (
+                    row["id"],
+                    row["world_id"],
+                    row["source_key"],
+                    _to_epoch_seconds(row["fetched_at"]),
+                    row["fetched_at"],
+                    row["name"],
+                    row["visits"],
+                    row["favorites"],
+                    row["heat"],
+                    row["popularity"],
+                    row["updated_at"],
+                    row["created_at"],
+                    row["publication_date"],
+                    row["labs_publication_date"],
+                )
+                for row in rows
+            ],
+        )
+
+    def _rebuild_world_latest(
+        self,
+        conn: sqlite3.Connection,
+        *,
+        source_key: str | None = None,
+    ) -> int:
+        filters = ["world_id IS NOT NULL"]
+        params: list[object] = []
+        if source_key is not None:
+            filters.append("source_key = ?")
+            params.append(source_key)
+        where = " AND ".join(filters)
+        conn.execute(f"DELETE FROM world_latest WHERE {where}", tuple(params))
+        cur = conn.execute(
+            f"""
+            INSERT INTO world_latest (
+                source_key, world_id, snapshot_id, run_id, fetched_at, name, author_id,
+                author_name, visits, favorites, heat, popularity, updated_at,
+                publication_date, tags_json, raw_json, raw_encoding
+            )
+            SELECT
+                latest.source_key, latest.world_id, latest.id, latest.run_id, latest.fetched_at,
+                latest.name, latest.author_id, latest.author_name, latest.visits, latest.favorites,
+                latest.heat, latest.popularity, latest.updated_at, latest.publication_date,
+                latest.tags_json,
+                COALESCE(payload.raw_json, latest.raw_json),
+                COALESCE(payload.raw_encoding, latest.raw_encoding)
+            FROM (
+                SELECT
+                    *,
+                    ROW_NUMBER() OVER (
+                        PARTITION BY source_key, world_id
+                        ORDER BY fetched_at DESC, id DESC
+                    ) AS rn
+                FROM world_snapshots
+                WHERE {where}
+            ) AS latest
+            LEFT JOIN world_snapshots payload ON payload.id = latest.payload_snapshot_id
+            WHERE latest.rn = 1
+            """,
+            tuple(params),
+        )
+        self._backfill_latest_descriptions(conn)
+        return max(cur.rowcount, 0)
+
+    def rebuild_world_latest(self, source_key: str | None = None) -> int:
+        with self._connect() as conn:
+            row_count = self._rebuild_world_latest(conn, source_key=source_key)
+        self._bump_data_version()
+        return row_count
+
+    def migrate_payload_encoding(self, *, batch_size: int = PAYLOAD_MIGRATION_BATCH) -> dict[str, int]:
+        codec = self.payload_codec
+        targets = (
+            ("world_snapshots", "raw_json", "raw_encoding", "raw_json != ''"),
+            ("world_latest", "raw_json", "raw_encoding", "1 = 1"),
+            ("analysis_cache", "payload_json", "payload_encoding", "1 = 1"),
+        )
+        converted: dict[str, int] = {}
+        for table, column, encoding_column, condition in targets:
+            total = 0
+            last_rowid = 0
+            while True:
+                with self._connect() as conn:
+                    rows = conn.execute(
+                        f"""
+                        SELECT rowid AS row_key, {column} AS raw, {encoding_column} AS encoding
+                        FROM {table}
+                        WHERE rowid > ? AND {encoding_column} != ? AND {condition}
+                        ORDER BY rowid ASC
+                        LIMIT ?
+                        """,
+                        (last_rowid, codec, batch_size),
+                    ).fetchall()
+                    if not rows:
+                        break
+                    conn.executemany(
+                        f"UPDATE {table} SET {column} = ?, {encoding_column} = ? WHERE rowid = ?",
+                        [
+                            (_recode_payload(row["raw"], row["encoding"], codec), codec, row["row_key"])
+                            for row in rows
+                        ],
+                    )
+                last_rowid = rows[-1]["row_key"]
+                total += len(rows)
+            converted[table] = total
+        return converted
+
+    def compact_snapshots(
+        self,
+        source_key: str,
+        *,
+        full_resolution_days: int = COMPACTION_FULL_RESOLUTION_DAYS,
+        daily_days: int = COMPACTION_DAILY_DAYS,
+        batch_size: int = COMPACTION_BATCH,
+    ) -> dict[str, int]:
+        full_resolution_days = max(int(full_resolution_days), TREND_LOOKBACK_DAYS)
+        daily_days = max(int(daily_days), full_resolution_days)
+        # Windows are anchored on each world's newest point rather than on "now", so a
+        # world that stopped being fetched keeps the same history its trend was built from.
+        # Within a tier only the last point of each day/week survives; the newest point
+        # older than the full window is always such a survivor, which keeps every
+        # at-or-before lookup used by the 1d/7d/30d deltas unchanged. Points on either
+        # side of an updated_at change are never thinned: the last one before it is the
+        # since-update baseline and the first one after it dates the update.
+        with self._connect() as conn:
+            rows = conn.execute(
+                """
+                WITH points AS (
+                    SELECT
+                        snapshot_id,
+                        world_id,
+                        ts,
+                        updated_at IS NOT LAG(updated_at) OVER ordered
+                            OR updated_at IS NOT LEAD(updated_at) OVER ordered AS update_edge
+                    FROM world_metric_points
+                    WHERE source_key = ? AND ts IS NOT NULL
+                    WINDOW ordered AS (PARTITION BY world_id ORDER BY ts, snapshot_id)
+                ),
+                anchors AS (
+                    SELECT world_id, MAX(ts) AS latest_ts
+                    FROM points
+                    GROUP BY world_id
+                ),
+                candidates AS (
+                    SELECT
+                        p.snapshot_id,
+                        p.world_id,
+                        p.ts,
+                        p.update_edge,
+                        p.ts < a.latest_ts - ? AS weekly,
+                        CASE
+                            WHEN p.ts < a.latest_ts - ? THEN (p.ts + 259200) / 604800
+                            ELSE p.ts / 86400
+                        END AS bucket
+                    FROM points AS p
+                    JOIN anchors AS a ON a.world_id = p.world_id
+                    WHERE p.ts < a.latest_ts - ?
+                ),
+                ranked AS (
+                    SELECT
+                        snapshot_id,
+                        update_edge,
+                        ROW_NUMBER() OVER (
+                            PARTITION BY world_id, weekly, bucket
+                            ORDER BY ts DESC, snapshot_id DESC
+                        ) AS bucket_rank
+                    FROM candidates
+                )
+                SELECT snapshot_id
+                FROM ranked
+                WHERE bucket_rank > 1
+                  AND NOT update_edge
+                  AND snapshot_id NOT IN (SELECT snapshot_id FROM world_latest WHERE source_key = ?)
+                ORDER BY snapshot_id ASC
+                """,
+                (
+                    source_key,
+                    daily_days * 86400,
+                    daily_days * 86400,
+                    full_resolution_days * 86400,
+                    source_key,
+                ),
+            ).fetchall()
+        doomed = [int(row["snapshot_id"]) for row in rows]
+        deleted = 0
+        removed = {"runs_deleted": 0, "run_queries_deleted": 0, "run_query_hits_deleted": 0}
+        for offset in range(0, len(doomed), batch_size):
+            batch = doomed[offset : offset + batch_size]
+            placeholders = ",".join("?" * len(batch))
+            with self._connect() as conn:
+                run_ids = [
+                    int(row["run_id"])
+                    for row in conn.execute(
+                        f"SELECT DISTINCT run_id FROM world_snapshots WHERE id IN ({placeholders}) AND run_id IS NOT NULL",
+                        batch,
+                    ).fetchall()
+                ]
+                # Query hits recorded for the thinned (run, world) pairs go with them.
+                removed["run_query_hits_deleted"] += conn.execute(
+                    f"""
+                    DELETE FROM run_query_hits
+                    WHERE id IN (
+                        SELECT h.id
+                        FROM world_snapshots AS s
+                        JOIN run_queries AS q ON q.run_id = s.run_id
+                        JOIN run_query_hits AS h ON h.run_query_id = q.id AND h.world_id = s.world_id
+                        WHERE s.id IN ({placeholders})
+                    )
+                    """,
+                    batch,
+                ).rowcount
+                self._detach_snapshot_payloads(
+                    conn,
+                    f"SELECT id FROM world_snapshots WHERE id IN ({placeholders})",
+                    tuple(batch),
+                )
+                cur = conn.execute(f"DELETE FROM world_snapshots WHERE id IN ({placeholders})", batch)
+                conn.execute(f"DELETE FROM world_metric_points WHERE snapshot_id IN ({placeholders})", batch)
+                deleted += cur.rowcount
+                for key, count in self._delete_emptied_runs(conn, run_ids).items():
+                    removed[key] += count
+        orphans = self._delete_orphaned_run_queries(batch_size=batch_size)
+        if deleted:
+            self._bump_data_version()
+        return {
+            "full_resolution_days": full_resolution_days,
+            "daily_days": daily_days,
+            "snapshots_deleted": deleted,
+            "runs_deleted": removed["runs_deleted"],
+            "run_queries_deleted": removed["run_queries_deleted"] + orphans["run_queries_deleted"],
+            "run_query_hits_deleted": removed["run_query_hits_deleted"] + orphans["run_query_hits_deleted"],
+        }
+
+    def _delete_emptied_runs(self, conn: sqlite3.Connection, run_ids: list[int]) -> dict[str, int]:
+        # Runs whose every snapshot was compacted away, with their queries and summary.
+        if not run_ids:
+            return {}
+        empty = [
+            int(row["id"])
+            for row in conn.execute(
+                """
+                SELECT r.id FROM sync_runs AS r
+                WHERE r.id IN (SELECT value FROM json_each(?))
+                  AND NOT EXISTS (SELECT 1 FROM world_snapshots AS s WHERE s.run_id = r.id)
+                """,
+                (jsoncodec.dumps(run_ids),),
+            ).fetchall()
+        ]
+        if not empty:
+            return {}
+        ids = (jsoncodec.dumps(empty),)
+        hits = conn.execute(
+            """
+            DELETE FROM run_query_hits
+            WHERE run_query_id IN (
+                SELECT id FROM run_queries WHERE run_id IN (SELECT value FROM json_each(?))
+            )
+            """,
+            ids,
+        ).rowcount
+        queries = conn.execute("DELETE FROM run_queries WHERE run_id IN (SELECT value FROM json_each(?))", ids).rowcount
+        conn.execute("DELETE FROM run_summaries WHERE run_id IN (SELECT value FROM json_each(?))", ids)
+        runs = conn.execute("DELETE FROM sync_runs WHERE id IN (SELECT value FROM json_each(?))", ids).rowcount
+        return {"runs_deleted": runs, "run_queries_deleted": queries, "run_query_hits_deleted": hits}
+
+    def _delete_orphaned_run_queries(self, *, batch_size: int = COMPACTION_BATCH) -> dict[str, int]:
+        targets = (
+            ("run_queries", "run_id NOT IN (SELECT id FROM sync_runs)"),
+            ("run_query_hits", "run_query_id NOT IN (SELECT id FROM run_queries)"),
+        )
+        deleted: dict[str, int] = {}
+        for table, condition in targets:
+            total = 0
+            while True:
+                with self._connect() as conn:
+                    cur = conn.execute(
+                        f"DELETE FROM {table} WHERE id IN (SELECT id FROM {table} WHERE {condition} LIMIT ?)",
+                        (batch_size,),
+                    )
+                total += max(cur.rowcount, 0)
+                if cur.rowcount < batch_size:
+                    break
+            deleted[f"{table}_deleted"] = total
+        return deleted
+
+    def database_size_bytes(self) -> int:
+        with self._connect() as conn:
+            page_count = conn.execute("PRAGMA page_count").fetchone()[0]
+            page_size = conn.execute("PRAGMA page_size").fetchone()[0]
+        return int(page_count) * int(page_size)
 
     def create_run(
         self,
@@ -314,15 +1398,34 @@ class WorldInfoStorage:
         started_at: str,
     ) -> int:
         with self._connect() as conn:
-            cur = conn.execute(
-                """
-                INSERT INTO sync_runs (
-                    source_key, job_key, trigger_type, query_label, status, started_at
-                ) VALUES (?, ?, ?, ?, ?, ?)
-                """,
-                (source_key, job_key, trigger_type, query_label, "running", started_at),
+            return self._create_run(
+                conn,
+                source_key=source_key,
+                job_key=job_key,
+                trigger_type=trigger_type,
+                query_label=query_label,
+                started_at=started_at,
             )
-            return int(cur.lastrowid)
+
+    def _create_run(
+        self,
+        conn: sqlite3.Connection,
+        *,
+        source_key: str,
+        job_key: str | None,
+        trigger_type: str,
+        query_label: str | None,
+        started_at: str,
+    ) -> int:
+        cur = conn.execute(
+            """
+            INSERT INTO sync_runs (
+                source_key, job_key, trigger_type, query_label, status, started_at
+            ) VALUES (?, ?, ?, ?, ?, ?)
+            """,
+            (source_key, job_key, trigger_type, query_label, "running", started_at),
+        )
+        return int(cur.lastrowid)
 
     def finish_run(
         self,
@@ -334,15 +1437,34 @@ class WorldInfoStorage:
         error_text: str | None = None,
     ) -> None:
         with self._connect() as conn:
-            conn.execute(
-                """
-                UPDATE sync_runs
-                SET status = ?, finished_at = ?, world_count = ?, error_text = ?
-                WHERE id = ?
-                """,
-                (status, finished_at, world_count, error_text, run_id),
+            self._finish_run(
+                conn,
+                run_id,
+                status=status,
+                finished_at=finished_at,
+                world_count=world_count,
+                error_text=error_text,
             )
 
+    def _finish_run(
+        self,
+        conn: sqlite3.Connection,
+        run_id: int,
+        *,
+        status: str,
+        finished_at: str,
+        world_count: int = 0,
+        error_text: str | None = None,
+    ) -> None:
+        conn.execute(
+            """
+            UPDATE sync_runs
+            SET status = ?, finished_at = ?, world_count = ?, error_text = ?
+            WHERE id = ?
+            """,
+            (status, finished_at, world_count, error_text, run_id),
+        )
+
     def insert_world_snapshots(
         self,
         *,
@@ -350,11 +1472,53 @@ class WorldInfoStorage:
         source_key: str,
         fetched_at: str,
         worlds: list[dict[str, Any]],
+        change_only: bool = False,
+    ) -> None:
+        with self._connect() as conn:
+            self._insert_world_snapshots(
+                conn,
+                run_id=run_id,
+                source_key=source_key,
+                fetched_at=fetched_at,
+                worlds=worlds,
+                change_only=change_only,
+            )
+        self._bump_data_version()
+
+    def _insert_world_snapshots(
+        self,
+        conn: sqlite3.Connection,
+        *,
+        run_id: int,
+        source_key: str,
+        fetched_at: str,
+        worlds: list[dict[str, Any]],
+        change_only: bool = False,
     ) -> None:
+        if not worlds:
+            return
+        previous: dict[str, tuple[int, dict[str, Any]]] = {}
+        if change_only:
+            previous = self._load_latest_payload_fingerprints(
+                conn,
+                source_key,
+                [str(world["id"]) for world in worlds if world.get("id")],
+            )
         rows = []
+        latest_payloads = []
         for world in worlds:
             metrics = world.get("metrics", {})
             world_fetched_at = str(world.get("fetched_at") or fetched_at)
+            raw_json = _encode_payload(world, self.payload_codec)
+            raw_encoding = self.payload_codec
+            tags_json = jsoncodec.dumps(world.get("tags", []))
+            latest_payloads.append((tags_json, str(world.get("description") or ""), raw_json, raw_encoding))
+            payload_snapshot_id = None
+            unchanged = previous.get(str(world.get("id") or ""))
+            if unchanged is not None and unchanged[1] == _snapshot_fingerprint(world):
+                payload_snapshot_id = unchanged[0]
+                raw_json = ""
+                raw_encoding = "json"
             rows.append(
                 (
                     run_id,
@@ -377,29 +1541,121 @@ class WorldInfoStorage:
                     world.get("image_url"),
                     world.get("thumbnail_url"),
                     world.get("world_url"),
-                    json.dumps(world.get("tags", []), ensure_ascii=False),
+                    tags_json,
                     metrics.get("favorite_rate"),
                     metrics.get("labs_to_publication_days"),
                     metrics.get("days_since_update"),
                     metrics.get("visits_per_day"),
-                    json.dumps(world, ensure_ascii=False),
+                    raw_json,
+                    raw_encoding,
+                    payload_snapshot_id,
                 )
             )
-        if not rows:
-            return
-        with self._connect() as conn:
-            conn.executemany(
-                """
-                INSERT INTO world_snapshots (
-                    run_id, source_key, fetched_at, world_id, name, author_id, author_name,
-                    capacity, visits, favorites, heat, popularity, created_at, updated_at,
-                    publication_date, labs_publication_date, release_status, image_url,
-                    thumbnail_url, world_url, tags_json, favorite_rate,
-                    labs_to_publication_days, days_since_update, visits_per_day, raw_json
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """,
-                rows,
+        max_row = conn.execute("SELECT COALESCE(MAX(id), 0) AS max_id FROM world_snapshots").fetchone()
+        conn.executemany(
+            """
+            INSERT INTO world_snapshots (
+                run_id, source_key, fetched_at, world_id, name, author_id, author_name,
+                capacity, visits, favorites, heat, popularity, created_at, updated_at,
+                publication_date, labs_publication_date, release_status, image_url,
+                thumbnail_url, world_url, tags_json, favorite_rate,
+                labs_to_publication_days, days_since_update, visits_per_day, raw_json,
+                raw_encoding, payload_snapshot_id
+            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            """,
+            rows,
+        )
+        inserted = conn.execute(
+            """
+            SELECT id, run_id, world_id, source_key, fetched_at, name, author_id, author_name,
+                visits, favorites, heat, popularity, created_at, updated_at, publication_date,
+                labs_publication_date
+            FROM world_snapshots
+            WHERE id > ?
+            ORDER BY id ASC
+            """,
+            (int(max_row["max_id"]),),
+        ).fetchall()
+        latest_rows = [
+            (
+                row["source_key"],
+                row["world_id"],
+                row["id"],
+                row["run_id"],
+                row["fetched_at"],
+                row["name"],
+                row["author_id"],
+                row["author_name"],
+                row["visits"],
+                row["favorites"],
+                row["heat"],
+                row["popularity"],
+                row["updated_at"],
+                row["publication_date"],
+                tags_json,
+                description,
+                raw_json,
+                raw_encoding,
             )
+            for row, (tags_json, description, raw_json, raw_encoding) in zip(inserted, latest_payloads)
+            if row["world_id"] is not None
+        ]
+        conn.executemany(
+            """
+            INSERT INTO world_latest (
+                source_key, world_id, snapshot_id, run_id, fetched_at, name, author_id,
+                author_name, visits, favorites, heat, popularity, updated_at,
+                publication_date, tags_json, description, raw_json, raw_encoding
+            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            ON CONFLICT(source_key, world_id) DO UPDATE SET
+                snapshot_id = excluded.snapshot_id,
+                run_id = excluded.run_id,
+                fetched_at = excluded.fetched_at,
+                name = excluded.name,
+                author_id = excluded.author_id,
+                author_name = excluded.author_name,
+                visits = excluded.visits,
+                favorites = excluded.favorites,
+                heat = excluded.heat,
+                popularity = excluded.popularity,
+                updated_at = excluded.updated_at,
+                publication_date = excluded.publication_date,
+                tags_json = excluded.tags_json,
+                description = excluded.description,
+                raw_json = excluded.raw_json,
+                raw_encoding = excluded.raw_encoding
+            WHERE excluded.fetched_at >= world_latest.fetched_at
+            """,
+            latest_rows,
+        )
+        self._insert_metric_points(conn, [row for row in inserted if row["world_id"] is not None])
+
+    def _load_latest_payload_fingerprints(
+        self,
+        conn: sqlite3.Connection,
+        source_key: str,
+        world_ids: list[str],
+    ) -> dict[str, tuple[int, dict[str, Any]]]:
+        if not world_ids:
+            return {}
+        placeholders = ",".join("?" * len(world_ids))
+        rows = conn.execute(
+            f"""
+            SELECT
+                wl.world_id,
+                wl.raw_json,
+                wl.raw_encoding,
+                COALESCE(ws.payload_snapshot_id, ws.id) AS payload_id
+            FROM world_latest wl
+            JOIN world_snapshots ws ON ws.id = wl.snapshot_id
+            WHERE wl.source_key = ? AND wl.world_id IN ({placeholders})
+            """,
+            (source_key, *world_ids),
+        ).fetchall()
+        return {
+            row["world_id"]: (int(row["payload_id"]), _snapshot_fingerprint(_decode_payload(row["raw_json"], row["raw_encoding"])))
+            for row in rows
+        }
 
     def upsert_daily_stats(
         self,
@@ -410,89 +1666,118 @@ class WorldInfoStorage:
         new_worlds_today: int,
     ) -> None:
         with self._connect() as conn:
-            conn.execute(
-                """
-                INSERT INTO daily_stats (source_key, date, total_worlds, new_worlds_today)
-                VALUES (?, ?, ?, ?)
-                ON CONFLICT(source_key, date) DO UPDATE SET
-                    total_worlds = excluded.total_worlds,
-                    new_worlds_today = excluded.new_worlds_today
-                """,
-                (source_key, date, total_worlds, new_worlds_today),
+            self._upsert_daily_stats(
+                conn,
+                source_key=source_key,
+                date=date,
+                total_worlds=total_worlds,
+                new_worlds_today=new_worlds_today,
             )
 
+    def _upsert_daily_stats(
+        self,
+        conn: sqlite3.Connection,
+        *,
+        source_key: str,
+        date: str,
+        total_worlds: int,
+        new_worlds_today: int,
+    ) -> None:
+        conn.execute(
+            """
+            INSERT INTO daily_stats (source_key, date, total_worlds, new_worlds_today)
+            VALUES (?, ?, ?, ?)
+            ON CONFLICT(source_key, date) DO UPDATE SET
+                total_worlds = excluded.total_worlds,
+                new_worlds_today = excluded.new_worlds_today
+            """,
+            (source_key, date, total_worlds, new_worlds_today),
+        )
+
     def get_existing_world_ids(self, world_ids: set[str]) -> set[str]:
+        with self._connect() as conn:
+            return self._get_existing_world_ids(conn, world_ids)
+
+    def _get_existing_world_ids(self, conn: sqlite3.Connection, world_ids: set[str]) -> set[str]:
         if not world_ids:
             return set()
         placeholders = ",".join("?" * len(world_ids))
         query = f"""
             SELECT DISTINCT world_id
-            FROM world_snapshots
+            FROM world_latest
             WHERE world_id IN ({placeholders})
         """
-        with self._connect() as conn:
-            rows = conn.execute(query, tuple(sorted(world_ids))).fetchall()
+        rows = conn.execute(query, tuple(sorted(world_ids))).fetchall()
         return {str(row["world_id"]) for row in rows if row["world_id"]}
 
     def insert_run_queries(self, *, run_id: int, queries: list[dict[str, Any]]) -> None:
+        with self._connect() as conn:
+            self._insert_run_queries(conn, run_id=run_id, queries=queries)
+
+    def _insert_run_queries(
+        self,
+        conn: sqlite3.Connection,
+        *,
+        run_id: int,
+        queries: list[dict[str, Any]],
+    ) -> None:
         if not queries:
             return
-        with self._connect() as conn:
-            for item in queries:
-                cur = conn.execute(
-                    """
-                    INSERT INTO run_queries (
-                        run_id,
-                        query_index,
-                        query_kind,
-                        query_value,
-                        query_label,
-                        query_payload_json,
-                        result_count,
-                        kept_count,
-                        new_world_count
-                    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-                    """,
+        for item in queries:
+            cur = conn.execute(
+                """
+                INSERT INTO run_queries (
+                    run_id,
+                    query_index,
+                    query_kind,
+                    query_value,
+                    query_label,
+                    query_payload_json,
+                    result_count,
+                    kept_count,
+                    new_world_count
+                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+                """,
+                (
+                    run_id,
+                    item.get("query_index", 0),
+                    item.get("query_kind", "keyword"),
+                    item.get("query_value", ""),
+                    item.get("query_label"),
+                    jsoncodec.dumps(item.get("query_payload", {})),
+                    item.get("result_count", 0),
+                    item.get("kept_count", 0),
+                    item.get("new_world_count", 0),
+                ),
+            )
+            run_query_id = int(cur.lastrowid)
+            hits = item.get("hits", [])
+            if not hits:
+                continue
+            conn.executemany(
+                """
+                INSERT INTO run_query_hits (
+                    run_query_id,
+                    world_id,
+                    world_name,
+                    author_id,
+                    rank_index,
+                    is_new_global
+                ) VALUES (?, ?, ?, ?, ?, ?)
+                """,
+                [
                     (
-                        run_id,
-                        item.get("query_index", 0),
-                        item.get("query_kind", "keyword"),
-                        item.get("query_value", ""),
-                        item.get("query_label"),
-                        json.dumps(item.get("query_payload", {}), ensure_ascii=False),
-                        item.get("result_count", 0),
-                        item.get("kept_count", 0),
-                        item.get("new_world_count", 0),
-                    ),
-                )
-                run_query_id = int(cur.lastrowid)
-                hits = item.get("hits", [])
-                if not hits:
-                    continue
-                conn.executemany(
-                    """
-                    INSERT INTO run_query_hits (
                         run_query_id,
-                        world_id,
-                        world_name,
-                        author_id,
-                        rank_index,
-                        is_new_global
-                    ) VALUES (?, ?, ?, ?, ?, ?)
-                    """,
-                    [
-                        (
-                            run_query_id,
-                            hit.get("world_id"),
-                            hit.get("world_name"),
-                            hit.get("author_id"),
-                            hit.get("rank_index", 0),
-                            1 if hit.get("is_new_global") else 0,
-                        )
-                        for hit in hits
-                        if hit.get("world_id")
-                    ],
-                )
+                        hit.get("world_id"),
+                        hit.get("world_name"),
+                        hit.get("author_id"),
+                        hit.get("rank_index", 0),
+                        1 if hit.get("is_new_global") else 0,
+                    )
+                    for hit in hits
+                    if hit.get("world_id")
+                ],
+            )
 
     def list_run_queries(self, run_ids: list[int]) -> list[dict[str, Any]]:
         if not run_ids:
@@ -519,7 +1804,7 @@ class WorldInfoStorage:
         items: list[dict[str, Any]] = []
         for row in rows:
             item = dict(row)
-            item["query_payload"] = json.loads(item.pop("query_payload_json") or "{}")
+            item["query_payload"] = jsoncodec.loads(item.pop("query_payload_json") or "{}")
             items.append(item)
         return items
 
@@ -657,9 +1942,9 @@ class WorldInfoStorage:
                 """
                 SELECT
                     source_key,
-                    COUNT(DISTINCT world_id) AS world_count,
+                    COUNT(*) AS world_count,
                     MAX(fetched_at) AS latest_fetched_at
-                FROM world_snapshots
+                FROM world_latest
                 WHERE source_key NOT LIKE 'history:%'
                 GROUP BY source_key
                 ORDER BY latest_fetched_at DESC, source_key ASC
@@ -671,124 +1956,445 @@ class WorldInfoStorage:
         if source_key is None:
             query = """
                 SELECT COUNT(DISTINCT world_id) AS count
-                FROM world_snapshots
+                FROM world_latest
                 WHERE source_key NOT LIKE 'history:%'
             """
             params: tuple[object, ...] = ()
         else:
             query = """
-                SELECT COUNT(DISTINCT world_id) AS count
-                FROM world_snapshots
+                SELECT COUNT(*) AS count
+                FROM world_latest
                 WHERE source_key = ?
             """
             params = (source_key,)
         with self._connect() as conn:
-            row = conn.execute(query, params).fetchone()
-        return int(row["count"] if row and row["count"] is not None else 0)
+            row = conn.execute(query, params).fetchone()
+        return int(row["count"] if row and row["count"] is not None else 0)
+
+    def has_data(self) -> bool:
+        with self._connect() as conn:
+            row = conn.execute(
+                "SELECT 1 FROM world_snapshots WHERE source_key NOT LIKE 'history:%' LIMIT 1"
+            ).fetchone()
+        return row is not None
+
+    def load_latest_worlds(
+        self,
+        source_key: str | None = None,
+        *,
+        search: str | None = None,
+        tag: str | None = None,
+        world_ids: Iterable[str] | None = None,
+    ) -> list[dict[str, Any]]:
+        if source_key is None:
+            where = "wl.source_key NOT LIKE 'history:%'"
+            params: tuple[object, ...] = ()
+        else:
+            where = "wl.source_key = ?"
+            params = (source_key,)
+        if world_ids is not None:
+            where += " AND wl.world_id IN (SELECT value FROM json_each(?))"
+            params = (*params, jsoncodec.dumps(sorted(world_ids)))
+        if tag:
+            where += """
+                AND EXISTS (
+                    SELECT 1 FROM world_tags t
+                    WHERE t.tag = ? AND t.source_key = wl.source_key AND t.world_id = wl.world_id
+                )
+            """
+            params = (*params, tag)
+        columns = ", ".join(f"wl.{field}" for field in LATEST_WORLD_FIELDS)
+        if search:
+            condition, search_params = self._search_condition(search, SEARCH_QUERY_COLUMNS)
+            query = f"""
+                SELECT wl.world_id, wl.source_key, wl.fetched_at, {columns}, wl.raw_json, wl.raw_encoding
+                FROM world_search
+                JOIN world_latest wl ON wl.id = world_search.rowid
+                WHERE {condition} AND {where}
+            """
+            params = (*search_params, *params)
+        else:
+            query = f"""
+                SELECT wl.world_id, wl.source_key, wl.fetched_at, {columns}, wl.raw_json, wl.raw_encoding
+                FROM world_latest wl
+                WHERE {where}
+            """
+        with self._connect() as conn:
+            rows = conn.execute(query, params).fetchall()
+        return [_lazy_world(row, LATEST_WORLD_FIELDS) for row in rows]
+
+    def list_tag_facets(
+        self,
+        source_key: str | None = None,
+        *,
+        exclude: Iterable[tuple[str, str]] = (),
+    ) -> list[dict[str, Any]]:
+        # exclude holds (source_key, world_id) pairs, so a world hidden from one
+        # source still counts through the others. The pairs are decoded once and
+        # anti-joined by key instead of re-reading the JSON for every tag row.
+        with self._connect() as conn:
+            rows = conn.execute(
+                """
+                WITH excluded(source_key, world_id) AS MATERIALIZED (
+                    SELECT DISTINCT json_extract(value, '$[0]'), json_extract(value, '$[1]')
+                    FROM json_each(?)
+                )
+                SELECT t.tag, COUNT(DISTINCT t.world_id) AS world_count
+                FROM world_tags AS t
+                LEFT JOIN excluded AS e ON e.source_key = t.source_key AND e.world_id = t.world_id
+                WHERE ((? IS NULL AND t.source_key NOT LIKE 'history:%') OR t.source_key = ?)
+                  AND e.world_id IS NULL
+                GROUP BY t.tag
+                ORDER BY world_count DESC, t.tag ASC
+                """,
+                (jsoncodec.dumps(sorted(exclude)), source_key, source_key),
+            ).fetchall()
+        return [dict(row) for row in rows]
+
+    def list_tagged_world_ids(self, tag: str, source_key: str | None = None) -> set[str]:
+        with self._connect() as conn:
+            rows = conn.execute(
+                """
+                SELECT DISTINCT world_id
+                FROM world_tags
+                WHERE tag = ? AND ((? IS NULL AND source_key NOT LIKE 'history:%') OR source_key = ?)
+                """,
+                (tag, source_key, source_key),
+            ).fetchall()
+        return {row["world_id"] for row in rows}
+
+    def upsert_trend_metrics(self, source_key: str, rows: list[dict[str, Any]]) -> int:
+        # Each row is pinned to the world_latest snapshot it was computed from;
+        # worlds that left world_latest in the meantime are skipped.
+        params = [
+            (
+                source_key,
+                row["world_id"],
+                row["computed_at"],
+                jsoncodec.dumps(row["baselines"]),
+                jsoncodec.dumps(row["payload"]),
+                *(float(row["scores"].get(field) or 0.0) for field in TREND_SORT_COLUMNS),
+                int(row.get("sort_date") or 0),
+                int(row.get("visits") or 0),
+                source_key,
+                row["world_id"],
+            )
+            for row in rows
+        ]
+        if not params:
+            return 0
+        columns = ", ".join(TREND_SORT_COLUMNS.values())
+        updates = ",\n                ".join(f"{column} = excluded.{column}" for column in TREND_SORT_COLUMNS.values())
+        with self._connect() as conn:
+            before = conn.total_changes
+            conn.executemany(
+                f"""
+                INSERT INTO world_trend_metrics (
+                    source_key, world_id, snapshot_id, points_mark, computed_at, baselines_json, payload_json,
+                    {columns}, sort_date, visits
+                )
+                SELECT ?, ?, wl.snapshot_id, {TREND_POINTS_MARK_SQL.format(row="wl")}, ?, ?, ?,
+                    {", ".join("?" * len(TREND_SORT_COLUMNS))}, ?, ?
+                FROM world_latest wl
+                WHERE wl.source_key = ? AND wl.world_id = ?
+                ON CONFLICT(source_key, world_id) DO UPDATE SET
+                snapshot_id = excluded.snapshot_id,
+                points_mark = excluded.points_mark,
+                computed_at = excluded.computed_at,
+                baselines_json = excluded.baselines_json,
+                payload_json = excluded.payload_json,
+                {updates},
+                sort_date = excluded.sort_date,
+                visits = excluded.visits
+                """,
+                params,
+            )
+            return conn.total_changes - before
+
+    def stale_trend_world_ids(self, source_key: str) -> list[str]:
+        with self._connect() as conn:
+            rows = conn.execute(
+                f"""
+                SELECT wl.world_id
+                FROM world_latest wl
+                LEFT JOIN world_trend_metrics t
+                    ON t.source_key = wl.source_key AND t.world_id = wl.world_id
+                WHERE wl.source_key = ?
+                  AND (
+                    t.world_id IS NULL
+                    OR t.snapshot_id != wl.snapshot_id
+                    OR t.points_mark < {TREND_POINTS_MARK_SQL.format(row="wl")}
+                  )
+                ORDER BY wl.world_id
+                """,
+                (source_key,),
+            ).fetchall()
+        return [row["world_id"] for row in rows]
+
+    def load_trend_metrics(
+        self,
+        source_key: str,
+        *,
+        world_ids: Iterable[str] | None = None,
+    ) -> dict[str, dict[str, Any]]:
+        # Only rows that still match the world's latest snapshot are returned.
+        id_filter = ""
+        params: tuple[object, ...] = (source_key,)
+        if world_ids is not None:
+            id_filter = "AND t.world_id IN (SELECT value FROM json_each(?))"
+            params = (*params, jsoncodec.dumps(sorted(world_ids)))
+        with self._connect() as conn:
+            rows = conn.execute(
+                f"""
+                SELECT t.world_id, t.computed_at, t.baselines_json, t.payload_json
+                FROM world_trend_metrics t
+                JOIN world_latest wl
+                    ON wl.source_key = t.source_key AND wl.world_id = t.world_id AND wl.snapshot_id = t.snapshot_id
+                WHERE t.source_key = ? {id_filter}
+                  AND t.points_mark >= {TREND_POINTS_MARK_SQL.format(row="t")}
+                """,
+                params,
+            ).fetchall()
+        return {
+            row["world_id"]: {
+                "computed_at": row["computed_at"],
+                "baselines": jsoncodec.loads(row["baselines_json"]),
+                "payload": jsoncodec.loads(row["payload_json"]),
+            }
+            for row in rows
+        }
+
+    def list_trend_order(
+        self,
+        source_key: str,
+        sort: str,
+        *,
+        descending: bool = True,
+    ) -> list[tuple[str, tuple[float, int, int]]]:
+        # (world_id, (score, sort_date, visits)) in sort order; rows with equal keys
+        # come back in index (world_id) order, so callers decide how ties rank.
+        column = TREND_SORT_COLUMNS[sort]
+        direction = "DESC" if descending else "ASC"
+        with self._connect() as conn:
+            rows = conn.execute(
+                f"""
+                SELECT world_id, {column} AS score, sort_date, visits
+                FROM world_trend_metrics
+                WHERE source_key = ?
+                ORDER BY {column} {direction}, sort_date {direction}, visits {direction}
+                """,
+                (source_key,),
+            ).fetchall()
+        return [(row["world_id"], (row["score"], row["sort_date"], row["visits"])) for row in rows]
+
+    def list_trend_sources(self) -> list[str]:
+        with self._connect() as conn:
+            rows = conn.execute("SELECT DISTINCT source_key FROM world_trend_metrics ORDER BY source_key").fetchall()
+        return [row["source_key"] for row in rows]
 
-    def has_data(self) -> bool:
+    def load_run_worlds(self, run_id: int) -> list[dict[str, Any]]:
+        columns = ", ".join(f"s.{field}" for field in (*SNAPSHOT_WORLD_FIELDS, *SNAPSHOT_METRIC_FIELDS))
+        with self._connect() as conn:
+            rows = conn.execute(
+                f"""
+                SELECT
+                    s.world_id,
+                    s.source_key,
+                    s.fetched_at,
+                    s.payload_snapshot_id,
+                    {columns},
+                    COALESCE(p.raw_json, s.raw_json) AS raw_json,
+                    COALESCE(p.raw_encoding, s.raw_encoding) AS raw_encoding
+                FROM world_snapshots s
+                LEFT JOIN world_snapshots p ON p.id = s.payload_snapshot_id
+                WHERE s.run_id = ?
+                ORDER BY s.world_id ASC, s.id ASC
+                """,
+                (run_id,),
+            ).fetchall()
+        # Rows that reuse an earlier payload carry their own metrics in the typed columns.
+        return [
+            _lazy_world(
+                row,
+                SNAPSHOT_WORLD_FIELDS,
+                metrics=(
+                    {field: row[field] for field in SNAPSHOT_METRIC_FIELDS}
+                    if row["payload_snapshot_id"] is not None
+                    else None
+                ),
+            )
+            for row in rows
+        ]
+
+    def get_run(self, run_id: int) -> dict[str, Any] | None:
         with self._connect() as conn:
             row = conn.execute(
-                "SELECT 1 FROM world_snapshots WHERE source_key NOT LIKE 'history:%' LIMIT 1"
+                """
+                SELECT
+                    id, source_key, job_key, trigger_type, query_label, status,
+                    started_at, finished_at, world_count, error_text
+                FROM sync_runs
+                WHERE id = ?
+                """,
+                (run_id,),
             ).fetchone()
-        return row is not None
+        return dict(row) if row else None
 
-    def load_latest_worlds(self, source_key: str | None = None) -> list[dict[str, Any]]:
-        if source_key is None:
-            query = """
-                SELECT * FROM (
-                    SELECT
-                        world_id,
-                        source_key,
-                        fetched_at,
-                        raw_json,
-                        ROW_NUMBER() OVER (
-                            PARTITION BY source_key, world_id
-                            ORDER BY fetched_at DESC, id DESC
-                        ) AS rn
-                    FROM world_snapshots
-                    WHERE source_key NOT LIKE 'history:%'
+    def diff_runs(
+        self,
+        base_run_id: int,
+        target_run_id: int,
+        *,
+        kinds: tuple[str, ...] = RUN_DIFF_KINDS,
+        limit: int | None = None,
+        offset: int = 0,
+    ) -> dict[str, Any]:
+        with self._connect() as conn:
+            return self._diff_runs(conn, base_run_id, target_run_id, kinds=kinds, limit=limit, offset=offset)
+
+    def _diff_runs(
+        self,
+        conn: sqlite3.Connection,
+        base_run_id: int,
+        target_run_id: int,
+        *,
+        kinds: tuple[str, ...] = RUN_DIFF_KINDS,
+        limit: int | None = None,
+        offset: int = 0,
+    ) -> dict[str, Any]:
+        # Works on the typed snapshot columns only, so no payload is decoded. When a run
+        # holds several rows for one world the newest row wins, as in load_run_worlds().
+        runs_cte = """
+            WITH base AS (
+                SELECT * FROM world_snapshots
+                WHERE id IN (
+                    SELECT MAX(id) FROM world_snapshots
+                    WHERE run_id = ? AND world_id IS NOT NULL
+                    GROUP BY world_id
                 )
-                WHERE rn = 1
-            """
-            params: tuple[object, ...] = ()
-        else:
-            query = """
-                SELECT * FROM (
-                    SELECT
-                        world_id,
-                        source_key,
-                        fetched_at,
-                        raw_json,
-                        ROW_NUMBER() OVER (
-                            PARTITION BY world_id
-                            ORDER BY fetched_at DESC, id DESC
-                        ) AS rn
-                    FROM world_snapshots
-                    WHERE source_key = ?
+            ),
+            target AS (
+                SELECT * FROM world_snapshots
+                WHERE id IN (
+                    SELECT MAX(id) FROM world_snapshots
+                    WHERE run_id = ? AND world_id IS NOT NULL
+                    GROUP BY world_id
                 )
-                WHERE rn = 1
+            )
+        """
+        run_params = (base_run_id, target_run_id)
+        page_params = (-1 if limit is None else limit, offset)
+        preview_columns = """
+            world_id AS id, COALESCE(NULLIF(name, ''), world_id) AS name, author_id, author_name,
+            COALESCE(visits, 0) AS visits, COALESCE(favorites, 0) AS favorites, updated_at, world_url
+        """
+        field_flags = ",\n".join(
+            f"NULLIF(t.{field}, '') IS NOT NULLIF(b.{field}, '') AS {field}_changed"
+            for field in RUN_DIFF_FIELDS
+        )
+        deltas = ",\n".join(
+            f"COALESCE(t.{field}, 0) - COALESCE(b.{field}, 0) AS {field}_delta" for field in RUN_DIFF_METRICS
+        )
+        changed_query = f"""
+            {runs_cte},
+            paired AS (
+                SELECT
+                    t.world_id,
+                    COALESCE(NULLIF(t.name, ''), NULLIF(b.name, ''), t.world_id) AS diff_name,
+                    COALESCE(NULLIF(t.author_name, ''), NULLIF(b.author_name, '')) AS diff_author_name,
+                    {field_flags},
+                    {deltas},
+                    COALESCE(NULLIF(t.name, ''), t.world_id) AS t_name, t.author_id AS t_author_id,
+                    t.author_name AS t_author_name, COALESCE(t.visits, 0) AS t_visits,
+                    COALESCE(t.favorites, 0) AS t_favorites, t.updated_at AS t_updated_at,
+                    t.world_url AS t_world_url,
+                    COALESCE(NULLIF(b.name, ''), b.world_id) AS b_name, b.author_id AS b_author_id,
+                    b.author_name AS b_author_name, COALESCE(b.visits, 0) AS b_visits,
+                    COALESCE(b.favorites, 0) AS b_favorites, b.updated_at AS b_updated_at,
+                    b.world_url AS b_world_url
+                FROM target t
+                JOIN base b ON b.world_id = t.world_id
+            )
+            SELECT {{columns}}
+            FROM paired
+            WHERE {" OR ".join(f"{field}_changed" for field in RUN_DIFF_FIELDS)}
+               OR {" OR ".join(f"{field}_delta != 0" for field in RUN_DIFF_METRICS)}
+        """
+        score = " + ".join(
+            f"ABS({field}_delta) * {weight}" for field, weight in zip(RUN_DIFF_METRICS, (1, 4, 2, 2))
+        )
+
+        result: dict[str, Any] = {}
+        for kind, side, other in (("added", "target", "base"), ("removed", "base", "target")):
+            query = f"""
+                {runs_cte}
+                SELECT {{columns}}
+                FROM {side} s
+                WHERE NOT EXISTS (SELECT 1 FROM {other} o WHERE o.world_id = s.world_id)
             """
-            params = (source_key,)
-        with self._connect() as conn:
-            rows = conn.execute(query, params).fetchall()
-        items = []
-        for row in rows:
-            payload = json.loads(row["raw_json"])
-            payload["fetched_at"] = row["fetched_at"]
-            payload["_db_source_key"] = row["source_key"]
-            items.append(payload)
-        return items
+            result[f"{kind}_count"] = conn.execute(
+                query.format(columns="COUNT(*)"), run_params
+            ).fetchone()[0]
+            rows = []
+            if kind in kinds:
+                rows = conn.execute(
+                    query.format(columns=preview_columns) + " ORDER BY s.world_id ASC LIMIT ? OFFSET ?",
+                    run_params + page_params,
+                ).fetchall()
+            result[kind] = [dict(row) for row in rows]
 
-    def load_run_worlds(self, run_id: int) -> list[dict[str, Any]]:
-        with self._connect() as conn:
+        result["changed_count"] = conn.execute(
+            changed_query.format(columns="COUNT(*)"), run_params
+        ).fetchone()[0]
+        rows = []
+        if "changed" in kinds:
             rows = conn.execute(
-                """
-                SELECT world_id, source_key, fetched_at, raw_json
-                FROM world_snapshots
-                WHERE run_id = ?
-                ORDER BY world_id ASC, id ASC
-                """,
-                (run_id,),
+                changed_query.format(columns=f"*, {score} AS score")
+                + " ORDER BY score DESC, casefold(diff_name) DESC LIMIT ? OFFSET ?",
+                run_params + page_params,
             ).fetchall()
-        items = []
-        for row in rows:
-            payload = json.loads(row["raw_json"])
-            payload["fetched_at"] = row["fetched_at"]
-            payload["_db_source_key"] = row["source_key"]
-            items.append(payload)
-        return items
+        result["changed"] = [
+            {
+                "id": row["world_id"],
+                "name": row["diff_name"],
+                "author_name": row["diff_author_name"],
+                **{f"{field}_delta": row[f"{field}_delta"] for field in RUN_DIFF_METRICS},
+                "changed_fields": sorted(
+                    [field for field in RUN_DIFF_FIELDS if row[f"{field}_changed"]]
+                    + [field for field in RUN_DIFF_METRICS if row[f"{field}_delta"]]
+                ),
+                "latest": {"id": row["world_id"], **{field: row[f"t_{field}"] for field in RUN_DIFF_PREVIEW_FIELDS}},
+                "previous": {"id": row["world_id"], **{field: row[f"b_{field}"] for field in RUN_DIFF_PREVIEW_FIELDS}},
+            }
+            for row in rows
+        ]
+        return result
 
     def load_worlds_by_authors(self, author_ids: set[str]) -> list[dict[str, Any]]:
         if not author_ids:
             return []
         placeholders = ",".join("?" * len(author_ids))
+        columns = ", ".join(f"wl.{field}" for field in LATEST_WORLD_FIELDS)
         query = f"""
-            SELECT * FROM (
+            SELECT wl.world_id, wl.source_key, wl.fetched_at, {columns}, wl.raw_json, wl.raw_encoding
+            FROM (
                 SELECT
-                    world_id,
                     source_key,
-                    fetched_at,
-                    raw_json,
+                    world_id,
                     ROW_NUMBER() OVER (
                         PARTITION BY world_id
-                        ORDER BY fetched_at DESC, id DESC
+                        ORDER BY fetched_at DESC, snapshot_id DESC
                     ) AS rn
-                FROM world_snapshots
+                FROM world_latest
                 WHERE author_id IN ({placeholders})
                   AND source_key NOT LIKE 'history:%'
-            )
-            WHERE rn = 1
+            ) AS ranked
+            JOIN world_latest wl ON wl.source_key = ranked.source_key AND wl.world_id = ranked.world_id
+            WHERE ranked.rn = 1
         """
         with self._connect() as conn:
             rows = conn.execute(query, tuple(author_ids)).fetchall()
-        items = []
-        for row in rows:
-            payload = json.loads(row["raw_json"])
-            payload["fetched_at"] = row["fetched_at"]
-            payload["_db_source_key"] = row["source_key"]
-            items.append(payload)
-        return items
+        return [_lazy_world(row, LATEST_WORLD_FIELDS) for row in rows]
 
     def delete_runs_before(self, source_key: str, keep_run_ids: set[int]) -> int:
         if not keep_run_ids:
@@ -811,6 +2417,15 @@ class WorldInfoStorage:
                 f"DELETE FROM run_queries WHERE run_id IN (SELECT id FROM sync_runs WHERE source_key=? AND id NOT IN ({placeholders}))",
                 (source_key, *keep_run_ids),
             )
+            conn.execute(
+                f"DELETE FROM run_summaries WHERE run_id IN (SELECT id FROM sync_runs WHERE source_key=? AND id NOT IN ({placeholders}))",
+                (source_key, *keep_run_ids),
+            )
+            self._detach_snapshot_payloads(
+                conn,
+                f"SELECT id FROM world_snapshots WHERE source_key=? AND run_id NOT IN ({placeholders})",
+                (source_key, *keep_run_ids),
+            )
             cur = conn.execute(
                 f"DELETE FROM world_snapshots WHERE source_key=? AND run_id NOT IN ({placeholders})",
                 (source_key, *keep_run_ids),
@@ -820,43 +2435,112 @@ class WorldInfoStorage:
                 f"DELETE FROM sync_runs WHERE source_key=? AND id NOT IN ({placeholders})",
                 (source_key, *keep_run_ids),
             )
+            if deleted:
+                conn.execute(
+                    """
+                    DELETE FROM world_metric_points
+                    WHERE source_key = ?
+                      AND snapshot_id NOT IN (SELECT id FROM world_snapshots WHERE source_key = ?)
+                    """,
+                    (source_key, source_key),
+                )
+                self._rebuild_world_latest(conn, source_key=source_key)
+        if deleted:
+            self._bump_data_version()
         return deleted
 
+    def _detach_snapshot_payloads(
+        self,
+        conn: sqlite3.Connection,
+        doomed_query: str,
+        params: tuple[object, ...],
+    ) -> None:
+        # Unchanged snapshots point at an earlier row for their payload. Before that
+        # row is deleted, copy the payload into the oldest surviving marker and
+        # re-point the remaining markers at it.
+        rows = conn.execute(
+            f"""
+            SELECT id, payload_snapshot_id
+            FROM world_snapshots
+            WHERE payload_snapshot_id IN ({doomed_query})
+              AND id NOT IN ({doomed_query})
+            ORDER BY payload_snapshot_id ASC, id ASC
+            """,
+            params + params,
+        ).fetchall()
+        promoted: dict[int, int] = {}
+        for row in rows:
+            payload_id = int(row["payload_snapshot_id"])
+            if payload_id not in promoted:
+                promoted[payload_id] = int(row["id"])
+                conn.execute(
+                    """
+                    UPDATE world_snapshots
+                    SET raw_json = (SELECT raw_json FROM world_snapshots WHERE id = ?),
+                        raw_encoding = (SELECT raw_encoding FROM world_snapshots WHERE id = ?),
+                        payload_snapshot_id = NULL
+                    WHERE id = ?
+                    """,
+                    (payload_id, payload_id, row["id"]),
+                )
+                continue
+            conn.execute(
+                "UPDATE world_snapshots SET payload_snapshot_id = ? WHERE id = ?",
+                (promoted[payload_id], row["id"]),
+            )
+
     def load_history_points(
         self,
         world_id: str | None = None,
         source_key: str | None = None,
+        *,
+        world_ids: Iterable[str] | None = None,
     ) -> dict[str, list[dict[str, Any]]]:
-        query = """
+        id_filter = ""
+        params: tuple[object, ...] = (world_id, world_id, source_key, source_key)
+        if world_ids is not None:
+            id_filter = "AND world_id IN (SELECT value FROM json_each(?))"
+            params = (*params, jsoncodec.dumps(sorted(world_ids)))
+        query = f"""
             SELECT
                 world_id,
                 source_key,
+                ts,
                 fetched_at,
-                raw_json
-            FROM world_snapshots
+                name,
+                visits,
+                favorites,
+                heat,
+                popularity,
+                updated_at,
+                created_at,
+                publication_date,
+                labs_publication_date
+            FROM world_metric_points
             WHERE (? IS NULL OR world_id = ?)
               AND (? IS NULL OR source_key = ?)
-            ORDER BY world_id ASC, fetched_at ASC, id ASC
+              {id_filter}
+            ORDER BY world_id ASC, ts ASC, snapshot_id ASC
         """
         with self._connect() as conn:
-            rows = conn.execute(query, (world_id, world_id, source_key, source_key)).fetchall()
+            rows = conn.execute(query, params).fetchall()
 
         history: dict[str, list[dict[str, Any]]] = {}
         for row in rows:
-            payload = json.loads(row["raw_json"])
             history.setdefault(row["world_id"], []).append(
                 {
                     "source_key": row["source_key"],
+                    "ts": row["ts"],
                     "fetched_at": row["fetched_at"],
-                    "name": payload.get("name"),
-                    "created_at": payload.get("created_at"),
-                    "updated_at": payload.get("updated_at"),
-                    "publication_date": payload.get("publication_date"),
-                    "labs_publication_date": payload.get("labs_publication_date"),
-                    "visits": payload.get("visits"),
-                    "favorites": payload.get("favorites"),
-                    "heat": payload.get("heat"),
-                    "popularity": payload.get("popularity"),
+                    "name": row["name"],
+                    "created_at": row["created_at"],
+                    "updated_at": row["updated_at"],
+                    "publication_date": row["publication_date"],
+                    "labs_publication_date": row["labs_publication_date"],
+                    "visits": row["visits"],
+                    "favorites": row["favorites"],
+                    "heat": row["heat"],
+                    "popularity": row["popularity"],
                 }
             )
         return history
@@ -922,7 +2606,7 @@ class WorldInfoStorage:
         items = []
         for row in rows:
             item = dict(row)
-            item["external_links"] = json.loads(item.pop("external_links_json") or "[]")
+            item["external_links"] = jsoncodec.loads(item.pop("external_links_json") or "[]")
             items.append(item)
         return items
 
@@ -965,7 +2649,7 @@ class WorldInfoStorage:
                     category,
                     description,
                     managed_status,
-                    json.dumps(external_links or [], ensure_ascii=False),
+                    jsoncodec.dumps(external_links or []),
                     last_synced_at,
                 ),
             )
@@ -1118,7 +2802,7 @@ class WorldInfoStorage:
         items = []
         for row in rows:
             item = dict(row)
-            item["payload"] = json.loads(item.pop("payload_json") or "{}")
+            item["payload"] = jsoncodec.loads(item.pop("payload_json") or "{}")
             items.append(item)
         return items
 
@@ -1153,7 +2837,7 @@ class WorldInfoStorage:
                         content_type,
                         status,
                         scheduled_for,
-                        json.dumps(payload, ensure_ascii=False),
+                        jsoncodec.dumps(payload),
                         created_at,
                         updated_at,
                         delivered_at,
@@ -1172,7 +2856,7 @@ class WorldInfoStorage:
                     content_type,
                     status,
                     scheduled_for,
-                    json.dumps(payload, ensure_ascii=False),
+                    jsoncodec.dumps(payload),
                     updated_at,
                     delivered_at,
                     post_id,
@@ -1206,6 +2890,16 @@ class WorldInfoStorage:
         return int(row["count"] if row and row["count"] is not None else 0)
 
     def list_runs(self, *, limit: int = 20, job_key: str | None = None) -> list[dict[str, Any]]:
+        with self._connect() as conn:
+            return self._list_runs(conn, limit=limit, job_key=job_key)
+
+    def _list_runs(
+        self,
+        conn: sqlite3.Connection,
+        *,
+        limit: int = 20,
+        job_key: str | None = None,
+    ) -> list[dict[str, Any]]:
         query = """
             SELECT
                 id, source_key, job_key, trigger_type, query_label, status,
@@ -1215,10 +2909,144 @@ class WorldInfoStorage:
             ORDER BY started_at DESC, id DESC
             LIMIT ?
         """
-        with self._connect() as conn:
-            rows = conn.execute(query, (job_key, job_key, limit)).fetchall()
+        rows = conn.execute(query, (job_key, job_key, limit)).fetchall()
         return [dict(row) for row in rows]
 
+    def list_recent_job_runs(self, *, runs_per_job: int = 20, completed_per_job: int = 2) -> list[dict[str, Any]]:
+        # One pass over every job's run history: each job's newest run plus its
+        # newest completed runs (within the last runs_per_job), with the stored
+        # run summary attached. Rows come back newest first per job.
+        query = """
+            WITH ranked AS (
+                SELECT
+                    id, source_key, job_key, trigger_type, query_label, status,
+                    started_at, finished_at, world_count, error_text,
+                    ROW_NUMBER() OVER (
+                        PARTITION BY job_key ORDER BY started_at DESC, id DESC
+                    ) AS run_rank,
+                    SUM(status = 'completed') OVER (
+                        PARTITION BY job_key ORDER BY started_at DESC, id DESC
+                        ROWS UNBOUNDED PRECEDING
+                    ) AS completed_rank
+                FROM sync_runs
+                WHERE job_key IS NOT NULL
+            )
+            SELECT
+                r.id, r.source_key, r.job_key, r.trigger_type, r.query_label, r.status,
+                r.started_at, r.finished_at, r.world_count, r.error_text,
+                s.run_id AS summary_run_id, s.previous_run_id AS summary_previous_run_id,
+                s.world_count AS summary_world_count, s.creator_count AS summary_creator_count,
+                s.diff_json AS summary_diff_json
+            FROM ranked r
+            LEFT JOIN run_summaries s ON s.run_id = r.id
+            WHERE r.run_rank = 1
+                OR (r.status = 'completed' AND r.run_rank <= ? AND r.completed_rank <= ?)
+            ORDER BY r.job_key ASC, r.run_rank ASC
+        """
+        with self._connect() as conn:
+            rows = conn.execute(query, (runs_per_job, completed_per_job)).fetchall()
+        items = []
+        for row in rows:
+            item = {key: row[key] for key in row.keys() if not key.startswith("summary_")}
+            item["summary"] = None
+            if row["summary_run_id"] is not None:
+                item["summary"] = {
+                    "previous_run_id": row["summary_previous_run_id"],
+                    "world_count": row["summary_world_count"],
+                    "creator_count": row["summary_creator_count"],
+                    "diff": jsoncodec.loads(row["summary_diff_json"]) if row["summary_diff_json"] else None,
+                }
+            items.append(item)
+        return items
+
+    def count_run_worlds(self, run_ids: Iterable[int]) -> dict[int, dict[str, int]]:
+        with self._connect() as conn:
+            return self._count_run_worlds(conn, run_ids)
+
+    def _count_run_worlds(self, conn: sqlite3.Connection, run_ids: Iterable[int]) -> dict[int, dict[str, int]]:
+        ids = sorted({int(run_id) for run_id in run_ids})
+        if not ids:
+            return {}
+        # Newest row per (run, world), as in load_run_worlds(); reads typed columns only.
+        query = """
+            SELECT run_id, COUNT(*) AS world_count, COUNT(DISTINCT author_id) AS creator_count
+            FROM world_snapshots
+            WHERE id IN (
+                SELECT MAX(id) FROM world_snapshots
+                WHERE run_id IN (SELECT value FROM json_each(?)) AND world_id IS NOT NULL
+                GROUP BY run_id, world_id
+            )
+            GROUP BY run_id
+        """
+        rows = conn.execute(query, (jsoncodec.dumps(ids),)).fetchall()
+        counts = {run_id: {"world_count": 0, "creator_count": 0} for run_id in ids}
+        for row in rows:
+            counts[int(row["run_id"])] = {
+                "world_count": int(row["world_count"]),
+                "creator_count": int(row["creator_count"]),
+            }
+        return counts
+
+    def upsert_run_summary(
+        self,
+        *,
+        run_id: int,
+        job_key: str | None,
+        previous_run_id: int | None,
+        world_count: int,
+        creator_count: int,
+        diff: dict[str, Any] | None,
+        created_at: str,
+    ) -> None:
+        with self._connect() as conn:
+            self._upsert_run_summary(
+                conn,
+                run_id=run_id,
+                job_key=job_key,
+                previous_run_id=previous_run_id,
+                world_count=world_count,
+                creator_count=creator_count,
+                diff=diff,
+                created_at=created_at,
+            )
+
+    def _upsert_run_summary(
+        self,
+        conn: sqlite3.Connection,
+        *,
+        run_id: int,
+        job_key: str | None,
+        previous_run_id: int | None,
+        world_count: int,
+        creator_count: int,
+        diff: dict[str, Any] | None,
+        created_at: str,
+    ) -> None:
+        conn.execute(
+            """
+            INSERT INTO run_summaries (
+                run_id, job_key, previous_run_id, world_count, creator_count, diff_json, created_at
+            )
+            VALUES (?, ?, ?, ?, ?, ?, ?)
+            ON CONFLICT(run_id) DO UPDATE SET
+                job_key = excluded.job_key,
+                previous_run_id = excluded.previous_run_id,
+                world_count = excluded.world_count,
+                creator_count = excluded.creator_count,
+                diff_json = excluded.diff_json,
+                created_at = excluded.created_at
+            """,
+            (
+                run_id,
+                job_key,
+                previous_run_id,
+                world_count,
+                creator_count,
+                jsoncodec.dumps(diff) if diff is not None else None,
+                created_at,
+            ),
+        )
+
     def get_latest_run_for_job(self, job_key: str) -> dict[str, Any] | None:
         runs = self.list_runs(limit=1, job_key=job_key)
         return runs[0] if runs else None
@@ -1235,28 +3063,87 @@ class WorldInfoStorage:
         with self._connect() as conn:
             conn.execute(
                 """
-                INSERT INTO analysis_cache (scope_key, scope_type, updated_at, source_run_id, payload_json)
-                VALUES (?, ?, ?, ?, ?)
+                INSERT INTO analysis_cache (
+                    scope_key, scope_type, updated_at, source_run_id, payload_json, payload_encoding
+                )
+                VALUES (?, ?, ?, ?, ?, ?)
                 ON CONFLICT(scope_key) DO UPDATE SET
                     scope_type = excluded.scope_type,
                     updated_at = excluded.updated_at,
                     source_run_id = excluded.source_run_id,
-                    payload_json = excluded.payload_json
+                    payload_json = excluded.payload_json,
+                    payload_encoding = excluded.payload_encoding,
+                    -- A marker newer than this payload (a write it did not see) keeps it stale.
+                    stale_since = CASE
+                        WHEN analysis_cache.stale_since > excluded.updated_at THEN analysis_cache.stale_since
+                    END
                 """,
                 (
                     scope_key,
                     scope_type,
                     updated_at,
                     source_run_id,
-                    json.dumps(payload, ensure_ascii=False),
+                    _encode_payload(payload, self.payload_codec),
+                    self.payload_codec,
                 ),
             )
 
+    def mark_analysis_stale(self, scope_keys: Iterable[str], stale_since: str) -> int:
+        # Keeps the latest marker: a rebuild that started before the last write
+        # lands with updated_at < stale_since and so stays stale.
+        with self._connect() as conn:
+            cursor = conn.executemany(
+                """
+                UPDATE analysis_cache SET stale_since = ?
+                WHERE scope_key = ? AND (stale_since IS NULL OR stale_since < ?)
+                """,
+                [(stale_since, scope_key, stale_since) for scope_key in scope_keys],
+            )
+            return cursor.rowcount
+
+    def analysis_version(self) -> tuple[int, str | None, str | None]:
+        # Background rebuilds commit after the write that bumped data_version, so
+        # response validators fold this in as well.
+        with self._connect() as conn:
+            row = conn.execute(
+                "SELECT COUNT(*) AS total, MAX(updated_at) AS updated_at, MAX(stale_since) AS stale_since FROM analysis_cache"
+            ).fetchone()
+        return (int(row["total"]), row["updated_at"], row["stale_since"])
+
+    def list_analysis_scope_keys(self) -> set[str]:
+        with self._connect() as conn:
+            rows = conn.execute("SELECT scope_key FROM analysis_cache").fetchall()
+        return {row["scope_key"] for row in rows}
+
+    def delete_analysis_cache(self, scope_key: str) -> None:
+        with self._connect() as conn:
+            conn.execute("DELETE FROM analysis_cache WHERE scope_key = ?", (scope_key,))
+
+    def list_stale_analysis_scopes(self) -> list[dict[str, Any]]:
+        with self._connect() as conn:
+            rows = conn.execute(
+                """
+                SELECT scope_key, scope_type, updated_at, stale_since
+                FROM analysis_cache
+                WHERE stale_since IS NOT NULL
+                ORDER BY stale_since ASC, scope_key ASC
+                """
+            ).fetchall()
+        return [dict(row) for row in rows]
+
+    def get_analysis_cache_meta(self, scope_key: str) -> dict[str, Any] | None:
+        with self._connect() as conn:
+            row = conn.execute(
+                "SELECT updated_at, stale_since FROM analysis_cache WHERE scope_key = ?",
+                (scope_key,),
+            ).fetchone()
+        return dict(row) if row is not None else None
+
     def get_analysis_cache(self, scope_key: str) -> dict[str, Any] | None:
         with self._connect() as conn:
             row = conn.execute(
                 """
-                SELECT scope_key, scope_type, updated_at, source_run_id, payload_json
+                SELECT scope_key, scope_type, updated_at, source_run_id, stale_since, payload_json, payload_encoding
                 FROM analysis_cache
                 WHERE scope_key = ?
                 """,
@@ -1269,9 +3156,153 @@ class WorldInfoStorage:
             "scope_type": row["scope_type"],
             "updated_at": row["updated_at"],
             "source_run_id": row["source_run_id"],
-            "payload": json.loads(row["payload_json"]),
+            "stale_since": row["stale_since"],
+            "payload": _decode_payload(row["payload_json"], row["payload_encoding"]),
         }
 
+    def upsert_world_events(self, events: list[dict[str, Any]]) -> int:
+        with self._connect() as conn:
+            return self._upsert_world_events(conn, events)
+
+    def _upsert_world_events(self, conn: sqlite3.Connection, events: list[dict[str, Any]]) -> int:
+        # One row per (job, type, world, day); a repeat keeps the more severe occurrence.
+        if not events:
+            return 0
+        cursor = conn.executemany(
+            """
+            INSERT INTO world_events (
+                job_key, source_key, run_id, event_type, world_id, event_day,
+                occurred_at, detected_at, sort_at, severity, summary, payload_json
+            )
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            ON CONFLICT(job_key, event_type, world_id, event_day) DO UPDATE SET
+                source_key = excluded.source_key,
+                run_id = excluded.run_id,
+                occurred_at = excluded.occurred_at,
+                detected_at = excluded.detected_at,
+                sort_at = excluded.sort_at,
+                severity = excluded.severity,
+                summary = excluded.summary,
+                payload_json = excluded.payload_json
+            WHERE excluded.severity >= world_events.severity
+            """,
+            [
+                (
+                    event["job_key"],
+                    event["source_key"],
+                    event.get("run_id"),
+                    event["event_type"],
+                    event["world_id"],
+                    event["event_day"],
+                    event.get("occurred_at"),
+                    event["detected_at"],
+                    event["sort_at"],
+                    float(event.get("severity") or 0),
+                    event.get("summary") or "",
+                    jsoncodec.dumps(event.get("payload") or {}),
+                )
+                for event in events
+            ],
+        )
+        return cursor.rowcount
+
+    def _world_event_filters(
+        self,
+        *,
+        since: str,
+        event_types: Iterable[str] | None,
+        job_key: str | None,
+        min_severity: float | None,
+    ) -> tuple[list[str], list[Any]]:
+        clauses = ["sort_at > ?"]
+        params: list[Any] = [since]
+        if event_types:
+            clauses.append("event_type IN (SELECT value FROM json_each(?))")
+            params.append(jsoncodec.dumps(sorted(set(event_types))))
+        if job_key:
+            clauses.append("job_key = ?")
+            params.append(job_key)
+        if min_severity is not None:
+            clauses.append("severity >= ?")
+            params.append(float(min_severity))
+        return clauses, params
+
+    def list_world_events(
+        self,
+        *,
+        since: str,
+        event_types: Iterable[str] | None = None,
+        job_key: str | None = None,
+        min_severity: float | None = None,
+        before: tuple[str, int] | None = None,
+        limit: int = 50,
+    ) -> list[dict[str, Any]]:
+        clauses, params = self._world_event_filters(
+            since=since, event_types=event_types, job_key=job_key, min_severity=min_severity
+        )
+        if before is not None:
+            # Keyset paging: continue strictly after the last (sort_at, id) served.
+            clauses.append("(sort_at, id) < (?, ?)")
+            params.extend(before)
+        query = f"""
+            SELECT
+                id, job_key, source_key, run_id, event_type, world_id, event_day,
+                occurred_at, detected_at, sort_at, severity, summary, payload_json
+            FROM world_events
+            WHERE {" AND ".join(clauses)}
+            ORDER BY sort_at DESC, id DESC
+            LIMIT ?
+        """
+        with self._connect() as conn:
+            rows = conn.execute(query, (*params, limit)).fetchall()
+        items = []
+        for row in rows:
+            item = dict(row)
+            item["payload"] = jsoncodec.loads(item.pop("payload_json") or "{}")
+            items.append(item)
+        return items
+
+    def count_world_events(
+        self,
+        *,
+        since: str,
+        event_types: Iterable[str] | None = None,
+        job_key: str | None = None,
+        min_severity: float | None = None,
+    ) -> dict[str, int]:
+        clauses, params = self._world_event_filters(
+            since=since, event_types=event_types, job_key=job_key, min_severity=min_severity
+        )
+        query = f"""
+            SELECT event_type, COUNT(*) AS total
+            FROM world_events
+            WHERE {" AND ".join(clauses)}
+            GROUP BY event_type
+        """
+        with self._connect() as conn:
+            rows = conn.execute(query, params).fetchall()
+        return {row["event_type"]: int(row["total"]) for row in rows}
+
+    def has_world_events(self) -> bool:
+        with self._connect() as conn:
+            row = conn.execute("SELECT 1 FROM world_events LIMIT 1").fetchone()
+        return row is not None
+
+    def delete_world_events(self, *, job_key: str | None = None, before: str | None = None) -> int:
+        clauses = []
+        params: list[Any] = []
+        if job_key is not None:
+            clauses.append("job_key = ?")
+            params.append(job_key)
+        if before is not None:
+            clauses.append("sort_at < ?")
+            params.append(before)
+        if not clauses:
+            raise ValueError("delete_world_events needs job_key or before")
+        with self._connect() as conn:
+            cursor = conn.execute(f"DELETE FROM world_events WHERE {' AND '.join(clauses)}", params)
+            return cursor.rowcount
+
     def upsert_topics(self, topics: list[dict[str, Any]]) -> None:
         rows = [
             (
@@ -1351,6 +3382,7 @@ class WorldInfoStorage:
             conn.execute("DELETE FROM topic_memberships WHERE topic_key = ?", (topic_key,))
             conn.execute("DELETE FROM topic_rules WHERE topic_key = ?", (topic_key,))
             conn.execute("DELETE FROM topics WHERE topic_key = ?", (topic_key,))
+        self._bump_data_version()
 
     def list_topic_rules(self, topic_key: str) -> list[dict[str, Any]]:
         with self._connect() as conn:
@@ -1365,6 +3397,18 @@ class WorldInfoStorage:
             ).fetchall()
         return [dict(row) for row in rows]
 
+    def list_topics_for_worlds(self, world_ids: Iterable[str]) -> set[str]:
+        with self._connect() as conn:
+            rows = conn.execute(
+                """
+                SELECT DISTINCT topic_key
+                FROM topic_memberships
+                WHERE world_id IN (SELECT value FROM json_each(?))
+                """,
+                (jsoncodec.dumps(sorted(world_ids)),),
+            ).fetchall()
+        return {row["topic_key"] for row in rows}
+
     def list_topic_memberships(self, topic_key: str) -> list[dict[str, Any]]:
         with self._connect() as conn:
             rows = conn.execute(
@@ -1381,14 +3425,49 @@ class WorldInfoStorage:
     def get_existing_topic_memberships(self, topic_key: str) -> dict[str, dict[str, Any]]:
         return {row["world_id"]: row for row in self.list_topic_memberships(topic_key)}
 
-    def replace_topic_memberships(self, topic_key: str, memberships: list[dict[str, Any]]) -> None:
+    def apply_topic_memberships(
+        self,
+        topic_key: str,
+        memberships: list[dict[str, Any]],
+        *,
+        world_ids: Iterable[str] | None = None,
+    ) -> dict[str, int]:
+        # Makes `memberships` the topic's rows for the given worlds (all worlds when
+        # world_ids is None): stale rows are deleted and only new or changed rows
+        # are written.
+        wanted = jsoncodec.dumps(sorted(item["world_id"] for item in memberships))
         with self._connect() as conn:
-            conn.execute("DELETE FROM topic_memberships WHERE topic_key = ?", (topic_key,))
+            if world_ids is None:
+                deleted = conn.execute(
+                    """
+                    DELETE FROM topic_memberships
+                    WHERE topic_key = ? AND world_id NOT IN (SELECT value FROM json_each(?))
+                    """,
+                    (topic_key, wanted),
+                ).rowcount
+            else:
+                deleted = conn.execute(
+                    """
+                    DELETE FROM topic_memberships
+                    WHERE topic_key = ?
+                      AND world_id IN (SELECT value FROM json_each(?))
+                      AND world_id NOT IN (SELECT value FROM json_each(?))
+                    """,
+                    (topic_key, jsoncodec.dumps(sorted(world_ids)), wanted),
+                ).rowcount
+            before = conn.total_changes
             conn.executemany(
                 """
                 INSERT INTO topic_memberships (
                     topic_key, world_id, first_seen_at, last_seen_at, matched_by
                 ) VALUES (?, ?, ?, ?, ?)
+                ON CONFLICT(topic_key, world_id) DO UPDATE SET
+                    first_seen_at = excluded.first_seen_at,
+                    last_seen_at = excluded.last_seen_at,
+                    matched_by = excluded.matched_by
+                WHERE topic_memberships.first_seen_at IS NOT excluded.first_seen_at
+                   OR topic_memberships.last_seen_at IS NOT excluded.last_seen_at
+                   OR topic_memberships.matched_by IS NOT excluded.matched_by
                 """,
                 [
                     (
@@ -1401,29 +3480,44 @@ class WorldInfoStorage:
                     for item in memberships
                 ],
             )
+            upserted = conn.total_changes - before
+        if upserted or deleted:
+            # Topic world lists and insights are read from these rows.
+            self._bump_data_version()
+        return {"upserted": upserted, "deleted": deleted}
 
     def purge_source(self, source_key: str) -> None:
         with self._connect() as conn:
-            conn.execute(
-                """
-                DELETE FROM run_query_hits
-                WHERE run_query_id IN (
-                    SELECT id FROM run_queries
-                    WHERE run_id IN (SELECT id FROM sync_runs WHERE source_key = ?)
-                )
-                """,
-                (source_key,),
-            )
-            conn.execute(
-                """
-                DELETE FROM run_queries
+            self._purge_source(conn, source_key)
+        self._bump_data_version()
+
+    def _purge_source(self, conn: sqlite3.Connection, source_key: str) -> None:
+        conn.execute(
+            """
+            DELETE FROM run_query_hits
+            WHERE run_query_id IN (
+                SELECT id FROM run_queries
                 WHERE run_id IN (SELECT id FROM sync_runs WHERE source_key = ?)
-                """,
-                (source_key,),
             )
-            conn.execute("DELETE FROM world_snapshots WHERE source_key = ?", (source_key,))
-            conn.execute("DELETE FROM daily_stats WHERE source_key = ?", (source_key,))
-            conn.execute("DELETE FROM sync_runs WHERE source_key = ?", (source_key,))
+            """,
+            (source_key,),
+        )
+        conn.execute(
+            """
+            DELETE FROM run_queries
+            WHERE run_id IN (SELECT id FROM sync_runs WHERE source_key = ?)
+            """,
+            (source_key,),
+        )
+        conn.execute("DELETE FROM world_snapshots WHERE source_key = ?", (source_key,))
+        conn.execute("DELETE FROM world_latest WHERE source_key = ?", (source_key,))
+        conn.execute("DELETE FROM world_metric_points WHERE source_key = ?", (source_key,))
+        conn.execute("DELETE FROM daily_stats WHERE source_key = ?", (source_key,))
+        conn.execute(
+            "DELETE FROM run_summaries WHERE run_id IN (SELECT id FROM sync_runs WHERE source_key = ?)",
+            (source_key,),
+        )
+        conn.execute("DELETE FROM sync_runs WHERE source_key = ?", (source_key,))
 
     def purge_daily_stats(self, source_key: str) -> None:
         with self._connect() as conn:
@@ -1435,3 +3529,12 @@ class WorldInfoStorage:
                 "DELETE FROM world_snapshots WHERE source_key = ? AND world_id = ?",
                 (source_key, world_id),
             )
+            conn.execute(
+                "DELETE FROM world_latest WHERE source_key = ? AND world_id = ?",
+                (source_key, world_id),
+            )
+            conn.execute(
+                "DELETE FROM world_metric_points WHERE source_key = ? AND world_id = ?",
+                (source_key, world_id),
+            )
+        self._bump_data_version()
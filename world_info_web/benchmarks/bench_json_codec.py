@@ -0,0 +1,99 @@
+from __future__ import annotations
+
+import argparse
+import shutil
+import sqlite3
+import tempfile
+import time
+import zlib
+from pathlib import Path
+from typing import Any
+
+from world_info_web.backend.jsoncodec import CODECS
+from world_info_web.backend.storage import WorldInfoStorage, zstandard
+from world_info_web.benchmarks.bench_payload_codec import _seed
+
+DEFAULT_DB = Path(__file__).resolve().parents[1] / "data" / "world_info.sqlite3"
+
+
+def _load_payloads(db_path: Path, limit: int) -> list[bytes]:
+    # Read-only: the benchmark must never touch a live database.
+    conn = sqlite3.connect(f"file:{db_path}?mode=ro", uri=True)
+    try:
+        rows = conn.execute(
+            "SELECT raw_json, raw_encoding FROM world_latest WHERE raw_json <> '' LIMIT ?",
+            (limit,),
+        ).fetchall()
+    finally:
+        conn.close()
+    payloads = []
+    for raw, encoding in rows:
+        if encoding == "zlib":
+            payloads.append(zlib.decompress(raw))
+        elif encoding == "zstd" and zstandard is not None:
+            payloads.append(zstandard.ZstdDecompressor().decompress(raw))
+        elif encoding in (None, "", "json"):
+            payloads.append(raw.encode("utf-8") if isinstance(raw, str) else bytes(raw))
+    return payloads
+
+
+def _best_of(repeat: int, func: Any) -> float:
+    best = None
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func()
+        elapsed = time.perf_counter() - started
+        best = elapsed if best is None else min(best, elapsed)
+    return round((best or 0.0) * 1000, 2)
+
+
+def run_benchmark(payloads: list[bytes], *, repeat: int) -> list[dict[str, Any]]:
+    worlds = CODECS["json"].loads(b"[" + b",".join(payloads) + b"]")
+    results = []
+    for name, codec in CODECS.items():
+        results.append(
+            {
+                "codec": name,
+                "decode_rows_ms": _best_of(repeat, lambda: [codec.loads(payload) for payload in payloads]),
+                "encode_rows_ms": _best_of(repeat, lambda: [codec.dumps(world) for world in worlds]),
+                "encode_list_ms": _best_of(repeat, lambda: codec.dumps_bytes({"items": worlds})),
+                "list_bytes": len(codec.dumps_bytes({"items": worlds})),
+            }
+        )
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Compare JSON codecs on stored world payloads")
+    parser.add_argument("--db", type=Path, default=DEFAULT_DB, help="snapshot database to read (opened read-only)")
+    parser.add_argument("--limit", type=int, default=50000)
+    parser.add_argument("--synthetic-worlds", type=int, default=5000, help="worlds to generate when --db is missing")
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    workdir = None
+    db_path = args.db
+    if not db_path.exists():
+        workdir = Path(tempfile.mkdtemp(prefix="world_info_json_bench_"))
+        db_path = workdir / "seed.sqlite3"
+        _seed(WorldInfoStorage(db_path), worlds=args.synthetic_worlds, runs=1)
+    try:
+        payloads = _load_payloads(db_path, args.limit)
+    finally:
+        if workdir is not None:
+            shutil.rmtree(workdir, ignore_errors=True)
+    if not payloads:
+        print(f"no payloads in {db_path}")
+        return
+
+    print(f"{len(payloads)} world payloads from {args.db if workdir is None else 'a synthetic database'}")
+    print(f"{'codec':<8} {'decode ms':>10} {'encode ms':>10} {'list ms':>9} {'list bytes':>12}")
+    for item in run_benchmark(payloads, repeat=args.repeat):
+        print(
+            f"{item['codec']:<8} {item['decode_rows_ms']:>10} {item['encode_rows_ms']:>10} "
+            f"{item['encode_list_ms']:>9} {item['list_bytes']:>12,}"
+        )
+
+
+if __name__ == "__main__":
+    main()
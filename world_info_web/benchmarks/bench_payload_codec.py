@@ -0,0 +1,143 @@
+from __future__ import annotations
+
+import argparse
+import shutil
+import tempfile
+import time
+from pathlib import Path
+from typing import Any
+
+from world_info_web.backend.storage import PAYLOAD_CODECS, WorldInfoStorage, zstandard
+
+
+def _synthetic_world(index: int, run_index: int) -> dict[str, Any]:
+    visits = 1000 + index * 7 + run_index * (index % 13)
+    return {
+        "source": "db:bench",
+        "id": f"wrld_bench_{index:06d}",
+        "name": f"Benchmark World {index}",
+        "description": "A synthetic world used to compare payload codecs. " * 4,
+        "author_id": f"usr_bench_{index % 500:04d}",
+        "author_name": f"Creator {index % 500}",
+        "capacity": 32,
+        "visits": visits,
+        "favorites": visits // 20,
+        "heat": index % 6,
+        "popularity": index % 9,
+        "created_at": "2025-01-01T00:00:00Z",
+        "updated_at": "2025-06-01T00:00:00Z",
+        "publication_date": "2025-02-01T00:00:00Z",
+        "labs_publication_date": "2025-01-15T00:00:00Z",
+        "release_status": "public",
+        "image_url": f"https://example.invalid/images/{index}.png",
+        "thumbnail_url": f"https://example.invalid/thumbs/{index}.png",
+        "tags": ["system_approved", f"author_tag_{index % 40}", "author_tag_game"],
+        "portal_links": [],
+        "world_url": f"https://vrchat.com/home/world/wrld_bench_{index:06d}",
+        "metrics": {"favorite_rate": 5.0, "days_since_update": 30, "visits_per_day": 12.5},
+    }
+
+
+def _seed(storage: WorldInfoStorage, *, worlds: int, runs: int) -> list[int]:
+    run_ids = []
+    for run_index in range(runs):
+        fetched_at = f"2026-01-{run_index + 1:02d}T00:00:00+00:00"
+        run_id = storage.create_run(
+            source_key="bench",
+            job_key="bench",
+            trigger_type="bench",
+            query_label="bench",
+            started_at=fetched_at,
+        )
+        storage.insert_world_snapshots(
+            run_id=run_id,
+            source_key="bench",
+            fetched_at=fetched_at,
+            worlds=[_synthetic_world(index, run_index) for index in range(worlds)],
+        )
+        run_ids.append(run_id)
+    return run_ids
+
+
+def _typed_fields(worlds: list[Any]) -> None:
+    # What list/sort paths read: answered from the typed columns, no payload decode.
+    for world in worlds:
+        world["id"], world["name"], world["visits"], world["updated_at"]
+
+
+def _materialise(worlds: list[Any]) -> None:
+    for world in worlds:
+        dict(world)
+
+
+def _time_reads(storage: WorldInfoStorage, run_ids: list[int], repeat: int) -> dict[str, float]:
+    timings: dict[str, float] = {}
+    for label, reader in (
+        ("latest_typed", lambda: _typed_fields(storage.load_latest_worlds("bench"))),
+        ("latest_full", lambda: _materialise(storage.load_latest_worlds("bench"))),
+        ("run_typed", lambda: _typed_fields(storage.load_run_worlds(run_ids[-1]))),
+        ("run_full", lambda: _materialise(storage.load_run_worlds(run_ids[-1]))),
+    ):
+        best = None
+        for _ in range(repeat):
+            started = time.perf_counter()
+            reader()
+            elapsed = time.perf_counter() - started
+            best = elapsed if best is None else min(best, elapsed)
+        timings[label] = round((best or 0.0) * 1000, 2)
+    return timings
+
+
+def run_benchmark(*, worlds: int, runs: int, repeat: int) -> list[dict[str, Any]]:
+    workdir = Path(tempfile.mkdtemp(prefix="world_info_codec_bench_"))
+    results = []
+    try:
+        seed_path = workdir / "seed.sqlite3"
+        run_ids = _seed(WorldInfoStorage(seed_path), worlds=worlds, runs=runs)
+        for codec in PAYLOAD_CODECS:
+            if codec == "zstd" and zstandard is None:
+                continue
+            db_path = workdir / f"{codec}.sqlite3"
+            shutil.copyfile(seed_path, db_path)
+            storage = WorldInfoStorage(db_path, payload_codec=codec)
+            started = time.perf_counter()
+            storage.migrate_payload_encoding()
+            migrate_ms = round((time.perf_counter() - started) * 1000, 2)
+            with storage._connect() as conn:
+                conn.execute("VACUUM")
+            results.append(
+                {
+                    "codec": codec,
+                    "db_size_bytes": storage.database_size_bytes(),
+                    "migrate_ms": migrate_ms,
+                    **_time_reads(storage, run_ids, repeat),
+                }
+            )
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Compare snapshot payload codecs")
+    parser.add_argument("--worlds", type=int, default=2000)
+    parser.add_argument("--runs", type=int, default=10)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    results = run_benchmark(worlds=args.worlds, runs=args.runs, repeat=args.repeat)
+    print(f"{args.worlds} worlds x {args.runs} runs")
+    print("read columns: typed fields only (payload left encoded) / every row decoded")
+    print(
+        f"{'codec':<6} {'db size':>12} {'migrate ms':>11} {'latest typed':>13} {'latest full':>12} "
+        f"{'run typed':>10} {'run full':>9}"
+    )
+    for item in results:
+        print(
+            f"{item['codec']:<6} {item['db_size_bytes']:>12,} {item['migrate_ms']:>11} "
+            f"{item['latest_typed']:>13} {item['latest_full']:>12} {item['run_typed']:>10} {item['run_full']:>9}"
+        )
+
+
+if __name__ == "__main__":
+    main()
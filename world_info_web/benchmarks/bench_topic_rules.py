@@ -0,0 +1,113 @@
+from __future__ import annotations
+
+import argparse
+import datetime as dt
+import random
+import time
+from typing import Any
+
+from world_info_web.backend.automaton import ahocorasick
+from world_info_web.backend.records import WorldRecord
+from world_info_web.backend.service import WorldInfoService, np
+
+WORDS = [
+    "night", "market", "horror", "cafe", "taiwan", "台灣", "夜市", "school", "forest", "space",
+    "dance", "music", "chill", "rain", "city", "temple", "beach", "game", "club", "garden",
+]
+THRESHOLD_RULES = [
+    ("visits_min", lambda rng: str(rng.randrange(100, 100000))),
+    ("favorites_min", lambda rng: str(rng.randrange(10, 5000))),
+    ("heat_min", lambda rng: str(rng.randrange(1, 8))),
+    ("favorite_rate_min", lambda rng: str(rng.randrange(1, 20))),
+    ("published_within_days", lambda rng: str(rng.randrange(7, 365))),
+    ("updated_within_days", lambda rng: str(rng.randrange(7, 90))),
+]
+
+
+def _synthetic_worlds(count: int, rng: random.Random) -> list[dict[str, Any]]:
+    now = dt.datetime.now(dt.timezone.utc)
+    worlds = []
+    for index in range(count):
+        visits = rng.randrange(0, 500000)
+        worlds.append(
+            {
+                "id": f"wrld_{index:08d}",
+                "name": " ".join(rng.sample(WORDS, 3)) + f" {index}",
+                "author_id": f"usr_{rng.randrange(count // 10 + 1):06d}",
+                "author_name": rng.choice(WORDS).title() + str(rng.randrange(100)),
+                "source": rng.choice(["db:taiwan", "db:horror", "db:manual"]),
+                "tags": [f"author_tag_{tag}" for tag in rng.sample(WORDS, 2)],
+                "visits": visits,
+                "favorites": rng.randrange(0, visits // 10 + 1),
+                "heat": rng.randrange(0, 10),
+                "popularity": rng.randrange(0, 10),
+                "publication_date": (now - dt.timedelta(days=rng.randrange(1000))).isoformat(),
+                "updated_at": (now - dt.timedelta(days=rng.randrange(400))).isoformat(),
+            }
+        )
+    return worlds
+
+
+def _synthetic_topics(count: int, rng: random.Random) -> dict[str, list[dict[str, Any]]]:
+    topics = {}
+    for index in range(count):
+        rules = [{"rule_type": "keyword", "rule_value": word} for word in rng.sample(WORDS, rng.randrange(1, 4))]
+        rules.append({"rule_type": "tag", "rule_value": f"author_tag_{rng.choice(WORDS)}"})
+        for rule_type, value in rng.sample(THRESHOLD_RULES, 2):
+            rules.append({"rule_type": rule_type, "rule_value": value(rng)})
+        rng.shuffle(rules)
+        topics[f"topic_{index:03d}"] = rules
+    return topics
+
+
+def _per_rule(service: WorldInfoService, rules_by_topic: dict[str, list[dict[str, Any]]], worlds: list[Any]) -> dict[str, list[str | None]]:
+    results = {}
+    for topic_key, rules in rules_by_topic.items():
+        labels = []
+        for world in worlds:
+            label = None
+            for rule in rules:
+                if service._world_matches_rule(world, rule["rule_type"], rule["rule_value"]):
+                    label = f"{rule['rule_type']}:{rule['rule_value']}"
+                    break
+            labels.append(label)
+        results[topic_key] = labels
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Compare compiled topic rule evaluation with per-rule matching")
+    parser.add_argument("--topics", type=int, default=100)
+    parser.add_argument("--worlds", type=int, default=50000)
+    parser.add_argument("--seed", type=int, default=7)
+    parser.add_argument("--skip-baseline", action="store_true", help="only time the compiled engine")
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    worlds = [WorldRecord.from_dict(world) for world in _synthetic_worlds(args.worlds, rng)]
+    rules_by_topic = _synthetic_topics(args.topics, rng)
+    # Rule evaluation needs no storage or config.
+    service = object.__new__(WorldInfoService)
+
+    started = time.perf_counter()
+    plan = service._compile_topic_rules(rules_by_topic)
+    compiled = service._evaluate_topic_rules(plan, worlds)
+    compiled_ms = (time.perf_counter() - started) * 1000
+    matches = sum(label is not None for labels in compiled.values() for label in labels)
+
+    print(
+        f"{args.topics} topics x {args.worlds} worlds, {len(plan['automaton'])} keyword needles "
+        f"(pyahocorasick: {ahocorasick is not None}, numpy: {np is not None})"
+    )
+    print(f"compiled engine: {compiled_ms:>10.1f} ms, {matches} memberships")
+    if args.skip_baseline:
+        return
+    started = time.perf_counter()
+    baseline = _per_rule(service, rules_by_topic, worlds)
+    baseline_ms = (time.perf_counter() - started) * 1000
+    print(f"per-rule match:  {baseline_ms:>10.1f} ms ({baseline_ms / compiled_ms:.1f}x)")
+    print(f"results agree:   {baseline == compiled}")
+
+
+if __name__ == "__main__":
+    main()
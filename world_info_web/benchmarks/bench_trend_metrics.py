@@ -0,0 +1,121 @@
+from __future__ import annotations
+
+import argparse
+import datetime as dt
+import random
+import shutil
+import tempfile
+import time
+from pathlib import Path
+from typing import Any
+
+from world_info_web.backend.service import WorldInfoService, np
+
+NOW = dt.datetime(2026, 3, 1, tzinfo=dt.timezone.utc)
+
+
+def _synthetic_scope(*, worlds: int, points: int, seed: int = 7) -> tuple[list[dict[str, Any]], dict[str, list[dict[str, Any]]]]:
+    rng = random.Random(seed)
+    latest_ts = int(NOW.timestamp())
+    items = []
+    history: dict[str, list[dict[str, Any]]] = {}
+    for index in range(worlds):
+        world_id = f"wrld_bench_{index:06d}"
+        step = rng.choice((3600, 6 * 3600, 12 * 3600, 86400))
+        visits = rng.randint(0, 5000)
+        favorites = visits // rng.randint(5, 40)
+        updates = sorted(rng.sample(range(points), k=min(points, rng.randint(1, 3))))
+        entries = []
+        updated_at = None
+        for point in range(points):
+            if point in updates:
+                updated_at = (NOW - dt.timedelta(seconds=(points - point) * step)).isoformat().replace("+00:00", "Z")
+            visits += rng.randint(0, 40)
+            favorites += rng.randint(0, 3)
+            entries.append(
+                {
+                    "timestamp": latest_ts - (points - 1 - point) * step,
+                    "visits": visits,
+                    "favorites": favorites,
+                    "updated_at": updated_at,
+                }
+            )
+        rng.shuffle(entries)
+        history[world_id] = entries
+        items.append(
+            {
+                "id": world_id,
+                "name": f"Benchmark World {index}",
+                "visits": visits,
+                "favorites": favorites,
+                "heat": index % 6,
+                "popularity": index % 9,
+                "updated_at": updated_at,
+                "publication_date": (NOW - dt.timedelta(days=rng.randint(1, 900))).isoformat().replace("+00:00", "Z"),
+            }
+        )
+    return items, history
+
+
+def _best_of(repeat: int, func: Any) -> tuple[float, Any]:
+    best = None
+    result = None
+    for _ in range(repeat):
+        started = time.perf_counter()
+        result = func()
+        elapsed = time.perf_counter() - started
+        best = elapsed if best is None else min(best, elapsed)
+    return round((best or 0.0) * 1000, 2), result
+
+
+def run_benchmark(*, worlds: int, points: int, repeat: int) -> dict[str, Any]:
+    workdir = Path(tempfile.mkdtemp(prefix="world_info_trend_bench_"))
+    try:
+        service = WorldInfoService(repo_root=workdir, app_root=workdir / "world_info_web")
+        items, history = _synthetic_scope(worlds=worlds, points=points)
+        per_world_ms, per_world = _best_of(
+            repeat,
+            lambda: [service._build_world_trend_metrics(world, history[world["id"]], now=NOW) for world in items],
+        )
+
+        batch_ms, batch = _best_of(repeat, lambda: service._build_trend_metrics_batch(items, history, now=NOW))
+        # A history map served from the catalog cache carries its data version,
+        # so repeated sorts reuse the flattened arrays.
+        history_key = ("bench", (0,))
+        service._build_trend_metrics_batch(items, history, now=NOW, history_key=history_key)
+        warm_ms, _ = _best_of(
+            repeat,
+            lambda: service._build_trend_metrics_batch(items, history, now=NOW, history_key=history_key),
+        )
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+    return {
+        "per_world_ms": per_world_ms,
+        "batch_ms": batch_ms,
+        "warm_batch_ms": warm_ms,
+        "speedup": round(per_world_ms / batch_ms, 2) if batch_ms else None,
+        "warm_speedup": round(per_world_ms / warm_ms, 2) if warm_ms else None,
+        "identical": per_world == batch,
+        "numpy": np is not None,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Compare per-world and batched trend metric computation")
+    parser.add_argument("--worlds", type=int, default=10000)
+    parser.add_argument("--points", type=int, default=200)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    result = run_benchmark(worlds=args.worlds, points=args.points, repeat=args.repeat)
+    print(f"{args.worlds} worlds x {args.points} points (numpy: {'yes' if result['numpy'] else 'no'})")
+    print(
+        f"per-world {result['per_world_ms']} ms, batch {result['batch_ms']} ms "
+        f"(cached arrays {result['warm_batch_ms']} ms), speedup {result['speedup']}x cold, "
+        f"{result['warm_speedup']}x cached"
+    )
+    print(f"identical payloads: {result['identical']}")
+
+
+if __name__ == "__main__":
+    main()
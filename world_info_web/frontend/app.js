@@ -16,6 +16,7 @@ const state = {
   activeTopic: null,
   topics: [],
   worlds: [],
+  worldsPage: null,
   loadedCollectionScope: null,
   collectionLoadingScope: null,
   collectionInsights: null,
@@ -86,6 +87,7 @@ const INACTIVE_VISITS_THRESHOLD = 1000;
 const INACTIVE_PUBLISHED_DAYS = 30;
 const PAUSED_UPDATE_DAYS = 365;
 const COMPARE_PREFETCH_LIMIT = 16;
+const WORLD_PAGE_SIZE = 500;
 const DEBUG_REQUEST_LIMIT = 120;
 const DEBUG_LIFECYCLE_LIMIT = 120;
 
@@ -2549,7 +2551,9 @@ function renderTags(tags) {
 }
 
 function renderTable(worlds) {
-  $("table-caption").textContent = `${worlds.length} worlds`;
+  const total = toNumber(state.worldsPage?.total);
+  $("table-caption").textContent = total > worlds.length ? `${worlds.length} of ${total} worlds` : `${worlds.length} worlds`;
+  $("load-more-worlds-button").classList.toggle("hidden", state.worldsPage?.nextOffset == null);
   $("world-table-body").innerHTML = worlds
     .map(
       (world) => {
@@ -5310,34 +5314,33 @@ async function loadCollection(preferredSource = null) {
 
   try {
     if (state.activeTopic) {
-      const params = new URLSearchParams({ q, tag, sort, direction });
-      const { data } = await fetchJson(`/api/v1/topics/${encodeURIComponent(state.activeTopic)}/worlds?${params.toString()}`);
+      const params = new URLSearchParams({ q, tag, sort, direction, limit: String(WORLD_PAGE_SIZE) });
+      const path = `/api/v1/topics/${encodeURIComponent(state.activeTopic)}/worlds`;
+      const { data } = await fetchJson(`${path}?${params.toString()}`);
       state.worlds = data.items || [];
+      state.worldsPage = { path, params, total: data.total, nextOffset: data.next_offset };
       state.source = data.topic.label;
       state.collectionInsights = await loadCollectionInsights({ topicKey: state.activeTopic, label: data.topic.label });
       state.briefing = buildDashboardPayloadFromInsights(state.collectionInsights);
       setTopicMode(data.topic.label);
       $("current-source-label").textContent = data.topic.label;
       renderTags(data.tags || []);
-      renderSummary(data.topic.summary || state.collectionInsights?.summary || { world_count: data.count || 0 });
+      renderSummary(data.topic.summary || state.collectionInsights?.summary || { world_count: data.total || 0 });
       renderTable(state.worlds);
     } else {
       const source = preferredSource || $("source-select").value;
-      const params = new URLSearchParams({ source, q, tag, sort, direction });
+      const params = new URLSearchParams({ source, q, tag, sort, direction, limit: String(WORLD_PAGE_SIZE) });
       const { data } = await fetchJson(`/api/v1/worlds?${params.toString()}`);
       state.source = source;
       state.worlds = data.items || [];
+      state.worldsPage = { path: "/api/v1/worlds", params, total: data.total, nextOffset: data.next_offset };
       state.collectionInsights = await loadCollectionInsights({ source, label: source });
       state.briefing = buildDashboardPayloadFromInsights(state.collectionInsights);
       setTopicMode("all sources");
       $("current-source-label").textContent = source;
       renderTags(data.tags || []);
-      renderSummary(state.collectionInsights?.summary || {
-        world_count: data.count,
-        total_visits: state.worlds.reduce((sum, item) => sum + toNumber(item.visits), 0),
-        total_favorites: state.worlds.reduce((sum, item) => sum + toNumber(item.favorites), 0),
-        tracked_creators: new Set(state.worlds.map((item) => item.author_id).filter(Boolean)).size,
-      });
+      // data.summary covers every matching world; state.worlds is only the first page.
+      renderSummary(state.collectionInsights?.summary || data.summary || { world_count: data.total || 0 });
       renderTable(state.worlds);
     }
 
@@ -5374,6 +5377,22 @@ async function loadCollection(preferredSource = null) {
   }
 }
 
+async function loadMoreWorlds() {
+  const page = state.worldsPage;
+  if (!page || page.nextOffset == null) {
+    return;
+  }
+  const params = new URLSearchParams(page.params);
+  params.set("offset", String(page.nextOffset));
+  const { data } = await fetchJson(`${page.path}?${params.toString()}`);
+  if (state.worldsPage !== page) {
+    return;
+  }
+  state.worlds = [...state.worlds, ...(data.items || [])];
+  state.worldsPage = { ...page, total: data.total, nextOffset: data.next_offset };
+  renderTable(state.worlds);
+}
+
 async function loadCollectionInsights({ source = null, topicKey = null, label = "current collection" } = {}) {
   const params = new URLSearchParams({ limit: "12" });
   if (topicKey) {
@@ -5994,6 +6013,9 @@ function attachControls() {
       loadCollection();
     }
   });
+  $("load-more-worlds-button").addEventListener("click", () => {
+    loadMoreWorlds();
+  });
   $("reload-button").addEventListener("click", () => {
     if (state.page === "discover") {
       loadCollection();